@@ -6,15 +6,22 @@ from code_agnostic.cli import AliasedGroup
 from code_agnostic.cli.commands.agents import agents_group
 from code_agnostic.cli.commands.apps import apps
 from code_agnostic.cli.commands.apply import apply
+from code_agnostic.cli.commands.batch import batch
+from code_agnostic.cli.commands.build import build
 from code_agnostic.cli.commands.explain_lossiness import explain_lossiness
+from code_agnostic.cli.commands.fleet import fleet
 from code_agnostic.cli.commands.import_ import import_group
 from code_agnostic.cli.commands.mcp import mcp
 from code_agnostic.cli.commands.plan import plan
 from code_agnostic.cli.commands.restore import restore
+from code_agnostic.cli.commands.revisions import revisions
 from code_agnostic.cli.commands.rules import rules
+from code_agnostic.cli.commands.serve import serve
 from code_agnostic.cli.commands.skills import skills
+from code_agnostic.cli.commands.stats import stats
 from code_agnostic.cli.commands.status import status
 from code_agnostic.cli.commands.validate import validate
+from code_agnostic.cli.commands.watch import watch
 from code_agnostic.cli.commands.workspaces import workspaces
 
 
@@ -31,10 +38,15 @@ def cli(ctx: click.Context) -> None:
 # Register individual commands
 cli.add_command(plan)
 cli.add_command(apply)
+cli.add_command(build)
 cli.add_command(restore)
 cli.add_command(status)
 cli.add_command(validate)
 cli.add_command(explain_lossiness)
+cli.add_command(watch)
+cli.add_command(serve)
+cli.add_command(batch)
+cli.add_command(stats)
 
 # Register command groups
 cli.add_command(apps)
@@ -42,8 +54,10 @@ cli.add_command(workspaces)
 cli.add_command(rules)
 cli.add_command(skills)
 cli.add_command(agents_group)
+cli.add_command(revisions)
 cli.add_command(mcp)
 cli.add_command(import_group)
+cli.add_command(fleet)
 
 
 def main() -> int:
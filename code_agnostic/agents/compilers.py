@@ -8,30 +8,90 @@ from code_agnostic.agents.codex import serialize_codex_agent
 from code_agnostic.agents.models import Agent
 from code_agnostic.agents.opencode import serialize_opencode_agent
 from code_agnostic.agents.parser import serialize_agent
+from code_agnostic.lossiness import LossyProperty, report_lossiness
 
 
 class IAgentCompiler(ABC):
+    app: str
+
     @abstractmethod
     def compile(self, agent: Agent) -> str:
         """Return compiled agent content for target editor."""
 
+    def dropped(self, agent: Agent) -> list[LossyProperty]:
+        """Canonical properties of ``agent`` the compiled output cannot carry."""
+        return []
+
+
+def _dropped_outside_codex(agent: Agent) -> list[LossyProperty]:
+    dropped: list[LossyProperty] = []
+    if agent.metadata.codex.mcp_servers:
+        dropped.append(
+            LossyProperty(
+                "codex.mcp_servers",
+                "target only supports codex.mcp_servers in Codex output",
+            )
+        )
+    if agent.metadata.codex.skills_config:
+        dropped.append(
+            LossyProperty(
+                "codex.skills.config",
+                "target only supports codex.skills.config in Codex output",
+            )
+        )
+    if agent.metadata.nickname_candidates:
+        dropped.append(
+            LossyProperty(
+                "nickname_candidates",
+                "target does not support agent nickname_candidates",
+            )
+        )
+    if agent.metadata.sandbox_mode:
+        dropped.append(
+            LossyProperty("sandbox_mode", "target does not support agent sandbox_mode")
+        )
+    return dropped
+
 
 class OpenCodeAgentCompiler(IAgentCompiler):
     """Cross-compile for OpenCode agents."""
 
+    app = "opencode"
+
     def compile(self, agent: Agent) -> str:
+        report_lossiness(self.app, agent.source_path, self.dropped(agent))
         return serialize_opencode_agent(agent)
 
+    def dropped(self, agent: Agent) -> list[LossyProperty]:
+        return _dropped_outside_codex(agent)
+
 
 class CursorAgentCompiler(IAgentCompiler):
     """Cross-compile for Cursor."""
 
+    app = "cursor"
+
     def compile(self, agent: Agent) -> str:
+        report_lossiness(self.app, agent.source_path, self.dropped(agent))
         return serialize_agent(agent, target_app="cursor")
 
+    def dropped(self, agent: Agent) -> list[LossyProperty]:
+        return _dropped_outside_codex(agent)
+
 
 class CodexAgentCompiler(IAgentCompiler):
     """Cross-compile for Codex subagents."""
 
+    app = "codex"
+
     def compile(self, agent: Agent) -> str:
         return serialize_codex_agent(agent)
+
+
+def agent_compiler_for(app: str) -> IAgentCompiler:
+    compilers: dict[str, type[IAgentCompiler]] = {
+        "codex": CodexAgentCompiler,
+        "cursor": CursorAgentCompiler,
+        "opencode": OpenCodeAgentCompiler,
+    }
+    return compilers[app]()
@@ -4,9 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 
-import yaml
-
 from code_agnostic.agents.models import Agent
+from code_agnostic.codecs import dump_yaml
 
 
 def serialize_opencode_agent(agent: Agent) -> str:
@@ -48,7 +47,7 @@ def serialize_opencode_agent(agent: Agent) -> str:
     parts: list[str] = []
     if fm:
         parts.append("---")
-        parts.append(yaml.dump(fm, default_flow_style=False, sort_keys=False).rstrip())
+        parts.append(dump_yaml(fm))
         parts.append("---")
         parts.append("")
 
@@ -2,12 +2,9 @@
 
 from __future__ import annotations
 
-import re
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from code_agnostic.agents.models import (
     Agent,
     AgentCodexConfig,
@@ -16,26 +13,25 @@ from code_agnostic.agents.models import (
     AgentToolPermissions,
     normalize_agent_override_key,
 )
+from code_agnostic.codecs import dump_yaml, split_frontmatter
+from code_agnostic.source_cache import cached_source
 from code_agnostic.spec.loaders import load_agent_bundle
 
-_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
 _APP_OVERRIDE_PREFIXES = ("cursor", "codex", "opencode")
 
 
 def parse_agent(path: Path) -> Agent:
+    return cached_source("agent", path, _parse_agent)
+
+
+def _parse_agent(path: Path) -> Agent:
     if _is_agent_bundle_dir(path):
         return load_agent_bundle(path)
 
     text = path.read_text(encoding="utf-8")
     name = path.stem
 
-    match = _FRONTMATTER_RE.match(text)
-    if match:
-        raw = yaml.safe_load(match.group(1)) or {}
-        content = text[match.end() :]
-    else:
-        raw = {}
-        content = text
+    raw, content = split_frontmatter(text)
 
     tools_raw = raw.get("tools", {})
     if not isinstance(tools_raw, dict):
@@ -124,7 +120,7 @@ def serialize_agent(agent: Agent, *, target_app: str | None = None) -> str:
     parts: list[str] = []
     if fm:
         parts.append("---")
-        parts.append(yaml.dump(fm, default_flow_style=False, sort_keys=False).rstrip())
+        parts.append(dump_yaml(fm))
         parts.append("---")
         parts.append("")
 
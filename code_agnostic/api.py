@@ -0,0 +1,125 @@
+"""Programmatic API for driving sync from long-running Python processes."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from code_agnostic.apps.apps_service import AppsService
+from code_agnostic.caching import CachingCoreRepository, CachingWorkspaceService
+from code_agnostic.errors import SyncAppError
+from code_agnostic.models import (
+    EditorStatusRow,
+    SyncPlan,
+    WorkspaceStatusRow,
+)
+from code_agnostic.source_cache import CacheStats, SourceCache, use_source_cache
+from code_agnostic.status import StatusService
+from code_agnostic.validation import ConfigValidator, ValidationResult
+
+
+@dataclass(frozen=True)
+class ApplyResult:
+    plan: SyncPlan
+    applied: int = 0
+    failed: int = 0
+    failures: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.plan.errors and self.failed == 0
+
+
+@dataclass(frozen=True)
+class StatusReport:
+    editors: list[EditorStatusRow]
+    workspaces: list[WorkspaceStatusRow]
+
+
+class Session:
+    """Warm, reusable entry point for plan/apply/status/validate.
+
+    The session keeps app services (with their schema validators), parsed
+    sources, repo discovery and the workspace registry between calls. All of
+    them are revalidated against file stamps; repo discovery against the
+    stamps of the directories it walked. Pass ``repo_rescan_interval`` to
+    trust discovery for that many seconds without checking instead.
+    Calls are serialized, so one session can be shared between threads.
+    """
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        *,
+        repo_rescan_interval: float | None = None,
+    ) -> None:
+        self.core = CachingCoreRepository(root)
+        self.apps = AppsService(self.core)
+        self.source_cache = SourceCache()
+        self.workspace_service = CachingWorkspaceService(max_age=repo_rescan_interval)
+        self.status_service = StatusService(workspace_service=self.workspace_service)
+        self.validator = ConfigValidator()
+        self._lock = threading.RLock()
+
+    @property
+    def root(self) -> Path:
+        return self.core.root
+
+    def plan(
+        self,
+        target: str = "all",
+        *,
+        include_apps: bool = True,
+        workspace_names: set[str] | None = None,
+    ) -> SyncPlan:
+        with self._lock, use_source_cache(self.source_cache):
+            return self.apps.plan_for_target(
+                target,
+                include_apps=include_apps,
+                workspace_names=workspace_names,
+                workspace_service=self.workspace_service,
+            )
+
+    def execute(self, plan: SyncPlan) -> ApplyResult:
+        with self._lock:
+            if plan.errors or not plan.actions:
+                return ApplyResult(plan=plan)
+            applied, failed, failures = self.apps.execute_plan(plan)
+            return ApplyResult(
+                plan=plan, applied=applied, failed=failed, failures=failures
+            )
+
+    def apply(self, target: str = "all") -> ApplyResult:
+        with self._lock:
+            return self.execute(self.plan(target))
+
+    def status(self, target: str = "all") -> StatusReport:
+        with self._lock, use_source_cache(self.source_cache):
+            editors = self.status_service.build_editor_status(self.apps, target)
+            workspaces = self.status_service.build_workspace_status(
+                self.core,
+                app_services=self.apps._resolve_services_for_target("all"),
+            )
+        return StatusReport(editors=editors, workspaces=workspaces)
+
+    def validate(self, workspace: str | None = None) -> ValidationResult:
+        with self._lock, use_source_cache(self.source_cache):
+            if workspace is None:
+                return self.validator.validate_core_root(self.core.root)
+            names = {item["name"] for item in self.core.load_workspaces()}
+            if workspace not in names:
+                raise SyncAppError(f"Workspace not found: {workspace}")
+            return self.validator.validate_workspace_root(
+                self.core.workspace_config_dir(workspace)
+            )
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self.source_cache.invalidate()
+            self.workspace_service.invalidate()
+            self.core.invalidate()
+            self.apps.clear_service_cache()
+
+    def cache_stats(self) -> CacheStats:
+        return self.source_cache.stats()
@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from pathlib import Path
 
 from code_agnostic.apps.app_id import AppId, app_ids_by_capability
@@ -7,15 +8,26 @@ from code_agnostic.apps.common.framework import (
 )
 from code_agnostic.apps.common.interfaces.service import IAppConfigService
 from code_agnostic.apps.common.interfaces.repositories import ISourceRepository
-from code_agnostic.executor import SyncExecutor
+from code_agnostic.bundle import (
+    ArtifactBundle,
+    BundleBuilder,
+    BundlePlanner,
+    BundleSummary,
+)
+from code_agnostic.compile_pool import CompilePool, compile_jobs
+from code_agnostic.durability import DEFAULT_DURABILITY
+from code_agnostic.executor import RootOutcome, SyncExecutor, summarize_outcomes
+from code_agnostic.git_exclude_service import GitExcludeStage
 from code_agnostic.models import AppStatusRow, AppSyncStatus, SyncPlan
-from code_agnostic.planner import SyncPlanner
+from code_agnostic.planner import PlanFilter, SyncPlanner
 from code_agnostic.utils import read_json_safe, write_json
+from code_agnostic.workspaces import WorkspaceService
 
 
 class AppsService:
     def __init__(self, core_repository: ISourceRepository) -> None:
         self.core_repository = core_repository
+        self._services: dict[str, IAppConfigService] = {}
 
     @property
     def apps_path(self) -> Path:
@@ -84,29 +96,111 @@ class AppsService:
         apps = self.load_apps()
         return [name for name in self.available_apps() if apps.get(name, False)]
 
-    def plan_for_target(self, target: str) -> SyncPlan:
+    def plan_for_target(
+        self,
+        target: str,
+        *,
+        include_apps: bool = True,
+        workspace_names: set[str] | None = None,
+        workspace_service: WorkspaceService | None = None,
+        plan_filter: PlanFilter | None = None,
+        compile_processes: int | None = None,
+    ) -> SyncPlan:
+        plan = SyncPlan([], [], [])
+        for chunk in self.iter_plan_for_target(
+            target,
+            include_apps=include_apps,
+            workspace_names=workspace_names,
+            workspace_service=workspace_service,
+            plan_filter=plan_filter,
+            compile_processes=compile_processes,
+        ):
+            plan.extend(chunk)
+        return plan
+
+    def iter_plan_for_target(
+        self,
+        target: str,
+        *,
+        include_apps: bool = True,
+        workspace_names: set[str] | None = None,
+        workspace_service: WorkspaceService | None = None,
+        plan_filter: PlanFilter | None = None,
+        compile_processes: int | None = None,
+    ) -> Iterator[SyncPlan]:
         normalized = target.lower()
         app_services = self._resolve_services_for_target(normalized)
-        plan = SyncPlanner(
+        if compile_processes is not None:
+            # Compiled sources land in the active source cache for the planner.
+            CompilePool(compile_processes).prefill(
+                compile_jobs(self.core_repository, app_services, workspace_names)
+            )
+        planner = SyncPlanner(
             core=self.core_repository,
             app_services=app_services,
+            workspace_service=workspace_service,
             include_workspace=True,
-        ).build()
-        if normalized == "all":
-            if (
-                not app_services
-                and not plan.actions
-                and not plan.errors
-                and not plan.skipped
-            ):
-                return SyncPlan([], [], ["No apps enabled for sync."])
-            return plan
-        return plan.filter_for_target(normalized)
-
-    def execute_plan(self, scoped_plan: SyncPlan) -> tuple[int, int, list[str]]:
+            include_apps=include_apps,
+            workspace_names=workspace_names,
+            plan_filter=plan_filter,
+        )
+        produced = False
+        for chunk in planner.iter_plan():
+            if normalized != "all":
+                chunk = chunk.filter_for_target(normalized)
+            if chunk.actions or chunk.errors or chunk.skipped:
+                produced = True
+            yield chunk
+        if normalized == "all" and not app_services and not produced:
+            yield SyncPlan([], [], ["No apps enabled for sync."])
+
+    def build_bundle(self, target: str, out: Path) -> BundleSummary:
+        """Compile the global outputs of the target's apps into a bundle."""
+        services = self._resolve_services_for_target(target.lower())
+        return BundleBuilder(self.core_repository, services).build(out)
+
+    def plan_from_bundle(self, target: str, bundle: ArtifactBundle) -> SyncPlan:
+        """Plan the bundle's apps, whether or not they are enabled locally."""
+        normalized = target.lower()
+        names = set(bundle.apps) if normalized == "all" else {normalized}
+        app_services = self._services_for(names)
+        plan = SyncPlan([], [], [])
+        for chunk in BundlePlanner(
+            self.core_repository, app_services, bundle
+        ).iter_plan():
+            plan.extend(chunk)
+        if normalized == "all" and not app_services:
+            plan.skipped.append("Bundle has no apps.")
+        return plan
+
+    def execute_plan(
+        self,
+        scoped_plan: SyncPlan,
+        continue_on_error: bool = False,
+        durability: str = DEFAULT_DURABILITY,
+    ) -> tuple[int, int, list[str]]:
+        return summarize_outcomes(
+            self.execute_plan_by_root(
+                scoped_plan,
+                continue_on_error=continue_on_error,
+                durability=durability,
+            )
+        )
+
+    def execute_plan_by_root(
+        self,
+        scoped_plan: SyncPlan,
+        continue_on_error: bool = False,
+        durability: str = DEFAULT_DURABILITY,
+        git_exclude: GitExcludeStage | None = None,
+    ) -> list[RootOutcome]:
         persist_state = self._requires_state_persist(scoped_plan)
-        return SyncExecutor(core=self.core_repository).execute(
-            scoped_plan, persist_state=persist_state
+        executor = SyncExecutor(core=self.core_repository, durability=durability)
+        return executor.execute_by_root(
+            scoped_plan,
+            persist_state=persist_state,
+            continue_on_error=continue_on_error,
+            git_exclude=git_exclude,
         )
 
     def _resolve_services_for_target(self, target: str) -> list[IAppConfigService]:
@@ -115,15 +209,24 @@ class AppsService:
             selected = enabled
         else:
             selected = {target} if target in enabled else set()
+        return self._services_for(selected)
 
+    def _services_for(self, apps: set[str]) -> list[IAppConfigService]:
         services: list[IAppConfigService] = []
-        for app in sorted(selected):
-            try:
-                services.append(create_registered_app_service(AppId(app)))
-            except (KeyError, ValueError):
-                continue
+        for app in sorted(apps):
+            service = self._services.get(app)
+            if service is None:
+                try:
+                    service = create_registered_app_service(AppId(app))
+                except (KeyError, ValueError):
+                    continue
+                self._services[app] = service
+            services.append(service)
         return services
 
+    def clear_service_cache(self) -> None:
+        self._services.clear()
+
     @staticmethod
     def _requires_state_persist(scoped_plan: SyncPlan) -> bool:
         return any(
@@ -1,6 +1,6 @@
 from copy import deepcopy
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from jsonschema import Draft7Validator
 
@@ -21,6 +21,7 @@ from code_agnostic.apps.common.interfaces.repositories import (
     ISchemaRepository,
 )
 from code_agnostic.apps.common.models import MCPServerDTO
+from code_agnostic.constants import CODEX_PROJECT_DIRNAME
 from code_agnostic.errors import (
     InvalidConfigSchemaError,
     InvalidJsonFormatError,
@@ -30,6 +31,9 @@ from code_agnostic.utils import merge_dict_overlay, read_json_safe
 from code_agnostic.skills.compilers import CodexSkillCompiler
 from code_agnostic.skills.parser import parse_skill
 
+if TYPE_CHECKING:
+    from code_agnostic.core.repository import CoreRepository
+
 
 class CodexConfigService(RegisteredAppConfigService):
     APP_ID = AppId.CODEX
@@ -68,6 +72,17 @@ class CodexConfigService(RegisteredAppConfigService):
             base_config_path=core.codex_base_path,
         )
 
+    @classmethod
+    def create_for_home(
+        cls, home: Path, core: "CoreRepository"
+    ) -> "CodexConfigService":
+        return cls(
+            repository=CodexConfigRepository(root=home / CODEX_PROJECT_DIRNAME),
+            mapper=CodexMCPMapper(),
+            schema_repository=CodexSchemaRepository(),
+            base_config_path=core.codex_base_path,
+        )
+
     @property
     def app_id(self) -> AppId:
         return self.APP_ID
@@ -114,19 +129,24 @@ class CodexConfigService(RegisteredAppConfigService):
             return ActionStatus.NOOP
         return ActionStatus.UPDATE
 
-    def build_action(
+    def config_overlay(
         self,
         common_servers: dict[str, MCPServerDTO],
         agent_sources: list[Path] | None = None,
-    ) -> Action:
-        existing = self._codex_repo.load_config()
-        if existing or self._codex_repo.config_path.exists():
-            self.validate_config(existing)
+    ) -> dict[str, Any]:
+        return {
+            "mcp": self.mapper.from_common(common_servers),
+            "base": self._load_base_config(),
+            "agents": (
+                self._build_agent_registry(agent_sources) if agent_sources else None
+            ),
+        }
 
-        desired_mcp = self.mapper.from_common(common_servers)
+    def merge_config_overlay(
+        self, existing: dict[str, Any], overlay: dict[str, Any]
+    ) -> dict[str, Any]:
         merged = dict(existing)
-        base = self._load_base_config()
-        for key, value in base.items():
+        for key, value in overlay["base"].items():
             if key == "mcp_servers":
                 continue
             if key == "agents" and isinstance(value, dict):
@@ -139,22 +159,12 @@ class CodexConfigService(RegisteredAppConfigService):
                 merged[key] = merge_dict_overlay(current, value)
                 continue
             merged[key] = deepcopy(value)
-        self.set_mcp_payload(merged, desired_mcp)
-        if agent_sources:
+        self.set_mcp_payload(merged, overlay["mcp"])
+        if overlay["agents"]:
             merged["agents"] = self._merge_agents_payload(
-                merged.get("agents"),
-                self._build_agent_registry(agent_sources),
+                merged.get("agents"), overlay["agents"]
             )
-        self.validate_config(merged)
-
-        return Action(
-            kind=self.action_kind,
-            path=self.repository.config_path,
-            status=self.derive_status(existing, merged),
-            detail=f"sync {self.app_id.value} config from common mcp base",
-            payload=self.build_action_payload(merged),
-            app=self.app_id.value,
-        )
+        return merged
 
     def _merge_agents_payload(
         self, existing: Any, overlay: dict[str, Any]
@@ -188,6 +198,25 @@ class CodexConfigService(RegisteredAppConfigService):
             registry[agent_name] = entry
         return registry
 
+    def compile_skill_source(self, source: Path) -> tuple[Path, str]:
+        skill_md = source / "SKILL.md"
+        skill = parse_skill(skill_md if skill_md.exists() else source)
+        return Path(source.name) / "SKILL.md", CodexSkillCompiler().compile(skill)
+
+    def compile_agent_source(self, source: Path) -> tuple[Path, str]:
+        try:
+            agent = parse_agent(source)
+            payload = CodexAgentCompiler().compile(agent)
+        except InvalidConfigSchemaError:
+            raise
+        except Exception as exc:
+            raise InvalidConfigSchemaError(source, str(exc)) from exc
+
+        target_name = (
+            normalize_codex_agent_filename(agent.metadata.name, agent.name) + ".toml"
+        )
+        return Path(target_name), payload
+
     def plan_skill_actions(
         self,
         sources: list[Path],
@@ -197,7 +226,6 @@ class CodexConfigService(RegisteredAppConfigService):
         managed_paths: list[Path],
         removable_links: list[Path],
     ) -> tuple[list[Action], list[Path], list[str]]:
-        compiler = CodexSkillCompiler()
         return self._plan_compiled_text_actions(
             sources=sources,
             target_dir=target_dir,
@@ -205,20 +233,12 @@ class CodexConfigService(RegisteredAppConfigService):
             app=app,
             managed_paths=managed_paths,
             removable_links=removable_links,
-            compile_source=lambda source: (
-                target_dir / source.name / "SKILL.md",
-                compiler.compile(
-                    parse_skill(
-                        source / "SKILL.md"
-                        if (source / "SKILL.md").exists()
-                        else source
-                    )
-                ),
-            ),
+            resource="skill",
             create_detail="create compiled codex skill",
             noop_detail="compiled codex skill already up to date",
             update_detail="update compiled codex skill",
             conflict_message="Codex skill sync skipped (conflict): {target}",
+            copy_assets=True,
         )
 
     def plan_agent_actions(
@@ -230,23 +250,6 @@ class CodexConfigService(RegisteredAppConfigService):
         managed_paths: list[Path],
         removable_links: list[Path],
     ) -> tuple[list[Action], list[Path], list[str]]:
-        compiler = CodexAgentCompiler()
-
-        def compile_source(source: Path) -> tuple[Path, str]:
-            try:
-                agent = parse_agent(source)
-                payload = compiler.compile(agent)
-            except InvalidConfigSchemaError:
-                raise
-            except Exception as exc:
-                raise InvalidConfigSchemaError(source, str(exc)) from exc
-
-            target_name = (
-                normalize_codex_agent_filename(agent.metadata.name, agent.name)
-                + ".toml"
-            )
-            return target_dir / target_name, payload
-
         return self._plan_compiled_text_actions(
             sources=sources,
             target_dir=target_dir,
@@ -254,7 +257,7 @@ class CodexConfigService(RegisteredAppConfigService):
             app=app,
             managed_paths=managed_paths,
             removable_links=removable_links,
-            compile_source=compile_source,
+            resource="agent",
             create_detail="create compiled codex agent",
             noop_detail="compiled codex agent already up to date",
             update_detail="update compiled codex agent",
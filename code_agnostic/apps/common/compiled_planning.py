@@ -1,5 +1,8 @@
+import hashlib
+import os
 from pathlib import Path
 
+from code_agnostic.content_store import active_content_store
 from code_agnostic.models import Action, ActionKind, ActionStatus
 
 
@@ -31,6 +34,154 @@ def _symlink_ancestor_state(
         current = current.parent
 
 
+def _target_is_current(target: Path, payload: str, scope: str) -> bool:
+    store = active_content_store()
+    if store is not None and store.covers(scope) and store.can_link(target):
+        # In hardlink fan-out a current target *is* the store object, so an
+        # inode comparison replaces reading the file. Equal copies get relinked.
+        return store.is_linked(target, payload)
+    return target.read_text(encoding="utf-8") == payload
+
+
+# Files a skill compiles from; everything else in the folder is an asset.
+SKILL_INPUT_NAMES = frozenset({"SKILL.md", "meta.yaml", "prompt.md"})
+
+
+def list_skill_assets(source: Path) -> list[Path]:
+    """Relative paths of the auxiliary files shipped beside a compiled skill.
+
+    Hidden entries and symlinks are skipped so assets never escape the skill.
+    """
+    assets: list[Path] = []
+    for root, dir_names, file_names in os.walk(source):
+        current = Path(root)
+        dir_names[:] = sorted(
+            name
+            for name in dir_names
+            if not name.startswith(".") and not (current / name).is_symlink()
+        )
+        for name in sorted(file_names):
+            path = current / name
+            if name.startswith(".") or path.is_symlink():
+                continue
+            if current == source and name in SKILL_INPUT_NAMES:
+                continue
+            assets.append(path.relative_to(source))
+    return assets
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _copy_is_current(source: Path, target: Path) -> bool:
+    """rsync-style check: equal size and mtime skip reading, else hash both."""
+    source_stat = source.stat()
+    target_stat = target.stat()
+    if source_stat.st_size != target_stat.st_size:
+        return False
+    if source_stat.st_mtime_ns == target_stat.st_mtime_ns:
+        return True
+    return _file_digest(source) == _file_digest(target)
+
+
+def plan_copied_file_action(
+    *,
+    source: Path,
+    target: Path,
+    removable_link_paths: set[Path] | None = None,
+    scope: str,
+    app: str,
+    create_detail: str,
+    noop_detail: str,
+    update_detail: str,
+    conflict_detail: str = "non-managed path exists",
+) -> Action:
+    has_symlink_ancestor, is_removable_ancestor = _symlink_ancestor_state(
+        target, removable_link_paths or set()
+    )
+
+    def action(status: ActionStatus, detail: str) -> Action:
+        return Action(
+            kind=ActionKind.COPY_FILE,
+            path=target,
+            status=status,
+            detail=detail,
+            source=source,
+            app=app,
+            scope=scope,
+        )
+
+    if has_symlink_ancestor:
+        if not is_removable_ancestor:
+            return action(ActionStatus.CONFLICT, conflict_detail)
+        # The old symlink points back at the source, so compare nothing.
+        return action(ActionStatus.CREATE, create_detail)
+
+    if not target.exists() and not target.is_symlink():
+        return action(ActionStatus.CREATE, create_detail)
+
+    if target.is_file() and not target.is_symlink():
+        if _copy_is_current(source, target):
+            return action(ActionStatus.NOOP, noop_detail)
+        return action(ActionStatus.UPDATE, update_detail)
+
+    return action(ActionStatus.CONFLICT, conflict_detail)
+
+
+def plan_bundled_file_action(
+    *,
+    target: Path,
+    checksum: str,
+    size: int,
+    removable_link_paths: set[Path] | None = None,
+    scope: str,
+    app: str,
+    create_detail: str,
+    noop_detail: str,
+    update_detail: str,
+    conflict_detail: str = "non-managed path exists",
+) -> Action:
+    """Plan a prebuilt bundle file by its checksum alone.
+
+    The returned action has no source yet; the bundle member is extracted
+    and set as its source only when the target needs writing.
+    """
+    has_symlink_ancestor, is_removable_ancestor = _symlink_ancestor_state(
+        target, removable_link_paths or set()
+    )
+
+    def action(status: ActionStatus, detail: str) -> Action:
+        return Action(
+            kind=ActionKind.COPY_FILE,
+            path=target,
+            status=status,
+            detail=detail,
+            app=app,
+            scope=scope,
+        )
+
+    if has_symlink_ancestor:
+        if not is_removable_ancestor:
+            return action(ActionStatus.CONFLICT, conflict_detail)
+        return action(ActionStatus.CREATE, create_detail)
+
+    if not target.exists() and not target.is_symlink():
+        return action(ActionStatus.CREATE, create_detail)
+
+    if target.is_file() and not target.is_symlink():
+        # A size mismatch settles it without reading the target.
+        if target.stat().st_size == size and _file_digest(target) == checksum:
+            return action(ActionStatus.NOOP, noop_detail)
+        return action(ActionStatus.UPDATE, update_detail)
+
+    return action(ActionStatus.CONFLICT, conflict_detail)
+
+
 def plan_compiled_text_action(
     *,
     target: Path,
@@ -62,8 +213,7 @@ def plan_compiled_text_action(
 
     if has_symlink_ancestor and is_removable_ancestor:
         if target.is_file():
-            existing = target.read_text(encoding="utf-8")
-            if existing == payload:
+            if _target_is_current(target, payload, scope):
                 return Action(
                     kind=ActionKind.WRITE_TEXT,
                     path=target,
@@ -104,8 +254,7 @@ def plan_compiled_text_action(
         )
 
     if target.is_file():
-        existing = target.read_text(encoding="utf-8")
-        if existing == payload:
+        if _target_is_current(target, payload, scope):
             return Action(
                 kind=ActionKind.WRITE_TEXT,
                 path=target,
@@ -1,10 +1,13 @@
 from abc import ABCMeta, abstractmethod
 from pathlib import Path
-from typing import Any, ClassVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from code_agnostic.apps.app_id import AppId, app_label
 from code_agnostic.apps.common.interfaces.service import IAppConfigService
 
+if TYPE_CHECKING:
+    from code_agnostic.core.repository import CoreRepository
+
 
 def format_schema_error(error: Any) -> str:
     path = ".".join([str(part) for part in error.path])
@@ -44,6 +47,14 @@ class RegisteredAppConfigService(IAppConfigService, metaclass=AppServiceRegistry
     def create_default(cls, root: Path | None = None) -> "RegisteredAppConfigService":
         raise NotImplementedError
 
+    @classmethod
+    @abstractmethod
+    def create_for_home(
+        cls, home: Path, core: "CoreRepository"
+    ) -> "RegisteredAppConfigService":
+        """Service for the app's user config under ``home``, fed from ``core``."""
+        raise NotImplementedError
+
 
 def list_registered_app_services() -> list[AppId]:
     _load_registered_modules()
@@ -60,6 +71,16 @@ def create_registered_app_service(
     return service_class.create_default(root=root)
 
 
+def create_registered_app_service_for_home(
+    app_id: AppId, home: Path, core: "CoreRepository"
+) -> RegisteredAppConfigService:
+    _load_registered_modules()
+    service_class = AppServiceRegistryMeta._registry.get(app_id)
+    if service_class is None:
+        raise KeyError(f"No app service registered for: {app_id.value}")
+    return service_class.create_for_home(home, core)
+
+
 def _load_registered_modules() -> None:
     from code_agnostic.apps.common.loader import load_app_service_modules
 
@@ -1,12 +1,16 @@
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from code_agnostic.apps.app_id import AppId, app_scope
 from code_agnostic.apps.common.compiled_planning import (
     find_replaceable_symlink_ancestor,
+    list_skill_assets,
+    plan_bundled_file_action,
     plan_compiled_text_action,
+    plan_copied_file_action,
 )
 from code_agnostic.apps.common.interfaces.mapper import IAppMCPMapper
 from code_agnostic.apps.common.interfaces.repositories import IAppConfigRepository
@@ -18,7 +22,23 @@ from code_agnostic.apps.common.symlink_planning import (
     plan_stale_files_group,
     plan_stale_group,
 )
+from code_agnostic.lossiness import collect_lossiness, replay_lossiness
 from code_agnostic.models import Action, ActionKind, ActionStatus, SyncPlan
+from code_agnostic.source_cache import cached_source
+
+if TYPE_CHECKING:
+    from code_agnostic.bundle import ArtifactBundle
+
+# (sources, target_dir, scope, app, managed_paths, removable_links)
+PlanCompiledActions = Callable[
+    [list[Path], Path, str, str, list[Path], list[Path]],
+    tuple[list[Action], list[Path], list[str]],
+]
+
+
+def compiled_cache_kind(app_id: str, resource: str) -> str:
+    """Source cache kind holding one app's compiled skills or agents."""
+    return f"compiled:{app_id}:{resource}"
 
 
 class IAppConfigService(ABC):
@@ -91,6 +111,41 @@ class IAppConfigService(ABC):
     ) -> tuple[list[Action], list[Path], list[str]]:
         raise NotImplementedError
 
+    @abstractmethod
+    def compile_skill_source(self, source: Path) -> tuple[Path, str]:
+        """Return the compiled skill's path relative to the skills dir, and text."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def compile_agent_source(self, source: Path) -> tuple[Path, str]:
+        """Return the compiled agent's path relative to the agents dir, and text."""
+        raise NotImplementedError
+
+    def compile_source(self, resource: str, source: Path) -> tuple[Path, str, tuple]:
+        """Compile ``source`` with the lossiness it reports, once per cache.
+
+        Compiled output depends only on the source, the app and the resource,
+        so every target dir (each scope, repo and fleet home) shares one
+        compilation, whether it ran here or in a compile worker.
+        """
+        compile_one = (
+            self.compile_skill_source
+            if resource == "skill"
+            else self.compile_agent_source
+        )
+
+        def load(path: Path) -> tuple[Path, str, tuple]:
+            with collect_lossiness() as findings:
+                relative, payload = compile_one(path)
+            return relative, payload, tuple(findings)
+
+        return cached_source(
+            compiled_cache_kind(self.app_id.value, resource),
+            source,
+            load,
+            count_misses=False,
+        )
+
     def agent_action_removable_links(self, removable_links: list[Path]) -> list[Path]:
         return []
 
@@ -107,11 +162,12 @@ class IAppConfigService(ABC):
         app: str,
         managed_paths: list[Path],
         removable_links: list[Path],
-        compile_source: Callable[[Path], tuple[Path, str]],
+        resource: str,
         create_detail: str,
         noop_detail: str,
         update_detail: str,
         conflict_message: str,
+        copy_assets: bool = False,
     ) -> tuple[list[Action], list[Path], list[str]]:
         managed_path_set = {path.resolve(strict=False) for path in managed_paths}
         removable_link_set = {path.resolve(strict=False) for path in removable_links}
@@ -121,25 +177,20 @@ class IAppConfigService(ABC):
         scheduled_removals: set[Path] = set()
 
         for source in sources:
-            target, payload = compile_source(source)
+            relative, payload, findings = self.compile_source(resource, source)
+            replay_lossiness(findings)
+            target = target_dir / relative
             desired_paths.append(target)
-            replaceable_symlink = find_replaceable_symlink_ancestor(target, target_dir)
-            if (
-                replaceable_symlink is not None
-                and replaceable_symlink not in scheduled_removals
-            ):
-                scheduled_removals.add(replaceable_symlink)
-                removable_link_set.add(replaceable_symlink.resolve(strict=False))
-                actions.append(
-                    Action(
-                        kind=ActionKind.REMOVE_SYMLINK,
-                        path=replaceable_symlink,
-                        status=ActionStatus.REMOVE,
-                        detail=f"replace compiled {scope} symlink",
-                        app=app,
-                        scope=scope,
-                    )
+            actions.extend(
+                self._replace_symlink_ancestor(
+                    target,
+                    target_dir,
+                    scope=scope,
+                    app=app,
+                    scheduled_removals=scheduled_removals,
+                    removable_link_set=removable_link_set,
                 )
+            )
             action = plan_compiled_text_action(
                 target=target,
                 payload=payload,
@@ -155,6 +206,100 @@ class IAppConfigService(ABC):
             if action.status == ActionStatus.CONFLICT:
                 skipped.append(conflict_message.format(target=target))
 
+            if not copy_assets:
+                continue
+            for relative in list_skill_assets(source):
+                asset_target = target.parent / relative
+                desired_paths.append(asset_target)
+                asset_action = plan_copied_file_action(
+                    source=source / relative,
+                    target=asset_target,
+                    removable_link_paths=removable_link_set,
+                    scope=scope,
+                    app=app,
+                    create_detail="copy skill asset",
+                    noop_detail="skill asset already up to date",
+                    update_detail="update skill asset",
+                )
+                actions.append(asset_action)
+                if asset_action.status == ActionStatus.CONFLICT:
+                    skipped.append(conflict_message.format(target=asset_target))
+
+        return actions, desired_paths, skipped
+
+    @staticmethod
+    def _replace_symlink_ancestor(
+        target: Path,
+        target_dir: Path,
+        *,
+        scope: str,
+        app: str,
+        scheduled_removals: set[Path],
+        removable_link_set: set[Path],
+    ) -> list[Action]:
+        replaceable_symlink = find_replaceable_symlink_ancestor(target, target_dir)
+        if replaceable_symlink is None or replaceable_symlink in scheduled_removals:
+            return []
+        scheduled_removals.add(replaceable_symlink)
+        removable_link_set.add(replaceable_symlink.resolve(strict=False))
+        return [
+            Action(
+                kind=ActionKind.REMOVE_SYMLINK,
+                path=replaceable_symlink,
+                status=ActionStatus.REMOVE,
+                detail=f"replace compiled {scope} symlink",
+                app=app,
+                scope=scope,
+            )
+        ]
+
+    def _plan_bundled_actions(
+        self,
+        bundle: "ArtifactBundle",
+        resource: str,
+        sources: list[Path],
+        target_dir: Path,
+        scope: str,
+        app: str,
+        managed_paths: list[Path],
+        removable_links: list[Path],
+    ) -> tuple[list[Action], list[Path], list[str]]:
+        removable_link_set = {path.resolve(strict=False) for path in removable_links}
+        actions: list[Action] = []
+        desired_paths: list[Path] = []
+        skipped: list[str] = []
+        scheduled_removals: set[Path] = set()
+
+        for entry in bundle.files(app, resource):
+            target = target_dir / entry.path
+            desired_paths.append(target)
+            actions.extend(
+                self._replace_symlink_ancestor(
+                    target,
+                    target_dir,
+                    scope=scope,
+                    app=app,
+                    scheduled_removals=scheduled_removals,
+                    removable_link_set=removable_link_set,
+                )
+            )
+            action = plan_bundled_file_action(
+                target=target,
+                checksum=entry.sha256,
+                size=entry.size,
+                removable_link_paths=removable_link_set,
+                scope=scope,
+                app=app,
+                create_detail=f"copy bundled {resource} file",
+                noop_detail=f"bundled {resource} file already up to date",
+                update_detail=f"update bundled {resource} file",
+            )
+            if action.status in (ActionStatus.CREATE, ActionStatus.UPDATE):
+                action.source = bundle.extract(entry)
+            actions.append(action)
+            if action.status == ActionStatus.CONFLICT:
+                skipped.append(f"Bundled file conflict (not overwritten): {target}")
+
         return actions, desired_paths, skipped
 
     def _build_compiled_group(
@@ -164,10 +309,7 @@ class IAppConfigService(ABC):
         target_dir: Path,
         scope: str,
         resource_name: str,
-        plan_actions: Callable[
-            [list[Path], Path, str, str, list[Path], list[Path]],
-            tuple[list[Action], list[Path], list[str]],
-        ],
+        plan_actions: PlanCompiledActions,
         managed_links_group: dict[str, Any],
         managed_paths_group: dict[str, Any],
         action_removable_links: list[Path] | None = None,
@@ -220,13 +362,35 @@ class IAppConfigService(ABC):
         common_servers: dict[str, MCPServerDTO],
         agent_sources: list[Path] | None = None,
     ) -> Action:
+        return self.build_config_action(
+            self.config_overlay(common_servers, agent_sources=agent_sources)
+        )
+
+    def config_overlay(
+        self,
+        common_servers: dict[str, MCPServerDTO],
+        agent_sources: list[Path] | None = None,
+    ) -> dict[str, Any]:
+        """What the hub contributes to the app config, as plain JSON data.
+
+        Everything read from hub sources ends up here, so an overlay built on
+        one machine can be merged into the app config on another.
+        """
+        return {"mcp": self.mapper.from_common(common_servers)}
+
+    def merge_config_overlay(
+        self, existing: dict[str, Any], overlay: dict[str, Any]
+    ) -> dict[str, Any]:
+        merged = dict(existing)
+        self.set_mcp_payload(merged, overlay["mcp"])
+        return merged
+
+    def build_config_action(self, overlay: dict[str, Any]) -> Action:
         existing = self.repository.load_config()
         if existing or self.repository.config_path.exists():
             self.validate_config(existing)
 
-        desired_mcp = self.mapper.from_common(common_servers)
-        merged = dict(existing)
-        self.set_mcp_payload(merged, desired_mcp)
+        merged = self.merge_config_overlay(existing, overlay)
         self.validate_config(merged)
 
         return Action(
@@ -243,42 +407,83 @@ class IAppConfigService(ABC):
         common_servers: dict[str, MCPServerDTO],
         source_repository: ISourceRepository,
     ) -> SyncPlan:
+        actions, skipped = self._plan_compiled_outputs(
+            source_repository,
+            skill_sources=source_repository.list_skill_sources(),
+            agent_sources=source_repository.list_agent_sources(),
+            plan_skills=self.plan_skill_actions,
+            plan_agents=self.plan_agent_actions,
+        )
+        return SyncPlan(
+            actions=[
+                self.build_action(
+                    common_servers,
+                    agent_sources=source_repository.list_agent_sources(),
+                ),
+                *actions,
+            ],
+            errors=[],
+            skipped=skipped,
+        )
+
+    def build_bundle_plan(
+        self, bundle: "ArtifactBundle", source_repository: ISourceRepository
+    ) -> SyncPlan:
+        """Plan this app's global outputs from a prebuilt artifact bundle.
+
+        Like ``build_plan``, but skill and agent files are compared with the
+        bundle's checksums and the config is merged from its overlay, so no
+        hub source is read.
+        """
+        actions, skipped = self._plan_compiled_outputs(
+            source_repository,
+            skill_sources=[],
+            agent_sources=[],
+            plan_skills=partial(self._plan_bundled_actions, bundle, "skills"),
+            plan_agents=partial(self._plan_bundled_actions, bundle, "agents"),
+        )
+        return SyncPlan(
+            actions=[
+                self.build_config_action(bundle.config_overlay(self.app_id.value)),
+                *actions,
+            ],
+            errors=[],
+            skipped=skipped,
+        )
+
+    def _plan_compiled_outputs(
+        self,
+        source_repository: ISourceRepository,
+        *,
+        skill_sources: list[Path],
+        agent_sources: list[Path],
+        plan_skills: PlanCompiledActions,
+        plan_agents: PlanCompiledActions,
+    ) -> tuple[list[Action], list[str]]:
         state = source_repository.load_state()
         managed_links_group = self._normalize_managed_group(state.get("managed_links"))
         managed_paths_group = self._normalize_managed_group(state.get("managed_paths"))
-        skill_scope = app_scope(self.app_id, "skills")
         agent_scope = app_scope(self.app_id, "agents")
 
         skill_actions, skill_skipped = self._build_compiled_group(
-            sources=source_repository.list_skill_sources(),
+            sources=skill_sources,
             target_dir=self.repository.skills_dir,
-            scope=skill_scope,
+            scope=app_scope(self.app_id, "skills"),
             resource_name="skill",
-            plan_actions=self.plan_skill_actions,
+            plan_actions=plan_skills,
             managed_links_group=managed_links_group,
             managed_paths_group=managed_paths_group,
         )
         agent_actions, agent_skipped = self._build_compiled_group(
-            sources=source_repository.list_agent_sources(),
+            sources=agent_sources,
             target_dir=self.repository.agents_dir,
             scope=agent_scope,
             resource_name="agent",
-            plan_actions=self.plan_agent_actions,
+            plan_actions=plan_agents,
             managed_links_group=managed_links_group,
             managed_paths_group=managed_paths_group,
             action_removable_links=self.agent_action_removable_links(
                 load_state_links(managed_links_group, agent_scope)
             ),
         )
-        return SyncPlan(
-            actions=[
-                self.build_action(
-                    common_servers,
-                    agent_sources=source_repository.list_agent_sources(),
-                ),
-                *skill_actions,
-                *agent_actions,
-            ],
-            errors=[],
-            skipped=[*skill_skipped, *agent_skipped],
-        )
+        return [*skill_actions, *agent_actions], [*skill_skipped, *agent_skipped]
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from jsonschema import Draft202012Validator
 
@@ -18,11 +18,15 @@ from code_agnostic.agents.parser import parse_agent
 from code_agnostic.apps.cursor.config_repository import CursorConfigRepository
 from code_agnostic.apps.cursor.mapper import CursorMCPMapper
 from code_agnostic.apps.cursor.schema_repository import CursorSchemaRepository
+from code_agnostic.constants import CURSOR_PROJECT_DIRNAME
 from code_agnostic.errors import InvalidConfigSchemaError
 from code_agnostic.models import Action, ActionKind, ActionStatus
 from code_agnostic.skills.compilers import CursorSkillCompiler
 from code_agnostic.skills.parser import parse_skill
 
+if TYPE_CHECKING:
+    from code_agnostic.core.repository import CoreRepository
+
 
 class CursorConfigService(RegisteredAppConfigService):
     APP_ID = AppId.CURSOR
@@ -48,6 +52,16 @@ class CursorConfigService(RegisteredAppConfigService):
             schema_repository=CursorSchemaRepository(),
         )
 
+    @classmethod
+    def create_for_home(
+        cls, home: Path, core: "CoreRepository"
+    ) -> "CursorConfigService":
+        return cls(
+            repository=CursorConfigRepository(root=home / CURSOR_PROJECT_DIRNAME),
+            mapper=CursorMCPMapper(),
+            schema_repository=CursorSchemaRepository(),
+        )
+
     @property
     def app_id(self) -> AppId:
         return self.APP_ID
@@ -103,6 +117,15 @@ class CursorConfigService(RegisteredAppConfigService):
     def agent_action_removable_links(self, removable_links: list[Path]) -> list[Path]:
         return removable_links
 
+    def compile_skill_source(self, source: Path) -> tuple[Path, str]:
+        skill_md = source / "SKILL.md"
+        skill = parse_skill(skill_md if skill_md.exists() else source)
+        return Path(source.name) / "SKILL.md", CursorSkillCompiler().compile(skill)
+
+    def compile_agent_source(self, source: Path) -> tuple[Path, str]:
+        target_name = source.name if source.is_file() else f"{source.name}.md"
+        return Path(target_name), CursorAgentCompiler().compile(parse_agent(source))
+
     def plan_skill_actions(
         self,
         sources: list[Path],
@@ -112,7 +135,6 @@ class CursorConfigService(RegisteredAppConfigService):
         managed_paths: list[Path],
         removable_links: list[Path],
     ) -> tuple[list[Action], list[Path], list[str]]:
-        compiler = CursorSkillCompiler()
         return self._plan_compiled_text_actions(
             sources=sources,
             target_dir=target_dir,
@@ -120,20 +142,12 @@ class CursorConfigService(RegisteredAppConfigService):
             app=app,
             managed_paths=managed_paths,
             removable_links=removable_links,
-            compile_source=lambda source: (
-                target_dir / source.name / "SKILL.md",
-                compiler.compile(
-                    parse_skill(
-                        source / "SKILL.md"
-                        if (source / "SKILL.md").exists()
-                        else source
-                    )
-                ),
-            ),
+            resource="skill",
             create_detail="create compiled cursor skill",
             noop_detail="compiled cursor skill already up to date",
             update_detail="update compiled cursor skill",
             conflict_message="Cursor skill sync skipped (conflict): {target}",
+            copy_assets=True,
         )
 
     def plan_agent_actions(
@@ -145,7 +159,6 @@ class CursorConfigService(RegisteredAppConfigService):
         managed_paths: list[Path],
         removable_links: list[Path],
     ) -> tuple[list[Action], list[Path], list[str]]:
-        compiler = CursorAgentCompiler()
         return self._plan_compiled_text_actions(
             sources=sources,
             target_dir=target_dir,
@@ -153,10 +166,7 @@ class CursorConfigService(RegisteredAppConfigService):
             app=app,
             managed_paths=managed_paths,
             removable_links=removable_links,
-            compile_source=lambda source: (
-                target_dir / (source.name if source.is_file() else f"{source.name}.md"),
-                compiler.compile(parse_agent(source)),
-            ),
+            resource="agent",
             create_detail="create compiled cursor agent",
             noop_detail="compiled cursor agent already up to date",
             update_detail="update compiled cursor agent",
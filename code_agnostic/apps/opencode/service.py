@@ -84,6 +84,17 @@ class OpenCodeConfigService(RegisteredAppConfigService):
             base_config_path=core.opencode_base_path,
         )
 
+    @classmethod
+    def create_for_home(
+        cls, home: Path, core: CoreRepository
+    ) -> "OpenCodeConfigService":
+        return cls(
+            repository=OpenCodeConfigRepository(root=home / ".config" / "opencode"),
+            mapper=OpenCodeMCPMapper(),
+            schema_repository=OpenCodeSchemaRepository(),
+            base_config_path=core.opencode_base_path,
+        )
+
     @property
     def app_id(self) -> AppId:
         return self.APP_ID
@@ -130,36 +141,37 @@ class OpenCodeConfigService(RegisteredAppConfigService):
             )
         return payload
 
-    def build_action(
+    def config_overlay(
         self,
         common_servers: dict[str, MCPServerDTO],
         agent_sources: list[Path] | None = None,
-    ) -> Action:
-        existing = self._opencode_repo.load_config()
-        if existing or self._opencode_repo.config_path.exists():
-            self.validate_config(existing)
+    ) -> dict[str, Any]:
+        return {
+            "mcp": self.mapper.from_common(common_servers),
+            "base": (
+                self._load_base_config() if self._base_config_path is not None else None
+            ),
+        }
+
+    def merge_config_overlay(
+        self, existing: dict[str, Any], overlay: dict[str, Any]
+    ) -> dict[str, Any]:
+        if overlay["base"] is not None:
+            return self._opencode_repo.merge_config(
+                existing, overlay["base"], overlay["mcp"]
+            )
+        merged = dict(existing)
+        self.set_mcp_payload(merged, overlay["mcp"])
+        return merged
 
-        desired_mcp = self.mapper.from_common(common_servers)
+    def compile_skill_source(self, source: Path) -> tuple[Path, str]:
+        skill_md = source / "SKILL.md"
+        skill = parse_skill(skill_md if skill_md.exists() else source)
+        return Path(source.name) / "SKILL.md", OpenCodeSkillCompiler().compile(skill)
 
-        if self._base_config_path is not None:
-            opencode_base = self._load_base_config()
-            merged = self._opencode_repo.merge_config(
-                existing, opencode_base, desired_mcp
-            )
-        else:
-            merged = dict(existing)
-            self.set_mcp_payload(merged, desired_mcp)
-
-        self.validate_config(merged)
-
-        return Action(
-            kind=self.action_kind,
-            path=self.repository.config_path,
-            status=self.derive_status(existing, merged),
-            detail=f"sync {self.app_id.value} config from common mcp base",
-            payload=self.build_action_payload(merged),
-            app=self.app_id.value,
-        )
+    def compile_agent_source(self, source: Path) -> tuple[Path, str]:
+        target_name = f"{source.name}.md" if source.is_dir() else source.name
+        return Path(target_name), OpenCodeAgentCompiler().compile(parse_agent(source))
 
     def plan_skill_actions(
         self,
@@ -170,7 +182,6 @@ class OpenCodeConfigService(RegisteredAppConfigService):
         managed_paths: list[Path],
         removable_links: list[Path],
     ) -> tuple[list[Action], list[Path], list[str]]:
-        compiler = OpenCodeSkillCompiler()
         return self._plan_compiled_text_actions(
             sources=sources,
             target_dir=target_dir,
@@ -178,20 +189,12 @@ class OpenCodeConfigService(RegisteredAppConfigService):
             app=app,
             managed_paths=managed_paths,
             removable_links=removable_links,
-            compile_source=lambda source: (
-                target_dir / source.name / "SKILL.md",
-                compiler.compile(
-                    parse_skill(
-                        source / "SKILL.md"
-                        if (source / "SKILL.md").exists()
-                        else source
-                    )
-                ),
-            ),
+            resource="skill",
             create_detail="create compiled opencode skill",
             noop_detail="compiled opencode skill already up to date",
             update_detail="update compiled opencode skill",
             conflict_message="OpenCode skill sync skipped (conflict): {target}",
+            copy_assets=True,
         )
 
     def plan_agent_actions(
@@ -203,7 +206,6 @@ class OpenCodeConfigService(RegisteredAppConfigService):
         managed_paths: list[Path],
         removable_links: list[Path],
     ) -> tuple[list[Action], list[Path], list[str]]:
-        compiler = OpenCodeAgentCompiler()
         return self._plan_compiled_text_actions(
             sources=sources,
             target_dir=target_dir,
@@ -211,10 +213,7 @@ class OpenCodeConfigService(RegisteredAppConfigService):
             app=app,
             managed_paths=managed_paths,
             removable_links=removable_links,
-            compile_source=lambda source: (
-                target_dir / (f"{source.name}.md" if source.is_dir() else source.name),
-                compiler.compile(parse_agent(source)),
-            ),
+            resource="agent",
             create_detail="create compiled opencode agent",
             noop_detail="compiled opencode agent already up to date",
             update_detail="update compiled opencode agent",
@@ -0,0 +1,154 @@
+"""Run many hub mutations in one process with one load and one write per file."""
+
+from __future__ import annotations
+
+import io
+import json
+import shlex
+from collections.abc import Iterable
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import dataclass, field
+from typing import Any
+
+import click
+
+from code_agnostic.utils import batched_json_writes
+
+PROG_NAME = "code-agnostic"
+
+# Only groups whose commands touch hub JSON through read_json_safe/write_json
+# are safe to buffer; sync commands read and write targets directly.
+BATCH_GROUPS: frozenset[str] = frozenset(
+    {"agents", "apps", "mcp", "rules", "skills", "workspaces"}
+)
+
+
+@dataclass(frozen=True)
+class BatchCommand:
+    line: int
+    argv: list[str]
+
+
+@dataclass(frozen=True)
+class BatchCommandResult:
+    line: int
+    argv: list[str]
+    ok: bool
+    output: str = ""
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "line": self.line,
+            "args": self.argv,
+            "ok": self.ok,
+            "output": self.output,
+            "error": self.error,
+        }
+
+
+@dataclass
+class BatchReport:
+    results: list[BatchCommandResult] = field(default_factory=list)
+    files_loaded: int = 0
+    files_written: int = 0
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for result in self.results if not result.ok)
+
+
+def parse_batch_script(lines: Iterable[str]) -> list[BatchCommand]:
+    """Parse shell-style lines or JSONL (an args array or an object) into commands."""
+    commands: list[BatchCommand] = []
+    for number, raw in enumerate(lines, start=1):
+        text = raw.strip()
+        if not text or text.startswith("#"):
+            continue
+        try:
+            argv = _parse_line(text)
+        except ValueError as exc:
+            raise ValueError(f"line {number}: {exc}") from exc
+        if argv and argv[0] == PROG_NAME:
+            argv = argv[1:]
+        if not argv:
+            continue
+        commands.append(BatchCommand(line=number, argv=argv))
+    return commands
+
+
+def _parse_line(text: str) -> list[str]:
+    if text[0] not in "[{":
+        return shlex.split(text)
+    payload = json.loads(text)
+    if isinstance(payload, dict):
+        if isinstance(payload.get("args"), list):
+            payload = payload["args"]
+        elif isinstance(payload.get("command"), str):
+            return shlex.split(payload["command"])
+        else:
+            raise ValueError("JSON object needs an 'args' list or 'command' string")
+    if not isinstance(payload, list) or not all(
+        isinstance(item, (str, int, float)) for item in payload
+    ):
+        raise ValueError("JSON args must be a list of strings")
+    return [str(item) for item in payload]
+
+
+def run_batch(
+    group: click.Group,
+    commands: Iterable[BatchCommand],
+    *,
+    stop_on_error: bool = False,
+) -> BatchReport:
+    report = BatchReport()
+    with batched_json_writes() as buffer:
+        for command in commands:
+            result = _run_command(group, command)
+            report.results.append(result)
+            if stop_on_error and not result.ok:
+                break
+    report.files_loaded = buffer.loads
+    report.files_written = buffer.writes
+    return report
+
+
+def _run_command(group: click.Group, command: BatchCommand) -> BatchCommandResult:
+    ctx = click.Context(group, info_name=PROG_NAME)
+    resolved = group.get_command(ctx, command.argv[0])
+    if resolved is None or resolved.name not in BATCH_GROUPS:
+        return BatchCommandResult(
+            line=command.line,
+            argv=command.argv,
+            ok=False,
+            error=f"Command not supported in batch mode: {command.argv[0]}",
+        )
+
+    captured = io.StringIO()
+    error: str | None = None
+    try:
+        with redirect_stdout(captured), redirect_stderr(captured):
+            exit_code = group.main(
+                args=list(command.argv),
+                prog_name=PROG_NAME,
+                standalone_mode=False,
+            )
+        if isinstance(exit_code, int) and exit_code != 0:
+            error = f"exited with status {exit_code}"
+    except click.ClickException as exc:
+        error = exc.format_message()
+    except click.exceptions.Exit as exc:
+        if exc.exit_code:
+            error = f"exited with status {exc.exit_code}"
+    except click.Abort:
+        error = "aborted"
+    except Exception as exc:
+        error = str(exc) or type(exc).__name__
+
+    return BatchCommandResult(
+        line=command.line,
+        argv=command.argv,
+        ok=error is None,
+        output=captured.getvalue().strip(),
+        error=error,
+    )
@@ -0,0 +1,381 @@
+"""Prebuilt artifact bundles: compile the hub once, apply it anywhere.
+
+``BundleBuilder`` compiles the hub's global skills and agents for each app
+and writes them to a tar archive. The archive also holds each app's config
+overlay: its MCP servers and base config, already mapped for the app. A
+``manifest.json`` member comes first. It lists every file by app, resource,
+path relative to the app's skills or agents dir, and sha256.
+
+Applying a bundle plans from that manifest alone. Each target is hashed
+and compared with its checksum, and only members whose target differs are
+extracted and copied into place. No hub source is parsed. Workspaces are
+left out, as in ``fleet``: their repos live at machine-specific paths.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import tarfile
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path, PurePosixPath
+from typing import Any, BinaryIO, Literal
+
+from code_agnostic import __version__
+from code_agnostic.apps.common.compiled_planning import list_skill_assets
+from code_agnostic.apps.common.interfaces.repositories import ISourceRepository
+from code_agnostic.apps.common.interfaces.service import IAppConfigService
+from code_agnostic.apps.common.utils import common_mcp_to_dto
+from code_agnostic.errors import InvalidBundleError, SyncAppError
+from code_agnostic.lossiness import (
+    LossinessFinding,
+    collect_lossiness,
+    hub_findings,
+    replay_lossiness,
+)
+from code_agnostic.models import SyncPlan
+
+BUNDLE_FORMAT = 1
+MANIFEST_MEMBER = "manifest.json"
+BUNDLE_RESOURCES = ("skills", "agents")
+_FILES_PREFIX = "files"
+_WriteMode = Literal["w", "w:gz", "w:bz2", "w:xz"]
+_WRITE_MODES: dict[str, _WriteMode] = {
+    ".gz": "w:gz",
+    ".tgz": "w:gz",
+    ".bz2": "w:bz2",
+    ".xz": "w:xz",
+}
+
+
+@dataclass(frozen=True)
+class BundleFile:
+    app: str
+    resource: str
+    # Relative to the app's skills or agents dir, in POSIX form.
+    path: str
+    sha256: str
+    size: int
+
+    @property
+    def member(self) -> str:
+        return f"{_FILES_PREFIX}/{self.app}/{self.resource}/{self.path}"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "app": self.app,
+            "resource": self.resource,
+            "path": self.path,
+            "sha256": self.sha256,
+            "size": self.size,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> BundleFile:
+        return cls(
+            app=str(payload["app"]),
+            resource=str(payload["resource"]),
+            path=str(payload["path"]),
+            sha256=str(payload["sha256"]),
+            size=int(payload["size"]),
+        )
+
+
+@dataclass(frozen=True)
+class BundleSummary:
+    path: Path
+    apps: list[str]
+    files: int
+    size: int
+
+
+def _is_safe_relative(path: str) -> bool:
+    relative = PurePosixPath(path)
+    if not relative.parts or relative.is_absolute():
+        return False
+    return ".." not in relative.parts
+
+
+def _write_mode(path: Path) -> _WriteMode:
+    return _WRITE_MODES.get(path.suffix.lower(), "w")
+
+
+class BundleBuilder:
+    """Compile the hub's global outputs for each app into one bundle."""
+
+    def __init__(
+        self, core: ISourceRepository, app_services: list[IAppConfigService]
+    ) -> None:
+        self.core = core
+        self.app_services = app_services
+
+    def build(self, out: Path) -> BundleSummary:
+        mcp_base = self.core.load_mcp_base()
+        desired_common = common_mcp_to_dto(mcp_base.get("mcpServers", {}))
+        skill_sources = self.core.list_skill_sources()
+        agent_sources = self.core.list_agent_sources()
+
+        configs: dict[str, dict[str, Any]] = {}
+        members: dict[str, tuple[BundleFile, bytes | Path]] = {}
+        with collect_lossiness() as findings:
+            for service in self.app_services:
+                app = service.app_id.value
+                configs[app] = service.config_overlay(
+                    desired_common, agent_sources=agent_sources
+                )
+                for source in skill_sources:
+                    relative = self._add_compiled(members, service, "skill", source)
+                    # Skill assets ship beside the compiled SKILL.md.
+                    for asset in list_skill_assets(source):
+                        self._add(
+                            members,
+                            app,
+                            "skills",
+                            relative.parent / asset,
+                            source / asset,
+                        )
+                for source in agent_sources:
+                    self._add_compiled(members, service, "agent", source)
+
+        apps = sorted(configs)
+        lossiness = [
+            item.to_dict()
+            for item in hub_findings(findings, self.core.root)
+            if item.app in configs
+        ]
+        entries = [members[name] for name in sorted(members)]
+        manifest = {
+            "format": BUNDLE_FORMAT,
+            "version": __version__,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "apps": apps,
+            "configs": configs,
+            "files": [entry.to_dict() for entry, _ in entries],
+            "lossiness": lossiness,
+        }
+        self._write(out, manifest, entries)
+        return BundleSummary(
+            path=out,
+            apps=apps,
+            files=len(entries),
+            size=out.stat().st_size,
+        )
+
+    def _add_compiled(
+        self,
+        members: dict[str, tuple[BundleFile, bytes | Path]],
+        service: IAppConfigService,
+        resource: str,
+        source: Path,
+    ) -> Path:
+        relative, payload, findings = service.compile_source(resource, source)
+        replay_lossiness(findings)
+        self._add(
+            members,
+            service.app_id.value,
+            f"{resource}s",
+            relative,
+            payload.encode("utf-8"),
+        )
+        return relative
+
+    @staticmethod
+    def _add(
+        members: dict[str, tuple[BundleFile, bytes | Path]],
+        app: str,
+        resource: str,
+        relative: Path,
+        content: bytes | Path,
+    ) -> None:
+        digest = hashlib.sha256()
+        if isinstance(content, bytes):
+            digest.update(content)
+            size = len(content)
+        else:
+            with content.open("rb") as handle:
+                for block in iter(lambda: handle.read(1 << 20), b""):
+                    digest.update(block)
+            size = content.stat().st_size
+        entry = BundleFile(
+            app=app,
+            resource=resource,
+            path=relative.as_posix(),
+            sha256=digest.hexdigest(),
+            size=size,
+        )
+        members[entry.member] = (entry, content)
+
+    @staticmethod
+    def _write(
+        out: Path,
+        manifest: dict[str, Any],
+        entries: list[tuple[BundleFile, bytes | Path]],
+    ) -> None:
+        mtime = int(time.time())
+
+        def add(
+            archive: tarfile.TarFile,
+            name: str,
+            size: int,
+            data: BinaryIO,
+            mode: int = 0o644,
+        ) -> None:
+            info = tarfile.TarInfo(name)
+            info.size = size
+            info.mtime = mtime
+            info.mode = mode
+            archive.addfile(info, data)
+
+        out.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = out.with_name(f".{out.name}.partial")
+        try:
+            with tarfile.open(partial_path, _write_mode(out)) as archive:
+                # Key order is kept: it is the order app configs are written in.
+                payload = json.dumps(manifest, indent=2).encode()
+                add(archive, MANIFEST_MEMBER, len(payload), io.BytesIO(payload))
+                for entry, content in entries:
+                    if isinstance(content, bytes):
+                        add(archive, entry.member, entry.size, io.BytesIO(content))
+                        continue
+                    # Assets keep their permission bits, e.g. executable scripts.
+                    mode = content.stat().st_mode & 0o777
+                    with content.open("rb") as handle:
+                        add(archive, entry.member, entry.size, handle, mode)
+            os.replace(partial_path, out)
+        finally:
+            partial_path.unlink(missing_ok=True)
+
+
+class ArtifactBundle:
+    """An opened bundle; members are extracted only when asked for."""
+
+    def __init__(
+        self,
+        path: Path,
+        archive: tarfile.TarFile,
+        manifest: dict[str, Any],
+        extract_dir: Path,
+    ) -> None:
+        self.path = path
+        self._archive = archive
+        self._manifest = manifest
+        self._extract_dir = extract_dir
+        self._files: dict[tuple[str, str], list[BundleFile]] = {}
+        for item in manifest.get("files", []):
+            try:
+                entry = BundleFile.from_dict(item)
+            except (KeyError, TypeError, ValueError) as exc:
+                raise InvalidBundleError(path, f"malformed file entry ({exc})")
+            # Members are extracted by name, so none may leave the scratch dir.
+            if entry.resource not in BUNDLE_RESOURCES or not _is_safe_relative(
+                entry.member
+            ):
+                raise InvalidBundleError(path, f"unsafe file entry {entry.member}")
+            self._files.setdefault((entry.app, entry.resource), []).append(entry)
+
+    @property
+    def apps(self) -> list[str]:
+        return list(self._manifest["apps"])
+
+    def files(self, app: str, resource: str) -> list[BundleFile]:
+        return self._files.get((app, resource), [])
+
+    def config_overlay(self, app: str) -> dict[str, Any]:
+        return self._manifest["configs"][app]
+
+    def lossiness(self, app: str) -> list[LossinessFinding]:
+        return [
+            LossinessFinding.from_dict(item)
+            for item in self._manifest.get("lossiness", [])
+            if item.get("app") == app
+        ]
+
+    def extract(self, entry: BundleFile) -> Path:
+        """Stream one member to the scratch dir, checked against the manifest."""
+        try:
+            member = self._archive.getmember(entry.member)
+        except KeyError:
+            raise InvalidBundleError(self.path, f"missing member {entry.member}")
+        handle = self._archive.extractfile(member) if member.isfile() else None
+        if handle is None:
+            raise InvalidBundleError(self.path, f"{entry.member} is not a file")
+        target = self._extract_dir / entry.member
+        target.parent.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        with handle, target.open("wb") as out:
+            for block in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(block)
+                out.write(block)
+        if digest.hexdigest() != entry.sha256:
+            raise InvalidBundleError(self.path, f"checksum mismatch for {entry.member}")
+        os.chmod(target, member.mode & 0o777)
+        mtime_ns = int(member.mtime * 10**9)
+        os.utime(target, ns=(mtime_ns, mtime_ns))
+        return target
+
+
+@contextmanager
+def open_bundle(path: Path) -> Iterator[ArtifactBundle]:
+    """Open a bundle; extracted members live until the block exits."""
+    try:
+        archive = tarfile.open(path, "r:*")
+    except (OSError, tarfile.TarError) as exc:
+        raise InvalidBundleError(path, str(exc))
+    scratch = tempfile.TemporaryDirectory(prefix="code-agnostic-bundle-")
+    with archive, scratch as tmp:
+        try:
+            handle = archive.extractfile(MANIFEST_MEMBER)
+            manifest = json.load(handle) if handle is not None else None
+        except (KeyError, tarfile.TarError, ValueError) as exc:
+            raise InvalidBundleError(path, f"unreadable manifest ({exc})")
+        if not isinstance(manifest, dict):
+            raise InvalidBundleError(path, "manifest must be a JSON object")
+        if manifest.get("format") != BUNDLE_FORMAT:
+            raise InvalidBundleError(
+                path, f"unsupported bundle format {manifest.get('format')!r}"
+            )
+        apps = manifest.get("apps")
+        if not isinstance(apps, list) or not all(isinstance(a, str) for a in apps):
+            raise InvalidBundleError(path, "manifest apps must be a list of names")
+        configs = manifest.get("configs")
+        if not isinstance(configs, dict):
+            raise InvalidBundleError(path, "manifest configs must be a JSON object")
+        for app in apps:
+            if not isinstance(configs.get(app), dict):
+                raise InvalidBundleError(path, f"manifest has no config for {app}")
+        yield ArtifactBundle(path, archive, manifest, Path(tmp))
+
+
+class BundlePlanner:
+    """Plan the apps' global outputs from a bundle instead of hub sources."""
+
+    def __init__(
+        self,
+        core: ISourceRepository,
+        app_services: list[IAppConfigService],
+        bundle: ArtifactBundle,
+    ) -> None:
+        self.core = core
+        self.app_services = app_services
+        self.bundle = bundle
+
+    def iter_plan(self) -> Iterator[SyncPlan]:
+        for service in self.app_services:
+            app = service.app_id.value
+            if app not in self.bundle.apps:
+                yield SyncPlan([], [], [f"Bundle has no artifacts for {app}."])
+                continue
+            try:
+                plan = service.build_bundle_plan(self.bundle, self.core)
+            except SyncAppError as exc:
+                yield SyncPlan(actions=[], errors=[exc], skipped=[])
+                continue
+            plan.lossiness = self.bundle.lossiness(app)
+            yield plan
@@ -0,0 +1,99 @@
+"""Process-local caches that keep planning inputs warm between runs."""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from code_agnostic.core.repository import CoreRepository
+from code_agnostic.repo_selection import RepoSelection
+from code_agnostic.source_cache import FileStamp, file_stamp
+from code_agnostic.workspaces import WorkspaceService
+
+
+class CachingWorkspaceService(WorkspaceService):
+    """WorkspaceService that remembers repo discovery per workspace path.
+
+    Discovery is reused while every directory the walk listed keeps its
+    stamp: adding, removing or renaming a repo (or its ``.git``) changes the
+    mtime of the directory holding it. Revalidating stats those directories
+    instead of listing them and probing each for ``.git``. ``max_age`` opts
+    into trusting a result for that many seconds without any stat.
+    """
+
+    def __init__(self, max_age: float | None = None) -> None:
+        self.max_age = max_age
+        self._repos: dict[
+            tuple[Path, RepoSelection | None],
+            tuple[float, tuple[tuple[Path, FileStamp | None], ...], list[Path]],
+        ] = {}
+        self._lock = threading.Lock()
+
+    def discover_git_repos(
+        self, workspace_path: Path, selection: RepoSelection | None = None
+    ) -> list[Path]:
+        key = (workspace_path.resolve(), selection)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._repos.get(key)
+        if cached is not None:
+            taken, stamps, repos = cached
+            if self.max_age is not None and now - taken < self.max_age:
+                return list(repos)
+            if all(file_stamp(path) == stamp for path, stamp in stamps):
+                return list(repos)
+
+        repos, walked = self._walk_git_repos(workspace_path, selection)
+        stamps = tuple((path, file_stamp(path)) for path in walked)
+        with self._lock:
+            self._repos[key] = (now, stamps, repos)
+        return list(repos)
+
+    def invalidate(self, workspace_path: Path | None = None) -> None:
+        with self._lock:
+            if workspace_path is None:
+                self._repos.clear()
+                return
+            resolved = workspace_path.resolve()
+            for key in [key for key in self._repos if key[0] == resolved]:
+                del self._repos[key]
+
+
+class CachingCoreRepository(CoreRepository):
+    """CoreRepository that reuses the workspace registry and MCP base until they change."""
+
+    def __init__(self, root: Path | None = None) -> None:
+        super().__init__(root)
+        self._workspaces: tuple[Any, list[dict[str, str]]] | None = None
+        self._mcp_base: tuple[Any, dict[str, Any]] | None = None
+        self._lock = threading.Lock()
+
+    def load_workspaces(self) -> list[dict[str, str]]:
+        stamp = file_stamp(self.workspaces_path)
+        with self._lock:
+            cached = self._workspaces
+        if cached is not None and cached[0] == stamp:
+            return [dict(item) for item in cached[1]]
+        workspaces = super().load_workspaces()
+        with self._lock:
+            self._workspaces = (stamp, workspaces)
+        return [dict(item) for item in workspaces]
+
+    def load_mcp_base(self) -> dict[str, Any]:
+        stamp = (file_stamp(self.mcp_base_path), file_stamp(self.mcp_base_yaml_path))
+        with self._lock:
+            cached = self._mcp_base
+        if cached is not None and cached[0] == stamp:
+            return copy.deepcopy(cached[1])
+        payload = super().load_mcp_base()
+        with self._lock:
+            self._mcp_base = (stamp, payload)
+        return copy.deepcopy(payload)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._workspaces = None
+            self._mcp_base = None
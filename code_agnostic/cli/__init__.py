@@ -2,7 +2,6 @@
 
 from code_agnostic.cli.aliases import AliasedGroup
 from code_agnostic.cli.helpers import (
-    ensure_exclude_entries,
     require_workspace_entry,
     status_row_for_app,
     workspace_config_root,
@@ -14,6 +13,7 @@ from code_agnostic.cli.options import (
     verbose_option,
     workspace_option,
 )
+from code_agnostic.git_exclude_service import ensure_exclude_entries
 
 __all__ = [
     "AliasedGroup",
@@ -9,6 +9,7 @@ class AliasedGroup(click.Group):
     ALIASES: dict[str, str] = {
         "app": "apps",
         "workspace": "workspaces",
+        "revision": "revisions",
     }
 
     def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
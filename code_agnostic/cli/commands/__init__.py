@@ -4,15 +4,18 @@ from code_agnostic.cli.commands import (
     agents,
     apps,
     apply,
+    batch,
     explain_lossiness,
     import_,
     mcp,
     plan,
     restore,
     rules,
+    serve,
     skills,
     status,
     validate,
+    watch,
     workspaces,
 )
 
@@ -20,14 +23,17 @@ __all__ = [
     "agents",
     "apps",
     "apply",
+    "batch",
     "explain_lossiness",
     "import_",
     "mcp",
     "plan",
     "restore",
     "rules",
+    "serve",
     "skills",
     "status",
     "validate",
+    "watch",
     "workspaces",
 ]
@@ -1,42 +1,193 @@
 """Apply command."""
 
+from pathlib import Path
+
 import click
 from rich.console import Console
 
 from code_agnostic.apps.apps_service import AppsService
-from code_agnostic.cli.options import app_option, verbose_option
+from code_agnostic.bundle import open_bundle
+from code_agnostic.cli.helpers import (
+    content_store_for,
+    daemon_call,
+    plan_selection_kwargs,
+)
+from code_agnostic.cli.options import (
+    app_option,
+    compile_processes_option,
+    durability_option,
+    fanout_option,
+    metrics_option,
+    plan_selection_options,
+    plan_view_kwargs,
+    plan_view_options,
+    verbose_option,
+)
+from code_agnostic.content_store import use_content_store
 from code_agnostic.core.repository import CoreRepository
+from code_agnostic.daemon import plan_from_payload
+from code_agnostic.durability import DEFAULT_DURABILITY
+from code_agnostic.executor import summarize_outcomes
+from code_agnostic.git_exclude_service import GitExcludeStage
+from code_agnostic.run_history import record_run
+from code_agnostic.source_cache import SourceCache, use_source_cache
 from code_agnostic.tui import SyncConsoleUI
 
 
 @click.command(help="Apply planned sync changes.")
 @app_option()
+@plan_selection_options()
 @verbose_option()
+@plan_view_options()
+@fanout_option()
+@compile_processes_option()
+@durability_option()
+@click.option(
+    "--continue-on-error",
+    is_flag=True,
+    default=False,
+    help=(
+        "Keep applying the remaining roots (global, each workspace) after one "
+        "fails; every root commits or rolls back on its own."
+    ),
+)
+@click.option(
+    "--git-exclude",
+    "git_exclude",
+    is_flag=True,
+    default=False,
+    help=(
+        "Also add managed paths to each planned repo's .git/info/exclude, "
+        "recording the additions in the workspace revision."
+    ),
+)
+@click.option(
+    "--from-bundle",
+    "from_bundle",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help=(
+        "Apply global outputs from a prebuilt bundle (see build), comparing "
+        "checksums instead of compiling hub sources."
+    ),
+)
+@metrics_option()
 @click.pass_obj
-def apply(obj: dict[str, str], app: str, verbose: bool) -> None:
+def apply(
+    obj: dict[str, str],
+    app: str,
+    workspace: str | None,
+    repo: Path | None,
+    scopes: tuple[str, ...],
+    verbose: bool,
+    show: tuple[str, ...],
+    group_by: tuple[str, ...] | None,
+    pager: bool,
+    fanout: str,
+    compile_processes: int | None,
+    durability: str,
+    continue_on_error: bool,
+    git_exclude: bool,
+    from_bundle: Path | None,
+    metrics_textfile: Path | None,
+) -> None:
     target = app or "all"
+    view = plan_view_kwargs(show, group_by, pager)
     ui = SyncConsoleUI(Console())
     core = CoreRepository()
-    apps = AppsService(core)
-
-    try:
-        scoped_plan = apps.plan_for_target(target)
-    except Exception as exc:
-        raise click.ClickException(f"Fatal: {exc}")
+    store = content_store_for(core, fanout)
+    selection = plan_selection_kwargs(core, workspace, repo, scopes)
+    if from_bundle is not None and (
+        selection or store is not None or compile_processes is not None or git_exclude
+    ):
+        raise click.UsageError(
+            "--from-bundle applies global app outputs only; it cannot be combined "
+            "with workspace/repo/scope selection, --fanout, --compile-processes "
+            "or --git-exclude."
+        )
 
-    ui.render_plan(scoped_plan, mode=f"apply:{target.lower()}", verbose=verbose)
+    with record_run(
+        core.root, "apply", target=target, metrics_path=metrics_textfile
+    ) as run:
+        # The daemon applies everything in copy mode with default durability and
+        # stops at the first failing root; anything else runs in-process.
+        in_process = (
+            store is not None
+            or bool(selection)
+            or continue_on_error
+            or git_exclude
+            or durability != DEFAULT_DURABILITY
+            or compile_processes is not None
+            or from_bundle is not None
+        )
+        with run.phase("apply"):
+            remote = None if in_process else daemon_call(core, "apply", target=target)
+        if remote is not None:
+            run.set_remote(remote)
+            scoped_plan = plan_from_payload(remote["plan"])
+            run.set_plan(scoped_plan)
+            ui.render_plan(
+                scoped_plan, mode=f"apply:{target.lower()}", verbose=verbose, **view
+            )
+            if scoped_plan.errors:
+                raise click.ClickException(
+                    "Apply aborted due to planning/parsing errors above."
+                )
+            ui.render_apply_result(
+                remote["applied"], remote["failed"], remote["failures"]
+            )
+            if remote["failed"]:
+                raise click.exceptions.Exit(1)
+            return
 
-    if not scoped_plan.actions and not scoped_plan.errors:
-        ui.render_apply_result(applied=0, failed=0, failures=[])
-        return
+        apps = AppsService(core)
+        cache = SourceCache()
+        try:
+            with use_content_store(store), use_source_cache(cache), run.phase("plan"):
+                if from_bundle is not None:
+                    # Extracted members must outlive planning, until applied.
+                    bundle = click.get_current_context().with_resource(
+                        open_bundle(from_bundle)
+                    )
+                    scoped_plan = apps.plan_from_bundle(target, bundle)
+                else:
+                    scoped_plan = apps.plan_for_target(
+                        target, compile_processes=compile_processes, **selection
+                    )
+        except Exception as exc:
+            raise click.ClickException(f"Fatal: {exc}")
+        run.set_plan(scoped_plan)
+        run.set_cache(cache.stats())
 
-    if scoped_plan.errors:
-        raise click.ClickException(
-            "Apply aborted due to planning/parsing errors above."
+        ui.render_plan(
+            scoped_plan, mode=f"apply:{target.lower()}", verbose=verbose, **view
         )
 
-    applied, failed, failures = apps.execute_plan(scoped_plan)
-    ui.render_apply_result(applied, failed, failures)
+        if not scoped_plan.actions and not scoped_plan.errors and not git_exclude:
+            ui.render_apply_result(applied=0, failed=0, failures=[])
+            return
+
+        if scoped_plan.errors:
+            raise click.ClickException(
+                "Apply aborted due to planning/parsing errors above."
+            )
+
+        exclude_stage = (
+            GitExcludeStage(core, apps.enabled_apps()) if git_exclude else None
+        )
+        with use_content_store(store), run.phase("apply"):
+            outcomes = apps.execute_plan_by_root(
+                scoped_plan,
+                continue_on_error=continue_on_error,
+                durability=durability,
+                git_exclude=exclude_stage,
+            )
+        run.set_outcomes(outcomes)
+        applied, failed, failures = summarize_outcomes(outcomes)
+        ui.render_apply_roots(outcomes)
+        if exclude_stage is not None:
+            ui.render_exclude_report(exclude_stage.report)
+        ui.render_apply_result(applied, failed, failures)
 
-    if failed:
-        raise click.exceptions.Exit(1)
+        if failed:
+            raise click.exceptions.Exit(1)
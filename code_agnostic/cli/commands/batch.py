@@ -0,0 +1,53 @@
+"""Batch command."""
+
+import json
+
+import click
+
+from code_agnostic.batch import parse_batch_script, run_batch
+
+
+@click.command(help="Run hub mutation commands from a script in one process.")
+@click.argument("script", type=click.File("r", encoding="utf-8"), default="-")
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "jsonl"]),
+    default="text",
+    show_default=True,
+    help="Per-command result format.",
+)
+@click.option(
+    "--stop-on-error",
+    is_flag=True,
+    default=False,
+    help="Stop at the first failing command (earlier changes are still written).",
+)
+@click.pass_context
+def batch(ctx: click.Context, script, output_format: str, stop_on_error: bool) -> None:
+    try:
+        commands = parse_batch_script(script)
+    except ValueError as exc:
+        raise click.ClickException(f"Invalid batch script: {exc}")
+
+    root = ctx.find_root().command
+    assert isinstance(root, click.Group)
+    report = run_batch(root, commands, stop_on_error=stop_on_error)
+
+    for result in report.results:
+        if output_format == "jsonl":
+            click.echo(json.dumps(result.to_dict()))
+            continue
+        status = "ok" if result.ok else "error"
+        click.echo(f"[{status}] line {result.line}: {' '.join(result.argv)}")
+        detail = result.output if result.ok else result.error
+        if detail and (not result.ok or len(detail.splitlines()) == 1):
+            click.echo(f"    {detail}")
+
+    if output_format == "text":
+        click.echo(
+            f"{len(report.results)} commands, {report.failed} failed; "
+            f"{report.files_loaded} files loaded, {report.files_written} written."
+        )
+    if report.failed:
+        raise click.exceptions.Exit(1)
@@ -0,0 +1,32 @@
+"""Build command."""
+
+from pathlib import Path
+
+import click
+
+from code_agnostic.apps.apps_service import AppsService
+from code_agnostic.cli.options import app_option
+from code_agnostic.core.repository import CoreRepository
+
+
+@click.command(help="Compile the hub's global outputs into a prebuilt bundle.")
+@app_option()
+@click.option(
+    "--out",
+    "out",
+    required=True,
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Bundle path (.tar, or .tar.gz/.tgz/.tar.xz to compress).",
+)
+@click.pass_obj
+def build(obj: dict[str, str], app: str, out: Path) -> None:
+    target = app or "all"
+    apps = AppsService(CoreRepository())
+    try:
+        summary = apps.build_bundle(target, out)
+    except Exception as exc:
+        raise click.ClickException(f"Fatal: {exc}")
+    click.echo(
+        f"Wrote {summary.path}: {summary.files} files for "
+        f"{', '.join(summary.apps) or 'no apps'} ({summary.size} bytes)."
+    )
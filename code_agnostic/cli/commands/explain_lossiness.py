@@ -2,22 +2,42 @@
 
 import click
 
-from code_agnostic.cli.helpers import workspace_config_root
+from code_agnostic.cli.helpers import require_workspace_entry, workspace_config_root
 from code_agnostic.cli.options import app_option, workspace_option
 from code_agnostic.core.repository import CoreRepository
-from code_agnostic.lossiness import LossinessExplainer
+from code_agnostic.executor import SyncExecutor
+from code_agnostic.lossiness_explainer import LossinessExplainer
 
 
 @click.command(help="Explain documented lossy mappings without applying.")
 @app_option()
 @workspace_option()
+@click.option(
+    "--applied",
+    is_flag=True,
+    default=False,
+    help=(
+        "Report what the last apply's compiled outputs dropped, as recorded "
+        "in the root's active revision, instead of compiling again."
+    ),
+)
 @click.pass_obj
-def explain_lossiness(obj: dict[str, str], app: str, workspace: str | None) -> None:
+def explain_lossiness(
+    obj: dict[str, str], app: str, workspace: str | None, applied: bool
+) -> None:
     target = app or "all"
     core = CoreRepository()
     explainer = LossinessExplainer()
 
-    if workspace is not None:
+    if applied:
+        if workspace is not None:
+            require_workspace_entry(core, workspace)
+        findings = [
+            item
+            for item in SyncExecutor(core=core).active_lossiness(workspace)
+            if target.lower() in ("all", item.app)
+        ]
+    elif workspace is not None:
         findings = explainer.explain_workspace_root(
             workspace_config_root(core, workspace),
             workspace=workspace,
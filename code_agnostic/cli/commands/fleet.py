@@ -0,0 +1,159 @@
+"""Fleet command group."""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+import click
+from rich.console import Console
+
+from code_agnostic.apps.apps_service import AppsService
+from code_agnostic.cli.options import (
+    app_option,
+    durability_option,
+    fleet_root_options,
+    metrics_option,
+)
+from code_agnostic.core.repository import CoreRepository
+from code_agnostic.fleet import FleetResult, FleetService, expand_fleet_homes
+from code_agnostic.models import ActionStatus
+from code_agnostic.run_history import record_run
+from code_agnostic.tui import SyncConsoleUI
+from code_agnostic.utils import compact_home_path
+
+
+@click.group(help="Sync the hub's global config into many home roots.")
+def fleet() -> None:
+    pass
+
+
+def _format_option() -> Callable:
+    return click.option(
+        "--format",
+        "output_format",
+        type=click.Choice(["text", "json"]),
+        default="text",
+        show_default=True,
+    )
+
+
+def _jobs_option() -> Callable:
+    return click.option(
+        "--jobs",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Homes processed in parallel (default: up to 8).",
+    )
+
+
+def _resolve_homes(
+    roots: tuple[Path, ...], root_globs: tuple[str, ...], roots_file
+) -> list[Path]:
+    listed = list(roots)
+    if roots_file is not None:
+        listed.extend(
+            Path(line.strip())
+            for line in roots_file
+            if line.strip() and not line.lstrip().startswith("#")
+        )
+    homes = expand_fleet_homes(listed, root_globs)
+    if not homes:
+        raise click.ClickException(
+            "No home roots given; use --root, --root-glob or --roots-file."
+        )
+    return homes
+
+
+def _fleet_apps(core: CoreRepository, app: str) -> list[str]:
+    enabled = AppsService(core).enabled_apps()
+    apps = enabled if app == "all" else [name for name in enabled if name == app]
+    if not apps:
+        raise click.ClickException("No apps enabled for sync.")
+    return apps
+
+
+def _render_results(results: list[FleetResult], title: str, output_format: str) -> None:
+    if output_format == "json":
+        click.echo(
+            json.dumps({"homes": [item.to_dict() for item in results]}, indent=2)
+        )
+        return
+    rows: list[list[str]] = []
+    for item in results:
+        counts = item.plan.summary() if item.plan is not None else {}
+        changes = sum(
+            counts.get(status.value, 0)
+            for status in ActionStatus
+            if status is not ActionStatus.NOOP
+        )
+        rows.append(
+            [
+                compact_home_path(str(item.home)),
+                str(changes),
+                str(item.applied),
+                "ok" if item.ok else "; ".join(item.failures),
+            ]
+        )
+    SyncConsoleUI(Console()).render_list(
+        title, ["Home", "Changes", "Applied", "Status"], rows
+    )
+
+
+@fleet.command("plan", help="Show pending changes for each home root.")
+@fleet_root_options()
+@app_option()
+@_jobs_option()
+@_format_option()
+@click.pass_obj
+def fleet_plan(
+    obj: dict[str, str],
+    roots: tuple[Path, ...],
+    root_globs: tuple[str, ...],
+    roots_file,
+    app: str,
+    jobs: int | None,
+    output_format: str,
+) -> None:
+    core = CoreRepository()
+    homes = _resolve_homes(roots, root_globs, roots_file)
+    service = FleetService(core, _fleet_apps(core, app.lower()), jobs=jobs)
+    results = service.run(homes, apply=False)
+    _render_results(results, "Fleet plan", output_format)
+    if not all(item.ok for item in results):
+        raise click.exceptions.Exit(1)
+
+
+@fleet.command("apply", help="Apply the hub to each home root in parallel.")
+@fleet_root_options()
+@app_option()
+@_jobs_option()
+@_format_option()
+@durability_option()
+@metrics_option()
+@click.pass_obj
+def fleet_apply(
+    obj: dict[str, str],
+    roots: tuple[Path, ...],
+    root_globs: tuple[str, ...],
+    roots_file,
+    app: str,
+    jobs: int | None,
+    output_format: str,
+    durability: str,
+    metrics_textfile: Path | None,
+) -> None:
+    core = CoreRepository()
+    homes = _resolve_homes(roots, root_globs, roots_file)
+    service = FleetService(
+        core, _fleet_apps(core, app.lower()), jobs=jobs, durability=durability
+    )
+    with record_run(
+        core.root, "fleet-apply", target=app.lower(), metrics_path=metrics_textfile
+    ) as run:
+        with run.phase("apply"):
+            results = service.run(homes)
+        run.set_outcomes([outcome for item in results for outcome in item.outcomes])
+        run.set_cache(service.cache.stats())
+        _render_results(results, "Fleet apply", output_format)
+        if not all(item.ok for item in results):
+            raise click.exceptions.Exit(1)
@@ -47,6 +47,18 @@ def import_group() -> None:
 )
 @click.option("--source-root", type=click.Path(path_type=Path))
 @click.option("--follow-symlinks", is_flag=True, default=False)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Parallel copy workers for skills/agents (default: min(8, CPUs)).",
+)
+@click.option(
+    "--hardlink",
+    is_flag=True,
+    default=False,
+    help="Hardlink imported files on the same filesystem (edits affect both).",
+)
 @click.option(
     "-i",
     "--interactive",
@@ -64,6 +76,8 @@ def import_plan(
     on_conflict: str,
     source_root: Path | None,
     follow_symlinks: bool,
+    jobs: int | None,
+    hardlink: bool,
     interactive: bool,
     verbose: bool,
 ) -> None:
@@ -127,6 +141,18 @@ def import_plan(
 )
 @click.option("--source-root", type=click.Path(path_type=Path))
 @click.option("--follow-symlinks", is_flag=True, default=False)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Parallel copy workers for skills/agents (default: min(8, CPUs)).",
+)
+@click.option(
+    "--hardlink",
+    is_flag=True,
+    default=False,
+    help="Hardlink imported files on the same filesystem (edits affect both).",
+)
 @click.option(
     "-i",
     "--interactive",
@@ -144,6 +170,8 @@ def import_apply(
     on_conflict: str,
     source_root: Path | None,
     follow_symlinks: bool,
+    jobs: int | None,
+    hardlink: bool,
     interactive: bool,
     verbose: bool,
 ) -> None:
@@ -182,7 +210,7 @@ def import_apply(
     if result_plan.errors:
         raise click.ClickException("Import aborted due to conflicts/errors above.")
 
-    result = service.apply(result_plan)
+    result = service.apply(result_plan, jobs=jobs, hardlink=hardlink)
     ui.render_import_apply_result(result)
 
     if result.failed:
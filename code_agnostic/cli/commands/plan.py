@@ -1,30 +1,133 @@
 """Plan command."""
 
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
 import click
 from rich.console import Console
 
 from code_agnostic.apps.apps_service import AppsService
-from code_agnostic.cli.options import app_option, verbose_option
+from code_agnostic.cli.helpers import (
+    content_store_for,
+    daemon_call,
+    plan_selection_kwargs,
+)
+from code_agnostic.cli.options import (
+    app_option,
+    compile_processes_option,
+    fanout_option,
+    metrics_option,
+    plan_selection_options,
+    plan_view_kwargs,
+    plan_view_options,
+    verbose_option,
+)
+from code_agnostic.content_store import use_content_store
 from code_agnostic.core.repository import CoreRepository
+from code_agnostic.daemon import plan_from_payload
+from code_agnostic.plan_output import iter_plan_records
+from code_agnostic.run_history import record_run
+from code_agnostic.source_cache import SourceCache, use_source_cache
 from code_agnostic.tui import SyncConsoleUI
 
 
 @click.command(help="Build and print a dry-run plan.")
 @app_option()
+@plan_selection_options()
 @verbose_option()
+@plan_view_options()
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "jsonl"]),
+    default="text",
+    show_default=True,
+    help="jsonl streams one action per line with a payload digest.",
+)
+@fanout_option()
+@compile_processes_option()
+@metrics_option()
 @click.pass_obj
-def plan(obj: dict[str, str], app: str, verbose: bool) -> None:
+def plan(
+    obj: dict[str, str],
+    app: str,
+    workspace: str | None,
+    repo: Path | None,
+    scopes: tuple[str, ...],
+    verbose: bool,
+    show: tuple[str, ...],
+    group_by: tuple[str, ...] | None,
+    pager: bool,
+    output_format: str,
+    fanout: str,
+    compile_processes: int | None,
+    metrics_textfile: Path | None,
+) -> None:
     target = app or "all"
+    view = plan_view_kwargs(show, group_by, pager)
     ui = SyncConsoleUI(Console())
     core = CoreRepository()
-    apps = AppsService(core)
+    store = content_store_for(core, fanout)
+    selection = plan_selection_kwargs(core, workspace, repo, scopes)
+
+    with record_run(
+        core.root, "plan", target=target, metrics_path=metrics_textfile
+    ) as run:
+        # The daemon plans everything in copy mode; fan-out, scoped plans and
+        # process-pool compilation run in-process.
+        in_process = (
+            store is not None or bool(selection) or compile_processes is not None
+        )
+        with run.phase("plan"):
+            remote = None if in_process else daemon_call(core, "plan", target=target)
+        if remote is not None:
+            run.set_remote(remote)
+            scoped_plan = plan_from_payload(remote)
+            run.set_plan(scoped_plan)
+            if output_format == "jsonl":
+                _emit_records(iter_plan_records([scoped_plan]))
+            else:
+                ui.render_plan(
+                    scoped_plan, mode=f"plan:{target.lower()}", verbose=verbose, **view
+                )
+        else:
+            cache = SourceCache()
+            chunks = AppsService(core).iter_plan_for_target(
+                target, compile_processes=compile_processes, **selection
+            )
+            try:
+                with (
+                    use_content_store(store),
+                    use_source_cache(cache),
+                    run.phase("plan"),
+                ):
+                    if output_format == "jsonl":
+                        summary = _emit_records(iter_plan_records(chunks))
+                        run.record.counts = summary
+                        run.set_cache(cache.stats())
+                        if summary.get("errors"):
+                            raise click.exceptions.Exit(1)
+                        return
+                    scoped_plan = ui.render_plan_stream(
+                        chunks, mode=f"plan:{target.lower()}", verbose=verbose, **view
+                    )
+            except click.exceptions.Exit:
+                raise
+            except Exception as exc:
+                raise click.ClickException(f"Fatal: {exc}")
+            run.set_plan(scoped_plan)
+            run.set_cache(cache.stats())
 
-    try:
-        scoped_plan = apps.plan_for_target(target)
-    except Exception as exc:
-        raise click.ClickException(f"Fatal: {exc}")
+        if scoped_plan.errors:
+            raise click.exceptions.Exit(1)
 
-    ui.render_plan(scoped_plan, mode=f"plan:{target.lower()}", verbose=verbose)
 
-    if scoped_plan.errors:
-        raise click.exceptions.Exit(1)
+def _emit_records(records: Iterable[dict[str, Any]]) -> dict[str, int]:
+    summary: dict[str, int] = {}
+    for record in records:
+        if record["type"] == "summary":
+            summary = {key: value for key, value in record.items() if key != "type"}
+        click.echo(json.dumps(record, sort_keys=True))
+    return summary
@@ -1,28 +1,66 @@
 """Restore command."""
 
+from pathlib import Path
+
 import click
 
 from code_agnostic.cli.helpers import require_workspace_entry
-from code_agnostic.cli.options import workspace_option
+from code_agnostic.cli.options import metrics_option, workspace_option
 from code_agnostic.core.repository import CoreRepository
 from code_agnostic.executor import SyncExecutor
+from code_agnostic.run_history import record_run
 
 
 @click.command(
-    help="Restore the active synced revision for the global root or a workspace."
+    help=(
+        "Restore a synced revision (the active one by default) for the global "
+        "root or a workspace. Targets that already match are left untouched."
+    )
 )
 @workspace_option()
+@click.option(
+    "--revision",
+    "revision_id",
+    default=None,
+    help="Revision id to restore (see `revisions list`); it becomes active.",
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Parallel restore workers (default: up to 8).",
+)
+@metrics_option()
 @click.pass_obj
-def restore(obj: dict[str, str], workspace: str | None) -> None:
+def restore(
+    obj: dict[str, str],
+    workspace: str | None,
+    revision_id: str | None,
+    jobs: int | None,
+    metrics_textfile: Path | None,
+) -> None:
     core = CoreRepository()
 
     if workspace is not None:
         require_workspace_entry(core, workspace)
 
     executor = SyncExecutor(core=core)
-    try:
-        result = executor.restore_active_revision(workspace=workspace)
-    except FileNotFoundError as exc:
-        raise click.ClickException(str(exc))
+    with record_run(
+        core.root, "restore", target=workspace, metrics_path=metrics_textfile
+    ) as run:
+        try:
+            with run.phase("restore"):
+                result = executor.restore_revision(
+                    workspace=workspace, revision_id=revision_id, jobs=jobs
+                )
+        except FileNotFoundError as exc:
+            raise click.ClickException(str(exc))
+        run.record.counts = {
+            "restored": result.restored,
+            "unchanged": result.unchanged,
+        }
 
-    click.echo(f"Restored revision {result.revision_id} ({result.restored} targets).")
+    click.echo(
+        f"Restored revision {result.revision_id} "
+        f"({result.restored} targets, {result.unchanged} unchanged)."
+    )
@@ -0,0 +1,40 @@
+"""Revisions group commands."""
+
+import click
+from rich.console import Console
+
+from code_agnostic.cli.helpers import require_workspace_entry
+from code_agnostic.cli.options import workspace_option
+from code_agnostic.core.repository import CoreRepository
+from code_agnostic.executor import SyncExecutor
+from code_agnostic.tui import SyncConsoleUI
+
+
+@click.group(help="Inspect recorded sync revisions.")
+def revisions() -> None:
+    pass
+
+
+@revisions.command("list", help="List revisions for the global root or a workspace.")
+@workspace_option()
+@click.pass_obj
+def revisions_list(obj: dict[str, str], workspace: str | None) -> None:
+    core = CoreRepository()
+    if workspace is not None:
+        require_workspace_entry(core, workspace)
+
+    items = SyncExecutor(core=core).list_revisions(workspace=workspace)
+    SyncConsoleUI(Console()).render_list(
+        title=f"revisions ({workspace or 'global'})",
+        headers=["Revision", "Timestamp", "Targets", "Active"],
+        rows=[
+            [
+                item.revision_id,
+                item.timestamp or "-",
+                str(item.targets),
+                "*" if item.active else "",
+            ]
+            for item in items
+        ],
+        empty_msg="No revisions recorded.",
+    )
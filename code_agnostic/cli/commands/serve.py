@@ -0,0 +1,54 @@
+"""Serve command."""
+
+from pathlib import Path
+
+import click
+
+from code_agnostic.api import Session
+from code_agnostic.daemon import (
+    DaemonClient,
+    DaemonServer,
+    default_socket_path,
+)
+from code_agnostic.errors import SyncAppError
+
+
+@click.command(help="Run a local daemon that keeps sync caches warm.")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(path_type=Path, dir_okay=False),
+    default=None,
+    help="Unix socket path (default: <hub>/.sync-daemon.sock or $CODE_AGNOSTIC_SOCKET).",
+)
+@click.option(
+    "--stop",
+    is_flag=True,
+    default=False,
+    help="Ask a running daemon to shut down.",
+)
+@click.pass_obj
+def serve(obj: dict[str, str], socket_path: Path | None, stop: bool) -> None:
+    session = Session()
+    path = socket_path or default_socket_path(session.root)
+
+    if stop:
+        client = DaemonClient(path, timeout=5.0)
+        if not client.ping():
+            raise click.ClickException(f"No daemon running on {path}")
+        client.call("shutdown")
+        click.echo(f"Daemon on {path} stopped.")
+        return
+
+    try:
+        server = DaemonServer(session, socket_path=path)
+        server.bind()
+    except (SyncAppError, OSError) as exc:
+        raise click.ClickException(str(exc))
+
+    click.echo(f"Serving on {path}; plan/apply/status/validate will use it.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.close()
+        click.echo("Daemon stopped.")
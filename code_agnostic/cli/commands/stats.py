@@ -0,0 +1,130 @@
+"""Stats command."""
+
+import json
+from dataclasses import asdict
+
+import click
+from rich.console import Console
+
+from code_agnostic.core.repository import CoreRepository
+from code_agnostic.run_history import (
+    RunRecord,
+    load_history,
+    summarize_history,
+)
+from code_agnostic.tui import SyncConsoleUI
+
+RECENT_RUNS = 10
+
+
+@click.command(help="Summarize recorded plan, apply and restore runs.")
+@click.option(
+    "--last",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Only consider the newest N runs.",
+)
+@click.option(
+    "--command",
+    "command_name",
+    type=click.Choice(["plan", "apply", "restore", "fleet-apply"]),
+    default=None,
+    help="Only consider runs of this command.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    show_default=True,
+)
+@click.pass_obj
+def stats(
+    obj: dict[str, str],
+    last: int | None,
+    command_name: str | None,
+    output_format: str,
+) -> None:
+    records = load_history(CoreRepository().root)
+    if command_name is not None:
+        records = [item for item in records if item.command == command_name]
+    if last is not None:
+        records = records[-last:]
+    summaries = summarize_history(records)
+
+    if output_format == "json":
+        payload = {
+            "commands": [{**asdict(item), "trend": item.trend} for item in summaries],
+            "recent": [asdict(item) for item in records[-RECENT_RUNS:]],
+        }
+        click.echo(json.dumps(payload, indent=2, sort_keys=True))
+        return
+
+    ui = SyncConsoleUI(Console())
+    ui.render_list(
+        title="run stats",
+        headers=[
+            "Command",
+            "Runs",
+            "Failed",
+            "Median",
+            "p95",
+            "Trend",
+            "Written",
+            "Revisions",
+            "Cache",
+        ],
+        rows=[
+            [
+                item.command,
+                str(item.runs),
+                str(item.failures),
+                _seconds(item.median_duration),
+                _seconds(item.p95_duration),
+                "-" if item.trend is None else f"{item.trend:+.0%}",
+                _size(item.bytes_written),
+                str(item.revisions),
+                _ratio(item.cache_hit_rate),
+            ]
+            for item in summaries
+        ],
+        empty_msg="No runs recorded yet.",
+    )
+    if records:
+        ui.render_list(
+            title="recent runs",
+            headers=["Started", "Command", "Result", "Duration", "Actions", "Written"],
+            rows=[_recent_row(item) for item in reversed(records[-RECENT_RUNS:])],
+        )
+
+
+def _recent_row(record: RunRecord) -> list[str]:
+    pending = record.counts.get("actions", 0) - record.counts.get("noop", 0)
+    actions = (
+        f"{pending}/{record.counts['actions']}" if "actions" in record.counts else "-"
+    )
+    return [
+        record.started_at,
+        record.command + (" (daemon)" if record.via_daemon else ""),
+        "ok" if record.ok else "failed",
+        _seconds(record.duration),
+        actions,
+        "-" if record.bytes_written is None else _size(record.bytes_written),
+    ]
+
+
+def _seconds(value: float) -> str:
+    return f"{value * 1000:.0f}ms" if value < 1 else f"{value:.2f}s"
+
+
+def _size(value: int) -> str:
+    size = float(value)
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def _ratio(value: float | None) -> str:
+    return "-" if value is None else f"{value:.0%}"
@@ -1,30 +1,108 @@
 """Validate command."""
 
+import json
+
 import click
 
-from code_agnostic.cli.helpers import workspace_config_root
+from code_agnostic.cli.helpers import daemon_call, workspace_config_root
 from code_agnostic.cli.options import workspace_option
 from code_agnostic.core.repository import CoreRepository
-from code_agnostic.validation import ConfigValidator
+from code_agnostic.daemon import validation_from_payload
+from code_agnostic.validation import (
+    ConfigValidator,
+    RootValidation,
+    VerdictCache,
+    validation_json,
+    validation_junit,
+)
 
 
 @click.command(help="Validate canonical config files without applying.")
 @workspace_option()
+@click.option(
+    "--all",
+    "all_roots",
+    is_flag=True,
+    default=False,
+    help="Validate the global hub and every registered workspace in one run.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "json", "junit"]),
+    default="text",
+    show_default=True,
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Parallel validation workers (default: up to 8).",
+)
+@click.option(
+    "--cache/--no-cache",
+    "use_cache",
+    default=False,
+    show_default=True,
+    help=(
+        "Reuse verdicts for sources whose content has not changed, kept in "
+        "$XDG_STATE_HOME/code-agnostic/validate-cache.json."
+    ),
+)
 @click.pass_obj
-def validate(obj: dict[str, str], workspace: str | None) -> None:
+def validate(
+    obj: dict[str, str],
+    workspace: str | None,
+    all_roots: bool,
+    output_format: str,
+    jobs: int | None,
+    use_cache: bool,
+) -> None:
+    if all_roots and workspace is not None:
+        raise click.UsageError("--all cannot be combined with --workspace.")
     core = CoreRepository()
-    validator = ConfigValidator()
+    # Unused by --all, which walks every root itself.
+    root = core.root if all_roots else workspace_config_root(core, workspace)
 
-    if workspace is not None:
-        result = validator.validate_workspace_root(
-            workspace_config_root(core, workspace)
-        )
+    # The daemon only reports totals, so richer output validates in-process.
+    remote = None
+    if not all_roots and output_format == "text":
+        remote = daemon_call(core, "validate", workspace=workspace)
+    if remote is not None:
+        results = [
+            RootValidation(workspace or "global", root, validation_from_payload(remote))
+        ]
     else:
-        result = validator.validate_core_root(core.root)
+        validator = ConfigValidator(
+            jobs=jobs, verdicts=VerdictCache.default() if use_cache else None
+        )
+        if all_roots:
+            results = validator.validate_hub(core)
+        elif workspace is not None:
+            results = [
+                RootValidation(workspace, root, validator.validate_workspace_root(root))
+            ]
+        else:
+            results = [
+                RootValidation("global", root, validator.validate_core_root(root))
+            ]
 
-    if result.issues:
-        for issue in result.issues:
-            click.echo(f"{issue.path}: {issue.message}")
+    failed = any(item.result.issues for item in results)
+    if output_format == "json":
+        click.echo(json.dumps(validation_json(results), indent=2))
+    elif output_format == "junit":
+        click.echo(validation_junit(results))
+    else:
+        for item in results:
+            for issue in item.result.issues:
+                click.echo(f"{issue.path}: {issue.message}")
+        if not failed:
+            validated = sum(item.result.validated for item in results)
+            if all_roots:
+                click.echo(
+                    f"Validated {validated} resources across {len(results)} roots."
+                )
+            else:
+                click.echo(f"Validated {validated} resources.")
+    if failed:
         raise click.exceptions.Exit(1)
-
-    click.echo(f"Validated {result.validated} resources.")
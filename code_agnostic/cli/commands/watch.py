@@ -0,0 +1,86 @@
+"""Watch command."""
+
+import click
+from rich.console import Console
+
+from code_agnostic.cli.options import app_option, verbose_option
+from code_agnostic.api import Session
+from code_agnostic.tui import SyncConsoleUI
+from code_agnostic.watch import WatchCycle, WatchService, create_watch_backend
+
+
+@click.command(help="Watch the hub and apply affected scopes on every change.")
+@app_option()
+@click.option(
+    "--debounce",
+    type=click.FloatRange(min=0.0),
+    default=0.3,
+    show_default=True,
+    help="Quiet period in seconds before a burst of edits is applied.",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0.05),
+    default=1.0,
+    show_default=True,
+    help="Polling interval in seconds (also bounds inotify waits).",
+)
+@click.option(
+    "--poll",
+    "force_polling",
+    is_flag=True,
+    default=False,
+    help="Use the portable polling backend instead of inotify.",
+)
+@click.option(
+    "--no-initial",
+    is_flag=True,
+    default=False,
+    help="Skip the full apply performed on startup.",
+)
+@verbose_option()
+@click.pass_obj
+def watch(
+    obj: dict[str, str],
+    app: str,
+    debounce: float,
+    interval: float,
+    force_polling: bool,
+    no_initial: bool,
+    verbose: bool,
+) -> None:
+    target = (app or "all").lower()
+    console = Console()
+    ui = SyncConsoleUI(console)
+    session = Session()
+    session.root.mkdir(parents=True, exist_ok=True)
+    service = WatchService(session, target=target)
+    backend = create_watch_backend(session.root, force_polling=force_polling)
+
+    def _render(cycle: WatchCycle) -> None:
+        ui.render_watch_cycle(
+            cycle.changes.describe(),
+            cycle.plan,
+            applied=cycle.applied,
+            failed=cycle.failed,
+            failures=cycle.failures,
+            duration=cycle.duration,
+            verbose=verbose,
+        )
+
+    console.print(
+        f"Watching {session.root} ({type(backend).__name__}); press Ctrl+C to stop."
+    )
+    try:
+        service.run(
+            _render,
+            backend=backend,
+            debounce=debounce,
+            interval=interval,
+            initial=not no_initial,
+        )
+    except KeyboardInterrupt:
+        stats = session.cache_stats()
+        console.print(
+            f"Stopped. Source cache: {stats.hits} hits / {stats.misses} misses."
+        )
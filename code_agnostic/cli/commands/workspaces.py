@@ -1,16 +1,24 @@
 """Workspaces group commands."""
 
+from collections.abc import Callable
 from pathlib import Path
 
 import click
 from rich.console import Console
 
 from code_agnostic.apps.apps_service import AppsService
-from code_agnostic.cli.helpers import ensure_exclude_entries, require_workspace_entry
+from code_agnostic.cli.helpers import require_workspace_entry
 from code_agnostic.cli.options import workspace_option
 from code_agnostic.core.repository import CoreRepository
 from code_agnostic.core.workspace_repository import WorkspaceConfigRepository
-from code_agnostic.git_exclude_service import GitExcludeService
+from code_agnostic.constants import SYNC_LOCK_FILENAME
+from code_agnostic.git_exclude_service import GitExcludeService, GitExcludeStage
+from code_agnostic.locking import advisory_lock
+from code_agnostic.repo_selection import (
+    RepoSelectionService,
+    load_repo_selection,
+    repo_relative,
+)
 from code_agnostic.tui import SyncConsoleUI
 from code_agnostic.workspaces import WorkspaceService
 
@@ -63,14 +71,17 @@ def workspaces_list(obj: dict[str, str]) -> None:
     for item in core.load_workspaces():
         workspace_path = Path(item["path"])
         repos: list[str] = []
-        if workspace_path.exists() and workspace_path.is_dir():
-            repos = [
-                str(path.relative_to(workspace_path))
-                for path in workspace_service.discover_git_repos(workspace_path)
-            ]
         ws_source = WorkspaceConfigRepository(
             root=core.workspace_config_dir(item["name"])
         )
+        if workspace_path.exists() and workspace_path.is_dir():
+            selection = load_repo_selection(ws_source.root)
+            repos = [
+                repo_relative(workspace_path, path)
+                for path in workspace_service.discover_git_repos(
+                    workspace_path, selection if not selection.is_empty else None
+                )
+            ]
         overview.append(
             {
                 "name": item["name"],
@@ -96,9 +107,7 @@ def workspaces_git_exclude(obj: dict[str, str], workspace: str | None) -> None:
     core = CoreRepository()
     apps = AppsService(core)
     workspace_service = WorkspaceService()
-    exclude_service = GitExcludeService(core)
-
-    enabled_apps = apps.enabled_apps()
+    stage = GitExcludeStage(core, apps.enabled_apps(), workspace_service)
 
     ws_list = (
         [require_workspace_entry(core, workspace)]
@@ -106,29 +115,22 @@ def workspaces_git_exclude(obj: dict[str, str], workspace: str | None) -> None:
         else core.load_workspaces()
     )
 
-    processed = 0
-    touched = 0
-    added_lines = 0
-
     for item in ws_list:
         workspace_path = Path(item["path"])
         if not workspace_path.exists() or not workspace_path.is_dir():
             continue
-        entries = exclude_service.compute_entries(item["name"], enabled_apps)
-        repos = workspace_service.discover_git_repos(workspace_path)
-        for repo in repos:
-            git_dir = workspace_service.resolve_git_dir(repo)
-            if git_dir is None:
-                continue
-            exclude_path = git_dir / "info" / "exclude"
-            added, changed = ensure_exclude_entries(exclude_path, entries)
-            processed += 1
-            if changed:
-                touched += 1
-                added_lines += added
+        ws_root = core.workspace_config_dir(item["name"])
+        selection = load_repo_selection(ws_root)
+        repos = workspace_service.discover_git_repos(
+            workspace_path, selection if not selection.is_empty else None
+        )
+        with advisory_lock(ws_root / SYNC_LOCK_FILENAME):
+            stage.run(item["name"], repos)
 
+    report = stage.report
     click.echo(
-        f"Updated git excludes: repos={processed}, changed={touched}, lines_added={added_lines}"
+        f"Updated git excludes: repos={report.repos}, changed={report.changed}, "
+        f"lines_added={report.lines_added}, skipped={report.skipped}"
     )
 
 
@@ -184,3 +186,80 @@ def workspaces_exclude_list(obj: dict[str, str], workspace: str) -> None:
         include_defaults=config.get("include_defaults", True),
         extra_patterns=config.get("extra_patterns", []),
     )
+
+
+def _repo_pattern_options(func: Callable) -> Callable:
+    func = click.option(
+        "-a",
+        "--app",
+        default=None,
+        help="Only opt this app out of matching repos (exclude only).",
+    )(func)
+    func = click.option(
+        "--kind",
+        type=click.Choice(["include", "exclude"]),
+        default="exclude",
+        show_default=True,
+    )(func)
+    func = click.option("--pattern", required=True, help="Repo path glob.")(func)
+    return func
+
+
+@workspaces.command("repos-add", help="Add a repo include/exclude glob to a workspace.")
+@_repo_pattern_options
+@workspace_option(required=True)
+@click.pass_obj
+def workspaces_repos_add(
+    obj: dict[str, str], pattern: str, kind: str, app: str | None, workspace: str
+) -> None:
+    service = RepoSelectionService(CoreRepository())
+    try:
+        added = service.add_pattern(workspace, kind, pattern, app=app)
+    except ValueError as exc:
+        raise click.ClickException(str(exc))
+    label = f"{kind} ({app})" if app else kind
+    click.echo(
+        f"Added {label} pattern: {pattern}"
+        if added
+        else f"Pattern already present: {pattern}"
+    )
+
+
+@workspaces.command(
+    "repos-remove", help="Remove a repo include/exclude glob from a workspace."
+)
+@_repo_pattern_options
+@workspace_option(required=True)
+@click.pass_obj
+def workspaces_repos_remove(
+    obj: dict[str, str], pattern: str, kind: str, app: str | None, workspace: str
+) -> None:
+    service = RepoSelectionService(CoreRepository())
+    try:
+        removed = service.remove_pattern(workspace, kind, pattern, app=app)
+    except ValueError as exc:
+        raise click.ClickException(str(exc))
+    if not removed:
+        raise click.ClickException(f"Pattern not found: {pattern}")
+    click.echo(f"Removed {kind} pattern: {pattern}")
+
+
+@workspaces.command(
+    "repos-list", help="Show repo selection globs and which repos they select."
+)
+@workspace_option(required=True)
+@click.pass_obj
+def workspaces_repos_list(obj: dict[str, str], workspace: str) -> None:
+    ui = SyncConsoleUI(Console())
+    core = CoreRepository()
+    item = require_workspace_entry(core, workspace)
+    selection = RepoSelectionService(core).load(workspace)
+
+    workspace_path = Path(item["path"])
+    discovered: list[str] = []
+    if workspace_path.exists() and workspace_path.is_dir():
+        discovered = [
+            repo_relative(workspace_path, path)
+            for path in WorkspaceService().discover_git_repos(workspace_path)
+        ]
+    ui.render_repo_selection(workspace, selection, discovered)
@@ -1,12 +1,18 @@
 """Shared helper functions for CLI commands."""
 
 from pathlib import Path
+from typing import Any
 
 import click
 
 from code_agnostic.apps.apps_service import AppsService
+from code_agnostic.content_store import ContentStore
 from code_agnostic.core.repository import CoreRepository
-from code_agnostic.models import ActionStatus, EditorStatusRow, EditorSyncStatus
+from code_agnostic.daemon import DaemonError, DaemonUnavailableError, connect_daemon
+from code_agnostic.models import EditorStatusRow, SyncResource
+from code_agnostic.planner import PlanFilter
+from code_agnostic.status import editor_status_row
+from code_agnostic.utils import is_under
 
 
 def _workspace_entries_by_name(core: CoreRepository) -> dict[str, dict[str, str]]:
@@ -27,61 +33,74 @@ def workspace_config_root(core: CoreRepository, workspace: str | None) -> Path:
     return core.workspace_config_dir(workspace)
 
 
-def status_row_for_app(app_name: str, plan, apps: AppsService) -> EditorStatusRow:
-    if not apps.is_enabled(app_name):
-        return EditorStatusRow(
-            name=app_name,
-            status=EditorSyncStatus.DISABLED,
-            detail="disabled by apps config",
+def plan_selection_kwargs(
+    core: CoreRepository,
+    workspace: str | None,
+    repo: Path | None,
+    scopes: tuple[str, ...],
+) -> dict[str, Any]:
+    """Resolve plan/apply selectors into ``plan_for_target`` keyword args."""
+    if not workspace and repo is None and not scopes:
+        return {}
+    resolved_repo = repo.expanduser().resolve() if repo is not None else None
+    if resolved_repo is not None:
+        owners = [
+            entry["name"]
+            for entry in core.load_workspaces()
+            if is_under(resolved_repo, Path(entry["path"]).resolve())
+            and resolved_repo != Path(entry["path"]).resolve()
+        ]
+        if workspace:
+            require_workspace_entry(core, workspace)
+            if workspace not in owners:
+                raise click.ClickException(
+                    f"Repo {resolved_repo} is not inside workspace {workspace}"
+                )
+        elif not owners:
+            raise click.ClickException(
+                f"Repo is not inside a registered workspace: {resolved_repo}"
+            )
+        else:
+            workspace = owners[0]
+    elif workspace:
+        require_workspace_entry(core, workspace)
+    resources = frozenset(SyncResource(scope) for scope in scopes) or None
+    selection: dict[str, Any] = {
+        "plan_filter": PlanFilter(resources=resources, repo=resolved_repo)
+    }
+    if workspace:
+        selection["include_apps"] = False
+        selection["workspace_names"] = {workspace}
+    return selection
+
+
+def daemon_call(core: CoreRepository, method: str, **params: Any) -> Any | None:
+    """Run a command on the local daemon; None means run it in-process.
+
+    Only a daemon that could not be reached falls back. Once the request is
+    sent the daemon may already be acting on it (an apply, say), so a
+    timeout or dropped connection fails the command instead of running it
+    a second time in-process.
+    """
+    client = connect_daemon(core.root)
+    if client is None:
+        return None
+    try:
+        return client.call(method, **params)
+    except DaemonError as exc:
+        raise click.ClickException(f"Fatal: {exc}")
+    except DaemonUnavailableError:
+        return None
+    except (OSError, ValueError) as exc:
+        raise click.ClickException(
+            f"Daemon failed during {method} ({exc}); not re-running it in-process. "
+            "Check its result with `status`, or set CODE_AGNOSTIC_NO_DAEMON=1."
         )
 
-    relevant = [action for action in plan.actions if action.app == app_name]
 
-    for error in plan.errors:
-        if app_name in str(error).lower():
-            return EditorStatusRow(
-                name=app_name,
-                status=EditorSyncStatus.ERROR,
-                detail=f"cannot evaluate ({error})",
-            )
+def status_row_for_app(app_name: str, plan, apps: AppsService) -> EditorStatusRow:
+    return editor_status_row(app_name, plan, apps)
 
-    synced = (
-        all(action.status == ActionStatus.NOOP for action in relevant)
-        if relevant
-        else True
-    )
-    return EditorStatusRow(
-        name=app_name,
-        status=EditorSyncStatus.SYNCED if synced else EditorSyncStatus.DRIFT,
-        detail="in sync" if synced else "out of sync",
-    )
-
-
-def ensure_exclude_entries(path: Path, entries: list[str]) -> tuple[int, bool]:
-    """Add entries to a file, skipping duplicates and comments."""
-    existing_lines: list[str] = []
-    if path.exists():
-        existing_lines = path.read_text(encoding="utf-8").splitlines()
-
-    seen_entries = {
-        line.strip()
-        for line in existing_lines
-        if line.strip() and not line.lstrip().startswith("#")
-    }
-    additions: list[str] = []
-    for entry in entries:
-        normalized = entry.strip()
-        if not normalized or normalized in seen_entries:
-            continue
-        additions.append(entry)
-        seen_entries.add(normalized)
-    if not additions:
-        return 0, False
-
-    merged = list(existing_lines)
-    if merged and merged[-1] != "":
-        merged.append("")
-    merged.extend(additions)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text("\n".join(merged) + "\n", encoding="utf-8")
-    return len(additions), True
+
+def content_store_for(core: CoreRepository, fanout: str) -> ContentStore | None:
+    return ContentStore.for_hub(core.root) if fanout == "hardlink" else None
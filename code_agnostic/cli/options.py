@@ -1,11 +1,16 @@
 """Shared option decorators for CLI commands."""
 
 from collections.abc import Callable
+from pathlib import Path
 
 import click
 
 from code_agnostic.apps.app_id import app_ids_by_capability
 from code_agnostic.apps.common.framework import list_registered_app_services
+from code_agnostic.content_store import FANOUT_MODES
+from code_agnostic.durability import DEFAULT_DURABILITY, DURABILITY_LEVELS
+from code_agnostic.models import SyncResource
+from code_agnostic.tui.tables import PLAN_GROUP_FIELDS
 
 
 def _target_values() -> list[str]:
@@ -83,6 +88,178 @@ def verbose_option() -> Callable:
     return click.option("-v", "--verbose", is_flag=True, default=False)
 
 
+def _parse_group_by(
+    ctx: click.Context, param: click.Parameter, value: str | None
+) -> tuple[str, ...] | None:
+    if not value:
+        return None
+    fields = tuple(item.strip().lower() for item in value.split(",") if item.strip())
+    unknown = [item for item in fields if item not in PLAN_GROUP_FIELDS]
+    if unknown or not fields:
+        raise click.BadParameter(
+            f"expected a comma list of {', '.join(PLAN_GROUP_FIELDS)}"
+        )
+    return fields
+
+
+def plan_view_options() -> Callable:
+    """Options that control how a sync plan is rendered."""
+    decorators = [
+        click.option(
+            "--show",
+            "show",
+            type=click.Choice(["noop"]),
+            multiple=True,
+            help="Also list collapsed statuses (noop).",
+        ),
+        click.option(
+            "--group-by",
+            callback=_parse_group_by,
+            default=None,
+            help=(
+                "Summarize counts by fields "
+                f"({', '.join(PLAN_GROUP_FIELDS)}), e.g. app,status."
+            ),
+        ),
+        click.option(
+            "--pager",
+            is_flag=True,
+            default=False,
+            help="Page through one line per action instead of a table.",
+        ),
+    ]
+
+    def apply(func: Callable) -> Callable:
+        for decorator in reversed(decorators):
+            func = decorator(func)
+        return func
+
+    return apply
+
+
+def plan_view_kwargs(
+    show: tuple[str, ...], group_by: tuple[str, ...] | None, pager: bool
+) -> dict:
+    return {"show_noop": "noop" in show, "group_by": group_by, "pager": pager}
+
+
+def plan_selection_options() -> Callable:
+    """Options that limit planning to one workspace, repo or resource scope."""
+    decorators = [
+        click.option(
+            "-w",
+            "--workspace",
+            default=None,
+            help="Only plan this workspace; global app config is left alone.",
+        ),
+        click.option(
+            "--repo",
+            type=click.Path(file_okay=False, path_type=Path),
+            default=None,
+            help="Only plan the repo-level outputs of this workspace repo.",
+        ),
+        click.option(
+            "--scope",
+            "scopes",
+            type=click.Choice([resource.value for resource in SyncResource]),
+            multiple=True,
+            help="Only plan these resources (repeatable).",
+        ),
+    ]
+
+    def apply(func: Callable) -> Callable:
+        for decorator in reversed(decorators):
+            func = decorator(func)
+        return func
+
+    return apply
+
+
+def fleet_root_options() -> Callable:
+    """Options naming the home roots a fleet command targets."""
+    decorators = [
+        click.option(
+            "--root",
+            "roots",
+            multiple=True,
+            type=click.Path(file_okay=False, path_type=Path),
+            help="Target home root (repeatable).",
+        ),
+        click.option(
+            "--root-glob",
+            "root_globs",
+            multiple=True,
+            help="Glob matching home roots, e.g. '/home/*' (repeatable).",
+        ),
+        click.option(
+            "--roots-file",
+            type=click.File("r", encoding="utf-8"),
+            default=None,
+            help="File listing one home root per line.",
+        ),
+    ]
+
+    def apply(func: Callable) -> Callable:
+        for decorator in reversed(decorators):
+            func = decorator(func)
+        return func
+
+    return apply
+
+
+def metrics_option() -> Callable:
+    return click.option(
+        "--metrics-textfile",
+        type=click.Path(dir_okay=False, path_type=Path),
+        envvar="CODE_AGNOSTIC_METRICS_TEXTFILE",
+        default=None,
+        help=(
+            "Also write the latest run metrics to this file for the Prometheus "
+            "node_exporter textfile collector."
+        ),
+    )
+
+
+def fanout_option() -> Callable:
+    return click.option(
+        "--fanout",
+        type=click.Choice(FANOUT_MODES),
+        default="copy",
+        show_default=True,
+        help=(
+            "hardlink writes each compiled skill/agent file once into the hub "
+            "store and hard-links it into every target."
+        ),
+    )
+
+
+def compile_processes_option() -> Callable:
+    return click.option(
+        "--compile-processes",
+        "compile_processes",
+        type=click.IntRange(min=1),
+        default=None,
+        envvar="CODE_AGNOSTIC_COMPILE_PROCESSES",
+        help=(
+            "Compile skill and agent sources in this many worker processes "
+            "before planning. Small hubs still compile in-process."
+        ),
+    )
+
+
+def durability_option() -> Callable:
+    return click.option(
+        "--durability",
+        type=click.Choice(DURABILITY_LEVELS),
+        default=DEFAULT_DURABILITY,
+        show_default=True,
+        help=(
+            "batch flushes each root's files in grouped passes before its "
+            "revision is promoted; strict fsyncs every file as it is placed."
+        ),
+    )
+
+
 def experimental_option() -> Callable:
     return click.option(
         "--experimental",
@@ -0,0 +1,80 @@
+"""YAML frontmatter and JSON codecs with optional native fast paths.
+
+Parsing uses libyaml's ``CSafeLoader`` when PyYAML was built against it and
+``orjson`` when it is installed (set ``CODE_AGNOSTIC_JSON=stdlib`` to opt out).
+Serialization always goes through the pure-Python emitters, so generated files
+are byte-identical whichever backends are available.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_BACKEND = "libyaml" if YAML_LOADER is not yaml.SafeLoader else "python"
+
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+
+
+def _load_orjson() -> Any | None:
+    if os.environ.get("CODE_AGNOSTIC_JSON", "").lower() == "stdlib":
+        return None
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+_ORJSON = _load_orjson()
+JSON_BACKEND = "orjson" if _ORJSON is not None else "json"
+
+
+def load_yaml(text: str) -> Any:
+    return yaml.load(text, Loader=YAML_LOADER)
+
+
+def dump_yaml(payload: Any) -> str:
+    """Render a frontmatter block body, without the trailing newline."""
+    return yaml.dump(payload, default_flow_style=False, sort_keys=False).rstrip()
+
+
+def split_frontmatter(text: str) -> tuple[Any, str]:
+    """Return the parsed frontmatter (``{}`` when absent) and the body."""
+    # Most rule and prompt files have no frontmatter; skip the regex and YAML.
+    if not text.startswith("---"):
+        return {}, text
+    match = _FRONTMATTER_RE.match(text)
+    if match is None:
+        return {}, text
+    block = match.group(1)
+    raw = load_yaml(block) if block.strip() else None
+    return raw or {}, text[match.end() :]
+
+
+def loads_json(data: bytes | str) -> Any:
+    if _ORJSON is not None:
+        try:
+            return _ORJSON.loads(data)
+        except _ORJSON.JSONDecodeError:
+            # Inputs orjson rejects (NaN, huge ints) or that are invalid get
+            # the stdlib's result and error messages.
+            pass
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def read_json_file(path: Path) -> Any:
+    return loads_json(path.read_bytes())
+
+
+def dumps_json(payload: Any) -> str:
+    """Serialize the way every generated JSON file is written."""
+    return json.dumps(payload, indent=2, sort_keys=False) + "\n"
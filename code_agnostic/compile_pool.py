@@ -0,0 +1,134 @@
+"""Compile skill and agent sources in worker processes.
+
+Parsing frontmatter, validating it against the bundled schemas and
+serializing YAML/TOML are pure-Python CPU work, so threads do not speed them
+up. ``CompilePool`` compiles every source a plan is going to need on a
+process pool before planning starts. It then loads the results into the
+active source cache: the compiled output with its lossiness, and the parsed
+sources behind it. The planner finds them there and does not compile again.
+Entries keep the stamps taken in the worker, and the planner still walks
+sources in its own order, so plans match in-process planning exactly. Small
+batches, and sources that fail to compile, are left to the planner.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from code_agnostic.apps.app_id import APP_CATALOG, AppId
+from code_agnostic.apps.common.framework import create_registered_app_service
+from code_agnostic.apps.common.interfaces.repositories import ISourceRepository
+from code_agnostic.apps.common.interfaces.service import (
+    IAppConfigService,
+    compiled_cache_kind,
+)
+from code_agnostic.core.workspace_repository import WorkspaceConfigRepository
+from code_agnostic.source_cache import (
+    CacheEntry,
+    SourceCache,
+    active_source_cache,
+    use_source_cache,
+)
+
+DEFAULT_COMPILE_PROCESSES = os.cpu_count() or 1
+# Below this many uncached sources, starting workers costs more than it saves.
+MIN_PROCESS_SOURCES = 32
+
+
+@dataclass(frozen=True)
+class CompileJob:
+    app: str
+    resource: str
+    source: Path
+
+
+def compile_jobs(
+    core: ISourceRepository,
+    services: list[IAppConfigService],
+    workspace_names: set[str] | None = None,
+) -> list[CompileJob]:
+    """Every (app, resource, source) a plan over these services compiles."""
+    jobs: list[CompileJob] = []
+    roots: list[tuple[ISourceRepository, bool]] = [(core, False)]
+    for item in core.load_workspaces():
+        if workspace_names is None or item["name"] in workspace_names:
+            root = WorkspaceConfigRepository(core.workspace_config_dir(item["name"]))
+            roots.append((root, True))
+    for source_root, is_workspace in roots:
+        skills = source_root.list_skill_sources()
+        agents = source_root.list_agent_sources()
+        for service in services:
+            meta = APP_CATALOG[service.app_id]
+            if is_workspace and not meta.supports_workspace_propagation:
+                continue
+            app = service.app_id.value
+            jobs.extend(CompileJob(app, "skill", source) for source in skills)
+            if not is_workspace or meta.supports_import_agents:
+                jobs.extend(CompileJob(app, "agent", source) for source in agents)
+    return list(dict.fromkeys(jobs))
+
+
+_WORKER_SERVICES: dict[str, IAppConfigService] = {}
+
+
+def _compile_in_worker(job: CompileJob) -> list[CacheEntry] | None:
+    service = _WORKER_SERVICES.get(job.app)
+    if service is None:
+        service = _WORKER_SERVICES[job.app] = create_registered_app_service(
+            AppId(job.app)
+        )
+    cache = SourceCache()
+    try:
+        with use_source_cache(cache):
+            service.compile_source(job.resource, job.source)
+    except Exception:
+        # The planner compiles it again in-process and reports the error.
+        return None
+    return cache.export()
+
+
+class CompilePool:
+    def __init__(
+        self,
+        processes: int | None = None,
+        min_sources: int = MIN_PROCESS_SOURCES,
+    ) -> None:
+        self.processes = processes or DEFAULT_COMPILE_PROCESSES
+        self.min_sources = min_sources
+
+    def prefill(self, jobs: list[CompileJob]) -> int:
+        """Compile uncached jobs in worker processes; return how many ran there."""
+        cache = active_source_cache()
+        if cache is None:
+            return 0
+        pending = [
+            job
+            for job in jobs
+            if not cache.contains(
+                compiled_cache_kind(job.app, job.resource), job.source
+            )
+        ]
+        workers = min(self.processes, len(pending))
+        if workers < 2 or len(pending) < self.min_sources:
+            return 0
+        # Workers are spawned rather than forked: the parent may hold locks
+        # in other threads (daemon, watch) that a forked child would inherit.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            results = list(
+                pool.map(
+                    _compile_in_worker,
+                    pending,
+                    chunksize=max(1, len(pending) // (workers * 4)),
+                )
+            )
+        compiled = 0
+        for entries in results:
+            if entries is not None:
+                cache.merge(entries)
+                compiled += 1
+        return compiled
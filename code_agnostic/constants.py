@@ -7,6 +7,12 @@ GIT_DIRNAME: Final[str] = ".git"
 SYNC_STATE_FILENAME: Final[str] = ".sync-state.json"
 SYNC_REVISIONS_DIRNAME: Final[str] = ".sync-revisions"
 SYNC_STAGING_DIRNAME: Final[str] = ".sync-staging"
+SYNC_STORE_DIRNAME: Final[str] = ".sync-store"
+SYNC_LOCK_FILENAME: Final[str] = ".sync.lock"
+RUN_HISTORY_FILENAME: Final[str] = ".sync-history.jsonl"
+GIT_EXCLUDE_STATE_FILENAME: Final[str] = ".git-exclude-state.json"
+VALIDATION_CACHE_FILENAME: Final[str] = "validate-cache.json"
+REPO_SELECTION_FILENAME: Final[str] = "repos.json"
 
 RULES_DIRNAME: Final[str] = "rules"
 SKILLS_DIRNAME: Final[str] = "skills"
@@ -0,0 +1,181 @@
+"""Content-addressed store that lets identical generated files share one inode.
+
+With hardlink fan-out enabled, every compiled skill/agent file is written once
+into ``<hub>/.sync-store`` and hard-linked into each target. Planning can then
+prove a target is current by comparing inodes instead of reading it.
+
+Targets keep ordinary permissions, so editing one in place edits every link
+to the same object. Objects carry a pinned mtime: such an edit moves it, the
+edited targets stop counting as current, and the next apply rewrites the
+object and links fresh copies of it back in.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from code_agnostic.constants import SYNC_STORE_DIRNAME
+from code_agnostic.locking import advisory_lock
+from code_agnostic.models import SyncResource, resource_for_scope
+
+FANOUT_MODES = ("copy", "hardlink")
+
+_FANOUT_RESOURCES = frozenset({SyncResource.SKILLS, SyncResource.AGENTS})
+# Objects never change once written; any other mtime means one was edited.
+_OBJECT_MTIME_NS = 1_000_000_000
+
+
+def _device_of(path: Path) -> int | None:
+    current = path
+    while True:
+        try:
+            return current.stat().st_dev
+        except OSError:
+            if current.parent == current:
+                return None
+            current = current.parent
+
+
+class ContentStore:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._device: int | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_hub(cls, hub_root: Path) -> "ContentStore":
+        return cls(hub_root / SYNC_STORE_DIRNAME)
+
+    @staticmethod
+    def digest(payload: str) -> str:
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def covers(scope: str | None) -> bool:
+        return resource_for_scope(scope) in _FANOUT_RESOURCES
+
+    def object_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def can_link(self, target: Path) -> bool:
+        if self._device is None:
+            self._device = _device_of(self.root)
+        return self._device is not None and _device_of(target.parent) == self._device
+
+    @staticmethod
+    def _intact(object_stat: os.stat_result, payload: str) -> bool:
+        return object_stat.st_mtime_ns == _OBJECT_MTIME_NS and (
+            object_stat.st_size == len(payload.encode("utf-8"))
+        )
+
+    def _stat_intact(self, path: Path, payload: str) -> bool:
+        try:
+            return self._intact(path.stat(), payload)
+        except OSError:
+            return False
+
+    def is_linked(self, target: Path, payload: str) -> bool:
+        try:
+            target_stat = target.stat()
+            if target_stat.st_nlink < 2:
+                return False
+            object_stat = self.object_path(self.digest(payload)).stat()
+        except OSError:
+            return False
+        return (target_stat.st_dev, target_stat.st_ino) == (
+            object_stat.st_dev,
+            object_stat.st_ino,
+        ) and self._intact(object_stat, payload)
+
+    def ensure(self, payload: str) -> Path:
+        path = self.object_path(self.digest(payload))
+        if self._stat_intact(path, payload):
+            return path
+        with self._lock:
+            if self._stat_intact(path, payload):
+                return path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            temp.write_text(payload, encoding="utf-8", newline="")
+            os.utime(temp, ns=(_OBJECT_MTIME_NS, _OBJECT_MTIME_NS))
+            # An edited object is replaced, not rewritten: targets still
+            # linked to it keep their inode and stop counting as current.
+            os.replace(temp, path)
+        return path
+
+    def link(self, payload: str, destination: Path) -> bool:
+        """Hard-link the object for ``payload`` at ``destination`` if possible."""
+        try:
+            os.link(self.ensure(payload), destination)
+        except OSError:
+            return False
+        return True
+
+    @property
+    def _lock_path(self) -> Path:
+        # Beside the store, so the lock file is never mistaken for an object.
+        return self.root.with_name(f"{self.root.name}.lock")
+
+    @contextmanager
+    def in_use(self) -> Iterator[None]:
+        """Shared lock held while objects are created and linked into targets.
+
+        Concurrent applies share it; ``prune`` needs it exclusively, so a fresh
+        object can never be dropped between ``ensure`` and ``link``.
+        """
+        with advisory_lock(self._lock_path, shared=True):
+            yield
+
+    def prune(self) -> int:
+        """Drop objects no target links to any more.
+
+        Skipped when another apply is still linking from the store.
+        """
+        if not self.root.is_dir():
+            return 0
+        with advisory_lock(self._lock_path, blocking=False) as waited:
+            if waited is None:
+                return 0
+            return self._prune_unlinked()
+
+    def _prune_unlinked(self) -> int:
+        removed = 0
+        for bucket in self.root.iterdir():
+            if not bucket.is_dir():
+                continue
+            for item in bucket.iterdir():
+                try:
+                    if item.stat().st_nlink == 1:
+                        item.unlink()
+                        removed += 1
+                except OSError:
+                    continue
+            try:
+                bucket.rmdir()
+            except OSError:
+                pass
+        return removed
+
+
+_ACTIVE_STORE: ContextVar[ContentStore | None] = ContextVar(
+    "code_agnostic_content_store", default=None
+)
+
+
+def active_content_store() -> ContentStore | None:
+    return _ACTIVE_STORE.get()
+
+
+@contextmanager
+def use_content_store(store: ContentStore | None) -> Iterator[ContentStore | None]:
+    token = _ACTIVE_STORE.set(store)
+    try:
+        yield store
+    finally:
+        _ACTIVE_STORE.reset(token)
@@ -0,0 +1,395 @@
+"""Local sync daemon that keeps planning state warm behind a Unix socket.
+
+Requests are newline-delimited JSON-RPC 2.0 messages. The server handles one
+request at a time, so plan and apply calls never race on the same targets.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import socketserver
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+from code_agnostic.api import Session
+from code_agnostic.errors import SyncAppError
+from code_agnostic.lossiness import LossinessFinding
+from code_agnostic.models import (
+    Action,
+    ActionKind,
+    ActionStatus,
+    EditorStatusRow,
+    EditorSyncStatus,
+    RepoSyncStatus,
+    SyncPlan,
+    WorkspaceRepoStatusRow,
+    WorkspaceStatusRow,
+    WorkspaceSyncStatus,
+)
+from code_agnostic.plan_output import action_record
+from code_agnostic.source_cache import CacheStats
+from code_agnostic.validation import ValidationIssue, ValidationResult
+
+SOCKET_ENV = "CODE_AGNOSTIC_SOCKET"
+NO_DAEMON_ENV = "CODE_AGNOSTIC_NO_DAEMON"
+SOCKET_FILENAME = ".sync-daemon.sock"
+
+_MAX_SOCKET_PATH = 100
+_CLIENT_TIMEOUT = 120.0
+_PROBE_TIMEOUT = 0.5
+
+_RPC_PARSE_ERROR = -32700
+_RPC_METHOD_NOT_FOUND = -32601
+_RPC_INVALID_PARAMS = -32602
+_RPC_APP_ERROR = -32000
+
+
+class DaemonError(SyncAppError):
+    """Raised when the daemon answers a request with an error."""
+
+
+class DaemonUnavailableError(ConnectionError):
+    """Raised when the daemon cannot be reached; no request was sent."""
+
+
+def daemon_supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def default_socket_path(core_root: Path) -> Path:
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override).expanduser()
+    return core_root / SOCKET_FILENAME
+
+
+def plan_to_payload(plan: SyncPlan) -> dict[str, Any]:
+    return {
+        "actions": [action_record(action) for action in plan.actions],
+        "errors": [str(error) for error in plan.errors],
+        "skipped": list(plan.skipped),
+        "lossiness": [item.to_dict() for item in plan.lossiness],
+    }
+
+
+def plan_from_payload(payload: dict[str, Any]) -> SyncPlan:
+    actions = [
+        Action(
+            kind=ActionKind(item["kind"]),
+            path=Path(item["path"]),
+            status=ActionStatus(item["status"]),
+            detail=item["detail"],
+            source=None if item.get("source") is None else Path(item["source"]),
+            app=item.get("app"),
+            scope=item.get("scope"),
+            workspace=item.get("workspace"),
+        )
+        for item in payload.get("actions", [])
+    ]
+    return SyncPlan(
+        actions=actions,
+        errors=[SyncAppError(item) for item in payload.get("errors", [])],
+        skipped=list(payload.get("skipped", [])),
+        lossiness=[
+            LossinessFinding.from_dict(item) for item in payload.get("lossiness", [])
+        ],
+    )
+
+
+def status_to_payload(
+    editors: list[EditorStatusRow], workspaces: list[WorkspaceStatusRow]
+) -> dict[str, Any]:
+    return {
+        "editors": [
+            {"name": row.name, "status": row.status.value, "detail": row.detail}
+            for row in editors
+        ],
+        "workspaces": [
+            {
+                "name": row.name,
+                "path": row.path,
+                "status": row.status.value,
+                "detail": row.detail,
+                "repos": [
+                    {
+                        "repo": repo.repo,
+                        "status": repo.status.value,
+                        "detail": repo.detail,
+                    }
+                    for repo in row.repos
+                ],
+            }
+            for row in workspaces
+        ],
+    }
+
+
+def status_from_payload(
+    payload: dict[str, Any],
+) -> tuple[list[EditorStatusRow], list[WorkspaceStatusRow]]:
+    editors = [
+        EditorStatusRow(
+            name=item["name"],
+            status=EditorSyncStatus(item["status"]),
+            detail=item["detail"],
+        )
+        for item in payload.get("editors", [])
+    ]
+    workspaces = [
+        WorkspaceStatusRow(
+            name=item["name"],
+            path=item["path"],
+            status=WorkspaceSyncStatus(item["status"]),
+            detail=item["detail"],
+            repos=[
+                WorkspaceRepoStatusRow(
+                    repo=repo["repo"],
+                    status=RepoSyncStatus(repo["status"]),
+                    detail=repo["detail"],
+                )
+                for repo in item.get("repos", [])
+            ],
+        )
+        for item in payload.get("workspaces", [])
+    ]
+    return editors, workspaces
+
+
+def validation_to_payload(result: ValidationResult) -> dict[str, Any]:
+    return {
+        "validated": result.validated,
+        "issues": [
+            {"path": str(issue.path), "message": issue.message}
+            for issue in result.issues
+        ],
+    }
+
+
+def validation_from_payload(payload: dict[str, Any]) -> ValidationResult:
+    return ValidationResult(
+        validated=int(payload.get("validated", 0)),
+        issues=[
+            ValidationIssue(path=Path(item["path"]), message=item["message"])
+            for item in payload.get("issues", [])
+        ],
+    )
+
+
+class DaemonContext:
+    """JSON-facing adapter over the warm session shared by every request."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def plan(self, target: str = "all") -> dict[str, Any]:
+        before = self.session.cache_stats()
+        payload = plan_to_payload(self.session.plan(target))
+        payload["cache"] = self._cache_delta(before)
+        return payload
+
+    def apply(self, target: str = "all") -> dict[str, Any]:
+        before = self.session.cache_stats()
+        result = self.session.apply(target)
+        return {
+            "plan": plan_to_payload(result.plan),
+            "applied": result.applied,
+            "failed": result.failed,
+            "failures": result.failures,
+            "cache": self._cache_delta(before),
+        }
+
+    def _cache_delta(self, before: CacheStats) -> dict[str, int]:
+        after = self.session.cache_stats()
+        return {
+            "hits": after.hits - before.hits,
+            "misses": after.misses - before.misses,
+        }
+
+    def status(self, target: str = "all") -> dict[str, Any]:
+        report = self.session.status(target)
+        return status_to_payload(report.editors, report.workspaces)
+
+    def validate(self, workspace: str | None = None) -> dict[str, Any]:
+        return validation_to_payload(self.session.validate(workspace))
+
+    def invalidate(self) -> dict[str, Any]:
+        self.session.invalidate()
+        return {"invalidated": True}
+
+    def stats(self) -> dict[str, Any]:
+        cache = self.session.cache_stats()
+        return {
+            "pid": os.getpid(),
+            "cache_hits": cache.hits,
+            "cache_misses": cache.misses,
+        }
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: "_UnixServer"
+
+    def handle(self) -> None:
+        for raw in self.rfile:
+            if not raw.strip():
+                continue
+            response = self.server.daemon.dispatch(raw)
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+            if self.server.daemon.stopping.is_set():
+                break
+
+
+class _UnixServer(socketserver.UnixStreamServer):
+    def __init__(self, path: str, daemon: "DaemonServer") -> None:
+        self.daemon = daemon
+        super().__init__(path, _RequestHandler)
+
+
+class DaemonServer:
+    def __init__(self, session: Session, socket_path: Path | None = None) -> None:
+        if not daemon_supported():
+            raise SyncAppError(
+                "Unix domain sockets are not supported on this platform."
+            )
+        self.session = session
+        self.socket_path = socket_path or default_socket_path(session.root)
+        if len(str(self.socket_path)) > _MAX_SOCKET_PATH:
+            raise SyncAppError(
+                f"Socket path too long ({self.socket_path}); set {SOCKET_ENV}."
+            )
+        self.context = DaemonContext(session)
+        self.stopping = threading.Event()
+        self._server: _UnixServer | None = None
+        self._methods: dict[str, Callable[..., Any]] = {
+            "ping": lambda: {"pong": True},
+            "plan": self.context.plan,
+            "apply": self.context.apply,
+            "status": self.context.status,
+            "validate": self.context.validate,
+            "invalidate": self.context.invalidate,
+            "stats": self.context.stats,
+            "shutdown": self._request_shutdown,
+        }
+
+    def bind(self) -> None:
+        if self.socket_path.exists():
+            if DaemonClient(self.socket_path, timeout=_PROBE_TIMEOUT).ping():
+                raise SyncAppError(f"Daemon already running on {self.socket_path}")
+            self.socket_path.unlink()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self._server = _UnixServer(str(self.socket_path), self)
+        os.chmod(self.socket_path, 0o600)
+
+    def serve_forever(self) -> None:
+        if self._server is None:
+            self.bind()
+        assert self._server is not None
+        try:
+            self._server.serve_forever(poll_interval=0.2)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _request_shutdown(self) -> dict[str, Any]:
+        self.stopping.set()
+        server = self._server
+        if server is not None:
+            threading.Thread(target=server.shutdown, daemon=True).start()
+        return {"stopping": True}
+
+    def dispatch(self, raw: bytes) -> dict[str, Any]:
+        try:
+            request = json.loads(raw)
+        except ValueError as exc:
+            return _rpc_error(None, _RPC_PARSE_ERROR, f"Parse error: {exc}")
+        if not isinstance(request, dict):
+            return _rpc_error(None, _RPC_PARSE_ERROR, "Request must be an object")
+
+        request_id = request.get("id")
+        method = self._methods.get(str(request.get("method")))
+        if method is None:
+            return _rpc_error(
+                request_id,
+                _RPC_METHOD_NOT_FOUND,
+                f"Unknown method: {request.get('method')}",
+            )
+        params = request.get("params") or {}
+        if not isinstance(params, dict):
+            return _rpc_error(
+                request_id, _RPC_INVALID_PARAMS, "params must be an object"
+            )
+        try:
+            result = method(**params)
+        except TypeError as exc:
+            return _rpc_error(request_id, _RPC_INVALID_PARAMS, str(exc))
+        except Exception as exc:
+            return _rpc_error(request_id, _RPC_APP_ERROR, str(exc))
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def _rpc_error(request_id: Any, code: int, message: str) -> dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {"code": code, "message": message},
+    }
+
+
+class DaemonClient:
+    def __init__(self, socket_path: Path, timeout: float = _CLIENT_TIMEOUT) -> None:
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._next_id = 0
+
+    def call(self, method: str, **params: Any) -> Any:
+        self._next_id += 1
+        request = {
+            "jsonrpc": "2.0",
+            "id": self._next_id,
+            "method": method,
+            "params": params,
+        }
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(self.timeout)
+            try:
+                conn.connect(str(self.socket_path))
+            except OSError as exc:
+                raise DaemonUnavailableError(str(exc)) from exc
+            conn.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with conn.makefile("rb") as reader:
+                line = reader.readline()
+        if not line:
+            raise ConnectionError("Daemon closed the connection without a response")
+        response = json.loads(line)
+        error = response.get("error")
+        if error:
+            raise DaemonError(str(error.get("message", "daemon error")))
+        return response.get("result")
+
+    def ping(self) -> bool:
+        try:
+            return bool(self.call("ping").get("pong"))
+        except (OSError, ValueError, DaemonError):
+            return False
+
+
+def connect_daemon(core_root: Path) -> DaemonClient | None:
+    """Return a client for a running daemon, or None to run in-process."""
+    if not daemon_supported() or os.environ.get(NO_DAEMON_ENV):
+        return None
+    socket_path = default_socket_path(core_root)
+    if not socket_path.exists():
+        return None
+    client = DaemonClient(socket_path)
+    return client if DaemonClient(socket_path, timeout=_PROBE_TIMEOUT).ping() else None
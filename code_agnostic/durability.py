@@ -0,0 +1,108 @@
+"""How hard apply works to make placed files survive a crash.
+
+``none`` leaves flushing to the OS. ``batch`` remembers what a revision root
+wrote and flushes it in grouped passes: staged data once per filesystem via
+``syncfs`` (falling back to one fsync per file), then each touched directory
+once, before the revision is promoted. ``strict`` fsyncs every file and its
+directory as it is placed.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+from functools import lru_cache
+from pathlib import Path
+
+DURABILITY_LEVELS = ("none", "batch", "strict")
+DEFAULT_DURABILITY = "none"
+
+
+@lru_cache(maxsize=1)
+def _syncfs_function():
+    libc_name = ctypes.util.find_library("c")
+    if libc_name is None:
+        return None
+    try:
+        return ctypes.CDLL(libc_name, use_errno=True).syncfs
+    except (AttributeError, OSError):
+        return None
+
+
+def _syncfs(path: Path) -> bool:
+    syncfs = _syncfs_function()
+    if syncfs is None:
+        return False
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        return syncfs(fd) == 0
+    finally:
+        os.close(fd)
+
+
+def fsync_file(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def fsync_directory(path: Path) -> None:
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        # Directories cannot be opened for fsync on every platform.
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class DurabilityBarrier:
+    """Collects writes of one revision root and flushes them per level."""
+
+    def __init__(self, level: str = DEFAULT_DURABILITY) -> None:
+        if level not in DURABILITY_LEVELS:
+            raise ValueError(f"Unknown durability level: {level}")
+        self.level = level
+        self._files: set[Path] = set()
+        self._directories: set[Path] = set()
+
+    def file_written(self, path: Path, *, now: bool = False) -> None:
+        """Record freshly written data; ``now`` flushes it even in batch mode."""
+        if self.level == "strict" or (self.level == "batch" and now):
+            fsync_file(path)
+        elif self.level == "batch":
+            self._files.add(path)
+
+    def entry_placed(self, path: Path) -> None:
+        """Record a rename, link or unlink inside ``path.parent``."""
+        if self.level == "strict":
+            fsync_directory(path.parent)
+        elif self.level == "batch":
+            self._directories.add(path.parent)
+
+    def flush(self) -> None:
+        if self.level != "batch":
+            return
+        by_device: dict[int, list[Path]] = {}
+        for path in self._files:
+            try:
+                by_device.setdefault(path.stat().st_dev, []).append(path)
+            except OSError:
+                continue
+        for paths in by_device.values():
+            if not _syncfs(paths[0]):
+                for path in paths:
+                    fsync_file(path)
+        for directory in sorted(self._directories):
+            if directory.exists():
+                fsync_directory(directory)
+        self._files.clear()
+        self._directories.clear()
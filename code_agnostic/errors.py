@@ -27,3 +27,9 @@ class InvalidConfigSchemaError(SyncFileError):
     def __init__(self, path: Path, detail: str) -> None:
         self.detail = detail
         super().__init__(path=path, message=f"Invalid config schema ({detail})")
+
+
+class InvalidBundleError(SyncFileError):
+    def __init__(self, path: Path, detail: str) -> None:
+        self.detail = detail
+        super().__init__(path=path, message=f"Invalid artifact bundle ({detail})")
@@ -1,21 +1,37 @@
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from datetime import datetime
 import hashlib
 import json
 import os
 from pathlib import Path
+import shutil
 from typing import Any
 from typing import Protocol
 
 from code_agnostic.apps.common.interfaces.repositories import ISourceRepository
 from code_agnostic.constants import (
+    SYNC_LOCK_FILENAME,
     SYNC_REVISIONS_DIRNAME,
     SYNC_STAGING_DIRNAME,
     SYNC_STATE_FILENAME,
 )
+from code_agnostic.content_store import active_content_store
 from code_agnostic.core.workspace_repository import WorkspaceConfigRepository
+from code_agnostic.durability import DEFAULT_DURABILITY, DurabilityBarrier
+from code_agnostic.locking import advisory_lock
+from code_agnostic.lossiness import LossinessFinding
 from code_agnostic.models import Action, ActionKind, ActionStatus, SyncPlan
-from code_agnostic.utils import write_json
+from code_agnostic.git_exclude_service import (
+    ExcludeCheck,
+    GitExcludeStage,
+    append_exclude_entries,
+    missing_exclude_entries,
+)
+from code_agnostic.utils import read_json_safe, write_json
+
+DEFAULT_RESTORE_JOBS = min(8, os.cpu_count() or 1)
 
 
 @dataclass
@@ -49,12 +65,50 @@ class StoredRevision:
     manifest_path: Path
     state: dict[str, Any] | None
     targets: list[dict[str, Any]]
+    git_exclude: list[dict[str, Any]] = field(default_factory=list)
+    lossiness: list[LossinessFinding] = field(default_factory=list)
 
 
 @dataclass(frozen=True)
 class RestoreResult:
     revision_id: str
     restored: int
+    unchanged: int = 0
+
+
+@dataclass(frozen=True)
+class RevisionSummary:
+    revision_id: str
+    timestamp: str | None
+    targets: int
+    active: bool
+
+
+@dataclass(frozen=True)
+class RootOutcome:
+    """Result of one revision root (global or a workspace) committed on its own."""
+
+    workspace: str | None
+    applied: int = 0
+    failure: str | None = None
+    attempted: bool = True
+    lock_wait: float = 0.0
+    bytes_written: int = 0
+    revisions: int = 0
+
+    @property
+    def label(self) -> str:
+        return "global" if self.workspace is None else self.workspace
+
+    @property
+    def committed(self) -> bool:
+        return self.attempted and self.failure is None
+
+
+def summarize_outcomes(outcomes: list[RootOutcome]) -> tuple[int, int, list[str]]:
+    failures = [item.failure for item in outcomes if item.failure is not None]
+    applied = sum(item.applied for item in outcomes if item.committed)
+    return applied, len(failures), failures
 
 
 @dataclass(frozen=True)
@@ -67,6 +121,12 @@ def _write_text_utf8(path: Path, payload: str) -> None:
     path.write_text(payload, encoding="utf-8", newline="")
 
 
+def _written_size(path: Path) -> int:
+    stat = path.lstat()
+    # Files hard-linked from the content store add no new data.
+    return 0 if stat.st_nlink > 1 else stat.st_size
+
+
 def _remove_tree(root: Path) -> None:
     for child in sorted(
         root.rglob("*"),
@@ -80,6 +140,15 @@ def _remove_tree(root: Path) -> None:
     root.rmdir()
 
 
+def _is_managed_file(action: Action) -> bool:
+    if action.kind in (ActionKind.WRITE_TEXT, ActionKind.WRITE_JSON):
+        return action.path.exists()
+    if action.kind == ActionKind.COPY_FILE:
+        # Conflicting assets were left untouched, so they are not ours to clean up.
+        return action.status != ActionStatus.CONFLICT and action.path.is_file()
+    return False
+
+
 class ActionHandler(Protocol):
     def handle(
         self, action: Action, context: ExecutionContext
@@ -174,8 +243,14 @@ class WriteRuleHandler:
 
 
 class SyncExecutor:
-    def __init__(self, core: ISourceRepository) -> None:
+    def __init__(
+        self, core: ISourceRepository, durability: str = DEFAULT_DURABILITY
+    ) -> None:
         self.context = ExecutionContext(core=core)
+        self.durability = durability
+        self._barrier = DurabilityBarrier(durability)
+        self._bytes_written = 0
+        self._revisions_created = 0
         self.handlers: dict[ActionKind, ActionHandler] = {
             ActionKind.WRITE_JSON: WriteJsonHandler(),
             ActionKind.WRITE_TEXT: WriteTextHandler(),
@@ -186,19 +261,140 @@ class SyncExecutor:
         }
 
     def execute(
-        self, plan: SyncPlan, persist_state: bool = True
+        self,
+        plan: SyncPlan,
+        persist_state: bool = True,
+        continue_on_error: bool = False,
     ) -> tuple[int, int, list[str]]:
+        return summarize_outcomes(
+            self.execute_by_root(
+                plan,
+                persist_state=persist_state,
+                continue_on_error=continue_on_error,
+            )
+        )
+
+    def execute_by_root(
+        self,
+        plan: SyncPlan,
+        persist_state: bool = True,
+        continue_on_error: bool = False,
+        git_exclude: GitExcludeStage | None = None,
+    ) -> list[RootOutcome]:
+        """Apply the plan as one transaction per revision root.
+
+        A failing root is rolled back on its own; roots committed before it
+        stay committed. Later roots run only with ``continue_on_error``.
+        Each root is applied under its advisory lock, taken one at a time in
+        partition order, so applies of other roots from other processes
+        proceed in parallel. With ``git_exclude`` every planned workspace is
+        a root, and its repos' exclude files are updated in its transaction.
+        """
+        store = active_content_store()
+        outcomes: list[RootOutcome] = []
+        stopped = False
+        partitions = self._partition_by_root(
+            plan, include_repo_roots=git_exclude is not None
+        )
+        for workspace, root_plan in partitions:
+            if stopped:
+                outcomes.append(RootOutcome(workspace=workspace, attempted=False))
+                continue
+            lock_path = self._revision_root(workspace) / SYNC_LOCK_FILENAME
+            with advisory_lock(lock_path) as lock_wait:
+                with store.in_use() if store is not None else nullcontext():
+                    applied, failure = self._execute_root(
+                        root_plan, persist_state, workspace, git_exclude
+                    )
+            outcomes.append(
+                RootOutcome(
+                    workspace=workspace,
+                    applied=applied,
+                    failure=failure,
+                    lock_wait=lock_wait or 0.0,
+                    bytes_written=self._bytes_written,
+                    revisions=self._revisions_created,
+                )
+            )
+            if failure is not None and not continue_on_error:
+                stopped = True
+
+        if store is not None and any(item.committed for item in outcomes):
+            store.prune()
+        return outcomes
+
+    def _revision_root(self, workspace: str | None) -> Path:
+        if workspace is None:
+            return self.context.core.root
+        return self.context.core.workspace_config_dir(workspace)
+
+    @staticmethod
+    def _partition_by_root(
+        plan: SyncPlan, include_repo_roots: bool = False
+    ) -> list[tuple[str | None, SyncPlan]]:
+        by_workspace = plan.index.by_workspace
+        names: set[str | None] = set(by_workspace)
+        if include_repo_roots:
+            names.update(plan.repos)
+        order = sorted(names, key=lambda name: (name is not None, name or ""))
+        if not order:
+            order = [None]
+        return [
+            (
+                name,
+                SyncPlan(
+                    actions=plan.index.take(by_workspace.get(name, [])),
+                    errors=[],
+                    skipped=plan.skipped,
+                    retained=[
+                        entry for entry in plan.retained if entry.workspace == name
+                    ],
+                    repos=(
+                        {name: plan.repos[name]}
+                        if name is not None and name in plan.repos
+                        else {}
+                    ),
+                    lossiness=[
+                        item for item in plan.lossiness if item.workspace == name
+                    ],
+                ),
+            )
+            for name in order
+        ]
+
+    def _execute_root(
+        self,
+        plan: SyncPlan,
+        persist_state: bool,
+        workspace: str | None = None,
+        git_exclude: GitExcludeStage | None = None,
+    ) -> tuple[int, str | None]:
         applied = 0
-        failed = 0
-        failures: list[str] = []
-        revision_records = self._prepare_revision_records(plan, persist_state)
+        self._barrier = DurabilityBarrier(self.durability)
+        self._bytes_written = 0
+        self._revisions_created = 0
+        exclude_checks: list[ExcludeCheck] = []
+        if git_exclude is not None and workspace is not None:
+            exclude_checks = git_exclude.check(workspace, plan.repos.get(workspace, []))
+        exclude_updates = [check for check in exclude_checks if check.additions]
+        # Exclude additions are recorded in the root's revision, even when
+        # they are all that changed in it.
+        persist_state = persist_state or bool(exclude_updates)
+        revision_records = self._prepare_revision_records(
+            plan,
+            persist_state,
+            extra_workspace=workspace if exclude_updates else None,
+        )
         self._repair_pending_revisions(revision_records)
         previous_revisions = self._load_previous_revisions(revision_records)
         snapshots = self._capture_snapshots(
             plan=plan,
             persist_state=persist_state,
             revision_records=revision_records,
+            global_root=workspace is None,
         )
+        for check in exclude_updates:
+            snapshots[check.path] = self._snapshot_path(check.path)
         staging_id = (
             revision_records[0].revision_id
             if revision_records
@@ -218,7 +414,9 @@ class SyncExecutor:
             if failure is not None:
                 self._rollback(snapshots, previous_revisions)
                 self._clear_pending_revisions(revision_records)
-                return 0, 1, [failure]
+                return 0, failure
+            # Staged data must be durable before any rename can expose it.
+            self._barrier.flush()
 
             for staged_action in self._ordered_staged_actions(staged_actions):
                 action = staged_action.action
@@ -227,17 +425,26 @@ class SyncExecutor:
                     if failure is not None:
                         self._rollback(snapshots, previous_revisions)
                         self._clear_pending_revisions(revision_records)
-                        return 0, 1, [failure]
+                        return 0, failure
                     if changed:
                         applied += 1
+                        self._barrier.entry_placed(action.path)
                 except Exception as exc:
                     self._rollback(snapshots, previous_revisions)
                     self._clear_pending_revisions(revision_records)
-                    return (
-                        0,
-                        1,
-                        [f"{action.kind.value} failed for {action.path}: {exc}"],
-                    )
+                    return 0, f"{action.kind.value} failed for {action.path}: {exc}"
+
+            if git_exclude is not None and exclude_updates:
+                try:
+                    exclude_checks = git_exclude.write(exclude_checks)
+                except Exception as exc:
+                    self._rollback(snapshots, previous_revisions)
+                    self._clear_pending_revisions(revision_records)
+                    return 0, f"git exclude update failed for {workspace}: {exc}"
+                exclude_updates = [check for check in exclude_checks if check.additions]
+                for check in exclude_updates:
+                    self._barrier.file_written(check.path)
+                    self._barrier.entry_placed(check.path)
 
             if persist_state:
                 try:
@@ -246,13 +453,19 @@ class SyncExecutor:
                         revision_records=revision_records,
                         staging_id=staging_id,
                         staging_dirs=staging_dirs,
+                        global_root=workspace is None,
+                        exclude_updates=exclude_updates,
                     )
                 except Exception as exc:
                     self._rollback(snapshots, previous_revisions)
                     self._clear_pending_revisions(revision_records)
-                    return 0, 1, [f"persist_state failed: {exc}"]
+                    return 0, f"persist_state failed: {exc}"
             self._clear_pending_revisions(revision_records)
-            return applied, failed, failures
+            self._barrier.flush()
+            self._revisions_created = len(revision_records) if persist_state else 0
+            if git_exclude is not None and workspace is not None:
+                git_exclude.commit(workspace, exclude_checks)
+            return applied, None
         finally:
             self._cleanup_staging_dirs(staging_dirs)
 
@@ -273,7 +486,10 @@ class SyncExecutor:
         return removals + others
 
     def _prepare_revision_records(
-        self, plan: SyncPlan, persist_state: bool
+        self,
+        plan: SyncPlan,
+        persist_state: bool,
+        extra_workspace: str | None = None,
     ) -> list[RevisionRecord]:
         if not persist_state:
             return []
@@ -289,13 +505,12 @@ class SyncExecutor:
                 )
             )
 
-        for workspace_name in sorted(
-            {
-                action.workspace
-                for action in plan.actions
-                if action.workspace is not None
-            }
-        ):
+        workspace_names = {
+            action.workspace for action in plan.actions if action.workspace is not None
+        }
+        if extra_workspace is not None:
+            workspace_names.add(extra_workspace)
+        for workspace_name in sorted(workspace_names):
             workspace_root = self.context.core.workspace_config_dir(workspace_name)
             records.append(
                 self._build_revision_record(
@@ -321,6 +536,55 @@ class SyncExecutor:
             artifacts_root=revisions_root / revision_id,
         )
 
+    @staticmethod
+    def _read_stored_revision(manifest_path: Path) -> StoredRevision | None:
+        if not manifest_path.exists():
+            return None
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except Exception:
+            return None
+        if not isinstance(manifest, dict):
+            return None
+        targets = manifest.get("targets")
+        if not isinstance(targets, list):
+            return None
+        state = manifest.get("state")
+        if state is not None and not isinstance(state, dict):
+            state = None
+        revision_id = manifest.get("revision_id")
+        if not isinstance(revision_id, str):
+            return None
+        git_exclude = manifest.get("git_exclude")
+        lossiness = manifest.get("lossiness")
+        return StoredRevision(
+            revision_id=revision_id,
+            manifest_path=manifest_path,
+            state=state,
+            targets=targets,
+            git_exclude=[
+                {
+                    "path": item["path"],
+                    "entries": [
+                        entry for entry in item["entries"] if isinstance(entry, str)
+                    ],
+                }
+                for item in (git_exclude if isinstance(git_exclude, list) else [])
+                if isinstance(item, dict)
+                and isinstance(item.get("path"), str)
+                and isinstance(item.get("entries"), list)
+            ],
+            lossiness=[
+                LossinessFinding.from_dict(item)
+                for item in (lossiness if isinstance(lossiness, list) else [])
+                if isinstance(item, dict)
+                and all(
+                    isinstance(item.get(key), str)
+                    for key in ("resource_path", "app", "property")
+                )
+            ],
+        )
+
     def _load_previous_revisions(
         self, revision_records: list[RevisionRecord]
     ) -> list[StoredRevision]:
@@ -337,69 +601,222 @@ class SyncExecutor:
             manifest_path_text = active_payload.get("manifest_path")
             if not isinstance(manifest_path_text, str):
                 continue
-            manifest_path = Path(manifest_path_text)
-            if not manifest_path.exists():
-                continue
-            try:
-                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
-            except Exception:
-                continue
-            targets = manifest.get("targets")
-            if not isinstance(targets, list):
-                continue
-            state = manifest.get("state")
-            if state is not None and not isinstance(state, dict):
-                state = None
-            revision_id = manifest.get("revision_id")
-            if not isinstance(revision_id, str):
-                continue
-            stored.append(
-                StoredRevision(
-                    revision_id=revision_id,
-                    manifest_path=manifest_path,
-                    state=state,
-                    targets=targets,
-                )
-            )
+            stored_revision = self._read_stored_revision(Path(manifest_path_text))
+            if stored_revision is not None:
+                stored.append(stored_revision)
         return stored
 
+    def active_lossiness(self, workspace: str | None = None) -> list[LossinessFinding]:
+        """Lossiness recorded by the root's active revision at apply time."""
+        record = self._build_revision_record(
+            root=self._revision_root(workspace),
+            workspace=workspace,
+            revision_id="lossiness",
+        )
+        active = self._load_previous_revisions([record])
+        return active[0].lossiness if active else []
+
     def restore_active_revision(self, workspace: str | None = None) -> RestoreResult:
-        if workspace is None:
-            root = self.context.core.root
-        else:
-            root = self.context.core.workspace_config_dir(workspace)
+        return self.restore_revision(workspace=workspace)
 
+    def restore_revision(
+        self,
+        workspace: str | None = None,
+        revision_id: str | None = None,
+        jobs: int | None = None,
+    ) -> RestoreResult:
+        """Bring a root back to a recorded revision (the active one by default).
+
+        Targets whose bytes already match the manifest are left alone; the
+        rest are restored in parallel. Files that newer revisions added and
+        the restored state does not manage are removed. Restoring another
+        revision makes it the active one.
+        """
+        root = self._revision_root(workspace)
+        with advisory_lock(root / SYNC_LOCK_FILENAME):
+            return self._restore_revision(root, workspace, revision_id, jobs)
+
+    def _restore_revision(
+        self,
+        root: Path,
+        workspace: str | None,
+        revision_id: str | None,
+        jobs: int | None,
+    ) -> RestoreResult:
+        label = f"workspace {workspace}" if workspace is not None else "global root"
+        if revision_id is not None and (
+            Path(revision_id).name != revision_id
+            or revision_id in ("active", "pending")
+        ):
+            raise FileNotFoundError(f"Revision {revision_id} not found for {label}.")
         revision_record = self._build_revision_record(
-            root=root, workspace=workspace, revision_id="restore"
+            root=root, workspace=workspace, revision_id=revision_id or "restore"
         )
         self._repair_pending_revisions([revision_record])
-        records = self._load_previous_revisions([revision_record])
-        if not records:
-            label = f"workspace {workspace}" if workspace is not None else "global root"
-            raise FileNotFoundError(f"No active revision found for {label}.")
+        if revision_id is None:
+            records = self._load_previous_revisions([revision_record])
+            if not records:
+                raise FileNotFoundError(f"No active revision found for {label}.")
+            record = records[0]
+        else:
+            stored = self._read_stored_revision(revision_record.manifest_path)
+            if stored is None:
+                raise FileNotFoundError(
+                    f"Revision {revision_id} not found for {label}."
+                )
+            record = stored
 
-        record = records[0]
+        entries = [
+            target
+            for target in [record.state, *record.targets]
+            if isinstance(target, dict) and isinstance(target.get("path"), str)
+        ]
+        stale = [
+            target for target in entries if not self._manifest_file_matches(target)
+        ]
+        stale_excludes = [
+            item for item in record.git_exclude if self._exclude_entries_missing(item)
+        ]
+        orphans = self._orphaned_targets(root, record)
         snapshots = {
             Path(target["path"]): self._snapshot_path(Path(target["path"]))
-            for target in record.targets
-            if isinstance(target, dict) and isinstance(target.get("path"), str)
+            for target in [*stale, *stale_excludes]
         }
-        if record.state is not None and isinstance(record.state.get("path"), str):
-            state_path = Path(record.state["path"])
-            snapshots[state_path] = self._snapshot_path(state_path)
+        snapshots.update({path: self._snapshot_path(path) for path in orphans})
+        activate = revision_id is not None and not self._is_active_revision(
+            revision_record, record
+        )
+        if activate:
+            snapshots[revision_record.active_path] = self._snapshot_path(
+                revision_record.active_path
+            )
 
-        restored = 0
         try:
-            if record.state is not None and self._restore_manifest_file(record.state):
-                restored += 1
-            for target in record.targets:
-                if self._restore_manifest_file(target):
-                    restored += 1
+            restored = sum(self._restore_manifest_files(stale, jobs))
+            for item in stale_excludes:
+                append_exclude_entries(Path(item["path"]), item["entries"])
+            restored += len(stale_excludes)
+            for path in orphans:
+                self._remove_existing_path(path)
+            restored += len(orphans)
+            if activate:
+                write_json(
+                    revision_record.active_path,
+                    {
+                        "revision_id": record.revision_id,
+                        "manifest_path": str(record.manifest_path),
+                    },
+                )
         except Exception:
             self._rollback(snapshots, [])
             raise
 
-        return RestoreResult(revision_id=record.revision_id, restored=restored)
+        return RestoreResult(
+            revision_id=record.revision_id,
+            restored=restored,
+            unchanged=len(entries)
+            - len(stale)
+            + len(record.git_exclude)
+            - len(stale_excludes),
+        )
+
+    def _orphaned_targets(self, root: Path, record: StoredRevision) -> list[Path]:
+        """Targets written by revisions newer than ``record`` that it lacks.
+
+        The restored state does not list them, so no later apply would
+        prune them. Paths the restored state still manages are kept.
+        """
+        kept = {
+            target["path"]
+            for target in record.targets
+            if isinstance(target.get("path"), str)
+        }
+        managed: list[Path] = []
+        state_artifact = (record.state or {}).get("artifact_path")
+        if isinstance(state_artifact, str):
+            state, _ = read_json_safe(Path(state_artifact))
+            for key in ("managed_links", "managed_paths"):
+                group = state.get(key) if isinstance(state, dict) else None
+                for paths in (group if isinstance(group, dict) else {}).values():
+                    if isinstance(paths, list):
+                        managed.extend(Path(p) for p in paths if isinstance(p, str))
+
+        orphans: dict[Path, None] = {}
+        revisions_root = root / SYNC_REVISIONS_DIRNAME
+        for manifest_path in sorted(revisions_root.glob("*.json")):
+            if manifest_path.stem in ("active", "pending"):
+                continue
+            if manifest_path.stem <= record.revision_id:
+                continue
+            newer = self._read_stored_revision(manifest_path)
+            if newer is None:
+                continue
+            for target in newer.targets:
+                path_text = target.get("path") if isinstance(target, dict) else None
+                if not isinstance(path_text, str) or path_text in kept:
+                    continue
+                path = Path(path_text)
+                if not (path.is_symlink() or path.is_file()):
+                    continue
+                if any(path == item or item in path.parents for item in managed):
+                    continue
+                orphans[path] = None
+        return list(orphans)
+
+    def _restore_manifest_files(
+        self, targets: list[dict[str, Any]], jobs: int | None
+    ) -> list[bool]:
+        workers = max(1, min(jobs or DEFAULT_RESTORE_JOBS, len(targets)))
+        if workers == 1:
+            return [self._restore_manifest_file(target) for target in targets]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self._restore_manifest_file, targets))
+
+    def list_revisions(self, workspace: str | None = None) -> list[RevisionSummary]:
+        root = self._revision_root(workspace)
+        record = self._build_revision_record(
+            root=root, workspace=workspace, revision_id="list"
+        )
+        active = self._load_previous_revisions([record])
+        active_id = active[0].revision_id if active else None
+        revisions_root = root / SYNC_REVISIONS_DIRNAME
+        if not revisions_root.is_dir():
+            return []
+
+        summaries: list[RevisionSummary] = []
+        for manifest_path in sorted(revisions_root.glob("*.json")):
+            if manifest_path in (record.active_path, record.pending_path):
+                continue
+            try:
+                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            except Exception:
+                continue
+            if not isinstance(manifest, dict):
+                continue
+            stored_id = manifest.get("revision_id")
+            targets = manifest.get("targets")
+            if not isinstance(stored_id, str) or not isinstance(targets, list):
+                continue
+            timestamp = manifest.get("timestamp")
+            summaries.append(
+                RevisionSummary(
+                    revision_id=stored_id,
+                    timestamp=timestamp if isinstance(timestamp, str) else None,
+                    targets=len(targets),
+                    active=stored_id == active_id,
+                )
+            )
+        return summaries
+
+    @staticmethod
+    def _is_active_revision(
+        revision_record: RevisionRecord, stored: StoredRevision
+    ) -> bool:
+        payload, _ = read_json_safe(revision_record.active_path)
+        return (
+            isinstance(payload, dict)
+            and payload.get("revision_id") == stored.revision_id
+        )
 
     def _repair_pending_revisions(self, revision_records: list[RevisionRecord]) -> None:
         for record in revision_records:
@@ -447,6 +864,7 @@ class SyncExecutor:
                 ActionKind.WRITE_JSON,
                 ActionKind.WRITE_TEXT,
                 ActionKind.WRITE_RULE,
+                ActionKind.COPY_FILE,
             }:
                 staged_path, failure = self._stage_write_action(
                     action=action,
@@ -457,6 +875,9 @@ class SyncExecutor:
                 )
                 if failure is not None:
                     return [], failure
+                if staged_path is not None:
+                    self._barrier.file_written(staged_path)
+                    self._bytes_written += _written_size(staged_path)
             staged_actions.append(StagedAction(action=action, staged_path=staged_path))
         return staged_actions, None
 
@@ -471,6 +892,11 @@ class SyncExecutor:
     ) -> tuple[Path | None, str | None]:
         if action.status == ActionStatus.NOOP:
             return None, None
+        if (
+            action.kind == ActionKind.COPY_FILE
+            and action.status == ActionStatus.CONFLICT
+        ):
+            return None, None
 
         staging_root = self._staging_root_for_action(
             action=action,
@@ -482,11 +908,29 @@ class SyncExecutor:
         suffix = action.path.suffix or ".tmp"
         staged_path = staging_root / f"{index}{suffix}"
 
+        if action.kind == ActionKind.COPY_FILE:
+            if action.source is None:
+                return None, f"Missing source for copy action: {action.path}"
+            try:
+                # copy2 keeps the source mtime so the next plan can skip hashing.
+                shutil.copy2(action.source, staged_path)
+            except Exception as exc:
+                return None, f"{action.kind.value} failed for {action.path}: {exc}"
+            return staged_path, None
+
         if action.kind in {ActionKind.WRITE_TEXT, ActionKind.WRITE_RULE}:
             if not isinstance(action.payload, str):
                 if action.kind == ActionKind.WRITE_RULE:
                     return None, f"Missing rule payload for write action: {action.path}"
                 return None, f"Missing text payload for write action: {action.path}"
+            store = active_content_store()
+            if (
+                store is not None
+                and store.covers(action.scope)
+                and store.can_link(action.path)
+                and store.link(action.payload, staged_path)
+            ):
+                return staged_path, None
             try:
                 _write_text_utf8(staged_path, action.payload)
             except Exception as exc:
@@ -526,9 +970,15 @@ class SyncExecutor:
             ActionKind.WRITE_JSON,
             ActionKind.WRITE_TEXT,
             ActionKind.WRITE_RULE,
+            ActionKind.COPY_FILE,
         }:
             if action.status == ActionStatus.NOOP:
                 return False, None
+            if (
+                action.kind == ActionKind.COPY_FILE
+                and action.status == ActionStatus.CONFLICT
+            ):
+                return False, None
             if staged_action.staged_path is None:
                 return False, f"Missing staged payload for write action: {action.path}"
             action.path.parent.mkdir(parents=True, exist_ok=True)
@@ -573,15 +1023,20 @@ class SyncExecutor:
         plan: SyncPlan,
         persist_state: bool,
         revision_records: list[RevisionRecord],
+        global_root: bool = True,
     ) -> dict[Path, PathSnapshot]:
         paths: dict[Path, PathSnapshot] = {}
         for action in plan.actions:
+            # NOOP actions never touch their target, so there is nothing to restore.
+            if action.status == ActionStatus.NOOP:
+                continue
             paths[action.path] = self._snapshot_path(action.path)
 
         if persist_state:
             core = self.context.core
-            core_state_path = core.root / SYNC_STATE_FILENAME
-            paths[core_state_path] = self._snapshot_path(core_state_path)
+            if global_root:
+                core_state_path = core.root / SYNC_STATE_FILENAME
+                paths[core_state_path] = self._snapshot_path(core_state_path)
             for workspace_name in {
                 action.workspace
                 for action in plan.actions
@@ -646,6 +1101,8 @@ class SyncExecutor:
         revision_records: list[RevisionRecord],
         staging_id: str,
         staging_dirs: set[Path],
+        global_root: bool = True,
+        exclude_updates: list[ExcludeCheck] | None = None,
     ) -> None:
         global_links: dict[str, list[str]] = {}
         global_paths: dict[str, list[str]] = {}
@@ -665,10 +1122,7 @@ class SyncExecutor:
                     workspace_links.setdefault(ws_name, {}).setdefault(
                         action.scope, []
                     ).append(str(action.path))
-                if (
-                    action.kind in (ActionKind.WRITE_TEXT, ActionKind.WRITE_JSON)
-                    and action.path.exists()
-                ):
+                if _is_managed_file(action):
                     workspace_paths.setdefault(ws_name, {}).setdefault(
                         action.scope, []
                     ).append(str(action.path))
@@ -676,38 +1130,48 @@ class SyncExecutor:
                 global_touched_scopes.add(action.scope)
                 if action.kind == ActionKind.SYMLINK and action.path.is_symlink():
                     global_links.setdefault(action.scope, []).append(str(action.path))
-                if (
-                    action.kind in (ActionKind.WRITE_TEXT, ActionKind.WRITE_JSON)
-                    and action.path.exists()
-                ):
+                if _is_managed_file(action):
                     global_paths.setdefault(action.scope, []).append(str(action.path))
 
+        # Entries of scopes planned only in part are written back unchanged.
+        for entry in plan.retained:
+            if entry.scope not in workspace_touched_scopes.get(entry.workspace, ()):
+                continue
+            workspace_links.setdefault(entry.workspace, {}).setdefault(
+                entry.scope, []
+            ).extend(entry.links)
+            workspace_paths.setdefault(entry.workspace, {}).setdefault(
+                entry.scope, []
+            ).extend(entry.paths)
+
         updated_at = datetime.now().isoformat(timespec="seconds")
 
-        # Persist global state
+        # Persist global state; workspace roots leave the hub state to the
+        # hub's own transaction so they never contend on its lock.
         core = self.context.core
-        existing_global_state = core.load_state()
-        global_state = {
-            "updated_at": updated_at,
-            "managed_links": self._merge_managed_links(
-                existing=existing_global_state.get("managed_links"),
-                touched_scopes=global_touched_scopes,
-                current_links=global_links,
-            ),
-            "managed_paths": self._merge_managed_links(
-                existing=existing_global_state.get("managed_paths"),
-                touched_scopes=global_touched_scopes,
-                current_links=global_paths,
-            ),
-            "skipped": plan.skipped,
-        }
-        self._place_json_via_staging(
-            target=core.root / SYNC_STATE_FILENAME,
-            payload=global_state,
-            staging_root=core.root / SYNC_STAGING_DIRNAME / staging_id / "metadata",
-            staging_dirs=staging_dirs,
-            stage_name="global-state.json",
-        )
+        if global_root:
+            existing_global_state = core.load_state()
+            global_state = {
+                "updated_at": updated_at,
+                "managed_links": self._merge_managed_links(
+                    existing=existing_global_state.get("managed_links"),
+                    touched_scopes=global_touched_scopes,
+                    current_links=global_links,
+                ),
+                "managed_paths": self._merge_managed_links(
+                    existing=existing_global_state.get("managed_paths"),
+                    touched_scopes=global_touched_scopes,
+                    current_links=global_paths,
+                ),
+                "skipped": plan.skipped,
+            }
+            self._place_json_via_staging(
+                target=core.root / SYNC_STATE_FILENAME,
+                payload=global_state,
+                staging_root=core.root / SYNC_STAGING_DIRNAME / staging_id / "metadata",
+                staging_dirs=staging_dirs,
+                stage_name="global-state.json",
+            )
 
         # Persist workspace state
         for ws_name in workspace_touched_scopes:
@@ -741,6 +1205,7 @@ class SyncExecutor:
             plan=plan,
             revision_records=revision_records,
             staging_dirs=staging_dirs,
+            exclude_updates=exclude_updates or [],
         )
 
     def _persist_revision_manifests(
@@ -749,12 +1214,19 @@ class SyncExecutor:
         plan: SyncPlan,
         revision_records: list[RevisionRecord],
         staging_dirs: set[Path],
+        exclude_updates: list[ExcludeCheck] | None = None,
     ) -> None:
         actions_by_workspace: dict[str | None, list[Action]] = {}
         for action in plan.actions:
             actions_by_workspace.setdefault(action.workspace, []).append(action)
 
         for record in revision_records:
+            previous = {
+                target["path"]: target
+                for stored in self._load_previous_revisions([record])
+                for target in stored.targets
+                if isinstance(target, dict) and isinstance(target.get("path"), str)
+            }
             actions = sorted(
                 actions_by_workspace.get(record.workspace, []),
                 key=lambda action: (
@@ -775,10 +1247,32 @@ class SyncExecutor:
                 ),
                 "sources": self._serialize_manifest_sources(record.root),
                 "targets": [
-                    self._serialize_manifest_target(record, action, index)
+                    self._serialize_manifest_target(
+                        record, action, index, previous.get(str(action.path))
+                    )
                     for index, action in enumerate(actions)
                 ],
             }
+            lossiness = [
+                item.to_dict()
+                for item in plan.lossiness
+                if item.workspace == record.workspace
+            ]
+            if lossiness:
+                # What the compiled outputs of this revision dropped.
+                manifest["lossiness"] = lossiness
+            if record.workspace is not None and exclude_updates:
+                # Lines added to repo exclude files; restoring re-adds any
+                # that were removed since.
+                manifest["git_exclude"] = [
+                    {
+                        "repo": str(check.repo),
+                        "path": str(check.path),
+                        "entries": list(check.additions),
+                    }
+                    for check in exclude_updates
+                    if check.additions
+                ]
             self._place_json_via_staging(
                 target=record.manifest_path,
                 payload=manifest,
@@ -789,6 +1283,8 @@ class SyncExecutor:
                 staging_dirs=staging_dirs,
                 stage_name=record.manifest_path.name,
             )
+            # Promote only once targets, state and manifest are durable.
+            self._barrier.flush()
             self._place_json_via_staging(
                 target=record.active_path,
                 payload={
@@ -816,14 +1312,18 @@ class SyncExecutor:
         staging_dirs.add(staging_root.parent)
         staged_path = staging_root / stage_name
         write_json(staged_path, payload)
+        self._barrier.file_written(staged_path, now=True)
         target.parent.mkdir(parents=True, exist_ok=True)
         os.replace(staged_path, target)
+        self._barrier.entry_placed(target)
 
     def _serialize_manifest_file(
         self, *, path: Path, artifact_path: Path
     ) -> dict[str, Any]:
         checksum: str | None = None
         serialized_artifact_path: str | None = None
+        size: int | None = None
+        mtime_ns: int | None = None
         exists = path.exists() or path.is_symlink()
         if path.is_symlink():
             checksum = hashlib.sha256(os.readlink(path).encode("utf-8")).hexdigest()
@@ -835,25 +1335,44 @@ class SyncExecutor:
                 os.readlink(path), encoding="utf-8"
             )
         elif path.exists() and path.is_file():
-            checksum = hashlib.sha256(path.read_bytes()).hexdigest()
+            content = path.read_bytes()
+            checksum = hashlib.sha256(content).hexdigest()
             artifact_path.parent.mkdir(parents=True, exist_ok=True)
-            artifact_path.write_bytes(path.read_bytes())
+            artifact_path.write_bytes(content)
             serialized_artifact_path = str(artifact_path)
+            file_stat = path.stat()
+            size, mtime_ns = file_stat.st_size, file_stat.st_mtime_ns
+
+        if serialized_artifact_path is not None:
+            self._barrier.file_written(Path(serialized_artifact_path))
+            self._barrier.entry_placed(Path(serialized_artifact_path))
 
         return {
             "path": str(path),
             "exists": exists,
             "checksum": checksum,
             "artifact_path": serialized_artifact_path,
+            "size": size,
+            "mtime_ns": mtime_ns,
         }
 
     def _serialize_manifest_target(
-        self, record: RevisionRecord, action: Action, index: int
+        self,
+        record: RevisionRecord,
+        action: Action,
+        index: int,
+        previous: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        payload = self._serialize_manifest_file(
-            path=action.path,
-            artifact_path=record.artifacts_root / f"{index}.bin",
-        )
+        artifact_path = record.artifacts_root / f"{index}.bin"
+        payload = None
+        if action.status == ActionStatus.NOOP and previous is not None:
+            payload = self._link_manifest_artifact(
+                path=action.path, artifact_path=artifact_path, previous=previous
+            )
+        if payload is None:
+            payload = self._serialize_manifest_file(
+                path=action.path, artifact_path=artifact_path
+            )
         return {
             "path": str(action.path),
             "kind": action.kind.value,
@@ -862,6 +1381,49 @@ class SyncExecutor:
             "exists": payload["exists"],
             "checksum": payload["checksum"],
             "artifact_path": payload["artifact_path"],
+            "size": payload["size"],
+            "mtime_ns": payload["mtime_ns"],
+        }
+
+    def _link_manifest_artifact(
+        self, *, path: Path, artifact_path: Path, previous: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Reuse the previous revision's artifact for an untouched target.
+
+        A NOOP target whose size and mtime still match the previous manifest
+        holds the bytes recorded there, so its artifact is hardlinked instead
+        of read and copied again. Returns None when it has to be snapshotted.
+        """
+        source = previous.get("artifact_path")
+        size = previous.get("size")
+        mtime_ns = previous.get("mtime_ns")
+        if (
+            previous.get("exists") is not True
+            or not isinstance(previous.get("checksum"), str)
+            or not isinstance(source, str)
+            or source.endswith(".symlink")
+            or not isinstance(size, int)
+            or not isinstance(mtime_ns, int)
+        ):
+            return None
+        if path.is_symlink() or not path.is_file():
+            return None
+        file_stat = path.stat()
+        if (file_stat.st_size, file_stat.st_mtime_ns) != (size, mtime_ns):
+            return None
+        artifact_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(source, artifact_path)
+        except OSError:
+            return None
+        self._barrier.entry_placed(artifact_path)
+        return {
+            "path": str(path),
+            "exists": True,
+            "checksum": previous["checksum"],
+            "artifact_path": str(artifact_path),
+            "size": size,
+            "mtime_ns": mtime_ns,
         }
 
     def _serialize_manifest_sources(self, root: Path) -> list[dict[str, str]]:
@@ -906,8 +1468,48 @@ class SyncExecutor:
             path.symlink_to(artifact_path.read_text(encoding="utf-8"))
             return True
         path.write_bytes(artifact_path.read_bytes())
+        mtime_ns = target.get("mtime_ns")
+        if isinstance(mtime_ns, int):
+            # Keep the recorded mtime so the next restore can skip by stat.
+            os.utime(path, ns=(mtime_ns, mtime_ns))
         return True
 
+    @staticmethod
+    def _exclude_entries_missing(item: dict[str, Any]) -> bool:
+        path = Path(item["path"])
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            lines = []
+        return bool(missing_exclude_entries(lines, item["entries"]))
+
+    @staticmethod
+    def _manifest_file_matches(target: dict[str, Any]) -> bool:
+        """Whether the path already holds what the manifest recorded."""
+        path = Path(target["path"])
+        if target.get("exists") is not True:
+            return not (path.exists() or path.is_symlink())
+        checksum = target.get("checksum")
+        artifact_path = target.get("artifact_path")
+        if not isinstance(checksum, str) or not isinstance(artifact_path, str):
+            return False
+        if artifact_path.endswith(".symlink"):
+            return (
+                path.is_symlink()
+                and hashlib.sha256(os.readlink(path).encode("utf-8")).hexdigest()
+                == checksum
+            )
+        if path.is_symlink() or not path.is_file():
+            return False
+        size = target.get("size")
+        if isinstance(size, int):
+            file_stat = path.stat()
+            if file_stat.st_size != size:
+                return False
+            if file_stat.st_mtime_ns == target.get("mtime_ns"):
+                return True
+        return hashlib.sha256(path.read_bytes()).hexdigest() == checksum
+
     @staticmethod
     def _merge_managed_links(
         *,
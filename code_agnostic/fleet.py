@@ -0,0 +1,180 @@
+"""Apply one hub's global config to many home roots.
+
+Each home gets the app configs, skills and agents a user would get from
+``apply`` in that home, with its own sync state, lock and revisions under
+``<home>/.config/code-agnostic``. Sources are parsed and compiled once for
+the whole fleet through one shared source cache, and homes are planned and
+applied in parallel. Workspaces are left out: their repos live at fixed
+paths, not under a home.
+"""
+
+from __future__ import annotations
+
+import glob
+import os
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from code_agnostic.apps.app_id import AppId
+from code_agnostic.apps.common.framework import (
+    create_registered_app_service_for_home,
+)
+from code_agnostic.apps.common.interfaces.service import IAppConfigService
+from code_agnostic.caching import CachingCoreRepository
+from code_agnostic.core.repository import CoreRepository
+from code_agnostic.durability import DEFAULT_DURABILITY
+from code_agnostic.executor import RootOutcome, SyncExecutor, summarize_outcomes
+from code_agnostic.models import SyncPlan
+from code_agnostic.planner import SyncPlanner
+from code_agnostic.source_cache import SourceCache, use_source_cache
+
+DEFAULT_FLEET_JOBS = min(8, os.cpu_count() or 1)
+FLEET_STATE_DIR = Path(".config") / "code-agnostic"
+
+
+class FleetRootRepository(CoreRepository):
+    """The hub's sources, with sync state kept under a fleet home."""
+
+    def __init__(self, hub: CoreRepository, home: Path) -> None:
+        super().__init__(home / FLEET_STATE_DIR)
+        self._hub = hub
+
+    @property
+    def config_dir(self) -> Path:
+        return self._hub.config_dir
+
+    @property
+    def skills_dir(self) -> Path:
+        return self._hub.skills_dir
+
+    @property
+    def agents_dir(self) -> Path:
+        return self._hub.agents_dir
+
+    @property
+    def workspaces_dir(self) -> Path:
+        return self._hub.workspaces_dir
+
+    def load_mcp_base(self) -> dict[str, Any]:
+        return self._hub.load_mcp_base()
+
+    def load_workspaces(self) -> list[dict[str, str]]:
+        return []
+
+
+@dataclass
+class FleetResult:
+    home: Path
+    plan: SyncPlan | None = None
+    outcomes: list[RootOutcome] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def applied(self) -> int:
+        return summarize_outcomes(self.outcomes)[0]
+
+    @property
+    def failures(self) -> list[str]:
+        if self.error is not None:
+            return [self.error]
+        if self.plan is not None and self.plan.errors:
+            return [str(error) for error in self.plan.errors]
+        return summarize_outcomes(self.outcomes)[2]
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "home": str(self.home),
+            "ok": self.ok,
+            "actions": self.plan.summary() if self.plan is not None else {},
+            "applied": self.applied,
+            "revisions": sum(item.revisions for item in self.outcomes),
+            "failures": self.failures,
+        }
+
+
+def expand_fleet_homes(
+    roots: Iterable[Path | str], patterns: Iterable[str] = ()
+) -> list[Path]:
+    """Resolve explicit roots and glob templates into distinct home dirs."""
+    homes: list[Path] = [Path(root).expanduser() for root in roots]
+    for pattern in patterns:
+        matches = sorted(glob.glob(os.path.expanduser(pattern)))
+        homes.extend(Path(match) for match in matches if Path(match).is_dir())
+    seen: set[Path] = set()
+    unique: list[Path] = []
+    for home in homes:
+        resolved = home.resolve()
+        if resolved not in seen:
+            seen.add(resolved)
+            unique.append(resolved)
+    return unique
+
+
+class FleetService:
+    def __init__(
+        self,
+        hub: CoreRepository,
+        apps: list[str],
+        *,
+        jobs: int | None = None,
+        durability: str = DEFAULT_DURABILITY,
+    ) -> None:
+        # One hub instance for every home so the MCP base is parsed once.
+        self.hub = CachingCoreRepository(hub.root)
+        self.apps = apps
+        self.jobs = jobs or DEFAULT_FLEET_JOBS
+        self.durability = durability
+        self.cache = SourceCache()
+
+    def _services_for(self, home: Path) -> list[IAppConfigService]:
+        services: list[IAppConfigService] = []
+        for app in self.apps:
+            try:
+                services.append(
+                    create_registered_app_service_for_home(AppId(app), home, self.hub)
+                )
+            except (KeyError, ValueError):
+                continue
+        return services
+
+    def plan_home(self, home: Path) -> SyncPlan:
+        planner = SyncPlanner(
+            core=FleetRootRepository(self.hub, home),
+            app_services=self._services_for(home),
+            include_workspace=False,
+        )
+        return planner.build()
+
+    def _run_home(self, home: Path, apply: bool) -> FleetResult:
+        result = FleetResult(home=home)
+        if not home.is_dir():
+            result.error = f"Home root is not a directory: {home}"
+            return result
+        try:
+            # Context variables do not follow work into pool threads.
+            with use_source_cache(self.cache):
+                result.plan = self.plan_home(home)
+            if not apply or result.plan.errors or not result.plan.actions:
+                return result
+            executor = SyncExecutor(
+                FleetRootRepository(self.hub, home), durability=self.durability
+            )
+            result.outcomes = executor.execute_by_root(result.plan)
+        except Exception as exc:
+            result.error = f"{home}: {exc}"
+        return result
+
+    def run(self, homes: list[Path], apply: bool = True) -> list[FleetResult]:
+        """Plan (and apply) every home; one home failing leaves the rest alone."""
+        workers = max(1, min(self.jobs, len(homes)))
+        if workers == 1:
+            return [self._run_home(home, apply) for home in homes]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda home: self._run_home(home, apply), homes))
@@ -1,14 +1,71 @@
-"""Git-exclude customization service."""
+"""Git-exclude customization service and the apply-time exclude stage."""
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from code_agnostic.apps.app_id import app_metadata
-from code_agnostic.constants import AGENTS_FILENAME, CLAUDE_FILENAME
+from code_agnostic.constants import (
+    AGENTS_FILENAME,
+    CLAUDE_FILENAME,
+    GIT_EXCLUDE_STATE_FILENAME,
+)
 from code_agnostic.core.repository import CoreRepository
 from code_agnostic.utils import read_json_safe, write_json
+from code_agnostic.workspaces import WorkspaceService
+
+DEFAULT_EXCLUDE_JOBS = min(8, os.cpu_count() or 1)
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def missing_exclude_entries(lines: list[str], entries: Iterable[str]) -> list[str]:
+    """Entries not yet present in an exclude file's lines, ignoring comments."""
+    seen_entries = {
+        line.strip()
+        for line in lines
+        if line.strip() and not line.lstrip().startswith("#")
+    }
+    additions: list[str] = []
+    for entry in entries:
+        normalized = entry.strip()
+        if not normalized or normalized in seen_entries:
+            continue
+        additions.append(entry)
+        seen_entries.add(normalized)
+    return additions
+
+
+def append_exclude_entries(path: Path, entries: Iterable[str]) -> list[str]:
+    """Append the missing entries to an exclude file and return them."""
+    existing_lines: list[str] = []
+    if path.exists():
+        existing_lines = path.read_text(encoding="utf-8").splitlines()
+    additions = missing_exclude_entries(existing_lines, entries)
+    if not additions:
+        return []
+
+    merged = list(existing_lines)
+    if merged and merged[-1] != "":
+        merged.append("")
+    merged.extend(additions)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(merged) + "\n", encoding="utf-8")
+    return additions
+
+
+def ensure_exclude_entries(path: Path, entries: list[str]) -> tuple[int, bool]:
+    """Add entries to a file, skipping duplicates and comments."""
+    additions = append_exclude_entries(path, entries)
+    return len(additions), bool(additions)
 
 
 class GitExcludeService:
@@ -85,3 +142,191 @@ class GitExcludeService:
     def list_patterns(self, workspace_name: str) -> dict[str, Any]:
         self._ensure_workspace_exists(workspace_name)
         return self._load_config(workspace_name)
+
+
+@dataclass(frozen=True)
+class ExcludeCheck:
+    """One repo's exclude file and the entries it is missing."""
+
+    repo: Path
+    path: Path
+    additions: tuple[str, ...] = ()
+    skipped: bool = False
+    stamp: dict[str, Any] | None = None
+
+
+@dataclass
+class ExcludeReport:
+    repos: int = 0
+    skipped: int = 0
+    changed: int = 0
+    lines_added: int = 0
+
+
+def _file_stamp(path: Path) -> dict[str, Any] | None:
+    try:
+        content = path.read_bytes()
+        file_stat = path.stat()
+    except OSError:
+        return None
+    return {
+        "path": str(path),
+        "mtime_ns": file_stat.st_mtime_ns,
+        "size": file_stat.st_size,
+        "sha256": hashlib.sha256(content).hexdigest(),
+    }
+
+
+def _valid_stamp(stamp: Any) -> bool:
+    return (
+        isinstance(stamp, dict)
+        and isinstance(stamp.get("path"), str)
+        and isinstance(stamp.get("mtime_ns"), int)
+        and isinstance(stamp.get("size"), int)
+        and isinstance(stamp.get("sha256"), str)
+    )
+
+
+class GitExcludeStage:
+    """Adds a workspace's exclude entries to its planned repos' exclude files.
+
+    Once a repo's ``info/exclude`` holds every entry, its path, mtime, size
+    and hash are recorded in the workspace's ``.git-exclude-state.json``.
+    While the entries and the file's stat stay the same, later runs skip
+    the repo without resolving its git dir or reading the file.
+    """
+
+    def __init__(
+        self,
+        core: CoreRepository,
+        enabled_apps: list[str],
+        workspace_service: WorkspaceService | None = None,
+        jobs: int | None = None,
+    ) -> None:
+        self._core = core
+        self._service = GitExcludeService(core)
+        self._enabled_apps = enabled_apps
+        self._workspace_service = workspace_service or WorkspaceService()
+        self._jobs = jobs or DEFAULT_EXCLUDE_JOBS
+        self._entries_digests: dict[str, str] = {}
+        self.report = ExcludeReport()
+
+    def _state_path(self, workspace_name: str) -> Path:
+        return (
+            self._core.workspace_config_dir(workspace_name) / GIT_EXCLUDE_STATE_FILENAME
+        )
+
+    def _load_stamps(self, workspace_name: str, digest: str) -> dict[str, Any]:
+        payload, _ = read_json_safe(self._state_path(workspace_name))
+        if not isinstance(payload, dict) or payload.get("entries") != digest:
+            return {}
+        repos = payload.get("repos")
+        if not isinstance(repos, dict):
+            return {}
+        return {repo: stamp for repo, stamp in repos.items() if _valid_stamp(stamp)}
+
+    def _map(self, func: Callable[[_T], _R], items: list[_T]) -> list[_R]:
+        workers = max(1, min(self._jobs, len(items)))
+        if workers == 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(func, items))
+
+    def check(self, workspace_name: str, repos: list[Path]) -> list[ExcludeCheck]:
+        """Find what each repo's exclude file is missing, without writing."""
+        entries = self._service.compute_entries(workspace_name, self._enabled_apps)
+        digest = hashlib.sha256(json.dumps(entries).encode("utf-8")).hexdigest()
+        self._entries_digests[workspace_name] = digest
+        stamps = self._load_stamps(workspace_name, digest)
+        checks = self._map(
+            lambda repo: self._check_repo(repo, entries, stamps.get(str(repo))),
+            list(repos),
+        )
+        return [check for check in checks if check is not None]
+
+    def _check_repo(
+        self, repo: Path, entries: list[str], stamp: dict[str, Any] | None
+    ) -> ExcludeCheck | None:
+        if stamp is not None:
+            path = Path(stamp["path"])
+            try:
+                file_stat = path.stat()
+            except OSError:
+                file_stat = None
+            if file_stat is not None and (
+                file_stat.st_mtime_ns == stamp["mtime_ns"]
+                and file_stat.st_size == stamp["size"]
+            ):
+                return ExcludeCheck(repo=repo, path=path, skipped=True, stamp=stamp)
+
+        git_dir = self._workspace_service.resolve_git_dir(repo)
+        if git_dir is None:
+            return None
+        path = git_dir / "info" / "exclude"
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            content = b""
+        if (
+            stamp is not None
+            and stamp["path"] == str(path)
+            and stamp["sha256"] == hashlib.sha256(content).hexdigest()
+        ):
+            # Touched but unchanged; re-stamped with its new stat on commit.
+            return ExcludeCheck(repo=repo, path=path, skipped=True)
+        lines = content.decode("utf-8").splitlines()
+        return ExcludeCheck(
+            repo=repo,
+            path=path,
+            additions=tuple(missing_exclude_entries(lines, entries)),
+        )
+
+    def write(self, checks: list[ExcludeCheck]) -> list[ExcludeCheck]:
+        """Append missing entries; returns the checks with what was written."""
+        return self._map(
+            lambda check: (
+                replace(
+                    check,
+                    additions=tuple(
+                        append_exclude_entries(check.path, check.additions)
+                    ),
+                )
+                if check.additions
+                else check
+            ),
+            checks,
+        )
+
+    def run(self, workspace_name: str, repos: list[Path]) -> list[ExcludeCheck]:
+        """Check, write and commit one workspace outside of an apply."""
+        checks = self.write(self.check(workspace_name, repos))
+        self.commit(workspace_name, checks)
+        return checks
+
+    def commit(self, workspace_name: str, checks: list[ExcludeCheck]) -> None:
+        """Tally the checked repos and stamp them for the next run."""
+        self.report.repos += len(checks)
+        self.report.skipped += sum(1 for check in checks if check.skipped)
+        self.report.changed += sum(1 for check in checks if check.additions)
+        self.report.lines_added += sum(len(check.additions) for check in checks)
+
+        digest = self._entries_digests.get(workspace_name)
+        if digest is None:
+            return
+        # Repos outside this run (another --repo, an unselected scope) keep
+        # their stamps as long as the entries are unchanged.
+        stamps = self._load_stamps(workspace_name, digest)
+        for check in checks:
+            stamp = check.stamp or _file_stamp(check.path)
+            if stamp is None:
+                stamps.pop(str(check.repo), None)
+            else:
+                stamps[str(check.repo)] = stamp
+        try:
+            write_json(
+                self._state_path(workspace_name),
+                {"entries": digest, "repos": stamps},
+            )
+        except OSError:
+            # Stamps only let later runs skip work; losing them is harmless.
+            pass
@@ -1,37 +1,211 @@
-import filecmp
+import hashlib
+import os
 import shutil
+import stat
+import sys
+import uuid
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+_HASH_BLOCK = 1024 * 1024
+_EXEC_BITS = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+_FICLONE = 0x40049409
+_STAGE_PREFIX = ".import-"
+# (source device, target device) pairs where FICLONE already failed.
+_NO_REFLINK: set[tuple[int, int]] = set()
+
 
 def is_entry_symlink(entry: Path) -> bool:
     return entry.is_symlink()
 
 
+@dataclass
+class TreeEntry:
+    """One file or directory in a scanned tree; the digest is computed on demand."""
+
+    path: Path
+    is_dir: bool
+    size: int
+    mode: int
+    _digest: str | None = field(default=None, repr=False)
+
+    def digest(self) -> str:
+        if self._digest is None:
+            hasher = hashlib.sha256()
+            with self.path.open("rb") as handle:
+                for block in iter(lambda: handle.read(_HASH_BLOCK), b""):
+                    hasher.update(block)
+            self._digest = hasher.hexdigest()
+        return self._digest
+
+    def same_shape(self, other: "TreeEntry") -> bool:
+        if self.is_dir or other.is_dir:
+            return self.is_dir and other.is_dir
+        return (
+            self.size == other.size
+            and self.mode & _EXEC_BITS == other.mode & _EXEC_BITS
+        )
+
+
+@dataclass
+class TreeManifest:
+    root: Path
+    entries: dict[str, TreeEntry]
+    has_symlink: bool = False
+
+    def matches(self, other: "TreeManifest") -> bool:
+        """Compare paths, types and sizes first; hash only files that still match."""
+        if self.entries.keys() != other.entries.keys():
+            return False
+        pairs = [(entry, other.entries[key]) for key, entry in self.entries.items()]
+        if not all(left.same_shape(right) for left, right in pairs):
+            return False
+        return all(
+            left.is_dir or left.digest() == right.digest() for left, right in pairs
+        )
+
+
+def scan_tree(path: Path, *, follow_symlinks: bool = False) -> TreeManifest:
+    """Build a manifest of ``path`` in one scandir pass, noting any symlinks.
+
+    Without ``follow_symlinks`` symlinks are recorded but not entered, so the
+    caller can reject the tree; with it, links are resolved the way
+    ``shutil.copytree`` copies them.
+    """
+    manifest = TreeManifest(root=path, entries={}, has_symlink=path.is_symlink())
+    try:
+        root_stat = path.stat() if follow_symlinks else path.lstat()
+    except OSError:
+        return manifest
+    if not stat.S_ISDIR(root_stat.st_mode):
+        manifest.entries["."] = TreeEntry(
+            path=path, is_dir=False, size=root_stat.st_size, mode=root_stat.st_mode
+        )
+        return manifest
+
+    seen = {(root_stat.st_dev, root_stat.st_ino)}
+    pending: list[tuple[Path, str]] = [(path, "")]
+    while pending:
+        current, prefix = pending.pop()
+        with os.scandir(current) as iterator:
+            for item in iterator:
+                relative = prefix + item.name
+                if item.is_symlink():
+                    manifest.has_symlink = True
+                    if not follow_symlinks:
+                        continue
+                try:
+                    info = item.stat(follow_symlinks=follow_symlinks)
+                except OSError:
+                    continue
+                if stat.S_ISDIR(info.st_mode):
+                    key = (info.st_dev, info.st_ino)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    manifest.entries[relative + "/"] = TreeEntry(
+                        path=Path(item.path), is_dir=True, size=0, mode=info.st_mode
+                    )
+                    pending.append((Path(item.path), relative + "/"))
+                    continue
+                manifest.entries[relative] = TreeEntry(
+                    path=Path(item.path),
+                    is_dir=False,
+                    size=info.st_size,
+                    mode=info.st_mode,
+                )
+    return manifest
+
+
 def tree_contains_symlink(path: Path) -> bool:
-    if path.is_symlink():
+    return scan_tree(path).has_symlink
+
+
+def content_equal(source: Path, target: Path) -> bool:
+    return scan_tree(source, follow_symlinks=True).matches(
+        scan_tree(target, follow_symlinks=True)
+    )
+
+
+def clone_file(
+    source: str | Path, target: str | Path, *, hardlink: bool = False
+) -> None:
+    """Materialize ``source`` at ``target`` as cheaply as the filesystems allow.
+
+    Tries a hardlink (only when asked, since it shares the inode), then a
+    copy-on-write clone, then a plain copy that lets the kernel move the bytes.
+    """
+    if hardlink:
+        try:
+            os.link(source, target)
+            return
+        except OSError:
+            pass
+    if not _reflink(Path(source), Path(target)):
+        shutil.copyfile(source, target)
+    shutil.copystat(source, target)
+
+
+def _reflink(source: Path, target: Path) -> bool:
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        devices = (source.stat().st_dev, target.parent.stat().st_dev)
+    except OSError:
+        return False
+    if devices in _NO_REFLINK:
+        return False
+    try:
+        with source.open("rb") as src, target.open("wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
         return True
-    if path.is_file():
+    except OSError:
+        _NO_REFLINK.add(devices)
+        target.unlink(missing_ok=True)
         return False
-    for child in path.rglob("*"):
-        if child.is_symlink():
-            return True
-    return False
 
 
-def content_equal(source: Path, target: Path) -> bool:
-    if source.is_file() and target.is_file():
-        return filecmp.cmp(source, target, shallow=False)
-    if source.is_dir() and target.is_dir():
-        return _dir_content_equal(source, target)
-    return False
+def stage_path(source: Path, target: Path, *, hardlink: bool = False) -> Path:
+    """Copy ``source`` to a hidden sibling of ``target`` and return that path."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staged = target.parent / f".{target.name}{_STAGE_PREFIX}{uuid.uuid4().hex[:8]}"
+    copy_function = partial(clone_file, hardlink=hardlink)
+    try:
+        if source.is_dir():
+            shutil.copytree(source, staged, copy_function=copy_function)
+        else:
+            copy_function(source, staged)
+    except BaseException:
+        remove_path(staged)
+        raise
+    return staged
 
 
-def copy_path(source: Path, target: Path) -> None:
-    if source.is_dir():
-        shutil.copytree(source, target)
+def swap_into_place(staged: Path, target: Path) -> None:
+    """Replace ``target`` with ``staged``, restoring the old entry on failure.
+
+    Files are swapped with a single rename; directories are moved aside first
+    because rename cannot replace a non-empty directory.
+    """
+    exists = target.exists() or target.is_symlink()
+    real_dir = target.is_dir() and not target.is_symlink()
+    if not real_dir and not (exists and staged.is_dir()):
+        os.replace(staged, target)
         return
-    target.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(source, target)
+    backup = target.parent / f".{target.name}{_STAGE_PREFIX}old-{uuid.uuid4().hex[:8]}"
+    os.replace(target, backup)
+    try:
+        os.replace(staged, target)
+    except BaseException:
+        os.replace(backup, target)
+        raise
+    remove_path(backup)
 
 
 def remove_path(path: Path) -> None:
@@ -40,30 +214,3 @@ def remove_path(path: Path) -> None:
         return
     if path.is_dir():
         shutil.rmtree(path)
-
-
-def _dir_content_equal(source: Path, target: Path) -> bool:
-    left = sorted(_dir_entries(source))
-    right = sorted(_dir_entries(target))
-    if left != right:
-        return False
-    for relative in left:
-        left_path = source / relative
-        right_path = target / relative
-        if left_path.is_file() and right_path.is_file():
-            if not filecmp.cmp(left_path, right_path, shallow=False):
-                return False
-            continue
-        if left_path.is_dir() and right_path.is_dir():
-            continue
-        return False
-    return True
-
-
-def _dir_entries(root: Path) -> list[str]:
-    result: list[str] = []
-    for child in root.rglob("*"):
-        relative = child.relative_to(root)
-        suffix = "/" if child.is_dir() else ""
-        result.append(str(relative) + suffix)
-    return result
@@ -1,3 +1,5 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from code_agnostic.agents.codex import normalize_codex_agent_filename, parse_codex_agent
@@ -10,11 +12,11 @@ from code_agnostic.core.repository import CoreRepository
 from code_agnostic.errors import InvalidConfigSchemaError, InvalidJsonFormatError
 from code_agnostic.imports.adapters import create_import_adapter
 from code_agnostic.imports.filesystem import (
-    content_equal,
-    copy_path,
     is_entry_symlink,
     remove_path,
-    tree_contains_symlink,
+    scan_tree,
+    stage_path,
+    swap_into_place,
 )
 from code_agnostic.imports.models import (
     ConflictPolicy,
@@ -27,6 +29,8 @@ from code_agnostic.imports.models import (
 )
 from code_agnostic.utils import read_json_safe, write_json
 
+DEFAULT_IMPORT_JOBS = min(8, os.cpu_count() or 1)
+
 
 class ImportService:
     def __init__(self, core_repository: CoreRepository | None = None) -> None:
@@ -108,7 +112,13 @@ class ImportService:
             skipped=skipped,
         )
 
-    def apply(self, plan: ImportPlan) -> ImportApplyResult:
+    def apply(
+        self,
+        plan: ImportPlan,
+        *,
+        jobs: int | None = None,
+        hardlink: bool = False,
+    ) -> ImportApplyResult:
         if plan.errors:
             return ImportApplyResult(
                 applied=0, failed=len(plan.errors), failures=plan.errors
@@ -117,6 +127,7 @@ class ImportService:
         applied = 0
         failed = 0
         failures: list[str] = []
+        copies: list[ImportAction] = []
 
         for action in plan.actions:
             if action.kind == ImportActionKind.NOTE:
@@ -153,10 +164,7 @@ class ImportService:
                 if action.kind == ImportActionKind.COPY_PATH:
                     if action.source is None or action.target is None:
                         raise ValueError("missing source/target")
-                    if action.target.exists() or action.target.is_symlink():
-                        remove_path(action.target)
-                    copy_path(action.source, action.target)
-                    applied += 1
+                    copies.append(action)
                     continue
 
                 failed += 1
@@ -165,8 +173,45 @@ class ImportService:
                 failed += 1
                 failures.append(str(exc))
 
+        for error in self._apply_copies(copies, jobs=jobs, hardlink=hardlink):
+            if error is None:
+                applied += 1
+            else:
+                failed += 1
+                failures.append(error)
+
         return ImportApplyResult(applied=applied, failed=failed, failures=failures)
 
+    @staticmethod
+    def _apply_copies(
+        actions: list[ImportAction], *, jobs: int | None, hardlink: bool
+    ) -> list[str | None]:
+        """Stage each entry beside its target in parallel, then swap it in.
+
+        Entries are independent directories or files, so a failure leaves the
+        previous version of that entry in place and does not affect others.
+        """
+        if not actions:
+            return []
+
+        def run(action: ImportAction) -> str | None:
+            assert action.source is not None and action.target is not None
+            staged: Path | None = None
+            try:
+                staged = stage_path(action.source, action.target, hardlink=hardlink)
+                swap_into_place(staged, action.target)
+            except Exception as exc:
+                if staged is not None:
+                    remove_path(staged)
+                return str(exc)
+            return None
+
+        workers = max(1, min(jobs or DEFAULT_IMPORT_JOBS, len(actions)))
+        if workers == 1:
+            return [run(action) for action in actions]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(run, actions))
+
     @staticmethod
     def _default_sections_for_app(source_app: str) -> list[ImportSection]:
         metadata = app_metadata(source_app.lower())
@@ -336,7 +381,8 @@ class ImportService:
                 )
                 continue
 
-            if not follow_symlinks and tree_contains_symlink(entry):
+            manifest = scan_tree(entry, follow_symlinks=follow_symlinks)
+            if not follow_symlinks and manifest.has_symlink:
                 skipped.append(
                     f"Skipped {section.value} entry with nested symlink: {entry}"
                 )
@@ -366,7 +412,7 @@ class ImportService:
                 )
                 continue
 
-            if content_equal(entry, target):
+            if manifest.matches(scan_tree(target, follow_symlinks=True)):
                 actions.append(
                     ImportAction(
                         section=section,
@@ -0,0 +1,54 @@
+"""Advisory file locks that serialize applies touching the same root.
+
+Each revision root (the hub and every workspace config dir) has its own lock
+file, so applies of unrelated workspaces from separate processes run in
+parallel while two applies of the same root queue up. Locks are ``flock``
+based and released automatically if the holder dies. Platforms without
+``fcntl`` run unlocked.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+@contextmanager
+def advisory_lock(
+    path: Path, *, shared: bool = False, blocking: bool = True
+) -> Iterator[float | None]:
+    """Hold an flock on ``path`` and yield the seconds spent waiting for it.
+
+    With ``blocking=False`` the context yields ``None`` instead of waiting
+    when another process holds a conflicting lock.
+    """
+    if fcntl is None:
+        yield 0.0
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        operation = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        if not blocking:
+            operation |= fcntl.LOCK_NB
+        started = time.monotonic()
+        try:
+            fcntl.flock(fd, operation)
+        except BlockingIOError:
+            yield None
+            return
+        try:
+            yield time.monotonic() - started
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
@@ -1,11 +1,26 @@
+"""Lossy mappings: canonical properties a target app's compiler drops.
+
+Compilers report what they drop while compiling (``report_lossiness``); the
+planner collects those reports per plan chunk, so a plan, and the revision
+manifest written from it, lists exactly what the compiled output lost.
+"""
+
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
+
+_BUNDLE_FILES = frozenset({"meta.yaml", "prompt.md"})
+
 
-from code_agnostic.agents.parser import parse_agent
-from code_agnostic.rules.parser import parse_rule
-from code_agnostic.spec.loaders import load_rule_bundle
+@dataclass(frozen=True)
+class LossyProperty:
+    property: str
+    reason: str
 
 
 @dataclass(frozen=True)
@@ -15,175 +30,96 @@ class LossinessFinding:
     property: str
     status: str
     reason: str
+    workspace: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "resource_path": self.resource_path,
+            "app": self.app,
+            "property": self.property,
+            "status": self.status,
+            "reason": self.reason,
+            "workspace": self.workspace,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> LossinessFinding:
+        return cls(
+            resource_path=str(payload["resource_path"]),
+            app=str(payload["app"]),
+            property=str(payload["property"]),
+            status=str(payload.get("status", "ignored")),
+            reason=str(payload.get("reason", "")),
+            workspace=payload.get("workspace"),
+        )
 
 
-class LossinessExplainer:
-    def explain_core_root(self, root: Path, app: str = "all") -> list[LossinessFinding]:
-        return self._explain_root(root=root, app=app, prefix=None)
+def _finding_key(item: LossinessFinding) -> tuple[str, str, str, str, str]:
+    return (item.resource_path, item.app, item.property, item.status, item.reason)
 
-    def explain_workspace_root(
-        self, root: Path, workspace: str, app: str = "all"
-    ) -> list[LossinessFinding]:
-        return self._explain_root(
-            root=root,
+
+_ACTIVE_FINDINGS: ContextVar[list[LossinessFinding] | None] = ContextVar(
+    "code_agnostic_lossiness", default=None
+)
+
+
+@contextmanager
+def collect_lossiness() -> Iterator[list[LossinessFinding]]:
+    """Gather findings reported by compilers run inside the block."""
+    findings: list[LossinessFinding] = []
+    token = _ACTIVE_FINDINGS.set(findings)
+    try:
+        yield findings
+    finally:
+        _ACTIVE_FINDINGS.reset(token)
+
+
+def report_lossiness(app: str, source: Path, dropped: Iterable[LossyProperty]) -> None:
+    findings = _ACTIVE_FINDINGS.get()
+    if findings is None:
+        return
+    # Bundles are reported by their directory, not the prompt they load from.
+    if source.name in _BUNDLE_FILES:
+        source = source.parent
+    findings.extend(
+        LossinessFinding(
+            resource_path=str(source),
             app=app,
-            prefix=Path("workspaces") / workspace,
+            property=item.property,
+            status="ignored",
+            reason=item.reason,
         )
-
-    def _explain_root(
-        self, root: Path, app: str, prefix: Path | None
-    ) -> list[LossinessFinding]:
-        findings: list[LossinessFinding] = []
-        findings.extend(self._explain_rules(root / "rules", app=app, prefix=prefix))
-        findings.extend(self._explain_agents(root / "agents", app=app, prefix=prefix))
-        return sorted(
-            findings,
-            key=lambda item: (
-                item.resource_path,
-                item.app,
-                item.property,
-                item.status,
-                item.reason,
-            ),
+        for item in dropped
+    )
+
+
+def replay_lossiness(findings: Iterable[LossinessFinding]) -> None:
+    """Report findings again, e.g. for compiled output served from a cache."""
+    active = _ACTIVE_FINDINGS.get()
+    if active is not None:
+        active.extend(findings)
+
+
+def hub_findings(
+    findings: Iterable[LossinessFinding],
+    root: Path,
+    workspace: str | None = None,
+) -> list[LossinessFinding]:
+    """Distinct findings with source paths made relative to the hub root."""
+    unique: dict[tuple[str, str, str, str, str], LossinessFinding] = {}
+    for item in findings:
+        source = Path(item.resource_path)
+        try:
+            resource_path = source.relative_to(root).as_posix()
+        except ValueError:
+            resource_path = source.as_posix()
+        finding = LossinessFinding(
+            resource_path=resource_path,
+            app=item.app,
+            property=item.property,
+            status=item.status,
+            reason=item.reason,
+            workspace=workspace,
         )
-
-    def _explain_rules(
-        self, rules_dir: Path, app: str, prefix: Path | None
-    ) -> list[LossinessFinding]:
-        if not rules_dir.exists():
-            return []
-
-        findings: list[LossinessFinding] = []
-        for child in sorted(rules_dir.iterdir()):
-            if child.name.startswith("."):
-                continue
-
-            if child.is_file() and child.suffix == ".md":
-                rule = parse_rule(child)
-            elif child.is_dir() and (
-                (child / "meta.yaml").exists() or (child / "prompt.md").exists()
-            ):
-                rule = load_rule_bundle(child)
-            else:
-                continue
-
-            resource_path = self._resource_path(
-                root=rules_dir.parent, child=child, prefix=prefix
-            )
-            if rule.metadata.always_apply:
-                findings.extend(
-                    self._findings_for_targets(
-                        resource_path=resource_path,
-                        property_name="always_apply",
-                        targets=("codex", "opencode"),
-                        app=app,
-                        reason="target does not support rule always_apply semantics",
-                    )
-                )
-            if rule.metadata.globs:
-                findings.extend(
-                    self._findings_for_targets(
-                        resource_path=resource_path,
-                        property_name="globs",
-                        targets=("codex", "opencode"),
-                        app=app,
-                        reason="target does not support rule globs",
-                    )
-                )
-
-        return findings
-
-    def _explain_agents(
-        self, agents_dir: Path, app: str, prefix: Path | None
-    ) -> list[LossinessFinding]:
-        if not agents_dir.exists():
-            return []
-
-        findings: list[LossinessFinding] = []
-        for child in sorted(agents_dir.iterdir()):
-            if child.name.startswith("."):
-                continue
-            if not child.is_file() and not child.is_dir():
-                continue
-
-            agent = parse_agent(child)
-            resource_path = self._resource_path(
-                root=agents_dir.parent,
-                child=child,
-                prefix=prefix,
-            )
-
-            if agent.metadata.codex.mcp_servers:
-                findings.extend(
-                    self._findings_for_targets(
-                        resource_path=resource_path,
-                        property_name="codex.mcp_servers",
-                        targets=("cursor", "opencode"),
-                        app=app,
-                        reason="target only supports codex.mcp_servers in Codex output",
-                    )
-                )
-            if agent.metadata.codex.skills_config:
-                findings.extend(
-                    self._findings_for_targets(
-                        resource_path=resource_path,
-                        property_name="codex.skills.config",
-                        targets=("cursor", "opencode"),
-                        app=app,
-                        reason="target only supports codex.skills.config in Codex output",
-                    )
-                )
-            if agent.metadata.nickname_candidates:
-                findings.extend(
-                    self._findings_for_targets(
-                        resource_path=resource_path,
-                        property_name="nickname_candidates",
-                        targets=("cursor", "opencode"),
-                        app=app,
-                        reason="target does not support agent nickname_candidates",
-                    )
-                )
-            if agent.metadata.sandbox_mode:
-                findings.extend(
-                    self._findings_for_targets(
-                        resource_path=resource_path,
-                        property_name="sandbox_mode",
-                        targets=("cursor", "opencode"),
-                        app=app,
-                        reason="target does not support agent sandbox_mode",
-                    )
-                )
-
-        return findings
-
-    def _findings_for_targets(
-        self,
-        *,
-        resource_path: str,
-        property_name: str,
-        targets: tuple[str, ...],
-        app: str,
-        reason: str,
-    ) -> list[LossinessFinding]:
-        normalized_app = app.lower()
-        selected_targets = [
-            target
-            for target in targets
-            if normalized_app == "all" or target == normalized_app
-        ]
-        return [
-            LossinessFinding(
-                resource_path=resource_path,
-                app=target,
-                property=property_name,
-                status="ignored",
-                reason=reason,
-            )
-            for target in selected_targets
-        ]
-
-    def _resource_path(self, root: Path, child: Path, prefix: Path | None) -> str:
-        relative = child.relative_to(root)
-        if prefix is None:
-            return relative.as_posix()
-        return (prefix / relative).as_posix()
+        unique.setdefault(_finding_key(finding), finding)
+    return sorted(unique.values(), key=_finding_key)
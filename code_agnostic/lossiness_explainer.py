@@ -0,0 +1,81 @@
+"""Compile a root for every app to explain what each one would drop."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from code_agnostic.agents.compilers import agent_compiler_for
+from code_agnostic.agents.parser import parse_agent
+from code_agnostic.lossiness import LossinessFinding, collect_lossiness, hub_findings
+from code_agnostic.rules.compilers import rule_compiler_for
+from code_agnostic.rules.parser import parse_rule
+from code_agnostic.source_cache import (
+    SourceCache,
+    active_source_cache,
+    use_source_cache,
+)
+from code_agnostic.spec.loaders import load_rule_bundle
+
+LOSSINESS_APPS: tuple[str, ...] = ("codex", "cursor", "opencode")
+
+
+class LossinessExplainer:
+    """Run every app's compilers over a root and report what they drop.
+
+    Unlike a plan, this covers apps that are not enabled and global rules,
+    which no app output consumes yet. Sources are parsed through the
+    enclosing session's source cache, or a fresh one for a single pass.
+    """
+
+    def explain_core_root(self, root: Path, app: str = "all") -> list[LossinessFinding]:
+        return self._explain_root(root=root, app=app, workspace=None)
+
+    def explain_workspace_root(
+        self, root: Path, workspace: str, app: str = "all"
+    ) -> list[LossinessFinding]:
+        return self._explain_root(root=root, app=app, workspace=workspace)
+
+    def _explain_root(
+        self, root: Path, app: str, workspace: str | None
+    ) -> list[LossinessFinding]:
+        apps = [name for name in LOSSINESS_APPS if app.lower() in ("all", name)]
+        cache = active_source_cache()
+        if cache is None:
+            cache = SourceCache()
+        with use_source_cache(cache), collect_lossiness() as findings:
+            self._compile_rules(root / "rules", apps)
+            self._compile_agents(root / "agents", apps)
+        # Report paths as seen from the hub, workspaces under their prefix.
+        base = root if workspace is None else root.parent.parent
+        return hub_findings(findings, base, workspace=workspace)
+
+    def _compile_rules(self, rules_dir: Path, apps: list[str]) -> None:
+        if not rules_dir.exists():
+            return
+        compilers = [rule_compiler_for(app) for app in apps]
+        for child in sorted(rules_dir.iterdir()):
+            if child.name.startswith("."):
+                continue
+            if child.is_file() and child.suffix == ".md":
+                rule = parse_rule(child)
+            elif child.is_dir() and (
+                (child / "meta.yaml").exists() or (child / "prompt.md").exists()
+            ):
+                rule = load_rule_bundle(child)
+            else:
+                continue
+            for compiler in compilers:
+                compiler.compile(rule)
+
+    def _compile_agents(self, agents_dir: Path, apps: list[str]) -> None:
+        if not agents_dir.exists():
+            return
+        compilers = [agent_compiler_for(app) for app in apps]
+        for child in sorted(agents_dir.iterdir()):
+            if child.name.startswith("."):
+                continue
+            if not child.is_file() and not child.is_dir():
+                continue
+            agent = parse_agent(child)
+            for compiler in compilers:
+                compiler.compile(agent)
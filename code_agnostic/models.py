@@ -1,10 +1,16 @@
-from dataclasses import dataclass
+import hashlib
+import json
+import sys
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, SupportsIndex
 
 from code_agnostic.utils import is_under
 
+if TYPE_CHECKING:
+    from code_agnostic.lossiness import LossinessFinding
+
 
 class ActionKind(str, Enum):
     WRITE_JSON = "write_json"
@@ -13,6 +19,7 @@ class ActionKind(str, Enum):
     SYMLINK = "symlink"
     REMOVE_SYMLINK = "remove_symlink"
     REMOVE_FILE = "remove_file"
+    COPY_FILE = "copy_file"
 
 
 class ActionStatus(str, Enum):
@@ -24,6 +31,13 @@ class ActionStatus(str, Enum):
     REMOVE = "remove"
 
 
+class SyncResource(str, Enum):
+    MCP = "mcp"
+    RULES = "rules"
+    SKILLS = "skills"
+    AGENTS = "agents"
+
+
 class SyncTarget(str, Enum):
     ALL = "all"
     OPENCODE = "opencode"
@@ -54,7 +68,37 @@ class AppSyncStatus(str, Enum):
     DISABLED = "disabled"
 
 
-@dataclass
+def resource_for_scope(scope: str | None) -> SyncResource:
+    if scope is None or scope.endswith("_mcp"):
+        return SyncResource.MCP
+    if scope == "rules":
+        return SyncResource.RULES
+    if "skills" in scope:
+        return SyncResource.SKILLS
+    if "agents" in scope:
+        return SyncResource.AGENTS
+    return SyncResource.MCP
+
+
+def payload_digest(payload: Any) -> str | None:
+    if payload is None:
+        return None
+    if isinstance(payload, bytes):
+        data = payload
+    elif isinstance(payload, str):
+        data = payload.encode("utf-8")
+    else:
+        data = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+
+# Action fields a PlanIndex groups by.
+_INDEXED_FIELDS = frozenset({"app", "workspace", "scope", "status"})
+# Bumped whenever an indexed action changes one of those fields.
+_index_edits = 0
+
+
+@dataclass(slots=True)
 class Action:
     kind: ActionKind
     path: Path
@@ -65,6 +109,218 @@ class Action:
     app: str | None = None
     scope: str | None = None
     workspace: str | None = None
+    # (id of the payload it was computed for, digest)
+    _digest: tuple[int, str | None] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def resource(self) -> SyncResource:
+        return resource_for_scope(self.scope)
+
+    def payload_digest(self) -> str | None:
+        cached = self._digest
+        if cached is None or cached[0] != id(self.payload):
+            cached = (id(self.payload), payload_digest(self.payload))
+            self._digest = cached
+        return cached[1]
+
+
+class _IndexedAction(Action):
+    """An Action a PlanIndex has grouped.
+
+    Indexing switches an action to this class, so only indexed actions pay
+    for the hook that counts edits of the fields the index groups by.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _INDEXED_FIELDS and getattr(self, name, value) != value:
+            global _index_edits
+            _index_edits += 1
+        object.__setattr__(self, name, value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Action):
+            return NotImplemented
+        return all(
+            getattr(self, item.name) == getattr(other, item.name)
+            for item in fields(Action)
+            if item.compare
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def _intern(value: str | None) -> str | None:
+    return None if value is None else sys.intern(value)
+
+
+_ANY: Any = object()
+
+
+class ActionList(list[Action]):
+    """A plan's action list that counts in-place edits other than appends."""
+
+    __slots__ = ("edits",)
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self.edits = 0
+
+    def _edited(self) -> None:
+        self.edits += 1
+
+    def __setitem__(self, *args: Any) -> None:
+        super().__setitem__(*args)
+        self._edited()
+
+    def __delitem__(self, *args: Any) -> None:
+        super().__delitem__(*args)
+        self._edited()
+
+    def __imul__(self, value: SupportsIndex) -> "ActionList":
+        super().__imul__(value)
+        self._edited()
+        return self
+
+    def insert(self, *args: Any) -> None:
+        super().insert(*args)
+        self._edited()
+
+    def pop(self, *args: Any) -> Action:
+        action = super().pop(*args)
+        self._edited()
+        return action
+
+    def remove(self, *args: Any) -> None:
+        super().remove(*args)
+        self._edited()
+
+    def clear(self) -> None:
+        super().clear()
+        self._edited()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._edited()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._edited()
+
+
+class PlanIndex:
+    """Positions of a plan's actions by app, workspace, scope and status.
+
+    Indexing also compacts each action: its label strings are interned and
+    equal str/bytes payloads are replaced by one shared object.
+    Appending to ``SyncPlan.actions`` is picked up on the next lookup. Any
+    other edit of the list, or of an indexed action's app, workspace, scope
+    or status, makes the plan rebuild its index on the next lookup.
+    """
+
+    __slots__ = (
+        "actions",
+        "size",
+        "list_edits",
+        "action_edits",
+        "by_app",
+        "by_workspace",
+        "by_scope",
+        "by_status",
+        "_payloads",
+    )
+
+    def __init__(self, actions: list[Action]) -> None:
+        self.actions = actions
+        self.size = 0
+        self.list_edits = getattr(actions, "edits", 0)
+        self.action_edits = _index_edits
+        self.by_app: dict[str | None, list[int]] = {}
+        self.by_workspace: dict[str | None, list[int]] = {}
+        self.by_scope: dict[str | None, list[int]] = {}
+        self.by_status: dict[ActionStatus, list[int]] = {}
+        self._payloads: dict[str | bytes, str | bytes] = {}
+        self.sync()
+
+    def sync(self) -> None:
+        for position in range(self.size, len(self.actions)):
+            action = self.actions[position]
+            action.detail = sys.intern(action.detail)
+            action.app = _intern(action.app)
+            action.scope = _intern(action.scope)
+            action.workspace = _intern(action.workspace)
+            if isinstance(action.payload, (str, bytes)):
+                # Keyed by value: the str/bytes hash is computed once per
+                # object, and the sha256 digest is left until output needs it.
+                action.payload = self._payloads.setdefault(
+                    action.payload, action.payload
+                )
+            self.by_app.setdefault(action.app, []).append(position)
+            self.by_workspace.setdefault(action.workspace, []).append(position)
+            self.by_scope.setdefault(action.scope, []).append(position)
+            self.by_status.setdefault(action.status, []).append(position)
+            if action.__class__ is Action:
+                action.__class__ = _IndexedAction
+        self.size = len(self.actions)
+
+    def is_stale(self, actions: list[Action]) -> bool:
+        return (
+            actions is not self.actions
+            or self.size > len(actions)
+            or getattr(actions, "edits", 0) != self.list_edits
+            or _index_edits != self.action_edits
+        )
+
+    def count(self, status: ActionStatus) -> int:
+        return len(self.by_status.get(status, ()))
+
+    def select(
+        self,
+        *,
+        app: Any = _ANY,
+        workspace: Any = _ANY,
+        scope: Any = _ANY,
+        status: Any = _ANY,
+    ) -> list[Action]:
+        """Actions matching every given field, in plan order."""
+        groups = [
+            index.get(value, [])
+            for index, value in (
+                (self.by_app, app),
+                (self.by_workspace, workspace),
+                (self.by_scope, scope),
+                (self.by_status, status),
+            )
+            if value is not _ANY
+        ]
+        if not groups:
+            return list(self.actions)
+        groups.sort(key=len)
+        positions = groups[0]
+        for other in groups[1:]:
+            members = set(other)
+            positions = [position for position in positions if position in members]
+        return [self.actions[position] for position in positions]
+
+    def take(self, positions: list[int]) -> list[Action]:
+        return [self.actions[position] for position in sorted(positions)]
+
+
+@dataclass(frozen=True)
+class RetainedEntries:
+    """Managed state of a partly planned scope that the plan must not drop.
+
+    A plan limited to one repo only re-plans that repo's entries of shared
+    repo-level scopes; the other repos' entries are carried through here.
+    """
+
+    workspace: str
+    scope: str
+    links: tuple[str, ...] = ()
+    paths: tuple[str, ...] = ()
 
 
 @dataclass
@@ -72,14 +328,45 @@ class SyncPlan:
     actions: list[Action]
     errors: list[Exception]
     skipped: list[str]
+    retained: list[RetainedEntries] = field(default_factory=list)
+    # Git repos each planned workspace fans out to, as discovered by the planner.
+    repos: dict[str, list[Path]] = field(default_factory=dict)
+    # What the compilers behind this plan's outputs dropped, per source.
+    lossiness: "list[LossinessFinding]" = field(default_factory=list)
+    _index: PlanIndex | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "actions" and not isinstance(value, ActionList):
+            value = ActionList(value)
+        object.__setattr__(self, name, value)
+
+    @property
+    def index(self) -> PlanIndex:
+        index = self._index
+        if index is None or index.is_stale(self.actions):
+            index = self._index = PlanIndex(self.actions)
+        else:
+            index.sync()
+        return index
+
+    def extend(self, chunk: "SyncPlan") -> None:
+        """Append a planned chunk, compacting its actions as they arrive."""
+        self.actions.extend(chunk.actions)
+        self.errors.extend(chunk.errors)
+        self.skipped.extend(chunk.skipped)
+        self.retained.extend(chunk.retained)
+        self.repos.update(chunk.repos)
+        self.lossiness.extend(chunk.lossiness)
+        self.index.sync()
 
     def is_valid(self) -> bool:
         return not self.errors
 
     def summary(self) -> dict[str, int]:
-        counts = {status.value: 0 for status in ActionStatus}
-        for action in self.actions:
-            counts[action.status.value] += 1
+        index = self.index
+        counts = {status.value: index.count(status) for status in ActionStatus}
         counts["actions"] = len(self.actions)
         counts["errors"] = len(self.errors)
         counts["skipped"] = len(self.skipped)
@@ -95,34 +382,41 @@ class SyncPlan:
         normalized = target.lower()
         if normalized == SyncTarget.ALL.value:
             return self
+        by_app = self.index.by_app
         if normalized in (SyncTarget.CURSOR.value, SyncTarget.CODEX.value):
-            filtered = [
-                action
-                for action in self.actions
-                if action.app in (normalized, "workspace")
-            ]
-            return SyncPlan(actions=filtered, errors=self.errors, skipped=self.skipped)
-
-        filtered_actions: list[Action] = []
-        for action in self.actions:
-            if action.app in (SyncTarget.CURSOR.value, SyncTarget.CODEX.value):
-                continue
-            if action.app == "workspace":
-                filtered_actions.append(action)
-                continue
-            if action.app in (None, SyncTarget.OPENCODE.value):
-                filtered_actions.append(action)
-                continue
-            if config_path is not None and action.path == config_path:
-                filtered_actions.append(action)
+            return SyncPlan(
+                actions=self.index.take(
+                    by_app.get(normalized, []) + by_app.get("workspace", [])
+                ),
+                errors=self.errors,
+                skipped=self.skipped,
+                retained=self.retained,
+                repos=self.repos,
+                lossiness=[item for item in self.lossiness if item.app == normalized],
+            )
+
+        kept: list[int] = []
+        for app, positions in by_app.items():
+            if app in (SyncTarget.CURSOR.value, SyncTarget.CODEX.value):
                 continue
-            if skills_root is not None and is_under(action.path, skills_root):
-                filtered_actions.append(action)
+            if app in ("workspace", None, SyncTarget.OPENCODE.value):
+                kept.extend(positions)
                 continue
-            if agents_root is not None and is_under(action.path, agents_root):
-                filtered_actions.append(action)
+            for position in positions:
+                action = self.actions[position]
+                if config_path is not None and action.path == config_path:
+                    kept.append(position)
+                elif skills_root is not None and is_under(action.path, skills_root):
+                    kept.append(position)
+                elif agents_root is not None and is_under(action.path, agents_root):
+                    kept.append(position)
         return SyncPlan(
-            actions=filtered_actions, errors=self.errors, skipped=self.skipped
+            actions=self.index.take(kept),
+            errors=self.errors,
+            skipped=self.skipped,
+            retained=self.retained,
+            repos=self.repos,
+            lossiness=[item for item in self.lossiness if item.app == normalized],
         )
 
 
@@ -0,0 +1,50 @@
+"""Machine-readable plan records."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from code_agnostic.models import Action, ActionStatus, SyncPlan
+
+
+def action_record(action: Action) -> dict[str, Any]:
+    return {
+        "kind": action.kind.value,
+        "path": str(action.path),
+        "status": action.status.value,
+        "detail": action.detail,
+        "source": None if action.source is None else str(action.source),
+        "app": action.app,
+        "scope": action.scope,
+        "workspace": action.workspace,
+        "payload_digest": action.payload_digest(),
+    }
+
+
+def iter_plan_records(chunks: Iterable[SyncPlan]) -> Iterator[dict[str, Any]]:
+    """Stream action records as chunks arrive, then errors, skips and a summary."""
+    counts = {status.value: 0 for status in ActionStatus}
+    total = errors = skipped = lossy = 0
+    for chunk in chunks:
+        for action in chunk.actions:
+            counts[action.status.value] += 1
+            total += 1
+            yield {"type": "action", **action_record(action)}
+        for error in chunk.errors:
+            errors += 1
+            yield {"type": "error", "message": str(error)}
+        for item in chunk.skipped:
+            skipped += 1
+            yield {"type": "skipped", "message": item}
+        for finding in chunk.lossiness:
+            lossy += 1
+            yield {"type": "lossiness", **finding.to_dict()}
+    yield {
+        "type": "summary",
+        **counts,
+        "actions": total,
+        "errors": errors,
+        "skipped": skipped,
+        "lossiness": lossy,
+    }
@@ -1,4 +1,8 @@
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from typing import Any
 
 from code_agnostic.apps.app_id import AppId, app_metadata
 from code_agnostic.apps.common.compiled_planning import plan_compiled_text_action
@@ -19,15 +23,79 @@ from code_agnostic.apps.common.utils import common_mcp_to_dto
 from code_agnostic.constants import AGENTS_FILENAME
 from code_agnostic.core.workspace_repository import WorkspaceConfigRepository
 from code_agnostic.errors import SyncAppError
-from code_agnostic.models import Action, ActionKind, ActionStatus, SyncPlan
-from code_agnostic.rules.compilers import OpenCodeRuleCompiler
+from code_agnostic.lossiness import collect_lossiness, hub_findings
+from code_agnostic.models import (
+    Action,
+    ActionKind,
+    ActionStatus,
+    RetainedEntries,
+    SyncPlan,
+    SyncResource,
+    resource_for_scope,
+)
+from code_agnostic.repo_selection import (
+    RepoSelection,
+    load_repo_selection,
+    repo_relative,
+)
+from code_agnostic.rules.compilers import CodexRuleCompiler, OpenCodeRuleCompiler
 from code_agnostic.rules.repository import RulesRepository
+from code_agnostic.utils import is_under
 from code_agnostic.workspaces import WorkspaceService
 
 
+@dataclass(frozen=True)
+class PlanFilter:
+    """Limits planning to some resources and, optionally, one repo.
+
+    With a repo only the repo-level outputs of its workspace are planned, and
+    no other repos are discovered.
+    """
+
+    resources: frozenset[SyncResource] | None = None
+    repo: Path | None = None
+
+    def wants(self, scope: str | None) -> bool:
+        # Scope-less workspace actions are the rendered workspace configs.
+        if self.repo is not None and (scope is None or ":repo_" not in scope):
+            return False
+        return self.resources is None or resource_for_scope(scope) in self.resources
+
+    def split_managed(
+        self, group: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, list[str]]]:
+        """Split recorded state into entries to re-plan and entries to keep."""
+        planned: dict[str, Any] = {}
+        retained: dict[str, list[str]] = {}
+        for scope, paths in group.items():
+            if not isinstance(scope, str) or not self.wants(scope):
+                continue
+            if self.repo is None or not isinstance(paths, list):
+                planned[scope] = paths
+                continue
+            planned[scope] = [
+                path
+                for path in paths
+                if isinstance(path, str) and is_under(Path(path), self.repo)
+            ]
+            retained[scope] = [
+                path
+                for path in paths
+                if isinstance(path, str) and not is_under(Path(path), self.repo)
+            ]
+        return planned, retained
+
+
 def _compile_workspace_agents(rules) -> str:
+    # Codex and OpenCode both read the shared AGENTS.md and render it the same
+    # way: compile once, and have Codex only report what it loses.
+    codex = CodexRuleCompiler()
     compiler = OpenCodeRuleCompiler()
-    sections = [compiler.compile(rule)[1] for rule in rules]
+    sections: list[str] = []
+    for rule in rules:
+        codex.report_dropped(rule)
+        _, section = compiler.compile(rule)
+        sections.append(section)
     return "\n\n".join(sections) + "\n"
 
 
@@ -116,14 +184,10 @@ def _set_workspace_opencode_instructions(
 
 
 def _merge_plans(*plans: SyncPlan) -> SyncPlan:
-    actions: list[Action] = []
-    errors: list[Exception] = []
-    skipped: list[str] = []
+    merged = SyncPlan(actions=[], errors=[], skipped=[])
     for plan in plans:
-        actions.extend(plan.actions)
-        errors.extend(plan.errors)
-        skipped.extend(plan.skipped)
-    return SyncPlan(actions=actions, errors=errors, skipped=skipped)
+        merged.extend(plan)
+    return merged
 
 
 def _workspace_scope_matches_app(scope: str, app_ids: set[str]) -> bool:
@@ -137,42 +201,103 @@ class SyncPlanner:
         app_services: list[IAppConfigService],
         workspace_service: WorkspaceService | None = None,
         include_workspace: bool = True,
+        include_apps: bool = True,
+        workspace_names: set[str] | None = None,
+        plan_filter: PlanFilter | None = None,
     ) -> None:
         self.core = core
         self.app_services = app_services
         self.workspace_service = workspace_service or WorkspaceService()
         self.include_workspace = include_workspace
+        self.include_apps = include_apps
+        self.workspace_names = workspace_names
+        self.plan_filter = plan_filter
+
+    def _wants(self, scope: str | None) -> bool:
+        return self.plan_filter is None or self.plan_filter.wants(scope)
 
     def build(self) -> SyncPlan:
-        app_plan = self._plan_apps()
-        workspace_plan = (
-            self._plan_workspaces() if self.include_workspace else SyncPlan([], [], [])
+        return _merge_plans(*self.iter_plan())
+
+    def iter_plan(self) -> Iterator[SyncPlan]:
+        """Yield one partial plan per app service and per workspace as planned."""
+        if self.include_apps:
+            yield from self._iter_app_plans()
+        if self.include_workspace:
+            yield from self._iter_workspace_plans()
+
+    def _with_lossiness(
+        self, build: Callable[[], SyncPlan], workspace: str | None = None
+    ) -> SyncPlan:
+        """Build a chunk and attach what its compilers reported dropping."""
+        with collect_lossiness() as findings:
+            plan = build()
+        app_ids = {service.app_id.value for service in self.app_services}
+        plan.lossiness = hub_findings(
+            [item for item in findings if item.app in app_ids],
+            self.core.root,
+            workspace=workspace,
         )
-        return _merge_plans(app_plan, workspace_plan)
+        return plan
 
-    def _plan_apps(self) -> SyncPlan:
+    def _iter_app_plans(self) -> Iterator[SyncPlan]:
         if not self.app_services:
-            return SyncPlan(actions=[], errors=[], skipped=[])
+            return
 
         try:
             mcp_base = self.core.load_mcp_base()
         except SyncAppError as exc:
-            return SyncPlan(actions=[], errors=[exc], skipped=[])
+            yield SyncPlan(actions=[], errors=[exc], skipped=[])
+            return
 
         desired_common = common_mcp_to_dto(mcp_base.get("mcpServers", {}))
-        plans: list[SyncPlan] = []
         for service in self.app_services:
             try:
-                plans.append(service.build_plan(desired_common, self.core))
+                plan = self._with_lossiness(
+                    partial(service.build_plan, desired_common, self.core)
+                )
             except SyncAppError as exc:
-                plans.append(SyncPlan(actions=[], errors=[exc], skipped=[]))
-        return _merge_plans(*plans)
+                yield SyncPlan(actions=[], errors=[exc], skipped=[])
+                continue
+            if self.plan_filter is not None:
+                plan.actions = [
+                    action for action in plan.actions if self._wants(action.scope)
+                ]
+            yield plan
 
-    def _plan_workspaces(self) -> SyncPlan:
-        plans = []
+    def _iter_workspace_plans(self) -> Iterator[SyncPlan]:
         for workspace in self.core.load_workspaces():
-            plans.append(self._plan_single_workspace(workspace))
-        return _merge_plans(*plans) if plans else SyncPlan([], [], [])
+            if (
+                self.workspace_names is not None
+                and workspace["name"] not in self.workspace_names
+            ):
+                continue
+            yield self._with_lossiness(
+                partial(self._plan_single_workspace, workspace), workspace["name"]
+            )
+
+    def _discover_repos(
+        self, workspace_path: Path, selection: RepoSelection
+    ) -> list[Path]:
+        repo_scopes = ("repo_mcp", "repo_skills_dir", "repo_agents_dir")
+        if not any(self._wants(f"ws:any:{scope}") for scope in repo_scopes):
+            return []
+        if self.plan_filter is None or self.plan_filter.repo is None:
+            return self.workspace_service.discover_git_repos(
+                workspace_path, selection if not selection.is_empty else None
+            )
+        # A selected repo is planned on its own; the workspace is not walked.
+        repo = self.plan_filter.repo
+        workspace_real = workspace_path.resolve()
+        if repo == workspace_real or not is_under(repo, workspace_real):
+            return []
+        if self.workspace_service.resolve_git_dir(repo) is None:
+            return []
+        if not selection.is_empty and not selection.selects(
+            repo.relative_to(workspace_real).as_posix()
+        ):
+            return []
+        return [repo]
 
     def _plan_single_workspace(self, workspace: dict) -> SyncPlan:
         workspace_name = workspace["name"]
@@ -189,7 +314,8 @@ class SyncPlanner:
             root=self.core.workspace_config_dir(workspace_name)
         )
 
-        repos = self.workspace_service.discover_git_repos(workspace_path)
+        selection = load_repo_selection(ws_source.root)
+        repos = self._discover_repos(workspace_path, selection)
         state = ws_source.load_state()
         managed_links = state.get("managed_links", {})
         if not isinstance(managed_links, dict):
@@ -197,10 +323,30 @@ class SyncPlanner:
         managed_paths = state.get("managed_paths", {})
         if not isinstance(managed_paths, dict):
             managed_paths = {}
+        retained: list[RetainedEntries] = []
+        if self.plan_filter is not None:
+            # Unselected scopes vanish from the planner's view, so neither
+            # their outputs nor their stale cleanup are planned.
+            managed_links, retained_links = self.plan_filter.split_managed(
+                managed_links
+            )
+            managed_paths, retained_paths = self.plan_filter.split_managed(
+                managed_paths
+            )
+            retained = [
+                RetainedEntries(
+                    workspace=workspace_name,
+                    scope=scope,
+                    links=tuple(retained_links.get(scope, [])),
+                    paths=tuple(retained_paths.get(scope, [])),
+                )
+                for scope in sorted(set(retained_links) | set(retained_paths))
+            ]
 
         has_config = ws_source.has_any_config()
+        planned_repos = {workspace_name: repos}
         if not has_config and not repos:
-            return SyncPlan([], [], [])
+            return SyncPlan([], [], [], retained=retained, repos=planned_repos)
 
         actions: list[Action] = []
         skipped: list[str] = []
@@ -210,7 +356,14 @@ class SyncPlanner:
         rules_repo = RulesRepository(ws_source.root)
         rules = rules_repo.list_rules()
         workspace_agents_target: Path | None = None
-        if rules:
+        has_rules_file = (
+            not rules_repo.rules_dir.exists() and ws_source.rules_file.exists()
+        )
+        if not self._wants("rules") and (rules or has_rules_file):
+            # Unselected rules are not rewritten, but their target still feeds
+            # the rendered workspace configs.
+            workspace_agents_target = workspace_path / AGENTS_FILENAME
+        elif rules:
             content = _compile_workspace_agents(rules)
             target = workspace_path / AGENTS_FILENAME
             rule_action = plan_compiled_text_action(
@@ -239,7 +392,7 @@ class SyncPlanner:
             actions.append(rule_action)
             desired_paths_by_scope.setdefault("rules", []).append(target)
             workspace_agents_target = target
-        elif not rules_repo.rules_dir.exists() and ws_source.rules_file.exists():
+        elif has_rules_file:
             target = workspace_path / AGENTS_FILENAME
             rule_action = plan_compiled_text_action(
                 target=target,
@@ -316,7 +469,7 @@ class SyncPlanner:
                 should_render_workspace_config = True
             if svc.app_id == AppId.CODEX and agent_sources:
                 should_render_workspace_config = True
-            if should_render_workspace_config:
+            if should_render_workspace_config and self._wants(None):
                 try:
                     mcp_action = project_svc.build_action(
                         mcp_payload,
@@ -336,8 +489,8 @@ class SyncPlanner:
                     )
 
             # Workspace skill entries compiled into workspace project dir
-            if skill_sources:
-                scope = f"ws:{svc.app_id.value}:skills_entries"
+            scope = f"ws:{svc.app_id.value}:skills_entries"
+            if skill_sources and self._wants(scope):
                 plan_skill_actions = getattr(project_svc, "plan_skill_actions")
                 skill_actions, desired_paths, skill_skipped = plan_skill_actions(
                     skill_sources,
@@ -359,8 +512,8 @@ class SyncPlanner:
                 skipped.extend(skill_skipped)
 
             # Workspace agent entries compiled into workspace project dir
-            if agent_sources and meta.supports_import_agents:
-                scope = f"ws:{svc.app_id.value}:agents_entries"
+            scope = f"ws:{svc.app_id.value}:agents_entries"
+            if agent_sources and meta.supports_import_agents and self._wants(scope):
                 plan_agent_actions = getattr(project_svc, "plan_agent_actions")
                 agent_actions, desired_paths, agent_skipped = plan_agent_actions(
                     agent_sources,
@@ -387,8 +540,8 @@ class SyncPlanner:
                 workspace_path / meta.project_dir_name,
                 ws_source,
             )
-            if should_render_workspace_config:
-                scope = f"ws:{svc.app_id.value}:workspace_root_mcp"
+            scope = f"ws:{svc.app_id.value}:workspace_root_mcp"
+            if should_render_workspace_config and self._wants(scope):
                 mcp_action = workspace_target_service.build_action(
                     mcp_payload,
                     agent_sources=agent_sources,
@@ -406,8 +559,8 @@ class SyncPlanner:
                 )
                 actions.append(mcp_action)
                 desired_paths_by_scope.setdefault(scope, []).append(mcp_action.path)
-            if skill_sources:
-                scope = f"ws:{svc.app_id.value}:workspace_root_skills_dir"
+            scope = f"ws:{svc.app_id.value}:workspace_root_skills_dir"
+            if skill_sources and self._wants(scope):
                 plan_skill_actions = getattr(
                     workspace_target_service, "plan_skill_actions"
                 )
@@ -429,8 +582,8 @@ class SyncPlanner:
                 actions.extend(skill_actions)
                 desired_paths_by_scope.setdefault(scope, []).extend(desired_paths)
                 skipped.extend(skill_skipped)
-            if agent_sources and meta.supports_import_agents:
-                scope = f"ws:{svc.app_id.value}:workspace_root_agents_dir"
+            scope = f"ws:{svc.app_id.value}:workspace_root_agents_dir"
+            if agent_sources and meta.supports_import_agents and self._wants(scope):
                 plan_agent_actions = getattr(
                     workspace_target_service, "plan_agent_actions"
                 )
@@ -454,14 +607,18 @@ class SyncPlanner:
                 skipped.extend(agent_skipped)
 
             for repo in repos:
+                if not selection.allows_app(
+                    repo_relative(workspace_path, repo), svc.app_id.value
+                ):
+                    continue
                 repo_target_service = _create_workspace_project_service(
                     svc.app_id,
                     repo / meta.project_dir_name,
                     ws_source,
                 )
 
-                if should_render_workspace_config:
-                    scope = f"ws:{svc.app_id.value}:repo_mcp"
+                scope = f"ws:{svc.app_id.value}:repo_mcp"
+                if should_render_workspace_config and self._wants(scope):
                     mcp_action = repo_target_service.build_action(
                         mcp_payload,
                         agent_sources=agent_sources,
@@ -480,8 +637,8 @@ class SyncPlanner:
                     actions.append(mcp_action)
                     desired_paths_by_scope.setdefault(scope, []).append(mcp_action.path)
 
-                if skill_sources:
-                    scope = f"ws:{svc.app_id.value}:repo_skills_dir"
+                scope = f"ws:{svc.app_id.value}:repo_skills_dir"
+                if skill_sources and self._wants(scope):
                     plan_skill_actions = getattr(
                         repo_target_service, "plan_skill_actions"
                     )
@@ -504,8 +661,8 @@ class SyncPlanner:
                     desired_paths_by_scope.setdefault(scope, []).extend(desired_paths)
                     skipped.extend(skill_skipped)
 
-                if agent_sources and meta.supports_import_agents:
-                    scope = f"ws:{svc.app_id.value}:repo_agents_dir"
+                scope = f"ws:{svc.app_id.value}:repo_agents_dir"
+                if agent_sources and meta.supports_import_agents and self._wants(scope):
                     plan_agent_actions = getattr(
                         repo_target_service, "plan_agent_actions"
                     )
@@ -657,4 +814,10 @@ class SyncPlanner:
                 )
             actions.extend(stale_actions)
 
-        return SyncPlan(actions=actions, errors=[], skipped=skipped)
+        return SyncPlan(
+            actions=actions,
+            errors=[],
+            skipped=skipped,
+            retained=retained,
+            repos=planned_repos,
+        )
@@ -0,0 +1,148 @@
+"""Per-workspace repo include/exclude globs and per-app opt-outs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any
+
+from code_agnostic.constants import REPO_SELECTION_FILENAME
+from code_agnostic.core.repository import CoreRepository
+from code_agnostic.utils import read_json_safe, write_json
+
+
+def _matches(relative: str, patterns: tuple[str, ...]) -> bool:
+    """Match a POSIX repo path; patterns without '/' also match the repo name."""
+    name = relative.rsplit("/", 1)[-1]
+    return any(
+        fnmatchcase(relative, pattern)
+        or ("/" not in pattern and fnmatchcase(name, pattern))
+        for pattern in patterns
+    )
+
+
+def _patterns(value: Any) -> tuple[str, ...]:
+    if not isinstance(value, list):
+        return ()
+    return tuple(str(item) for item in value if str(item).strip())
+
+
+@dataclass(frozen=True)
+class RepoSelection:
+    """Which discovered repos receive workspace config, globally and per app.
+
+    Patterns match the repo path relative to the workspace root. Excludes win
+    over includes; an empty include list selects every repo.
+    """
+
+    include: tuple[str, ...] = ()
+    exclude: tuple[str, ...] = ()
+    app_exclude: tuple[tuple[str, tuple[str, ...]], ...] = ()
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> "RepoSelection":
+        if not isinstance(payload, dict):
+            return cls()
+        apps = payload.get("apps")
+        app_exclude: list[tuple[str, tuple[str, ...]]] = []
+        if isinstance(apps, dict):
+            for app, patterns in sorted(apps.items()):
+                parsed = _patterns(patterns)
+                if parsed:
+                    app_exclude.append((str(app), parsed))
+        return cls(
+            include=_patterns(payload.get("include")),
+            exclude=_patterns(payload.get("exclude")),
+            app_exclude=tuple(app_exclude),
+        )
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "include": list(self.include),
+            "exclude": list(self.exclude),
+            "apps": {app: list(patterns) for app, patterns in self.app_exclude},
+        }
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.include or self.exclude or self.app_exclude)
+
+    def prunes(self, relative: str) -> bool:
+        """True when nothing at or below ``relative`` can be selected."""
+        return _matches(relative, self.exclude)
+
+    def selects(self, relative: str) -> bool:
+        if self.prunes(relative):
+            return False
+        return not self.include or _matches(relative, self.include)
+
+    def allows_app(self, relative: str, app: str) -> bool:
+        for name, patterns in self.app_exclude:
+            if name == app and _matches(relative, patterns):
+                return False
+        return True
+
+
+def repo_relative(workspace_path: Path, repo: Path) -> str:
+    try:
+        return repo.relative_to(workspace_path).as_posix()
+    except ValueError:
+        return repo.relative_to(workspace_path.resolve()).as_posix()
+
+
+def load_repo_selection(workspace_config_dir: Path) -> RepoSelection:
+    payload, _ = read_json_safe(workspace_config_dir / REPO_SELECTION_FILENAME)
+    return RepoSelection.from_payload(payload)
+
+
+class RepoSelectionService:
+    def __init__(self, core: CoreRepository) -> None:
+        self._core = core
+
+    def _config_path(self, workspace_name: str) -> Path:
+        return self._core.workspace_config_dir(workspace_name) / REPO_SELECTION_FILENAME
+
+    def _ensure_workspace_exists(self, workspace_name: str) -> None:
+        names = {item["name"] for item in self._core.load_workspaces()}
+        if workspace_name not in names:
+            raise ValueError(f"Workspace not found: {workspace_name}")
+
+    def load(self, workspace_name: str) -> RepoSelection:
+        self._ensure_workspace_exists(workspace_name)
+        return load_repo_selection(self._core.workspace_config_dir(workspace_name))
+
+    def _save(self, workspace_name: str, selection: RepoSelection) -> None:
+        write_json(self._config_path(workspace_name), selection.to_payload())
+
+    def add_pattern(
+        self, workspace_name: str, kind: str, pattern: str, app: str | None = None
+    ) -> bool:
+        payload = self.load(workspace_name).to_payload()
+        patterns = self._pattern_list(payload, kind, app)
+        if pattern in patterns:
+            return False
+        patterns.append(pattern)
+        self._save(workspace_name, RepoSelection.from_payload(payload))
+        return True
+
+    def remove_pattern(
+        self, workspace_name: str, kind: str, pattern: str, app: str | None = None
+    ) -> bool:
+        payload = self.load(workspace_name).to_payload()
+        patterns = self._pattern_list(payload, kind, app)
+        if pattern not in patterns:
+            return False
+        patterns.remove(pattern)
+        self._save(workspace_name, RepoSelection.from_payload(payload))
+        return True
+
+    @staticmethod
+    def _pattern_list(payload: dict[str, Any], kind: str, app: str | None) -> list[str]:
+        if app is not None:
+            if kind != "exclude":
+                raise ValueError("Per-app selection only supports exclude patterns")
+            return payload["apps"].setdefault(app, [])
+        if kind not in ("include", "exclude"):
+            raise ValueError(f"Unknown pattern kind: {kind}")
+        return payload[kind]
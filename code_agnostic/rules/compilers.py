@@ -4,20 +4,56 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
-import yaml
-
+from code_agnostic.codecs import dump_yaml
+from code_agnostic.lossiness import LossyProperty, report_lossiness
 from code_agnostic.rules.models import Rule
 
 
 class IRuleCompiler(ABC):
+    app: str
+
     @abstractmethod
     def compile(self, rule: Rule) -> tuple[str, str]:
         """Return (filename, compiled_content) for target editor."""
 
+    def dropped(self, rule: Rule) -> list[LossyProperty]:
+        """Canonical properties of ``rule`` the compiled output cannot carry."""
+        return []
+
+    def report_dropped(self, rule: Rule) -> None:
+        """Report what compiling ``rule`` would drop, without compiling it."""
+        report_lossiness(self.app, rule.source_path, self.dropped(rule))
+
+
+class _AgentsMdRuleCompiler(IRuleCompiler):
+    """Shared AGENTS.md section output; the file has no per-rule metadata."""
+
+    def compile(self, rule: Rule) -> tuple[str, str]:
+        self.report_dropped(rule)
+        filename = "AGENTS.md"
+        header = f"## {rule.metadata.description or rule.name}"
+        content = f"{header}\n\n{rule.content}"
+        return filename, content
+
+    def dropped(self, rule: Rule) -> list[LossyProperty]:
+        dropped: list[LossyProperty] = []
+        if rule.metadata.always_apply:
+            dropped.append(
+                LossyProperty(
+                    "always_apply",
+                    "target does not support rule always_apply semantics",
+                )
+            )
+        if rule.metadata.globs:
+            dropped.append(LossyProperty("globs", "target does not support rule globs"))
+        return dropped
+
 
 class CursorRuleCompiler(IRuleCompiler):
     """Compile to Cursor .mdc format with camelCase frontmatter."""
 
+    app = "cursor"
+
     def compile(self, rule: Rule) -> tuple[str, str]:
         filename = f"{rule.name}.mdc"
         fm: dict = {}
@@ -29,28 +65,29 @@ class CursorRuleCompiler(IRuleCompiler):
 
         parts: list[str] = []
         parts.append("---")
-        parts.append(yaml.dump(fm, default_flow_style=False, sort_keys=False).rstrip())
+        parts.append(dump_yaml(fm))
         parts.append("---")
         parts.append("")
         parts.append(rule.content)
         return filename, "\n".join(parts)
 
 
-class OpenCodeRuleCompiler(IRuleCompiler):
+class OpenCodeRuleCompiler(_AgentsMdRuleCompiler):
     """Compile to AGENTS.md section for OpenCode."""
 
-    def compile(self, rule: Rule) -> tuple[str, str]:
-        filename = "AGENTS.md"
-        header = f"## {rule.metadata.description or rule.name}"
-        content = f"{header}\n\n{rule.content}"
-        return filename, content
+    app = "opencode"
 
 
-class CodexRuleCompiler(IRuleCompiler):
+class CodexRuleCompiler(_AgentsMdRuleCompiler):
     """Compile to AGENTS.md section for Codex."""
 
-    def compile(self, rule: Rule) -> tuple[str, str]:
-        filename = "AGENTS.md"
-        header = f"## {rule.metadata.description or rule.name}"
-        content = f"{header}\n\n{rule.content}"
-        return filename, content
+    app = "codex"
+
+
+def rule_compiler_for(app: str) -> IRuleCompiler:
+    compilers: dict[str, type[IRuleCompiler]] = {
+        "codex": CodexRuleCompiler,
+        "cursor": CursorRuleCompiler,
+        "opencode": OpenCodeRuleCompiler,
+    }
+    return compilers[app]()
@@ -2,27 +2,22 @@
 
 from __future__ import annotations
 
-import re
 from pathlib import Path
 
-import yaml
-
+from code_agnostic.codecs import dump_yaml, split_frontmatter
 from code_agnostic.rules.models import Rule, RuleMetadata
-
-_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+from code_agnostic.source_cache import cached_source
 
 
 def parse_rule(path: Path) -> Rule:
+    return cached_source("rule", path, _parse_rule)
+
+
+def _parse_rule(path: Path) -> Rule:
     text = path.read_text(encoding="utf-8")
     name = path.stem
 
-    match = _FRONTMATTER_RE.match(text)
-    if match:
-        raw = yaml.safe_load(match.group(1)) or {}
-        content = text[match.end() :]
-    else:
-        raw = {}
-        content = text
+    raw, content = split_frontmatter(text)
 
     globs = raw.get("globs", [])
     if not isinstance(globs, list):
@@ -48,7 +43,7 @@ def serialize_rule(rule: Rule) -> str:
     parts: list[str] = []
     if fm:
         parts.append("---")
-        parts.append(yaml.dump(fm, default_flow_style=False, sort_keys=False).rstrip())
+        parts.append(dump_yaml(fm))
         parts.append("---")
         parts.append("")
 
@@ -7,6 +7,7 @@ from pathlib import Path
 
 from code_agnostic.rules.models import Rule, RuleMetadata
 from code_agnostic.rules.parser import parse_rule, serialize_rule
+from code_agnostic.source_cache import cached_source
 from code_agnostic.spec.loaders import load_rule_bundle
 
 
@@ -29,13 +30,13 @@ class RulesRepository:
                 rules.append(parse_rule(child))
                 continue
             if _is_rule_bundle_dir(child):
-                rules.append(load_rule_bundle(child))
+                rules.append(cached_source("rule_bundle", child, load_rule_bundle))
         return rules
 
     def get_rule(self, name: str) -> Rule | None:
         bundle_path = self._rules_dir / name
         if _is_rule_bundle_dir(bundle_path):
-            return load_rule_bundle(bundle_path)
+            return cached_source("rule_bundle", bundle_path, load_rule_bundle)
         path = self._rules_dir / f"{name}.md"
         if not path.exists():
             return None
@@ -0,0 +1,330 @@
+"""Bounded history of plan/apply/restore runs and Prometheus textfile export.
+
+Every run appends one JSON line to ``<hub>/.sync-history.jsonl``; the file is
+trimmed to the newest ``RUN_HISTORY_LIMIT`` records. Writing history is best
+effort and never fails the command that produced it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from code_agnostic.constants import RUN_HISTORY_FILENAME
+from code_agnostic.locking import advisory_lock
+from code_agnostic.models import SyncPlan
+from code_agnostic.source_cache import CacheStats
+
+if TYPE_CHECKING:
+    from code_agnostic.executor import RootOutcome
+
+RUN_HISTORY_LIMIT = 1000
+METRICS_PREFIX = "code_agnostic"
+
+
+@dataclass
+class RunRecord:
+    command: str
+    started_at: str
+    duration: float = 0.0
+    ok: bool = True
+    target: str | None = None
+    via_daemon: bool = False
+    phases: dict[str, float] = field(default_factory=dict)
+    counts: dict[str, int] = field(default_factory=dict)
+    bytes_written: int | None = None
+    revisions: int | None = None
+    cache_hits: int | None = None
+    cache_misses: int | None = None
+
+    @property
+    def cache_hit_rate(self) -> float | None:
+        if self.cache_hits is None or self.cache_misses is None:
+            return None
+        total = self.cache_hits + self.cache_misses
+        return self.cache_hits / total if total else None
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> RunRecord | None:
+        if not isinstance(payload.get("command"), str):
+            return None
+        known = set(cls.__dataclass_fields__)
+        try:
+            return cls(**{key: value for key, value in payload.items() if key in known})
+        except TypeError:
+            return None
+
+
+class RunRecorder:
+    """Collects one run's phase timings and outcome while it executes."""
+
+    def __init__(self, command: str, target: str | None = None) -> None:
+        self.record = RunRecord(
+            command=command,
+            started_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            target=target,
+        )
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.record.phases[name] = self.record.phases.get(name, 0.0) + elapsed
+
+    def set_cache(self, stats: CacheStats) -> None:
+        self.record.cache_hits = stats.hits
+        self.record.cache_misses = stats.misses
+
+    def set_remote(self, response: dict[str, Any]) -> None:
+        """Note that the daemon served the run, with its cache use if reported."""
+        self.record.via_daemon = True
+        cache = response.get("cache")
+        if isinstance(cache, dict):
+            self.record.cache_hits = int(cache.get("hits", 0))
+            self.record.cache_misses = int(cache.get("misses", 0))
+
+    def set_plan(self, plan: SyncPlan) -> None:
+        self.record.counts = plan.summary()
+
+    def set_outcomes(self, outcomes: list[RootOutcome]) -> None:
+        committed = [outcome for outcome in outcomes if outcome.committed]
+        self.record.bytes_written = sum(item.bytes_written for item in committed)
+        self.record.revisions = sum(item.revisions for item in committed)
+
+    def finish(self, ok: bool) -> RunRecord:
+        self.record.ok = ok
+        self.record.duration = time.perf_counter() - self._started
+        return self.record
+
+
+def history_path(core_root: Path) -> Path:
+    return core_root / RUN_HISTORY_FILENAME
+
+
+def load_history(core_root: Path) -> list[RunRecord]:
+    try:
+        lines = history_path(core_root).read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return []
+    records: list[RunRecord] = []
+    for line in lines:
+        try:
+            payload = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(payload, dict):
+            record = RunRecord.from_payload(payload)
+            if record is not None:
+                records.append(record)
+    return records
+
+
+def append_history(
+    core_root: Path, record: RunRecord, limit: int = RUN_HISTORY_LIMIT
+) -> None:
+    path = history_path(core_root)
+    line = json.dumps(asdict(record), sort_keys=True)
+    with advisory_lock(path.with_name(path.name + ".lock")):
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            lines = []
+        if len(lines) < limit:
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+            return
+        kept = [*lines[len(lines) - limit + 1 :], line]
+        _replace_text(path, "\n".join(kept) + "\n")
+
+
+@contextmanager
+def record_run(
+    core_root: Path,
+    command: str,
+    *,
+    target: str | None = None,
+    metrics_path: Path | None = None,
+) -> Iterator[RunRecorder]:
+    """Record the wrapped run; a raised error or non-zero exit marks it failed."""
+    recorder = RunRecorder(command, target=target)
+    ok = False
+    try:
+        yield recorder
+        ok = True
+    except SystemExit as exc:
+        ok = not exc.code
+        raise
+    except Exception as exc:
+        # click.exceptions.Exit carries the exit code without being SystemExit.
+        ok = getattr(exc, "exit_code", 1) == 0
+        raise
+    finally:
+        record = recorder.finish(ok)
+        try:
+            append_history(core_root, record)
+            if metrics_path is not None:
+                write_prometheus_textfile(metrics_path, load_history(core_root))
+        except OSError:
+            pass
+
+
+def _replace_text(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        os.chmod(temp_name, 0o644)
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+@dataclass(frozen=True)
+class CommandStats:
+    command: str
+    runs: int
+    failures: int
+    median_duration: float
+    p95_duration: float
+    last_duration: float
+    recent_median: float | None
+    previous_median: float | None
+    bytes_written: int
+    revisions: int
+    cache_hit_rate: float | None
+    last_started_at: str
+
+    @property
+    def trend(self) -> float | None:
+        """Relative change of the recent half's median duration."""
+        if not self.recent_median or not self.previous_median:
+            return None
+        return self.recent_median / self.previous_median - 1.0
+
+
+def summarize_history(records: list[RunRecord]) -> list[CommandStats]:
+    by_command: dict[str, list[RunRecord]] = {}
+    for record in records:
+        by_command.setdefault(record.command, []).append(record)
+
+    summaries: list[CommandStats] = []
+    for command, runs in sorted(by_command.items()):
+        durations = [run.duration for run in runs]
+        half = len(runs) // 2
+        hits = sum(run.cache_hits or 0 for run in runs)
+        lookups = hits + sum(run.cache_misses or 0 for run in runs)
+        summaries.append(
+            CommandStats(
+                command=command,
+                runs=len(runs),
+                failures=sum(1 for run in runs if not run.ok),
+                median_duration=statistics.median(durations),
+                p95_duration=_percentile(durations, 0.95),
+                last_duration=durations[-1],
+                recent_median=(statistics.median(durations[half:]) if half else None),
+                previous_median=(statistics.median(durations[:half]) if half else None),
+                bytes_written=sum(run.bytes_written or 0 for run in runs),
+                revisions=sum(run.revisions or 0 for run in runs),
+                cache_hit_rate=hits / lookups if lookups else None,
+                last_started_at=runs[-1].started_at,
+            )
+        )
+    return summaries
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_prometheus(records: list[RunRecord]) -> str:
+    """Gauges for the latest run of each command, in text exposition format."""
+    latest: dict[str, RunRecord] = {}
+    for record in records:
+        latest[record.command] = record
+
+    metrics: dict[str, tuple[str, list[str]]] = {}
+
+    def gauge(name: str, help_text: str, labels: dict[str, str], value: float) -> None:
+        rendered = ",".join(f'{key}="{_label(val)}"' for key, val in labels.items())
+        _, samples = metrics.setdefault(name, (help_text, []))
+        samples.append(f"{METRICS_PREFIX}_{name}{{{rendered}}} {value:g}")
+
+    for command, record in sorted(latest.items()):
+        labels = {"command": command}
+        started = datetime.fromisoformat(record.started_at).timestamp()
+        gauge("last_run_timestamp_seconds", "Start of the last run.", labels, started)
+        gauge("last_run_success", "1 if the last run succeeded.", labels, record.ok)
+        gauge(
+            "last_run_duration_seconds",
+            "Wall time of the last run.",
+            labels,
+            record.duration,
+        )
+        for phase, seconds in sorted(record.phases.items()):
+            gauge(
+                "last_run_phase_seconds",
+                "Wall time of each phase of the last run.",
+                {**labels, "phase": phase},
+                seconds,
+            )
+        for status, count in sorted(record.counts.items()):
+            gauge(
+                "last_run_actions",
+                "Actions of the last run by status.",
+                {**labels, "status": status},
+                count,
+            )
+        if record.bytes_written is not None:
+            gauge(
+                "last_run_bytes_written",
+                "Bytes written by the last run.",
+                labels,
+                record.bytes_written,
+            )
+        if record.revisions is not None:
+            gauge(
+                "last_run_revisions",
+                "Revisions created by the last run.",
+                labels,
+                record.revisions,
+            )
+        if record.cache_hit_rate is not None:
+            gauge(
+                "last_run_cache_hit_ratio",
+                "Parsed-source cache hit ratio of the last run.",
+                labels,
+                record.cache_hit_rate,
+            )
+
+    lines: list[str] = []
+    for name, (help_text, samples) in metrics.items():
+        lines.append(f"# HELP {METRICS_PREFIX}_{name} {help_text}")
+        lines.append(f"# TYPE {METRICS_PREFIX}_{name} gauge")
+        lines.extend(samples)
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def write_prometheus_textfile(path: Path, records: list[RunRecord]) -> None:
+    # The textfile collector may read at any time, so swap the file in whole.
+    _replace_text(path, render_prometheus(records))
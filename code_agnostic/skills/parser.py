@@ -2,31 +2,26 @@
 
 from __future__ import annotations
 
-import re
 from pathlib import Path
 
-import yaml
-
+from code_agnostic.codecs import dump_yaml, split_frontmatter
 from code_agnostic.skills.models import Skill, SkillMetadata, SkillToolPermissions
+from code_agnostic.source_cache import cached_source
 from code_agnostic.spec.loaders import load_skill_bundle
 
-_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
-
 
 def parse_skill(path: Path) -> Skill:
+    return cached_source("skill", path, _parse_skill)
+
+
+def _parse_skill(path: Path) -> Skill:
     if _is_skill_bundle_dir(path):
         return load_skill_bundle(path)
 
     text = path.read_text(encoding="utf-8")
     name = path.parent.name if path.name == "SKILL.md" else path.stem
 
-    match = _FRONTMATTER_RE.match(text)
-    if match:
-        raw = yaml.safe_load(match.group(1)) or {}
-        content = text[match.end() :]
-    else:
-        raw = {}
-        content = text
+    raw, content = split_frontmatter(text)
 
     tools_raw = raw.get("tools", {})
     if not isinstance(tools_raw, dict):
@@ -70,7 +65,7 @@ def serialize_skill(skill: Skill) -> str:
     parts: list[str] = []
     if fm:
         parts.append("---")
-        parts.append(yaml.dump(fm, default_flow_style=False, sort_keys=False).rstrip())
+        parts.append(dump_yaml(fm))
         parts.append("---")
         parts.append("")
 
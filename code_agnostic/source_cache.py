@@ -0,0 +1,170 @@
+"""Parsed-source cache shared by parsers, compilers and the planner.
+
+Kept free of repository and app imports so that anything that parses or
+compiles a source can use it without an import cycle.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+FileStamp = tuple[int, int, int, int]
+CacheEntry = tuple[tuple[str, str], Any, Any]
+
+
+def file_stamp(path: Path) -> FileStamp | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size, stat.st_ino)
+
+
+def source_stamp(path: Path) -> tuple[Any, ...] | None:
+    """Stamp a source file, or every regular file directly inside a bundle dir."""
+    if not path.is_dir():
+        stamp = file_stamp(path)
+        return None if stamp is None else (stamp,)
+    entries: list[tuple[str, FileStamp]] = []
+    try:
+        children = sorted(os.scandir(path), key=lambda entry: entry.name)
+    except OSError:
+        return None
+    for entry in children:
+        if not entry.is_file(follow_symlinks=True):
+            continue
+        stamp = file_stamp(Path(entry.path))
+        if stamp is not None:
+            entries.append((entry.name, stamp))
+    return tuple(entries)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SourceCache:
+    """Memoize parsed sources, revalidated against file stamps on every lookup."""
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, str], tuple[Any, Any]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(
+        self,
+        kind: str,
+        path: Path,
+        loader: Callable[[Path], T],
+        *,
+        count_misses: bool = True,
+    ) -> T:
+        """Return the cached value; ``count_misses=False`` suits derived values
+        (compiled output) whose loader already counts the parse it does."""
+        key = (kind, str(path))
+        stamp = source_stamp(path)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and stamp is not None and cached[0] == stamp:
+                self._hits += 1
+                return cached[1]
+            self._misses += count_misses
+
+        value = loader(path)
+        if stamp is not None:
+            with self._lock:
+                self._entries[key] = (stamp, value)
+        return value
+
+    def invalidate(self, path: Path | None = None) -> None:
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            prefix = str(path)
+            for key in [
+                key
+                for key in self._entries
+                if key[1] == prefix
+                or key[1].startswith(prefix + os.sep)
+                or prefix.startswith(key[1] + os.sep)
+            ]:
+                del self._entries[key]
+
+    def contains(self, kind: str, path: Path) -> bool:
+        """Whether a lookup would hit, without counting it."""
+        stamp = source_stamp(path)
+        with self._lock:
+            cached = self._entries.get((kind, str(path)))
+        return cached is not None and stamp is not None and cached[0] == stamp
+
+    def export(self) -> list[CacheEntry]:
+        with self._lock:
+            return [
+                (key, stamp, value) for key, (stamp, value) in self._entries.items()
+            ]
+
+    def merge(self, entries: list[CacheEntry]) -> None:
+        """Adopt entries loaded elsewhere, e.g. by a compile worker process.
+
+        Their stamps were taken when they were loaded, so a source edited
+        since is still reloaded on its next lookup.
+        """
+        with self._lock:
+            for key, stamp, value in entries:
+                self._entries.setdefault(key, (stamp, value))
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_ACTIVE_SOURCE_CACHE: ContextVar[SourceCache | None] = ContextVar(
+    "code_agnostic_source_cache", default=None
+)
+
+
+def active_source_cache() -> SourceCache | None:
+    return _ACTIVE_SOURCE_CACHE.get()
+
+
+@contextmanager
+def use_source_cache(cache: SourceCache | None) -> Iterator[SourceCache | None]:
+    token = _ACTIVE_SOURCE_CACHE.set(cache)
+    try:
+        yield cache
+    finally:
+        _ACTIVE_SOURCE_CACHE.reset(token)
+
+
+def cached_source(
+    kind: str,
+    path: Path,
+    loader: Callable[[Path], T],
+    *,
+    count_misses: bool = True,
+) -> T:
+    cache = _ACTIVE_SOURCE_CACHE.get()
+    if cache is None:
+        return loader(path)
+    return cache.get(kind, path, loader, count_misses=count_misses)
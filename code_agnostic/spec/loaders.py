@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -17,6 +18,7 @@ from code_agnostic.agents.models import (
 )
 from code_agnostic.apps.common.framework import format_schema_error
 from code_agnostic.apps.common.models import MCPAuthDTO, MCPServerDTO, MCPServerType
+from code_agnostic.codecs import load_yaml
 from code_agnostic.errors import InvalidConfigSchemaError, MissingConfigFileError
 from code_agnostic.rules.models import Rule, RuleMetadata
 from code_agnostic.skills.models import Skill, SkillMetadata, SkillToolPermissions
@@ -24,11 +26,16 @@ from code_agnostic.skills.models import Skill, SkillMetadata, SkillToolPermissio
 _SCHEMA_DIR = Path(__file__).with_name("schemas")
 
 
+@lru_cache(maxsize=None)
+def _schema_validator(schema_name: str) -> Draft202012Validator:
+    schema = json.loads((_SCHEMA_DIR / schema_name).read_text(encoding="utf-8"))
+    return Draft202012Validator(schema)
+
+
 def validate_schema_payload(
     path: Path, schema_name: str, payload: dict[str, Any]
 ) -> None:
-    schema = json.loads((_SCHEMA_DIR / schema_name).read_text(encoding="utf-8"))
-    error = next(iter(Draft202012Validator(schema).iter_errors(payload)), None)
+    error = next(iter(_schema_validator(schema_name).iter_errors(payload)), None)
     if error is not None:
         raise InvalidConfigSchemaError(path, format_schema_error(error))
 
@@ -175,7 +182,7 @@ def _load_yaml(path: Path) -> dict[str, Any]:
     if not path.exists():
         raise MissingConfigFileError(path)
     try:
-        payload = yaml.safe_load(path.read_text(encoding="utf-8"))
+        payload = load_yaml(path.read_text(encoding="utf-8"))
     except yaml.YAMLError as exc:
         raise InvalidConfigSchemaError(path, str(exc)) from exc
     if payload is None:
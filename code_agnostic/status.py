@@ -1,22 +1,87 @@
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from code_agnostic.apps.app_id import AppId, AppMetadata, app_metadata
 from code_agnostic.apps.common.interfaces.repositories import ISourceRepository
 from code_agnostic.apps.common.interfaces.service import IAppConfigService
 from code_agnostic.core.workspace_repository import WorkspaceConfigRepository
 from code_agnostic.models import (
+    ActionStatus,
+    EditorStatusRow,
+    EditorSyncStatus,
     RepoSyncStatus,
+    SyncPlan,
     WorkspaceRepoStatusRow,
     WorkspaceStatusRow,
     WorkspaceSyncStatus,
 )
+from code_agnostic.repo_selection import load_repo_selection, repo_relative
 from code_agnostic.workspaces import WorkspaceService
 
+if TYPE_CHECKING:
+    from code_agnostic.apps.apps_service import AppsService
+
+
+def editor_status_row(
+    app_name: str, plan: SyncPlan, apps: "AppsService"
+) -> EditorStatusRow:
+    if not apps.is_enabled(app_name):
+        return EditorStatusRow(
+            name=app_name,
+            status=EditorSyncStatus.DISABLED,
+            detail="disabled by apps config",
+        )
+
+    relevant = plan.index.select(app=app_name)
+
+    for error in plan.errors:
+        if app_name in str(error).lower():
+            return EditorStatusRow(
+                name=app_name,
+                status=EditorSyncStatus.ERROR,
+                detail=f"cannot evaluate ({error})",
+            )
+
+    synced = (
+        all(action.status == ActionStatus.NOOP for action in relevant)
+        if relevant
+        else True
+    )
+    return EditorStatusRow(
+        name=app_name,
+        status=EditorSyncStatus.SYNCED if synced else EditorSyncStatus.DRIFT,
+        detail="in sync" if synced else "out of sync",
+    )
+
 
 class StatusService:
     def __init__(self, workspace_service: WorkspaceService | None = None) -> None:
         self.workspace_service = workspace_service or WorkspaceService()
 
+    def build_editor_status(
+        self, apps: "AppsService", target: str = "all"
+    ) -> list[EditorStatusRow]:
+        try:
+            plan = apps.plan_for_target("all", workspace_service=self.workspace_service)
+            rows = [
+                editor_status_row(app_name, plan, apps)
+                for app_name in apps.available_apps()
+            ]
+        except Exception as exc:
+            rows = [
+                EditorStatusRow(
+                    name=app_name,
+                    status=EditorSyncStatus.ERROR,
+                    detail=f"cannot evaluate ({exc})",
+                )
+                for app_name in apps.available_apps()
+            ]
+
+        normalized_target = target.lower()
+        if normalized_target != "all":
+            rows = [row for row in rows if row.name == normalized_target]
+        return rows
+
     def build_workspace_status(
         self,
         source_repo: ISourceRepository,
@@ -56,7 +121,10 @@ class StatusService:
                 )
                 continue
 
-            repos = self.workspace_service.discover_git_repos(workspace_path)
+            selection = load_repo_selection(ws_source.root)
+            repos = self.workspace_service.discover_git_repos(
+                workspace_path, selection if not selection.is_empty else None
+            )
 
             app_metas: list[AppMetadata] = []
             for svc in app_services or []:
@@ -68,7 +136,18 @@ class StatusService:
                     app_metas.append(meta)
 
             repo_rows = [
-                self._repo_sync_status(repo, ws_source, app_metas) for repo in repos
+                self._repo_sync_status(
+                    repo,
+                    ws_source,
+                    [
+                        meta
+                        for meta in app_metas
+                        if selection.allows_app(
+                            repo_relative(workspace_path, repo), meta.app_id.value
+                        )
+                    ],
+                )
+                for repo in repos
             ]
 
             detail = "all git repos synced"
@@ -1,16 +1,26 @@
+from collections.abc import Iterable
+from typing import Any
+
 from rich.console import Console
 
+from code_agnostic.executor import RootOutcome
+from code_agnostic.git_exclude_service import ExcludeReport
 from code_agnostic.imports.models import ImportApplyResult, ImportPlan
 from code_agnostic.models import (
+    ActionStatus,
     AppStatusRow,
     EditorStatusRow,
     SyncPlan,
     WorkspaceStatusRow,
     WorkspaceSyncStatus,
 )
+from code_agnostic.repo_selection import RepoSelection
 from code_agnostic.tui.enums import UIStyle
 from code_agnostic.tui.sections import UISection
 from code_agnostic.tui.tables import (
+    DEFAULT_PLAN_GROUP_BY,
+    LOCK_WAIT_NOTICE_SECONDS,
+    PLAN_DETAIL_LIMIT,
     AppsTable,
     ApplyTable,
     ConfigListTable,
@@ -18,6 +28,7 @@ from code_agnostic.tui.tables import (
     PlanTable,
     StatusTable,
     WorkspaceTable,
+    format_lock_wait,
 )
 from code_agnostic.utils import compact_home_path, compact_home_paths_in_text
 
@@ -26,8 +37,22 @@ class SyncConsoleUI:
     def __init__(self, console: Console | None = None) -> None:
         self.console = console or Console()
 
-    def render_plan(self, plan: SyncPlan, mode: str, verbose: bool = False) -> None:
-        app_actions, workspace_actions = PlanTable.split_actions(plan)
+    def render_plan(
+        self,
+        plan: SyncPlan,
+        mode: str,
+        verbose: bool = False,
+        *,
+        show_noop: bool = False,
+        group_by: tuple[str, ...] | None = None,
+        pager: bool = False,
+    ) -> None:
+        visible = [
+            action
+            for action in plan.actions
+            if show_noop or action.status != ActionStatus.NOOP
+        ]
+        hidden = len(plan.actions) - len(visible)
 
         self.console.print(
             UISection.wrap(
@@ -37,26 +62,62 @@ class SyncConsoleUI:
             )
         )
 
-        if app_actions:
+        if not visible:
             self.console.print(
-                UISection.wrap(
-                    "app config sync",
-                    PlanTable.actions_table(app_actions, verbose=verbose),
-                    style=UIStyle.CYAN.value,
+                UISection.note(
+                    "actions", "No actions required.", style=UIStyle.DIM.value
                 )
             )
-        if workspace_actions:
+        elif pager:
+            with self.console.pager():
+                for line in PlanTable.detail_lines(visible, verbose=verbose):
+                    self.console.out(line, highlight=False)
+        elif group_by or len(visible) > PLAN_DETAIL_LIMIT:
             self.console.print(
                 UISection.wrap(
-                    "workspace config sync",
-                    PlanTable.actions_table(workspace_actions, verbose=verbose),
-                    style=UIStyle.MAGENTA.value,
+                    "plan summary",
+                    PlanTable.aggregate_table(
+                        visible, group_by or DEFAULT_PLAN_GROUP_BY
+                    ),
+                    style=UIStyle.CYAN.value,
                 )
             )
-        if not app_actions and not workspace_actions:
+            if not group_by:
+                self.console.print(
+                    UISection.note(
+                        "detail",
+                        f"{len(visible)} actions summarized; "
+                        "run with --pager to list each one.",
+                        style=UIStyle.DIM.value,
+                    )
+                )
+        else:
+            app_actions, workspace_actions = PlanTable.split_actions(
+                SyncPlan(actions=visible, errors=[], skipped=[])
+            )
+            if app_actions:
+                self.console.print(
+                    UISection.wrap(
+                        "app config sync",
+                        PlanTable.actions_table(app_actions, verbose=verbose),
+                        style=UIStyle.CYAN.value,
+                    )
+                )
+            if workspace_actions:
+                self.console.print(
+                    UISection.wrap(
+                        "workspace config sync",
+                        PlanTable.actions_table(workspace_actions, verbose=verbose),
+                        style=UIStyle.MAGENTA.value,
+                    )
+                )
+
+        if hidden:
             self.console.print(
                 UISection.note(
-                    "actions", "No actions required.", style=UIStyle.DIM.value
+                    "unchanged",
+                    f"{hidden} noop actions hidden (--show noop to list them).",
+                    style=UIStyle.DIM.value,
                 )
             )
 
@@ -86,6 +147,41 @@ class SyncConsoleUI:
             )
         )
 
+    def render_plan_stream(
+        self,
+        chunks: Iterable[SyncPlan],
+        mode: str,
+        verbose: bool = False,
+        **view: Any,
+    ) -> SyncPlan:
+        plan = SyncPlan(actions=[], errors=[], skipped=[])
+        with self.console.status("planning...", spinner="dots") as progress:
+            for chunk in chunks:
+                plan.extend(chunk)
+                pending = len(plan.actions) - plan.index.count(ActionStatus.NOOP)
+                progress.update(
+                    f"planning... {len(plan.actions)} actions, {pending} pending,"
+                    f" {len(plan.errors)} errors"
+                )
+        self.render_plan(plan, mode=mode, verbose=verbose, **view)
+        return plan
+
+    def render_apply_roots(self, outcomes: list[RootOutcome]) -> None:
+        """Per-root commit report; single-root applies only note a lock wait."""
+        if len(outcomes) > 1:
+            self.console.print(ApplyTable.roots_table(outcomes))
+            return
+        for item in outcomes:
+            if item.lock_wait >= LOCK_WAIT_NOTICE_SECONDS:
+                self.console.print(
+                    UISection.note(
+                        "lock",
+                        f"waited {format_lock_wait(item.lock_wait)} for the "
+                        f"{item.label} root lock",
+                        style=UIStyle.YELLOW.value,
+                    )
+                )
+
     def render_apply_result(
         self, applied: int, failed: int, failures: list[str]
     ) -> None:
@@ -98,6 +194,33 @@ class SyncConsoleUI:
                 UISection.note("failures", failure_text, style=UIStyle.RED.value)
             )
 
+    def render_watch_cycle(
+        self,
+        description: str,
+        plan: SyncPlan,
+        applied: int,
+        failed: int,
+        failures: list[str],
+        duration: float,
+        verbose: bool = False,
+    ) -> None:
+        pending = [a for a in plan.actions if a.status != ActionStatus.NOOP]
+        style = UIStyle.RED.value if failed or plan.errors else UIStyle.GREEN.value
+        if not pending and not plan.errors:
+            style = UIStyle.DIM.value
+        lines = [
+            f"changes: {description}",
+            f"actions: {len(pending)} pending / {len(plan.actions)} planned",
+            f"applied: {applied}  failed: {failed}  ({duration * 1000:.0f} ms)",
+        ]
+        lines.extend(
+            f"- {compact_home_paths_in_text(str(item))}" for item in plan.errors
+        )
+        lines.extend(f"- {compact_home_paths_in_text(item)}" for item in failures)
+        self.console.print(UISection.note("watch", "\n".join(lines), style=style))
+        if verbose and pending:
+            self.console.print(PlanTable.actions_table(pending, verbose=True))
+
     def render_workspace_saved(
         self, name: str, path: str, removed: bool = False
     ) -> None:
@@ -224,6 +347,46 @@ class SyncConsoleUI:
             )
         )
 
+    def render_exclude_report(self, report: ExcludeReport) -> None:
+        self.console.print(
+            UISection.note(
+                "git-exclude",
+                f"repos={report.repos}, skipped={report.skipped}, "
+                f"changed={report.changed}, lines_added={report.lines_added}",
+                style=UIStyle.BLUE.value,
+            )
+        )
+
+    def render_repo_selection(
+        self, workspace: str, selection: RepoSelection, repos: list[str]
+    ) -> None:
+        lines = [
+            f"include: {', '.join(selection.include) or '(all)'}",
+            f"exclude: {', '.join(selection.exclude) or '(none)'}",
+        ]
+        for app, patterns in selection.app_exclude:
+            lines.append(f"exclude for {app}: {', '.join(patterns)}")
+        if repos:
+            lines.append("repos:")
+        for repo in repos:
+            if not selection.selects(repo):
+                lines.append(f"  - {repo} (excluded)")
+                continue
+            opted_out = [
+                app
+                for app, _ in selection.app_exclude
+                if not selection.allows_app(repo, app)
+            ]
+            suffix = f" (skips {', '.join(opted_out)})" if opted_out else ""
+            lines.append(f"  - {repo}{suffix}")
+        self.console.print(
+            UISection.note(
+                f"repo selection ({workspace})",
+                "\n".join(lines),
+                style=UIStyle.BLUE.value,
+            )
+        )
+
     def render_import_plan(
         self, plan: ImportPlan, mode: str, verbose: bool = False
     ) -> None:
@@ -1,4 +1,5 @@
 from collections import Counter
+from collections.abc import Iterable, Iterator
 
 from rich.console import Group
 from rich.padding import Padding
@@ -7,9 +8,11 @@ from rich.table import Column, Table
 from rich.text import Text
 
 from code_agnostic.apps.app_id import AppId, app_label
+from code_agnostic.executor import RootOutcome
 from code_agnostic.imports.models import ImportAction, ImportActionStatus, ImportPlan
 from code_agnostic.models import (
     Action,
+    ActionStatus,
     AppStatusRow,
     AppSyncStatus,
     EditorStatusRow,
@@ -23,6 +26,12 @@ from code_agnostic.tui.enums import ACTION_STATUS_STYLE, UIStyle
 from code_agnostic.utils import compact_home_path
 
 
+PLAN_GROUP_FIELDS = ("workspace", "app", "scope", "status", "kind")
+DEFAULT_PLAN_GROUP_BY = ("workspace", "app", "scope", "status")
+# Above this many listed rows the plan is summarized instead of tabulated;
+# rich measures every cell, so layout time grows with the row count.
+PLAN_DETAIL_LIMIT = 300
+
 IMPORT_STATUS_STYLE = {
     ImportActionStatus.CREATE: UIStyle.GREEN.value,
     ImportActionStatus.UPDATE: UIStyle.CYAN.value,
@@ -35,7 +44,10 @@ IMPORT_STATUS_STYLE = {
 class PlanTable:
     @staticmethod
     def summary_block(plan: SyncPlan, mode: str):
-        counts = Counter(action.status.value for action in plan.actions)
+        counts = {
+            status.value: len(positions)
+            for status, positions in plan.index.by_status.items()
+        }
         chips = [f"{key}={value}" for key, value in sorted(counts.items()) if value > 0]
         if not chips:
             chips = ["none"]
@@ -50,14 +62,17 @@ class PlanTable:
 
     @staticmethod
     def split_actions(plan: SyncPlan) -> tuple[list[Action], list[Action]]:
-        app_actions: list[Action] = []
-        workspace_actions: list[Action] = []
-        for action in plan.actions:
-            if action.app == "workspace":
-                workspace_actions.append(action)
-            else:
-                app_actions.append(action)
-        return app_actions, workspace_actions
+        by_app = plan.index.by_app
+        app_positions = [
+            position
+            for app, positions in by_app.items()
+            if app != "workspace"
+            for position in positions
+        ]
+        return (
+            plan.index.take(app_positions),
+            plan.index.take(by_app.get("workspace", [])),
+        )
 
     @staticmethod
     def actions_table(actions: list[Action], verbose: bool = False) -> Table:
@@ -101,6 +116,55 @@ class PlanTable:
             table.add_row(*base_values)
         return table
 
+    @staticmethod
+    def group_value(action: Action, field: str) -> str:
+        if field == "workspace":
+            return action.workspace or "(global)"
+        if field == "app":
+            return action.app or AppId.CORE.value
+        if field == "scope":
+            return action.scope or "config"
+        if field == "status":
+            return action.status.value
+        if field == "kind":
+            return action.kind.value
+        raise ValueError(f"Unknown plan group field: {field}")
+
+    @staticmethod
+    def aggregate_table(actions: Iterable[Action], group_by: tuple[str, ...]) -> Table:
+        counts = Counter(
+            tuple(PlanTable.group_value(action, field) for field in group_by)
+            for action in actions
+        )
+        table = Table(
+            *[Column(header=field.title(), overflow="ellipsis") for field in group_by],
+            Column(header="Actions", justify="right"),
+            expand=True,
+            header_style="bold",
+        )
+        status_index = group_by.index("status") if "status" in group_by else None
+        for key, count in sorted(counts.items()):
+            values = list(key)
+            if status_index is not None:
+                style = ACTION_STATUS_STYLE.get(
+                    ActionStatus(values[status_index]), UIStyle.WHITE.value
+                )
+                values[status_index] = f"[{style}]{values[status_index]}[/{style}]"
+            table.add_row(*values, str(count))
+        return table
+
+    @staticmethod
+    def detail_lines(actions: Iterable[Action], verbose: bool = False) -> Iterator[str]:
+        """Plain fixed-width rows; cheap enough to page through any plan size."""
+        for action in actions:
+            target = compact_home_path(action.path)
+            if verbose and action.source is not None:
+                target = f"{compact_home_path(action.source)} -> {target}"
+            yield (
+                f"{action.status.value:<8} {action.kind.value:<12} "
+                f"{PlanTable.group_value(action, 'app'):<10} {target}  {action.detail}"
+            )
+
     @staticmethod
     def _source_label_for_action(action: Action) -> str:
         if action.app == "workspace":
@@ -116,6 +180,14 @@ class PlanTable:
         return app_label(action.app)
 
 
+# Waits shorter than this are uncontended and not worth mentioning.
+LOCK_WAIT_NOTICE_SECONDS = 0.05
+
+
+def format_lock_wait(seconds: float) -> str:
+    return f"{seconds * 1000:.0f} ms"
+
+
 class ApplyTable:
     @staticmethod
     def stats_panel(applied: int, failed: int) -> Panel:
@@ -132,6 +204,28 @@ class ApplyTable:
             border_style=UIStyle.GREEN.value if failed == 0 else UIStyle.RED.value,
         )
 
+    @staticmethod
+    def roots_table(outcomes: list[RootOutcome]) -> Table:
+        table = Table(
+            Column(header="Root", overflow="ellipsis"),
+            Column(header="Result", width=12),
+            Column(header="Applied", width=8, justify="right"),
+            Column(header="Lock wait", width=10, justify="right"),
+            expand=True,
+            header_style="bold",
+        )
+        for item in outcomes:
+            if not item.attempted:
+                result = Text("not attempted", style=UIStyle.DIM.value)
+            elif item.failure is not None:
+                result = Text("rolled back", style=UIStyle.RED.value)
+            else:
+                result = Text("committed", style=UIStyle.GREEN.value)
+            table.add_row(
+                item.label, result, str(item.applied), format_lock_wait(item.lock_wait)
+            )
+        return table
+
 
 class WorkspaceTable:
     @staticmethod
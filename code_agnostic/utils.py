@@ -1,15 +1,74 @@
-import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from copy import deepcopy
 from pathlib import Path
 from typing import Any
 
+from code_agnostic.codecs import dumps_json, read_json_file
+
+
+class JsonWriteBuffer:
+    """Serve repeated JSON reads from memory and defer writes until flush."""
+
+    def __init__(self) -> None:
+        self._payloads: dict[Path, Any] = {}
+        self._dirty: set[Path] = set()
+        self.loads = 0
+        self.writes = 0
+
+    def read(self, path: Path) -> tuple[Any | None, str | None]:
+        key = path.absolute()
+        if key not in self._payloads:
+            payload, error = _read_json_safe(path)
+            if error is not None:
+                return None, error
+            self.loads += 1
+            self._payloads[key] = payload
+        return deepcopy(self._payloads[key]), None
+
+    def write(self, path: Path, payload: Any) -> None:
+        key = path.absolute()
+        self._payloads[key] = deepcopy(payload)
+        self._dirty.add(key)
+
+    def flush(self) -> list[Path]:
+        flushed = sorted(self._dirty)
+        for path in flushed:
+            _write_json(path, self._payloads[path])
+            self.writes += 1
+        self._dirty.clear()
+        return flushed
+
+
+_JSON_BUFFER: ContextVar[JsonWriteBuffer | None] = ContextVar(
+    "code_agnostic_json_buffer", default=None
+)
+
+
+@contextmanager
+def batched_json_writes() -> Iterator[JsonWriteBuffer]:
+    buffer = JsonWriteBuffer()
+    token = _JSON_BUFFER.set(buffer)
+    try:
+        yield buffer
+        buffer.flush()
+    finally:
+        _JSON_BUFFER.reset(token)
+
 
 def read_json(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return read_json_file(path)
 
 
 def read_json_safe(path: Path) -> tuple[Any | None, str | None]:
+    buffer = _JSON_BUFFER.get()
+    if buffer is not None:
+        return buffer.read(path)
+    return _read_json_safe(path)
+
+
+def _read_json_safe(path: Path) -> tuple[Any | None, str | None]:
     if not path.exists():
         return None, None
     if path.stat().st_size == 0:
@@ -21,10 +80,16 @@ def read_json_safe(path: Path) -> tuple[Any | None, str | None]:
 
 
 def write_json(path: Path, payload: Any) -> None:
+    buffer = _JSON_BUFFER.get()
+    if buffer is not None:
+        buffer.write(path, payload)
+        return
+    _write_json(path, payload)
+
+
+def _write_json(path: Path, payload: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2, sort_keys=False)
-        handle.write("\n")
+    path.write_text(dumps_json(payload), encoding="utf-8")
 
 
 def merge_dict_overlay(
@@ -1,14 +1,29 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import os
+import threading
+import xml.etree.ElementTree as ET
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Any
 
+from code_agnostic import __version__
 from code_agnostic.agents.parser import parse_agent
+from code_agnostic.constants import VALIDATION_CACHE_FILENAME
 from code_agnostic.core.repository import CoreRepository
 from code_agnostic.core.workspace_repository import WorkspaceConfigRepository
 from code_agnostic.rules.parser import parse_rule
-from code_agnostic.spec.loaders import load_rule_bundle
 from code_agnostic.skills.parser import parse_skill
+from code_agnostic.source_cache import active_source_cache, use_source_cache
+from code_agnostic.spec.loaders import load_rule_bundle
+from code_agnostic.utils import read_json_safe, write_json
+
+DEFAULT_VALIDATE_JOBS = min(8, os.cpu_count() or 1)
+_SCHEMA_DIR = Path(__file__).with_name("spec") / "schemas"
 
 
 @dataclass(frozen=True)
@@ -17,107 +32,347 @@ class ValidationIssue:
     message: str
 
 
+@dataclass(frozen=True)
+class CheckVerdict:
+    kind: str
+    path: Path
+    message: str | None = None
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.message is None
+
+
 @dataclass(frozen=True)
 class ValidationResult:
     validated: int
     issues: list[ValidationIssue]
+    checks: list[CheckVerdict] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class RootValidation:
+    """Validation of one config root: the global hub or a workspace."""
+
+    name: str
+    root: Path
+    result: ValidationResult
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "root": str(self.root),
+            "validated": self.result.validated,
+            "issues": [
+                {"path": str(issue.path), "message": issue.message}
+                for issue in self.result.issues
+            ],
+            "checks": [
+                {
+                    "kind": check.kind,
+                    "path": str(check.path),
+                    "ok": check.ok,
+                    "message": check.message,
+                    "cached": check.cached,
+                }
+                for check in self.result.checks
+            ],
+        }
+
+
+@dataclass(frozen=True)
+class _Check:
+    kind: str
+    path: Path
+    inputs: tuple[Path, ...]
+    run: Callable[[], object]
+
+
+@lru_cache(maxsize=1)
+def _verdict_salt() -> bytes:
+    """Digest of what decides a verdict besides the sources themselves."""
+    digest = hashlib.sha256(__version__.encode("utf-8"))
+    for schema in sorted(_SCHEMA_DIR.glob("*.json")):
+        digest.update(schema.name.encode("utf-8"))
+        digest.update(schema.read_bytes())
+    return digest.digest()
+
+
+def source_digest(kind: str, inputs: tuple[Path, ...]) -> str:
+    digest = hashlib.sha256(_verdict_salt())
+    digest.update(kind.encode("utf-8"))
+    for item in inputs:
+        digest.update(b"\0" + str(item).encode("utf-8"))
+        if item.is_file():
+            digest.update(b"\0f" + item.read_bytes())
+        elif item.is_dir():
+            for child in sorted(path for path in item.rglob("*") if path.is_file()):
+                digest.update(b"\0" + child.relative_to(item).as_posix().encode())
+                digest.update(b"\0f" + child.read_bytes())
+        else:
+            digest.update(b"\0missing")
+    return digest.hexdigest()
+
+
+def verdict_cache_path() -> Path:
+    """Where ``validate --cache`` keeps verdicts: the user's state dir, not the hub."""
+    state_home = os.environ.get("XDG_STATE_HOME")
+    base = Path(state_home) if state_home else Path.home() / ".local" / "state"
+    return base / "code-agnostic" / VALIDATION_CACHE_FILENAME
+
+
+class VerdictCache:
+    """Validation verdicts per source path, valid while the content digest matches.
+
+    Keyed by absolute source path, so one file serves every hub. CI can keep
+    it between runs; entries for sources that no longer exist are dropped on
+    save.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._dirty = False
+        payload, _ = read_json_safe(path)
+        entries = payload.get("verdicts") if isinstance(payload, dict) else None
+        self._entries: dict[str, dict[str, Any]] = (
+            entries if isinstance(entries, dict) else {}
+        )
+
+    @classmethod
+    def default(cls) -> VerdictCache:
+        return cls(verdict_cache_path())
+
+    def lookup(self, path: Path, digest: str) -> tuple[bool, str | None]:
+        with self._lock:
+            entry = self._entries.get(str(path))
+            if isinstance(entry, dict) and entry.get("digest") == digest:
+                self.hits += 1
+                message = entry.get("message")
+                return True, message if isinstance(message, str) else None
+            self.misses += 1
+            return False, None
+
+    def store(self, path: Path, digest: str, message: str | None) -> None:
+        with self._lock:
+            self._entries[str(path)] = {"digest": digest, "message": message}
+            self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            stale = [key for key in self._entries if not Path(key).exists()]
+            for key in stale:
+                del self._entries[key]
+            if not self._dirty and not stale:
+                return
+            write_json(self.path, {"verdicts": self._entries})
+            self._dirty = False
 
 
 class ConfigValidator:
+    def __init__(
+        self, jobs: int | None = None, verdicts: VerdictCache | None = None
+    ) -> None:
+        self.jobs = jobs or DEFAULT_VALIDATE_JOBS
+        self.verdicts = verdicts
+
     def validate_core_root(self, root: Path) -> ValidationResult:
         return self._validate_repository(CoreRepository(root))
 
     def validate_workspace_root(self, root: Path) -> ValidationResult:
         return self._validate_repository(WorkspaceConfigRepository(root))
 
+    def validate_hub(self, core: CoreRepository) -> list[RootValidation]:
+        """Validate the global root and every registered workspace at once."""
+        roots: list[tuple[str, CoreRepository | WorkspaceConfigRepository]] = [
+            ("global", CoreRepository(core.root))
+        ]
+        for item in core.load_workspaces():
+            name = item["name"]
+            roots.append(
+                (name, WorkspaceConfigRepository(core.workspace_config_dir(name)))
+            )
+        return self.validate_roots(roots)
+
+    def validate_roots(
+        self, roots: list[tuple[str, CoreRepository | WorkspaceConfigRepository]]
+    ) -> list[RootValidation]:
+        # One pool for every root's sources, so a large workspace does not
+        # leave workers idle while a small one finishes.
+        checks = [self._collect(repository) for _, repository in roots]
+        verdicts = iter(self._run([item for group in checks for item in group]))
+        results: list[RootValidation] = []
+        for (name, repository), group in zip(roots, checks):
+            root_verdicts = [next(verdicts) for _ in group]
+            results.append(
+                RootValidation(
+                    name=name,
+                    root=repository.root,
+                    result=ValidationResult(
+                        validated=sum(item.ok for item in root_verdicts),
+                        issues=[
+                            ValidationIssue(item.path, item.message)
+                            for item in root_verdicts
+                            if item.message is not None
+                        ],
+                        checks=root_verdicts,
+                    ),
+                )
+            )
+        if self.verdicts is not None:
+            self.verdicts.save()
+        return results
+
     def _validate_repository(
         self, repository: CoreRepository | WorkspaceConfigRepository
     ) -> ValidationResult:
-        validated = 0
-        issues: list[ValidationIssue] = []
+        return self.validate_roots([("", repository)])[0].result
 
-        if repository.mcp_base_path.exists() or repository.mcp_base_yaml_path.exists():
-            try:
-                repository.load_mcp_base()
-                validated += 1
-            except Exception as exc:
-                issues.append(ValidationIssue(repository.mcp_base_path, str(exc)))
-
-        validated, issues = self._validate_rules(
-            repository.root / "rules", validated, issues
-        )
-        validated, issues = self._validate_skills(
-            repository.root / "skills", validated, issues
-        )
-        validated, issues = self._validate_agents(
-            repository.root / "agents", validated, issues
-        )
+    def _run(self, checks: list[_Check]) -> list[CheckVerdict]:
+        # Context variables do not follow work into pool threads.
+        cache = active_source_cache()
+
+        def run(check: _Check) -> CheckVerdict:
+            with use_source_cache(cache):
+                return self._run_check(check)
 
-        return ValidationResult(validated=validated, issues=issues)
+        workers = max(1, min(self.jobs, len(checks)))
+        if workers == 1:
+            return [self._run_check(check) for check in checks]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(run, checks))
 
-    def _validate_rules(
-        self, rules_dir: Path, validated: int, issues: list[ValidationIssue]
-    ) -> tuple[int, list[ValidationIssue]]:
+    def _run_check(self, check: _Check) -> CheckVerdict:
+        digest: str | None = None
+        if self.verdicts is not None:
+            digest = source_digest(check.kind, check.inputs)
+            found, message = self.verdicts.lookup(check.path, digest)
+            if found:
+                return CheckVerdict(check.kind, check.path, message, cached=True)
+        try:
+            check.run()
+            message = None
+        except Exception as exc:
+            message = str(exc)
+        if self.verdicts is not None and digest is not None:
+            self.verdicts.store(check.path, digest, message)
+        return CheckVerdict(check.kind, check.path, message)
+
+    def _collect(
+        self, repository: CoreRepository | WorkspaceConfigRepository
+    ) -> list[_Check]:
+        checks: list[_Check] = []
+        if repository.mcp_base_path.exists() or repository.mcp_base_yaml_path.exists():
+            checks.append(
+                _Check(
+                    "mcp",
+                    repository.mcp_base_path,
+                    (repository.mcp_base_path, repository.mcp_base_yaml_path),
+                    repository.load_mcp_base,
+                )
+            )
+        checks.extend(self._collect_rules(repository.root / "rules"))
+        checks.extend(self._collect_skills(repository.root / "skills"))
+        checks.extend(self._collect_agents(repository.root / "agents"))
+        return checks
+
+    def _collect_rules(self, rules_dir: Path) -> list[_Check]:
         if not rules_dir.exists():
-            return validated, issues
+            return []
 
+        checks: list[_Check] = []
         for child in sorted(rules_dir.iterdir()):
             if child.name.startswith("."):
                 continue
-            try:
-                if child.is_file() and child.suffix == ".md":
-                    parse_rule(child)
-                    validated += 1
-                    continue
-                if child.is_dir() and (
-                    (child / "meta.yaml").exists() or (child / "prompt.md").exists()
-                ):
-                    load_rule_bundle(child)
-                    validated += 1
-            except Exception as exc:
-                issues.append(ValidationIssue(child, str(exc)))
-        return validated, issues
-
-    def _validate_skills(
-        self, skills_dir: Path, validated: int, issues: list[ValidationIssue]
-    ) -> tuple[int, list[ValidationIssue]]:
+            if child.is_file() and child.suffix == ".md":
+                checks.append(
+                    _Check("rule", child, (child,), partial(parse_rule, child))
+                )
+                continue
+            if child.is_dir() and (
+                (child / "meta.yaml").exists() or (child / "prompt.md").exists()
+            ):
+                checks.append(
+                    _Check("rule", child, (child,), partial(load_rule_bundle, child))
+                )
+        return checks
+
+    def _collect_skills(self, skills_dir: Path) -> list[_Check]:
         if not skills_dir.exists():
-            return validated, issues
+            return []
 
+        checks: list[_Check] = []
         for child in sorted(skills_dir.iterdir()):
             if child.name.startswith(".") or not child.is_dir():
                 continue
-            try:
-                if (child / "SKILL.md").exists():
-                    parse_skill(child / "SKILL.md")
-                    validated += 1
-                    continue
-                if (child / "meta.yaml").exists() or (child / "prompt.md").exists():
-                    parse_skill(child)
-                    validated += 1
-            except Exception as exc:
-                issues.append(ValidationIssue(child, str(exc)))
-        return validated, issues
-
-    def _validate_agents(
-        self, agents_dir: Path, validated: int, issues: list[ValidationIssue]
-    ) -> tuple[int, list[ValidationIssue]]:
+            if (child / "SKILL.md").exists():
+                source = child / "SKILL.md"
+                checks.append(
+                    _Check("skill", child, (child,), partial(parse_skill, source))
+                )
+                continue
+            if (child / "meta.yaml").exists() or (child / "prompt.md").exists():
+                checks.append(
+                    _Check("skill", child, (child,), partial(parse_skill, child))
+                )
+        return checks
+
+    def _collect_agents(self, agents_dir: Path) -> list[_Check]:
         if not agents_dir.exists():
-            return validated, issues
+            return []
 
+        checks: list[_Check] = []
         for child in sorted(agents_dir.iterdir()):
             if child.name.startswith("."):
                 continue
-            try:
-                if child.is_file():
-                    parse_agent(child)
-                    validated += 1
-                    continue
-                if child.is_dir() and (
-                    (child / "meta.yaml").exists() or (child / "prompt.md").exists()
-                ):
-                    parse_agent(child)
-                    validated += 1
-            except Exception as exc:
-                issues.append(ValidationIssue(child, str(exc)))
-        return validated, issues
+            if child.is_file() or (
+                child.is_dir()
+                and ((child / "meta.yaml").exists() or (child / "prompt.md").exists())
+            ):
+                checks.append(
+                    _Check("agent", child, (child,), partial(parse_agent, child))
+                )
+        return checks
+
+
+def validation_json(results: list[RootValidation]) -> dict[str, Any]:
+    return {
+        "ok": all(not item.result.issues for item in results),
+        "validated": sum(item.result.validated for item in results),
+        "issues": sum(len(item.result.issues) for item in results),
+        "roots": [item.to_dict() for item in results],
+    }
+
+
+def validation_junit(results: list[RootValidation]) -> str:
+    """One test suite per root and one test case per validated source."""
+    suites = ET.Element("testsuites", name="code-agnostic validate")
+    total = failures = 0
+    for item in results:
+        suite = ET.SubElement(
+            suites,
+            "testsuite",
+            name=item.name,
+            tests=str(len(item.result.checks)),
+            failures=str(len(item.result.issues)),
+        )
+        for check in item.result.checks:
+            case = ET.SubElement(
+                suite,
+                "testcase",
+                classname=f"{item.name}.{check.kind}",
+                name=str(check.path.relative_to(item.root)),
+            )
+            if check.message is not None:
+                ET.SubElement(
+                    case, "failure", message=check.message
+                ).text = f"{check.path}: {check.message}"
+        total += len(item.result.checks)
+        failures += len(item.result.issues)
+    suites.set("tests", str(total))
+    suites.set("failures", str(failures))
+    ET.indent(suites)
+    return ET.tostring(suites, encoding="unicode", xml_declaration=True)
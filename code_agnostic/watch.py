@@ -0,0 +1,399 @@
+"""Watch the hub for source edits and re-apply only the affected scopes."""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Protocol
+
+from code_agnostic.api import Session
+from code_agnostic.constants import (
+    AGENTS_DIRNAME,
+    REPO_SELECTION_FILENAME,
+    RULES_DIRNAME,
+    SKILLS_DIRNAME,
+)
+from code_agnostic.models import ActionStatus, SyncPlan, SyncResource
+
+_ALL_RESOURCES = frozenset(SyncResource)
+_FULL_REPLAN_FILES = {"apps.json", "workspaces.json"}
+_WORKSPACE_IGNORED_FILES = {"git-exclude.json"}
+
+
+def _is_ignored_name(name: str) -> bool:
+    return name.startswith(".") or name.endswith("~")
+
+
+@dataclass
+class ChangeSet:
+    full: bool = False
+    global_resources: set[SyncResource] = field(default_factory=set)
+    workspace_resources: dict[str, set[SyncResource]] = field(default_factory=dict)
+    paths: set[Path] = field(default_factory=set)
+
+    def is_empty(self) -> bool:
+        return (
+            not self.full
+            and not self.global_resources
+            and not any(self.workspace_resources.values())
+        )
+
+    def add_global(self, *resources: SyncResource) -> None:
+        self.global_resources.update(resources)
+
+    def add_workspace(self, name: str, *resources: SyncResource) -> None:
+        self.workspace_resources.setdefault(name, set()).update(resources)
+
+    def describe(self) -> str:
+        if self.full:
+            return "full re-plan"
+        parts: list[str] = []
+        if self.global_resources:
+            parts.append(
+                "global: " + ", ".join(sorted(r.value for r in self.global_resources))
+            )
+        for name, resources in sorted(self.workspace_resources.items()):
+            if resources:
+                parts.append(
+                    f"{name}: " + ", ".join(sorted(r.value for r in resources))
+                )
+        return "; ".join(parts) or "no changes"
+
+
+def classify_changes(core_root: Path, paths: Iterable[Path]) -> ChangeSet:
+    """Map changed hub paths to the sync resources they feed."""
+    changes = ChangeSet()
+    for path in paths:
+        try:
+            parts = path.relative_to(core_root).parts
+        except ValueError:
+            continue
+        if any(_is_ignored_name(part) for part in parts):
+            continue
+        changes.paths.add(path)
+        if not parts:
+            changes.full = True
+            continue
+
+        head, rest = parts[0], parts[1:]
+        if head == "config":
+            if not rest or rest[0] in _FULL_REPLAN_FILES:
+                changes.full = True
+            else:
+                changes.add_global(SyncResource.MCP)
+        elif head == SKILLS_DIRNAME:
+            changes.add_global(SyncResource.SKILLS)
+        elif head == AGENTS_DIRNAME:
+            # Codex embeds an agent registry in config.toml.
+            changes.add_global(SyncResource.AGENTS, SyncResource.MCP)
+        elif head == RULES_DIRNAME:
+            continue
+        elif head == "workspaces":
+            if not rest:
+                changes.full = True
+                continue
+            _classify_workspace_change(changes, rest[0], rest[1:])
+    return changes
+
+
+def _classify_workspace_change(
+    changes: ChangeSet, workspace: str, parts: tuple[str, ...]
+) -> None:
+    if not parts:
+        changes.add_workspace(workspace, *_ALL_RESOURCES)
+        return
+    head = parts[0]
+    if head in _WORKSPACE_IGNORED_FILES:
+        return
+    if head == REPO_SELECTION_FILENAME:
+        # Repo selection changes which repos every resource fans out to.
+        changes.add_workspace(workspace, *_ALL_RESOURCES)
+    elif head in (RULES_DIRNAME, "AGENTS.md"):
+        # OpenCode project config points its instructions at the compiled rules.
+        changes.add_workspace(workspace, SyncResource.RULES, SyncResource.MCP)
+    elif head == SKILLS_DIRNAME:
+        changes.add_workspace(workspace, SyncResource.SKILLS)
+    elif head == AGENTS_DIRNAME:
+        changes.add_workspace(workspace, SyncResource.AGENTS, SyncResource.MCP)
+    elif head.endswith((".json", ".yaml", ".yml")):
+        changes.add_workspace(workspace, SyncResource.MCP)
+    else:
+        changes.add_workspace(workspace, *_ALL_RESOURCES)
+
+
+class WatchBackend(Protocol):
+    def poll(self, timeout: float) -> set[Path]: ...
+
+    def close(self) -> None: ...
+
+
+def _walk_watchable(root: Path) -> Iterable[tuple[Path, list[str], list[str]]]:
+    for current, dir_names, file_names in os.walk(root, topdown=True):
+        dir_names[:] = [name for name in dir_names if not _is_ignored_name(name)]
+        files = [name for name in file_names if not _is_ignored_name(name)]
+        yield Path(current), dir_names, files
+
+
+class PollingBackend:
+    """Portable backend that diffs stat snapshots of the watched tree."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        snapshot: dict[Path, tuple[int, int]] = {}
+        if not self.root.exists():
+            return snapshot
+        for current, _, file_names in _walk_watchable(self.root):
+            for name in file_names:
+                path = current / name
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def poll(self, timeout: float) -> set[Path]:
+        if timeout > 0:
+            time.sleep(timeout)
+        current = self._scan()
+        previous = self._snapshot
+        self._snapshot = current
+        changed = set(current.keys() ^ previous.keys())
+        changed.update(
+            path
+            for path, stamp in current.items()
+            if path in previous and previous[path] != stamp
+        )
+        return changed
+
+    def close(self) -> None:
+        self._snapshot = {}
+
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifyBackend:
+    """Linux inotify backend with recursive watches, driven through libc."""
+
+    def __init__(self, root: Path) -> None:
+        libc_name = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.root = root
+        fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._fd = fd
+        self._watches: dict[int, Path] = {}
+        self._add_tree(root)
+
+    def _add_watch(self, path: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(str(path)), _WATCH_MASK)
+        if wd >= 0:
+            self._watches[wd] = path
+
+    def _add_tree(self, root: Path) -> set[Path]:
+        found: set[Path] = set()
+        for current, _, file_names in _walk_watchable(root):
+            self._add_watch(current)
+            found.update(current / name for name in file_names)
+        return found
+
+    def poll(self, timeout: float) -> set[Path]:
+        readable, _, _ = select.select([self._fd], [], [], max(timeout, 0))
+        if not readable:
+            return set()
+        changed: set[Path] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            changed.update(self._decode(data))
+        return changed
+
+    def _decode(self, data: bytes) -> set[Path]:
+        changed: set[Path] = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            raw_name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                changed.add(self.root)
+                continue
+            base = self._watches.get(wd)
+            if mask & _IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            if base is None:
+                continue
+            path = base / os.fsdecode(raw_name) if raw_name else base
+            changed.add(path)
+            if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                if not _is_ignored_name(path.name):
+                    changed.update(self._add_tree(path))
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._watches.clear()
+
+
+def create_watch_backend(root: Path, *, force_polling: bool = False) -> WatchBackend:
+    if not force_polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyBackend(root)
+        except (OSError, AttributeError):
+            pass
+    return PollingBackend(root)
+
+
+@dataclass
+class WatchCycle:
+    changes: ChangeSet
+    plan: SyncPlan
+    applied: int = 0
+    failed: int = 0
+    failures: list[str] = field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def pending(self) -> int:
+        return sum(1 for a in self.plan.actions if a.status != ActionStatus.NOOP)
+
+
+class WatchService:
+    """Keeps a warm session and applies only the scopes a change touches."""
+
+    def __init__(self, session: Session, *, target: str = "all") -> None:
+        self.session = session
+        self.target = target
+
+    def full_changes(self) -> ChangeSet:
+        return ChangeSet(full=True)
+
+    def plan_changes(self, changes: ChangeSet) -> SyncPlan:
+        if changes.full:
+            self.session.apps.clear_service_cache()
+            self.session.workspace_service.invalidate()
+            return self.session.plan(self.target)
+
+        plan = self.session.plan(
+            self.target,
+            include_apps=bool(changes.global_resources),
+            workspace_names={
+                name for name, res in changes.workspace_resources.items() if res
+            },
+        )
+        actions = [
+            action
+            for action in plan.actions
+            if action.resource
+            in (
+                changes.global_resources
+                if action.workspace is None
+                else changes.workspace_resources.get(action.workspace, set())
+            )
+        ]
+        return SyncPlan(actions=actions, errors=plan.errors, skipped=plan.skipped)
+
+    def apply_changes(self, changes: ChangeSet) -> WatchCycle:
+        started = time.perf_counter()
+        plan = self.plan_changes(changes)
+        cycle = WatchCycle(changes=changes, plan=plan)
+        if cycle.pending:
+            result = self.session.execute(plan)
+            cycle.applied, cycle.failed, cycle.failures = (
+                result.applied,
+                result.failed,
+                result.failures,
+            )
+        cycle.duration = time.perf_counter() - started
+        return cycle
+
+    def run(
+        self,
+        on_cycle: Callable[[WatchCycle], None],
+        *,
+        backend: WatchBackend | None = None,
+        debounce: float = 0.3,
+        interval: float = 1.0,
+        initial: bool = True,
+        stop_event: threading.Event | None = None,
+    ) -> None:
+        root = self.session.root
+        root.mkdir(parents=True, exist_ok=True)
+        backend = backend or create_watch_backend(root)
+        stop = stop_event or threading.Event()
+        try:
+            if initial:
+                on_cycle(self.apply_changes(self.full_changes()))
+            while not stop.is_set():
+                changed = backend.poll(interval)
+                if not changed:
+                    continue
+                changed |= self._settle(backend, debounce, stop)
+                changes = classify_changes(root, changed)
+                if changes.is_empty():
+                    continue
+                on_cycle(self.apply_changes(changes))
+        finally:
+            backend.close()
+
+    @staticmethod
+    def _settle(
+        backend: WatchBackend, debounce: float, stop: threading.Event
+    ) -> set[Path]:
+        collected: set[Path] = set()
+        deadline = time.monotonic() + max(debounce * 10, 2.0)
+        while not stop.is_set() and time.monotonic() < deadline:
+            more = backend.poll(debounce)
+            if not more:
+                break
+            collected |= more
+        return collected
@@ -1,11 +1,17 @@
+from __future__ import annotations
+
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from code_agnostic.constants import (
     GIT_DIRNAME,
     WORKSPACE_IGNORED_DIRS,
 )
 
+if TYPE_CHECKING:
+    from code_agnostic.repo_selection import RepoSelection
+
 
 class WorkspaceService:
     def resolve_git_dir(self, repo_path: Path) -> Path | None:
@@ -30,18 +36,34 @@ class WorkspaceService:
             git_dir = (repo_path / git_dir).resolve()
         return git_dir
 
-    def discover_git_repos(self, workspace_path: Path) -> list[Path]:
+    def discover_git_repos(
+        self, workspace_path: Path, selection: RepoSelection | None = None
+    ) -> list[Path]:
+        """Find git repos under a workspace, skipping excluded subtrees entirely."""
+        repos, _ = self._walk_git_repos(workspace_path, selection)
+        return repos
+
+    def _walk_git_repos(
+        self, workspace_path: Path, selection: RepoSelection | None
+    ) -> tuple[list[Path], list[Path]]:
+        """Return the repos found and every directory the walk listed."""
         repos: list[Path] = []
+        walked: list[Path] = []
         workspace_real = workspace_path.resolve()
 
         for root, dir_names, _ in os.walk(str(workspace_real), topdown=True):
             current = Path(root)
-            if current == workspace_real:
-                pass
-            elif self.resolve_git_dir(current) is not None:
-                repos.append(current)
-                dir_names[:] = []
-                continue
+            walked.append(current)
+            if current != workspace_real:
+                relative = current.relative_to(workspace_real).as_posix()
+                if selection is not None and selection.prunes(relative):
+                    dir_names[:] = []
+                    continue
+                if self.resolve_git_dir(current) is not None:
+                    if selection is None or selection.selects(relative):
+                        repos.append(current)
+                    dir_names[:] = []
+                    continue
 
             dir_names[:] = [
                 name
@@ -49,4 +71,4 @@ class WorkspaceService:
                 if not name.startswith(".") and name not in WORKSPACE_IGNORED_DIRS
             ]
 
-        return sorted(set(repos))
+        return sorted(set(repos)), walked
@@ -20,6 +20,7 @@ _ensure_repo_on_path()
 def isolated_home(tmp_path: Path, monkeypatch) -> None:
     monkeypatch.setenv("HOME", str(tmp_path))
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / ".config"))
+    monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path / ".local" / "state"))
     monkeypatch.setenv("USERPROFILE", str(tmp_path))
     monkeypatch.setenv("APPDATA", str(tmp_path / ".config"))
     monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / ".local" / "share"))
@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+from code_agnostic.lossiness import collect_lossiness
 from code_agnostic.rules.compilers import (
     CodexRuleCompiler,
     CursorRuleCompiler,
@@ -83,3 +84,17 @@ def test_codex_compiler() -> None:
     assert filename == "AGENTS.md"
     assert "## Codex standards" in content
     assert "Rule body content." in content
+
+
+def test_report_dropped_records_lossiness_without_compiling(monkeypatch) -> None:
+    rule = _make_rule(globs=["*.py"], always_apply=True)
+    compiler = CodexRuleCompiler()
+    monkeypatch.setattr(compiler, "compile", None)
+
+    with collect_lossiness() as findings:
+        compiler.report_dropped(rule)
+
+    assert [(item.app, item.property) for item in findings] == [
+        ("codex", "always_apply"),
+        ("codex", "globs"),
+    ]
@@ -0,0 +1,115 @@
+from pathlib import Path
+
+from code_agnostic.__main__ import cli
+from code_agnostic.api import Session
+from code_agnostic.models import ActionStatus, EditorSyncStatus
+
+
+def test_session_plan_apply_and_status_round_trip(
+    minimal_shared_config: Path, enable_app
+) -> None:
+    enable_app("cursor")
+    session = Session()
+
+    plan = session.plan()
+    assert any(a.app == "cursor" for a in plan.actions)
+
+    result = session.apply()
+    assert result.ok
+    assert result.applied > 0
+
+    report = session.status("cursor")
+    assert [row.status for row in report.editors] == [EditorSyncStatus.SYNCED]
+    assert all(a.status == ActionStatus.NOOP for a in session.plan("cursor").actions)
+
+
+def test_session_validate_reports_issues(minimal_shared_config: Path) -> None:
+    skill = minimal_shared_config / "skills" / "broken"
+    skill.mkdir(parents=True)
+    (skill / "meta.yaml").write_text("name: [unterminated\n", encoding="utf-8")
+    (skill / "prompt.md").write_text("body", encoding="utf-8")
+
+    result = Session().validate()
+
+    assert [issue.path for issue in result.issues] == [skill]
+
+
+def test_session_reuses_parsed_sources_between_calls(
+    minimal_shared_config: Path, enable_app
+) -> None:
+    enable_app("cursor")
+    skill = minimal_shared_config / "skills" / "demo" / "SKILL.md"
+    skill.parent.mkdir(parents=True)
+    skill.write_text("---\nname: demo\n---\nv1\n", encoding="utf-8")
+    session = Session()
+
+    session.plan()
+    first = session.cache_stats()
+    session.plan()
+    second = session.cache_stats()
+
+    assert second.misses == first.misses
+    assert second.hits > first.hits
+
+    skill.write_text("---\nname: demo\n---\nversion two\n", encoding="utf-8")
+    plan = session.plan()
+    target = [a for a in plan.actions if a.path.name == "SKILL.md"][0]
+    assert "version two" in target.payload
+
+
+def test_session_sees_registry_and_repo_changes(
+    tmp_path: Path, minimal_shared_config: Path, cli_runner
+) -> None:
+    session = Session()
+    assert session.core.load_workspaces() == []
+
+    workspace = tmp_path / "ws"
+    (workspace / "repo-a" / ".git").mkdir(parents=True)
+    result = cli_runner.invoke(
+        cli, ["workspaces", "add", "--name", "ws", "--path", str(workspace)]
+    )
+    assert result.exit_code == 0
+    assert [item["name"] for item in session.core.load_workspaces()] == ["ws"]
+
+    discover = session.workspace_service.discover_git_repos
+    assert [repo.name for repo in discover(workspace)] == ["repo-a"]
+    (workspace / "repo-b" / ".git").mkdir(parents=True)
+    assert [repo.name for repo in discover(workspace)] == ["repo-a", "repo-b"]
+    (workspace / "nested" / "repo-c").mkdir(parents=True)
+    assert [repo.name for repo in discover(workspace)] == ["repo-a", "repo-b"]
+    (workspace / "nested" / "repo-c" / ".git").mkdir()
+    assert [repo.name for repo in discover(workspace)] == [
+        "repo-c",
+        "repo-a",
+        "repo-b",
+    ]
+
+
+def test_session_reuses_discovery_while_walked_dirs_are_unchanged(
+    tmp_path: Path, minimal_shared_config: Path, monkeypatch
+) -> None:
+    workspace = tmp_path / "ws"
+    (workspace / "repo-a" / ".git").mkdir(parents=True)
+    service = Session().workspace_service
+    assert [repo.name for repo in service.discover_git_repos(workspace)] == ["repo-a"]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("discovery walked the workspace again")
+
+    monkeypatch.setattr(service, "_walk_git_repos", fail)
+    assert [repo.name for repo in service.discover_git_repos(workspace)] == ["repo-a"]
+
+
+def test_session_repo_rescan_interval_is_opt_in(
+    tmp_path: Path, minimal_shared_config: Path
+) -> None:
+    workspace = tmp_path / "ws"
+    (workspace / "repo-a" / ".git").mkdir(parents=True)
+    session = Session(repo_rescan_interval=3600.0)
+    discover = session.workspace_service.discover_git_repos
+    assert [repo.name for repo in discover(workspace)] == ["repo-a"]
+    (workspace / "repo-b" / ".git").mkdir(parents=True)
+    assert [repo.name for repo in discover(workspace)] == ["repo-a"]
+
+    session.invalidate()
+    assert [repo.name for repo in discover(workspace)] == ["repo-a", "repo-b"]
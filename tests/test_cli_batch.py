@@ -0,0 +1,104 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from code_agnostic.__main__ import cli
+from code_agnostic.batch import parse_batch_script
+from code_agnostic.utils import batched_json_writes, read_json_safe, write_json
+
+
+def test_parse_batch_script_accepts_shell_lines_and_jsonl() -> None:
+    commands = parse_batch_script(
+        [
+            "# onboarding",
+            "",
+            "code-agnostic mcp add github --command npx --env 'TOKEN=a b'",
+            '["apps", "enable", "-a", "cursor"]',
+            '{"command": "mcp remove github"}',
+        ]
+    )
+
+    assert [(c.line, c.argv) for c in commands] == [
+        (3, ["mcp", "add", "github", "--command", "npx", "--env", "TOKEN=a b"]),
+        (4, ["apps", "enable", "-a", "cursor"]),
+        (5, ["mcp", "remove", "github"]),
+    ]
+
+
+def test_parse_batch_script_reports_bad_lines() -> None:
+    with pytest.raises(ValueError, match="line 2"):
+        parse_batch_script(["mcp list", '{"nope": 1}'])
+
+
+def test_batched_json_writes_loads_and_writes_each_file_once(tmp_path: Path) -> None:
+    path = tmp_path / "data.json"
+    write_json(path, {"items": []})
+
+    with batched_json_writes() as buffer:
+        for index in range(3):
+            payload, _ = read_json_safe(path)
+            payload["items"].append(index)
+            write_json(path, payload)
+        assert json.loads(path.read_text(encoding="utf-8")) == {"items": []}
+
+    assert buffer.loads == 1
+    assert buffer.writes == 1
+    assert json.loads(path.read_text(encoding="utf-8")) == {"items": [0, 1, 2]}
+
+
+def test_batch_runs_commands_and_reports_each_result(
+    tmp_path: Path, minimal_shared_config: Path, cli_runner
+) -> None:
+    workspace = tmp_path / "ws"
+    workspace.mkdir()
+    script = "\n".join(
+        [
+            "mcp add github --command npx",
+            "mcp add docs --url https://example.com/mcp",
+            "apps enable -a cursor",
+            f"workspace add --name ws --path {workspace}",
+            "workspaces exclude-add --pattern '*.gen' -w ws",
+            "mcp add github --command other",
+            "apply",
+        ]
+    )
+
+    result = cli_runner.invoke(cli, ["batch", "--format", "jsonl"], input=script)
+
+    assert result.exit_code == 1
+    rows = [json.loads(line) for line in result.output.splitlines()]
+    assert [row["ok"] for row in rows] == [True, True, True, True, True, False, False]
+    assert "already exists" in rows[5]["error"]
+    assert "not supported" in rows[6]["error"]
+
+    mcp = json.loads(
+        (minimal_shared_config / "config" / "mcp.base.json").read_text("utf-8")
+    )
+    assert set(mcp["mcpServers"]) == {"github", "docs"}
+    apps = json.loads((minimal_shared_config / "config" / "apps.json").read_text())
+    assert apps["cursor"] is True
+    exclude = json.loads(
+        (minimal_shared_config / "workspaces" / "ws" / "git-exclude.json").read_text()
+    )
+    assert exclude["extra_patterns"] == ["*.gen"]
+
+
+def test_batch_stop_on_error_keeps_earlier_changes(
+    tmp_path: Path, minimal_shared_config: Path, cli_runner
+) -> None:
+    script_path = tmp_path / "script.txt"
+    script_path.write_text(
+        "mcp add one --command a\nmcp remove missing\nmcp add two --command b\n",
+        encoding="utf-8",
+    )
+
+    result = cli_runner.invoke(cli, ["batch", "--stop-on-error", str(script_path)])
+
+    assert result.exit_code == 1
+    assert "[error] line 2" in result.output
+    assert "line 3" not in result.output
+    mcp = json.loads(
+        (minimal_shared_config / "config" / "mcp.base.json").read_text("utf-8")
+    )
+    assert set(mcp["mcpServers"]) == {"one"}
@@ -0,0 +1,170 @@
+import io
+import json
+import tarfile
+from pathlib import Path
+
+from code_agnostic.__main__ import cli
+from code_agnostic.apps.apps_service import AppsService
+from code_agnostic.bundle import open_bundle
+from code_agnostic.core.repository import CoreRepository
+from code_agnostic.models import ActionStatus
+
+
+def _write_hub(core_root: Path, write_json) -> None:
+    write_json(
+        core_root / "config" / "mcp.base.json",
+        {"mcpServers": {"docs": {"command": "npx", "args": ["docs-mcp"]}}},
+    )
+    skill = core_root / "skills" / "demo"
+    (skill / "scripts").mkdir(parents=True)
+    (skill / "SKILL.md").write_text(
+        "---\nname: demo\ndescription: Demo skill\n---\nUse it.\n", encoding="utf-8"
+    )
+    (skill / "scripts" / "run.sh").write_bytes(b"#!/bin/sh\necho hi\n")
+    agent = core_root / "agents" / "reviewer.md"
+    agent.parent.mkdir(parents=True)
+    agent.write_text(
+        "---\nname: reviewer\ndescription: Reviews code\n---\nReview carefully.\n",
+        encoding="utf-8",
+    )
+
+
+def _snapshot(home: Path) -> dict[str, bytes]:
+    return {
+        str(path.relative_to(home)): path.read_bytes()
+        for app_dir in (".cursor", ".codex")
+        for path in sorted((home / app_dir).rglob("*"))
+        if path.is_file()
+    }
+
+
+def test_apply_from_bundle_matches_apply_without_reading_sources(
+    minimal_shared_config: Path, tmp_path: Path, cli_runner, enable_app, write_json
+) -> None:
+    _write_hub(minimal_shared_config, write_json)
+    enable_app("cursor")
+    enable_app("codex")
+    assert cli_runner.invoke(cli, ["apply"]).exit_code == 0
+    expected = _snapshot(tmp_path)
+    bundle_path = tmp_path / "bundle.tar"
+
+    result = cli_runner.invoke(cli, ["build", "--out", str(bundle_path)])
+
+    assert result.exit_code == 0, result.output
+    assert "codex, cursor" in result.output
+    # A machine applying the bundle needs no hub sources at all.
+    for path in (
+        minimal_shared_config / "skills",
+        minimal_shared_config / "agents",
+        tmp_path / ".cursor",
+        tmp_path / ".codex",
+    ):
+        for item in sorted(path.rglob("*"), reverse=True):
+            item.rmdir() if item.is_dir() else item.unlink()
+        path.rmdir()
+    (minimal_shared_config / "config" / "mcp.base.json").write_text(
+        "{broken", encoding="utf-8"
+    )
+
+    result = cli_runner.invoke(cli, ["apply", "--from-bundle", str(bundle_path)])
+
+    assert result.exit_code == 0, result.output
+    assert _snapshot(tmp_path) == expected
+    assert (
+        tmp_path / ".cursor" / "skills" / "demo" / "scripts" / "run.sh"
+    ).read_bytes() == b"#!/bin/sh\necho hi\n"
+
+    with open_bundle(bundle_path) as bundle:
+        plan = AppsService(CoreRepository()).plan_from_bundle("all", bundle)
+    assert not plan.errors
+    assert {action.status for action in plan.actions} == {ActionStatus.NOOP}
+
+
+def test_apply_from_bundle_plans_the_bundle_apps_on_a_fresh_home(
+    minimal_shared_config: Path, tmp_path: Path, cli_runner, enable_app, write_json
+) -> None:
+    _write_hub(minimal_shared_config, write_json)
+    enable_app("cursor")
+    enable_app("codex")
+    bundle_path = tmp_path / "bundle.tar"
+    assert cli_runner.invoke(cli, ["build", "--out", str(bundle_path)]).exit_code == 0
+    (minimal_shared_config / "config" / "apps.json").unlink()
+
+    result = cli_runner.invoke(
+        cli, ["apply", "--from-bundle", str(bundle_path), "-a", "cursor"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / ".cursor" / "skills" / "demo" / "SKILL.md").exists()
+    assert not (tmp_path / ".codex").exists()
+
+    result = cli_runner.invoke(cli, ["apply", "--from-bundle", str(bundle_path)])
+
+    assert result.exit_code == 0, result.output
+    assert "No apps enabled" not in result.output
+    assert (tmp_path / ".codex" / "agents").is_dir()
+
+
+def test_apply_from_bundle_rejects_tampered_member(
+    minimal_shared_config: Path, tmp_path: Path, cli_runner, enable_app, write_json
+) -> None:
+    _write_hub(minimal_shared_config, write_json)
+    enable_app("cursor")
+    bundle_path = tmp_path / "bundle.tar"
+    assert cli_runner.invoke(cli, ["build", "--out", str(bundle_path)]).exit_code == 0
+
+    tampered = tmp_path / "tampered.tar"
+    with tarfile.open(bundle_path) as source, tarfile.open(tampered, "w") as out:
+        for member in source.getmembers():
+            data = source.extractfile(member).read()
+            if member.name.endswith("reviewer.md"):
+                data = data.replace(b"carefully", b"sloppily!")
+            member.size = len(data)
+            out.addfile(member, io.BytesIO(data))
+
+    result = cli_runner.invoke(cli, ["apply", "--from-bundle", str(tampered)])
+
+    assert result.exit_code != 0
+    assert "checksum mismatch" in result.output
+    assert not (tmp_path / ".cursor" / "agents" / "reviewer.md").exists()
+
+
+def test_apply_from_bundle_rejects_manifest_without_app_config(
+    minimal_shared_config: Path, tmp_path: Path, cli_runner, enable_app, write_json
+) -> None:
+    _write_hub(minimal_shared_config, write_json)
+    enable_app("cursor")
+    enable_app("codex")
+    bundle_path = tmp_path / "bundle.tar"
+    assert cli_runner.invoke(cli, ["build", "--out", str(bundle_path)]).exit_code == 0
+
+    broken = tmp_path / "broken.tar"
+    with tarfile.open(bundle_path) as source, tarfile.open(broken, "w") as out:
+        for member in source.getmembers():
+            data = source.extractfile(member).read()
+            if member.name == "manifest.json":
+                manifest = json.loads(data)
+                del manifest["configs"]["codex"]
+                data = json.dumps(manifest).encode()
+            member.size = len(data)
+            out.addfile(member, io.BytesIO(data))
+
+    result = cli_runner.invoke(cli, ["apply", "--from-bundle", str(broken)])
+
+    assert result.exit_code != 0
+    assert "manifest has no config for codex" in result.output
+    assert not isinstance(result.exception, KeyError)
+
+
+def test_apply_from_bundle_rejects_unsupported_options(
+    minimal_shared_config: Path, tmp_path: Path, cli_runner
+) -> None:
+    bundle_path = tmp_path / "bundle.tar"
+    bundle_path.write_bytes(b"")
+
+    result = cli_runner.invoke(
+        cli, ["apply", "--from-bundle", str(bundle_path), "--compile-processes", "2"]
+    )
+
+    assert result.exit_code == 2
+    assert "--from-bundle" in result.output
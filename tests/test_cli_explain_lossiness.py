@@ -1,6 +1,11 @@
+import json
 from pathlib import Path
 
 from code_agnostic.__main__ import cli
+from code_agnostic.api import Session
+from code_agnostic.lossiness import LossinessFinding
+from code_agnostic.lossiness_explainer import LossinessExplainer
+from code_agnostic.source_cache import SourceCache, use_source_cache
 
 
 def test_explain_lossiness_reports_documented_rule_and_agent_mappings(
@@ -130,3 +135,89 @@ def test_explain_lossiness_reports_when_no_documented_lossiness_exists(
 
     assert result.exit_code == 0
     assert result.output == "No lossy mappings found.\n"
+
+
+def _write_sandboxed_agent(core_root: Path) -> None:
+    agent_dir = core_root / "agents" / "reviewer"
+    agent_dir.mkdir(parents=True)
+    (agent_dir / "meta.yaml").write_text(
+        "spec_version: v1\n"
+        "kind: agent\n"
+        "name: reviewer\n"
+        "sandbox_mode: read-only\n",
+        encoding="utf-8",
+    )
+    (agent_dir / "prompt.md").write_text("Review.\n", encoding="utf-8")
+
+
+def test_plan_carries_lossiness_reported_by_compilers(
+    minimal_shared_config: Path,
+    core_root: Path,
+    enable_app,
+) -> None:
+    enable_app("cursor")
+    enable_app("codex")
+    _write_sandboxed_agent(core_root)
+    session = Session()
+
+    first = session.plan()
+    second = session.plan()
+
+    expected = [
+        LossinessFinding(
+            resource_path="agents/reviewer",
+            app="cursor",
+            property="sandbox_mode",
+            status="ignored",
+            reason="target does not support agent sandbox_mode",
+        )
+    ]
+    assert first.lossiness == expected
+    # The second plan reuses the compiled output and its findings.
+    assert second.lossiness == expected
+    assert session.plan("codex").lossiness == []
+
+
+def test_explain_lossiness_applied_reads_active_revision(
+    minimal_shared_config: Path,
+    core_root: Path,
+    cli_runner,
+    enable_app,
+) -> None:
+    enable_app("cursor")
+    _write_sandboxed_agent(core_root)
+
+    result = cli_runner.invoke(cli, ["explain-lossiness", "--applied"])
+    assert result.output == "No lossy mappings found.\n"
+
+    plan = cli_runner.invoke(cli, ["plan", "--format", "jsonl"])
+    records = [json.loads(line) for line in plan.output.splitlines()]
+    lossy = [record for record in records if record["type"] == "lossiness"]
+    assert [record["property"] for record in lossy] == ["sandbox_mode"]
+    assert cli_runner.invoke(cli, ["apply"]).exit_code == 0
+
+    result = cli_runner.invoke(cli, ["explain-lossiness", "--applied"])
+
+    assert result.exit_code == 0
+    assert result.output.splitlines() == [
+        "resource_path\tapp\tproperty\tstatus\treason",
+        "agents/reviewer\tcursor\tsandbox_mode\tignored\ttarget does not support agent sandbox_mode",
+    ]
+
+
+def test_explainer_parses_through_the_enclosing_source_cache(core_root: Path) -> None:
+    rules_dir = core_root / "rules"
+    rules_dir.mkdir(parents=True)
+    (rules_dir / "python.md").write_text(
+        "---\ndescription: Python rule\nglobs:\n  - '*.py'\n---\nUse types.\n",
+        encoding="utf-8",
+    )
+    cache = SourceCache()
+
+    with use_source_cache(cache):
+        first = LossinessExplainer().explain_core_root(core_root)
+        second = LossinessExplainer().explain_core_root(core_root)
+
+    assert first == second
+    assert cache.stats().misses == 1
+    assert cache.stats().hits == 1
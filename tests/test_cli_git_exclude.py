@@ -62,3 +62,90 @@ def test_exclude_list_empty(
     result = cli_runner.invoke(cli, ["workspaces", "exclude-list", "-w", "myws"])
     assert result.exit_code == 0
     assert "defaults" in result.output.lower() or "include_defaults" in result.output
+
+
+def _workspace_with_repos(cli_runner, tmp_path: Path) -> Path:
+    ws = tmp_path / "ws"
+    for repo in ("repo-a", "repo-b"):
+        (ws / repo / ".git").mkdir(parents=True)
+    result = cli_runner.invoke(
+        cli, ["workspaces", "add", "--name", "myws", "--path", str(ws)]
+    )
+    assert result.exit_code == 0, result.output
+    return ws
+
+
+def _exclude_lines(ws: Path, repo: str) -> list[str]:
+    path = ws / repo / ".git" / "info" / "exclude"
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+def test_apply_git_exclude_updates_planned_repos(
+    minimal_shared_config: Path, tmp_path: Path, cli_runner, enable_app
+) -> None:
+    enable_app("codex")
+    ws = _workspace_with_repos(cli_runner, tmp_path)
+
+    result = cli_runner.invoke(cli, ["apply", "--git-exclude"])
+
+    assert result.exit_code == 0, result.output
+    assert "repos=2, skipped=0, changed=2" in result.output
+    for repo in ("repo-a", "repo-b"):
+        assert ".codex" in _exclude_lines(ws, repo)
+
+    result = cli_runner.invoke(cli, ["apply", "--git-exclude"])
+
+    assert result.exit_code == 0, result.output
+    assert "repos=2, skipped=2, changed=0" in result.output
+
+
+def test_apply_git_exclude_scoped_to_repo(
+    minimal_shared_config: Path, tmp_path: Path, cli_runner, enable_app
+) -> None:
+    enable_app("codex")
+    ws = _workspace_with_repos(cli_runner, tmp_path)
+
+    result = cli_runner.invoke(
+        cli, ["apply", "--git-exclude", "--repo", str(ws / "repo-a")]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert ".codex" in _exclude_lines(ws, "repo-a")
+    assert not (ws / "repo-b" / ".git" / "info" / "exclude").exists()
+
+
+def test_restore_readds_removed_exclude_entries(
+    minimal_shared_config: Path, tmp_path: Path, cli_runner, enable_app
+) -> None:
+    enable_app("codex")
+    ws = _workspace_with_repos(cli_runner, tmp_path)
+    exclude = ws / "repo-a" / ".git" / "info" / "exclude"
+    exclude.parent.mkdir(parents=True)
+    exclude.write_text("# local\n*.log\n", encoding="utf-8")
+    assert cli_runner.invoke(cli, ["apply", "--git-exclude"]).exit_code == 0
+
+    exclude.write_text("# local\n*.log\n", encoding="utf-8")
+    result = cli_runner.invoke(cli, ["restore", "-w", "myws"])
+
+    assert result.exit_code == 0, result.output
+    lines = _exclude_lines(ws, "repo-a")
+    assert lines[:2] == ["# local", "*.log"]
+    assert ".codex" in lines
+
+
+def test_git_exclude_command_skips_unchanged_repos(
+    minimal_shared_config: Path, tmp_path: Path, cli_runner, enable_app
+) -> None:
+    enable_app("codex")
+    ws = _workspace_with_repos(cli_runner, tmp_path)
+    first = cli_runner.invoke(cli, ["workspaces", "git-exclude"])
+    assert "changed=2" in first.output
+
+    exclude = ws / "repo-b" / ".git" / "info" / "exclude"
+    exclude.write_text("", encoding="utf-8")
+    second = cli_runner.invoke(cli, ["workspaces", "git-exclude"])
+
+    assert second.exit_code == 0, second.output
+    assert "repos=2, changed=1" in second.output
+    assert "skipped=1" in second.output
+    assert ".codex" in _exclude_lines(ws, "repo-b")
@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 
 from code_agnostic.__main__ import cli
@@ -102,3 +103,39 @@ def test_plan_verbose_view_shows_path_columns_with_home_shorthand(
     assert result.exit_code == 0
     assert "Path" in result.output
     assert "~/" in result.output
+
+
+def test_plan_jsonl_streams_actions_with_digests_and_summary(
+    minimal_shared_config: Path, core_root: Path, cli_runner, enable_app
+) -> None:
+    enable_app("cursor")
+    skill = core_root / "skills" / "demo"
+    skill.mkdir(parents=True)
+    (skill / "SKILL.md").write_text("---\nname: demo\n---\nbody\n", encoding="utf-8")
+
+    result = cli_runner.invoke(cli, ["plan", "-a", "cursor", "--format", "jsonl"])
+
+    assert result.exit_code == 0
+    records = [json.loads(line) for line in result.output.splitlines()]
+    actions = [record for record in records if record["type"] == "action"]
+    assert actions
+    assert all("payload" not in record for record in actions)
+    assert any(
+        (record["payload_digest"] or "").startswith("sha256:") for record in actions
+    )
+    assert records[-1]["type"] == "summary"
+    assert records[-1]["actions"] == len(actions)
+
+
+def test_iter_plan_chunks_merge_to_full_plan(
+    minimal_shared_config: Path, core_root: Path, enable_app
+) -> None:
+    enable_app("cursor")
+    enable_app("codex")
+    apps = AppsService(CoreRepository(core_root))
+
+    chunks = list(apps.iter_plan_for_target("all"))
+    merged = [action.path for chunk in chunks for action in chunk.actions]
+
+    assert len(chunks) > 1
+    assert merged == [action.path for action in apps.plan_for_target("all").actions]
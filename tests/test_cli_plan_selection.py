@@ -0,0 +1,111 @@
+import json
+from pathlib import Path
+
+from code_agnostic.__main__ import cli
+from code_agnostic.core.repository import CoreRepository
+from code_agnostic.executor import SyncExecutor
+
+
+def _workspace_with_skill(core_root: Path, tmp_path: Path, cli_runner) -> Path:
+    workspace_root = tmp_path / "workspace"
+    for repo in ("repo-a", "repo-b"):
+        (workspace_root / repo / ".git").mkdir(parents=True)
+    result = cli_runner.invoke(
+        cli, ["workspaces", "add", "--name", "team", "--path", str(workspace_root)]
+    )
+    assert result.exit_code == 0, result.output
+
+    ws_config = core_root / "workspaces" / "team"
+    (ws_config / "skills" / "deploy").mkdir(parents=True)
+    (ws_config / "skills" / "deploy" / "SKILL.md").write_text("s", encoding="utf-8")
+    (ws_config / "rules").mkdir()
+    (ws_config / "rules" / "shared.md").write_text("rules", encoding="utf-8")
+    return workspace_root
+
+
+def _repo_skill(workspace_root: Path, repo: str) -> Path:
+    return workspace_root / repo / ".codex" / "skills" / "deploy" / "SKILL.md"
+
+
+def _workspace_state(core_root: Path) -> dict:
+    path = core_root / "workspaces" / "team" / ".sync-state.json"
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_plan_workspace_leaves_global_config_alone(
+    minimal_shared_config: Path,
+    core_root: Path,
+    tmp_path: Path,
+    cli_runner,
+    enable_app,
+) -> None:
+    enable_app("codex")
+    workspace_root = _workspace_with_skill(core_root, tmp_path, cli_runner)
+
+    result = cli_runner.invoke(cli, ["apply", "-w", "team"])
+
+    assert result.exit_code == 0, result.output
+    assert _repo_skill(workspace_root, "repo-a").is_file()
+    assert not (tmp_path / ".codex" / "config.toml").exists()
+    executor = SyncExecutor(CoreRepository(core_root))
+    assert executor.list_revisions() == []
+    assert executor.list_revisions("team")
+
+
+def test_apply_repo_keeps_other_repos_managed_files(
+    minimal_shared_config: Path,
+    core_root: Path,
+    tmp_path: Path,
+    cli_runner,
+    enable_app,
+) -> None:
+    enable_app("codex")
+    workspace_root = _workspace_with_skill(core_root, tmp_path, cli_runner)
+    assert cli_runner.invoke(cli, ["apply"]).exit_code == 0
+    before = _workspace_state(core_root)["managed_paths"]["ws:codex:repo_skills_dir"]
+
+    skill = core_root / "workspaces" / "team" / "skills" / "deploy" / "SKILL.md"
+    skill.write_text("changed", encoding="utf-8")
+    result = cli_runner.invoke(cli, ["apply", "--repo", str(workspace_root / "repo-a")])
+
+    assert result.exit_code == 0, result.output
+    assert "changed" in _repo_skill(workspace_root, "repo-a").read_text("utf-8")
+    assert "changed" not in _repo_skill(workspace_root, "repo-b").read_text("utf-8")
+    root_skill = workspace_root / ".codex" / "skills" / "deploy" / "SKILL.md"
+    assert "changed" not in root_skill.read_text("utf-8")
+    state = _workspace_state(core_root)["managed_paths"]
+    assert state["ws:codex:repo_skills_dir"] == before
+    assert "ws:codex:workspace_root_skills_dir" in state
+
+
+def test_apply_scope_does_not_remove_unselected_resources(
+    minimal_shared_config: Path,
+    core_root: Path,
+    tmp_path: Path,
+    cli_runner,
+    enable_app,
+) -> None:
+    enable_app("codex")
+    workspace_root = _workspace_with_skill(core_root, tmp_path, cli_runner)
+    assert cli_runner.invoke(cli, ["apply"]).exit_code == 0
+
+    result = cli_runner.invoke(cli, ["plan", "--scope", "rules"])
+
+    assert result.exit_code == 0, result.output
+    assert "skills" not in result.output
+    result = cli_runner.invoke(cli, ["apply", "--scope", "rules"])
+    assert result.exit_code == 0, result.output
+    assert _repo_skill(workspace_root, "repo-b").is_file()
+    assert "ws:codex:repo_skills_dir" in _workspace_state(core_root)["managed_paths"]
+
+
+def test_repo_outside_workspaces_is_rejected(
+    minimal_shared_config: Path, tmp_path: Path, cli_runner
+) -> None:
+    stray = tmp_path / "stray"
+    stray.mkdir()
+
+    result = cli_runner.invoke(cli, ["plan", "--repo", str(stray)])
+
+    assert result.exit_code != 0
+    assert "not inside a registered workspace" in result.output
@@ -121,3 +121,138 @@ def test_restore_repairs_pending_global_revision(
     assert result.exit_code == 0
     assert target.read_text(encoding="utf-8") == "hello\n"
     assert not pending_path.exists()
+
+
+def _write_plan(tmp_path: Path, payloads: dict[str, str]) -> SyncPlan:
+    return SyncPlan(
+        actions=[
+            Action(
+                kind=ActionKind.WRITE_TEXT,
+                path=tmp_path / name,
+                status=ActionStatus.CREATE,
+                detail="create file",
+                payload=payload,
+                scope="app:test:text",
+                app="opencode",
+            )
+            for name, payload in payloads.items()
+        ],
+        errors=[],
+        skipped=[],
+    )
+
+
+def test_restore_skips_targets_that_already_match(
+    minimal_shared_config: Path,
+    core_root: Path,
+    tmp_path: Path,
+    cli_runner,
+    monkeypatch,
+) -> None:
+    executor = SyncExecutor(core=CoreRepository(core_root))
+    executor.execute(_write_plan(tmp_path, {"a.txt": "a\n", "b.txt": "b\n"}))
+    (tmp_path / "b.txt").write_text("edited\n", encoding="utf-8")
+
+    hashed: list[Path] = []
+    original_read_bytes = Path.read_bytes
+
+    def tracking_read_bytes(self: Path) -> bytes:
+        hashed.append(self)
+        return original_read_bytes(self)
+
+    monkeypatch.setattr(Path, "read_bytes", tracking_read_bytes)
+    result = cli_runner.invoke(cli, ["restore"])
+
+    assert result.exit_code == 0
+    assert "(1 targets, 2 unchanged)" in result.output
+    assert (tmp_path / "b.txt").read_text(encoding="utf-8") == "b\n"
+    # Unchanged targets are proven equal by size and mtime alone.
+    assert tmp_path / "a.txt" not in hashed
+
+
+def test_noop_targets_link_the_previous_revision_artifact(
+    minimal_shared_config: Path,
+    core_root: Path,
+    tmp_path: Path,
+    cli_runner,
+) -> None:
+    executor = SyncExecutor(core=CoreRepository(core_root))
+    executor.execute(_write_plan(tmp_path, {"a.txt": "a\n", "b.txt": "b\n"}))
+    first_id = executor.list_revisions()[0].revision_id
+    plan = _write_plan(tmp_path, {"a.txt": "a\n", "b.txt": "edited\n"})
+    plan.actions[0].status = ActionStatus.NOOP
+    plan.actions[1].status = ActionStatus.UPDATE
+    executor.execute(plan)
+
+    second_id = executor.list_revisions()[1].revision_id
+    revisions = core_root / ".sync-revisions"
+    manifest = json.loads((revisions / f"{second_id}.json").read_text("utf-8"))
+    noop, updated = manifest["targets"]
+    assert Path(noop["artifact_path"]).stat().st_ino == (
+        (revisions / first_id / "0.bin").stat().st_ino
+    )
+    assert Path(updated["artifact_path"]).read_bytes() == b"edited\n"
+
+    (tmp_path / "a.txt").write_text("drifted\n", encoding="utf-8")
+    result = cli_runner.invoke(cli, ["restore"])
+
+    assert result.exit_code == 0
+    assert (tmp_path / "a.txt").read_text(encoding="utf-8") == "a\n"
+
+
+def test_restore_named_revision_and_list_revisions(
+    minimal_shared_config: Path,
+    core_root: Path,
+    tmp_path: Path,
+    cli_runner,
+) -> None:
+    executor = SyncExecutor(core=CoreRepository(core_root))
+    executor.execute(_write_plan(tmp_path, {"a.txt": "first\n"}))
+    first_id = executor.list_revisions()[0].revision_id
+    executor.execute(_write_plan(tmp_path, {"a.txt": "second\n"}))
+
+    listed = cli_runner.invoke(cli, ["revisions", "list"])
+    assert listed.exit_code == 0
+    assert first_id in listed.output
+    summaries = executor.list_revisions()
+    assert [item.active for item in summaries] == [False, True]
+
+    result = cli_runner.invoke(cli, ["restore", "--revision", first_id])
+
+    assert result.exit_code == 0
+    assert result.output.startswith(f"Restored revision {first_id} ")
+    assert (tmp_path / "a.txt").read_text(encoding="utf-8") == "first\n"
+    assert [item.active for item in executor.list_revisions()] == [True, False]
+
+
+def test_restore_older_revision_removes_targets_added_since(
+    minimal_shared_config: Path,
+    core_root: Path,
+    tmp_path: Path,
+    cli_runner,
+) -> None:
+    executor = SyncExecutor(core=CoreRepository(core_root))
+    executor.execute(_write_plan(tmp_path, {"a.txt": "a\n"}))
+    first_id = executor.list_revisions()[0].revision_id
+    executor.execute(_write_plan(tmp_path, {"a.txt": "a\n", "b.txt": "b\n"}))
+    unrelated = tmp_path / "unrelated.txt"
+    unrelated.write_text("mine\n", encoding="utf-8")
+
+    result = cli_runner.invoke(cli, ["restore", "--revision", first_id])
+
+    assert result.exit_code == 0
+    assert (tmp_path / "a.txt").read_text(encoding="utf-8") == "a\n"
+    # Added after the restored revision, and no longer tracked by its state.
+    assert not (tmp_path / "b.txt").exists()
+    assert unrelated.read_text(encoding="utf-8") == "mine\n"
+    state = json.loads((core_root / ".sync-state.json").read_text(encoding="utf-8"))
+    assert state["managed_paths"]["app:test:text"] == [str(tmp_path / "a.txt")]
+
+
+def test_restore_unknown_revision_fails(
+    minimal_shared_config: Path, core_root: Path, cli_runner
+) -> None:
+    result = cli_runner.invoke(cli, ["restore", "--revision", "../escape"])
+
+    assert result.exit_code != 0
+    assert "Revision ../escape not found for global root." in result.output
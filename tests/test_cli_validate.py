@@ -1,6 +1,11 @@
+import json
 from pathlib import Path
+from xml.etree import ElementTree
 
+from code_agnostic import validation
 from code_agnostic.__main__ import cli
+from code_agnostic.utils import is_under
+from code_agnostic.validation import verdict_cache_path
 
 
 def test_validate_succeeds_for_mixed_legacy_and_bundle_sources(
@@ -100,3 +105,107 @@ def test_validate_workspace_sources(
 
     assert result.exit_code == 0
     assert "Validated 1 resources." in result.output
+
+
+def _add_workspace_with_bad_skill(core_root: Path, tmp_path: Path, cli_runner) -> None:
+    workspace_root = tmp_path / "workspace"
+    workspace_root.mkdir()
+    result = cli_runner.invoke(
+        cli, ["workspaces", "add", "--name", "team", "--path", str(workspace_root)]
+    )
+    assert result.exit_code == 0
+    skill_dir = core_root / "workspaces" / "team" / "skills" / "broken"
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "meta.yaml").write_text(
+        "spec_version: v1\nkind: skill\nname: broken\n", encoding="utf-8"
+    )
+
+
+def test_validate_all_reports_every_root_as_json(
+    minimal_shared_config: Path,
+    core_root: Path,
+    tmp_path: Path,
+    cli_runner,
+) -> None:
+    (core_root / "rules").mkdir(parents=True)
+    (core_root / "rules" / "style.md").write_text(
+        "---\ndescription: Style\n---\n\nBody.\n", encoding="utf-8"
+    )
+    _add_workspace_with_bad_skill(core_root, tmp_path, cli_runner)
+
+    result = cli_runner.invoke(cli, ["validate", "--all", "--format", "json"])
+
+    assert result.exit_code == 1
+    payload = json.loads(result.output)
+    assert payload["ok"] is False
+    assert [root["name"] for root in payload["roots"]] == ["global", "team"]
+    global_root, team = payload["roots"]
+    assert global_root["issues"] == []
+    assert [check["kind"] for check in global_root["checks"]] == ["mcp", "rule"]
+    assert len(team["issues"]) == 1
+    assert "Missing required config file" in team["issues"][0]["message"]
+
+
+def test_validate_all_junit_has_a_case_per_source(
+    minimal_shared_config: Path,
+    core_root: Path,
+    tmp_path: Path,
+    cli_runner,
+) -> None:
+    _add_workspace_with_bad_skill(core_root, tmp_path, cli_runner)
+
+    result = cli_runner.invoke(cli, ["validate", "--all", "--format", "junit"])
+
+    assert result.exit_code == 1
+    suites = ElementTree.fromstring(result.output.split("\n", 1)[1])
+    assert suites.get("tests") == "2"
+    assert suites.get("failures") == "1"
+    failing = suites.find("testsuite[@name='team']/testcase")
+    assert failing is not None
+    assert failing.get("name") == str(Path("skills") / "broken")
+    assert failing.find("failure") is not None
+
+
+def test_validate_reuses_verdicts_until_content_changes(
+    minimal_shared_config: Path,
+    core_root: Path,
+    cli_runner,
+    monkeypatch,
+) -> None:
+    skill = core_root / "skills" / "demo" / "SKILL.md"
+    skill.parent.mkdir(parents=True)
+    skill.write_text("---\nname: demo\n---\nv1\n", encoding="utf-8")
+    parsed: list[Path] = []
+    original = validation.parse_skill
+
+    def counting(path: Path):
+        parsed.append(path)
+        return original(path)
+
+    monkeypatch.setattr(validation, "parse_skill", counting)
+
+    assert cli_runner.invoke(cli, ["validate", "--all", "--cache"]).exit_code == 0
+    assert cli_runner.invoke(cli, ["validate", "--all", "--cache"]).exit_code == 0
+    assert parsed == [skill]
+    assert verdict_cache_path().is_file()
+    assert not is_under(verdict_cache_path(), core_root)
+
+    skill.write_text("---\nname: demo\n---\nv2\n", encoding="utf-8")
+    result = cli_runner.invoke(cli, ["validate", "--all", "--cache", "--jobs", "2"])
+
+    assert result.exit_code == 0
+    assert "Validated 2 resources across 1 roots." in result.output
+    assert parsed == [skill, skill]
+    assert cli_runner.invoke(cli, ["validate", "--all"]).exit_code == 0
+    assert len(parsed) == 3
+
+
+def test_validate_leaves_no_files_behind_by_default(
+    minimal_shared_config: Path, core_root: Path, tmp_path: Path, cli_runner
+) -> None:
+    before = sorted(tmp_path.rglob("*"))
+
+    assert cli_runner.invoke(cli, ["validate"]).exit_code == 0
+    assert cli_runner.invoke(cli, ["validate", "--all"]).exit_code == 0
+
+    assert sorted(tmp_path.rglob("*")) == before
@@ -0,0 +1,85 @@
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+
+from code_agnostic import codecs
+from code_agnostic.rules.models import Rule, RuleMetadata
+from code_agnostic.rules.parser import parse_rule, serialize_rule
+from code_agnostic.utils import read_json, write_json
+
+
+def test_split_frontmatter_matches_safe_load() -> None:
+    text = "---\nname: deploy\nglobs:\n  - '*.py'\n---\nBody\n"
+
+    raw, content = codecs.split_frontmatter(text)
+
+    assert raw == yaml.safe_load("name: deploy\nglobs:\n  - '*.py'")
+    assert content == "Body\n"
+
+
+def test_split_frontmatter_skips_yaml_without_frontmatter(monkeypatch) -> None:
+    def fail(text: str) -> None:
+        raise AssertionError("YAML parsed for a plain file")
+
+    monkeypatch.setattr(codecs, "load_yaml", fail)
+
+    assert codecs.split_frontmatter("# Title\n---\n") == ({}, "# Title\n---\n")
+    assert codecs.split_frontmatter("---\n \n---\nBody") == ({}, "Body")
+
+
+def test_serialized_rule_round_trips_byte_identical(tmp_path: Path) -> None:
+    rule = Rule(
+        name="py",
+        source_path=tmp_path / "py.md",
+        metadata=RuleMetadata(description="Python ü", globs=["*.py"]),
+        content="Use types.\n",
+    )
+    text = serialize_rule(rule)
+    expected_block = yaml.dump(
+        {"description": "Python ü", "globs": ["*.py"]},
+        default_flow_style=False,
+        sort_keys=False,
+    ).rstrip()
+    assert text == f"---\n{expected_block}\n---\n\nUse types.\n"
+
+    rule.source_path.write_text(text, encoding="utf-8")
+    parsed = parse_rule(rule.source_path)
+    assert serialize_rule(parsed) == text
+
+
+def test_write_json_keeps_stdlib_layout(tmp_path: Path) -> None:
+    payload = {"name": "ü", "ratio": 1e16, "items": [], "nested": {"a": [1, 2]}}
+    path = tmp_path / "out.json"
+
+    write_json(path, payload)
+
+    expected = json.dumps(payload, indent=2, sort_keys=False) + "\n"
+    assert path.read_bytes() == expected.encode("utf-8")
+    assert read_json(path) == payload
+
+
+class _StrictBackend:
+    JSONDecodeError = ValueError
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def loads(self, data: bytes | str):
+        self.calls += 1
+        if b"NaN" in (data if isinstance(data, bytes) else data.encode()):
+            raise self.JSONDecodeError("NaN is not JSON")
+        return json.loads(data)
+
+
+def test_loads_json_falls_back_to_stdlib(monkeypatch) -> None:
+    backend = _StrictBackend()
+    monkeypatch.setattr(codecs, "_ORJSON", backend)
+
+    assert codecs.loads_json(b'{"a": 1}') == {"a": 1}
+    value = codecs.loads_json(b'{"a": NaN}')["a"]
+    assert value != value
+    assert backend.calls == 2
+    with pytest.raises(json.JSONDecodeError):
+        codecs.loads_json(b"{bad")
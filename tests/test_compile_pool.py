@@ -0,0 +1,96 @@
+from pathlib import Path
+
+from code_agnostic.apps.apps_service import AppsService
+from code_agnostic.compile_pool import CompilePool, compile_jobs
+from code_agnostic.core.repository import CoreRepository
+from code_agnostic.source_cache import SourceCache, use_source_cache
+
+
+def _write_sources(root: Path, count: int) -> None:
+    for index in range(count):
+        skill = root / "skills" / f"skill-{index}" / "SKILL.md"
+        skill.parent.mkdir(parents=True)
+        skill.write_text(
+            f"---\nname: skill-{index}\ndescription: demo\n---\nbody {index}\n",
+            encoding="utf-8",
+        )
+    agent = root / "agents" / "reviewer.md"
+    agent.parent.mkdir(parents=True)
+    agent.write_text(
+        "---\nname: reviewer\ndescription: Reviews code\n"
+        "nickname_candidates:\n  - rev\n"
+        "---\nReview carefully.\n",
+        encoding="utf-8",
+    )
+
+
+def _snapshot(plan):
+    return (
+        [(a.app, a.kind, a.status, str(a.path), a.payload) for a in plan.actions],
+        plan.errors,
+        [item.to_dict() for item in plan.lossiness],
+    )
+
+
+def test_process_pool_plan_matches_in_process_plan(
+    minimal_shared_config: Path, enable_app
+) -> None:
+    for app in ("cursor", "codex", "opencode"):
+        enable_app(app)
+    _write_sources(minimal_shared_config, 3)
+    core = CoreRepository()
+    apps = AppsService(core)
+
+    with use_source_cache(SourceCache()):
+        expected = apps.plan_for_target("all")
+
+    cache = SourceCache()
+    with use_source_cache(cache):
+        jobs = compile_jobs(core, apps._resolve_services_for_target("all"))
+        compiled = CompilePool(processes=2, min_sources=0).prefill(jobs)
+        before = cache.stats()
+        actual = apps.plan_for_target("all")
+        after = cache.stats()
+
+    assert compiled == len(jobs) == 12
+    assert _snapshot(actual) == _snapshot(expected)
+    assert actual.lossiness
+    # Every compiled source came from the workers.
+    assert after.misses == before.misses
+
+
+def test_small_hub_compiles_in_process(minimal_shared_config: Path, enable_app) -> None:
+    enable_app("cursor")
+    _write_sources(minimal_shared_config, 2)
+    core = CoreRepository()
+    apps = AppsService(core)
+
+    cache = SourceCache()
+    with use_source_cache(cache):
+        jobs = compile_jobs(core, apps._resolve_services_for_target("all"))
+        assert CompilePool(processes=4).prefill(jobs) == 0
+        plan = apps.plan_for_target("all", compile_processes=4)
+
+    assert [a.path.name for a in plan.actions if a.path.parent.name == "agents"] == [
+        "reviewer.md"
+    ]
+
+
+def test_broken_source_is_left_to_the_planner(
+    minimal_shared_config: Path, enable_app
+) -> None:
+    enable_app("codex")
+    _write_sources(minimal_shared_config, 1)
+    broken = minimal_shared_config / "agents" / "broken.md"
+    broken.write_text("---\nname: [unterminated\n---\nbody\n", encoding="utf-8")
+    core = CoreRepository()
+    apps = AppsService(core)
+
+    cache = SourceCache()
+    with use_source_cache(cache):
+        jobs = compile_jobs(core, apps._resolve_services_for_target("all"))
+        compiled = CompilePool(processes=2, min_sources=0).prefill(jobs)
+        plan = apps.plan_for_target("all")
+
+    assert compiled == len(jobs) - 1
+    assert any("broken.md" in str(error) for error in plan.errors)
@@ -0,0 +1,138 @@
+import json
+from pathlib import Path
+
+from code_agnostic.__main__ import cli
+from code_agnostic.apps.apps_service import AppsService
+from code_agnostic.content_store import ContentStore, use_content_store
+from code_agnostic.core.repository import CoreRepository
+from code_agnostic.models import ActionStatus
+
+
+def _setup_workspace(tmp_path: Path, core_root: Path, cli_runner) -> Path:
+    workspace = tmp_path / "ws"
+    for repo in ("api", "web"):
+        (workspace / repo / ".git").mkdir(parents=True)
+    result = cli_runner.invoke(
+        cli, ["workspaces", "add", "--name", "ws", "--path", str(workspace)]
+    )
+    assert result.exit_code == 0
+    skill = core_root / "workspaces" / "ws" / "skills" / "review"
+    skill.mkdir(parents=True)
+    (skill / "SKILL.md").write_text("---\nname: review\n---\nv1\n", encoding="utf-8")
+    return workspace
+
+
+def _skill_targets(workspace: Path) -> list[Path]:
+    return [
+        workspace / repo / ".codex" / "skills" / "review" / "SKILL.md"
+        for repo in ("api", "web")
+    ]
+
+
+def test_hardlink_fanout_shares_one_inode_and_plans_noop_by_inode(
+    tmp_path: Path,
+    core_root: Path,
+    minimal_shared_config: Path,
+    cli_runner,
+    enable_app,
+    monkeypatch,
+) -> None:
+    enable_app("codex")
+    workspace = _setup_workspace(tmp_path, core_root, cli_runner)
+
+    result = cli_runner.invoke(cli, ["apply", "--fanout", "hardlink"])
+    assert result.exit_code == 0
+
+    targets = _skill_targets(workspace)
+    inodes = {target.stat().st_ino for target in targets}
+    assert len(inodes) == 1
+    assert targets[0].stat().st_nlink >= 3
+    assert targets[0].stat().st_mode & 0o200
+
+    read_paths: list[Path] = []
+    original_read_text = Path.read_text
+
+    def tracking_read_text(self: Path, *args, **kwargs):
+        read_paths.append(self)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", tracking_read_text)
+    core = CoreRepository(core_root)
+    with use_content_store(ContentStore.for_hub(core_root)):
+        plan = AppsService(core).plan_for_target("codex")
+    monkeypatch.undo()
+
+    skill_actions = [a for a in plan.actions if a.path in targets]
+    assert [a.status for a in skill_actions] == [ActionStatus.NOOP] * 2
+    assert not set(read_paths) & set(targets)
+
+    plain = AppsService(core).plan_for_target("codex")
+    assert all(
+        a.status == ActionStatus.NOOP for a in plain.actions if a.path in targets
+    )
+
+
+def test_hardlink_fanout_relinks_copies_and_prunes_unused_objects(
+    tmp_path: Path,
+    core_root: Path,
+    minimal_shared_config: Path,
+    cli_runner,
+    enable_app,
+) -> None:
+    enable_app("codex")
+    workspace = _setup_workspace(tmp_path, core_root, cli_runner)
+    assert cli_runner.invoke(cli, ["apply"]).exit_code == 0
+    targets = _skill_targets(workspace)
+    assert targets[0].stat().st_ino != targets[1].stat().st_ino
+
+    result = cli_runner.invoke(
+        cli, ["plan", "--fanout", "hardlink", "--format", "jsonl"]
+    )
+    records = [json.loads(line) for line in result.output.splitlines()]
+    statuses = {r["path"]: r["status"] for r in records if r["type"] == "action"}
+    assert statuses[str(targets[0])] == "update"
+
+    assert cli_runner.invoke(cli, ["apply", "--fanout", "hardlink"]).exit_code == 0
+    assert targets[0].stat().st_ino == targets[1].stat().st_ino
+
+    skill = core_root / "workspaces" / "ws" / "skills" / "review" / "SKILL.md"
+    skill.write_text("---\nname: review\n---\nv2\n", encoding="utf-8")
+    assert cli_runner.invoke(cli, ["apply", "--fanout", "hardlink"]).exit_code == 0
+
+    store = ContentStore.for_hub(core_root)
+    objects = [p for p in store.root.rglob("*") if p.is_file()]
+    assert all(p.stat().st_nlink > 1 for p in objects)
+    assert "v2" in targets[1].read_text(encoding="utf-8")
+
+
+def test_in_place_edit_of_linked_target_is_detected_and_repaired(
+    tmp_path: Path,
+    core_root: Path,
+    minimal_shared_config: Path,
+    cli_runner,
+    enable_app,
+) -> None:
+    enable_app("codex")
+    workspace = _setup_workspace(tmp_path, core_root, cli_runner)
+    assert cli_runner.invoke(cli, ["apply", "--fanout", "hardlink"]).exit_code == 0
+    targets = _skill_targets(workspace)
+    expected = targets[0].read_text(encoding="utf-8")
+
+    with targets[0].open("a", encoding="utf-8") as handle:
+        handle.write("local edit\n")
+    # Both targets share the edited inode.
+    assert "local edit" in targets[1].read_text(encoding="utf-8")
+
+    result = cli_runner.invoke(
+        cli, ["plan", "--fanout", "hardlink", "--format", "jsonl"]
+    )
+    records = [json.loads(line) for line in result.output.splitlines()]
+    statuses = {r["path"]: r["status"] for r in records if r["type"] == "action"}
+    assert [statuses[str(target)] for target in targets] == ["update", "update"]
+
+    assert cli_runner.invoke(cli, ["apply", "--fanout", "hardlink"]).exit_code == 0
+    assert [target.read_text(encoding="utf-8") for target in targets] == [
+        expected,
+        expected,
+    ]
+    assert targets[0].stat().st_ino == targets[1].stat().st_ino
@@ -0,0 +1,140 @@
+import json
+import socket
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from code_agnostic.__main__ import cli
+from code_agnostic.api import Session
+from code_agnostic.core.repository import CoreRepository
+from code_agnostic.daemon import (
+    SOCKET_ENV,
+    DaemonClient,
+    DaemonError,
+    DaemonServer,
+    connect_daemon,
+    plan_from_payload,
+)
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="requires Unix domain sockets"
+)
+
+
+@pytest.fixture
+def socket_path(monkeypatch) -> Path:
+    # Unix socket paths are length-limited, so keep them out of tmp_path.
+    with tempfile.TemporaryDirectory(prefix="ca-") as tmp:
+        path = Path(tmp) / "d.sock"
+        monkeypatch.setenv(SOCKET_ENV, str(path))
+        yield path
+
+
+@pytest.fixture
+def running_daemon(socket_path: Path, minimal_shared_config: Path):
+    server = DaemonServer(Session(), socket_path=socket_path)
+    server.bind()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    if thread.is_alive():
+        DaemonClient(socket_path).call("shutdown")
+        thread.join(timeout=5)
+
+
+def test_daemon_serves_plan_over_json_rpc(
+    running_daemon: DaemonServer, socket_path: Path, enable_app
+) -> None:
+    enable_app("cursor")
+    client = connect_daemon(CoreRepository().root)
+    assert client is not None
+
+    plan = plan_from_payload(client.call("plan", target="all"))
+
+    assert any(action.app == "cursor" for action in plan.actions)
+    assert client.call("stats")["cache_misses"] >= 0
+
+
+def test_daemon_reports_unknown_methods(
+    running_daemon: DaemonServer, socket_path: Path
+) -> None:
+    with pytest.raises(DaemonError, match="Unknown method"):
+        DaemonClient(socket_path).call("bogus")
+
+
+def test_cli_commands_use_running_daemon(
+    running_daemon: DaemonServer, cli_runner, enable_app, monkeypatch
+) -> None:
+    enable_app("cursor")
+    calls: list[str] = []
+    original = running_daemon.dispatch
+
+    def _tracking_dispatch(raw: bytes):
+        calls.append(raw.decode("utf-8"))
+        return original(raw)
+
+    monkeypatch.setattr(running_daemon, "dispatch", _tracking_dispatch)
+
+    plan_result = cli_runner.invoke(cli, ["plan"])
+    apply_result = cli_runner.invoke(cli, ["apply"])
+    status_result = cli_runner.invoke(cli, ["status"])
+    validate_result = cli_runner.invoke(cli, ["validate"])
+
+    assert plan_result.exit_code == 0, plan_result.output
+    assert "Cursor" in plan_result.output
+    assert apply_result.exit_code == 0, apply_result.output
+    assert status_result.exit_code == 0, status_result.output
+    assert validate_result.exit_code == 0, validate_result.output
+    methods = [json.loads(call)["method"] for call in calls]
+    assert [method for method in methods if method != "ping"] == [
+        "plan",
+        "apply",
+        "status",
+        "validate",
+    ]
+    assert (Path.home() / ".cursor" / "mcp.json").exists()
+
+
+def test_cli_falls_back_when_socket_is_stale(
+    socket_path: Path, minimal_shared_config: Path, cli_runner
+) -> None:
+    socket_path.write_text("", encoding="utf-8")
+
+    assert connect_daemon(CoreRepository().root) is None
+    result = cli_runner.invoke(cli, ["plan"])
+
+    assert result.exit_code == 0
+
+
+def test_cli_does_not_rerun_apply_after_daemon_drops_request(
+    running_daemon: DaemonServer, cli_runner, enable_app, monkeypatch
+) -> None:
+    enable_app("cursor")
+    original = running_daemon.dispatch
+
+    def _dropping_dispatch(raw: bytes):
+        if json.loads(raw)["method"] == "apply":
+            raise ConnectionResetError("daemon went away")
+        return original(raw)
+
+    monkeypatch.setattr(running_daemon, "dispatch", _dropping_dispatch)
+
+    result = cli_runner.invoke(cli, ["apply"])
+
+    assert result.exit_code == 1
+    assert "not re-running it in-process" in result.output
+    assert not (Path.home() / ".cursor" / "mcp.json").exists()
+
+
+def test_daemon_shutdown_removes_socket(
+    running_daemon: DaemonServer, socket_path: Path
+) -> None:
+    assert DaemonClient(socket_path).call("shutdown") == {"stopping": True}
+
+    for _ in range(50):
+        if not socket_path.exists():
+            break
+        threading.Event().wait(0.05)
+    assert not socket_path.exists()
@@ -0,0 +1,99 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from code_agnostic import durability
+from code_agnostic.core.repository import CoreRepository
+from code_agnostic.durability import DurabilityBarrier
+from code_agnostic.executor import SyncExecutor
+from code_agnostic.models import Action, ActionKind, ActionStatus, SyncPlan
+
+FILE_COUNT = 60
+DIR_COUNT = 3
+
+
+def _plan(tmp_path: Path) -> SyncPlan:
+    return SyncPlan(
+        actions=[
+            Action(
+                kind=ActionKind.WRITE_TEXT,
+                path=tmp_path / "out" / f"d{index % DIR_COUNT}" / f"f{index}.md",
+                status=ActionStatus.CREATE,
+                detail="create file",
+                payload=f"payload {index}\n",
+                scope="app:test:skills",
+                app="test",
+            )
+            for index in range(FILE_COUNT)
+        ],
+        errors=[],
+        skipped=[],
+    )
+
+
+def _apply_counting(
+    tmp_path: Path, core_root: Path, monkeypatch, level: str, syncfs: bool
+) -> tuple[int, int]:
+    fsyncs: list[int] = []
+    syncfs_calls: list[Path] = []
+    original_fsync = os.fsync
+
+    def counting_fsync(fd: int) -> None:
+        fsyncs.append(fd)
+        original_fsync(fd)
+
+    def fake_syncfs(path: Path) -> bool:
+        syncfs_calls.append(path)
+        return syncfs
+
+    monkeypatch.setattr(os, "fsync", counting_fsync)
+    monkeypatch.setattr(durability, "_syncfs", fake_syncfs)
+
+    applied, failed, _ = SyncExecutor(
+        core=CoreRepository(core_root), durability=level
+    ).execute(_plan(tmp_path))
+    assert (applied, failed) == (FILE_COUNT, 0)
+    return len(fsyncs), len(syncfs_calls)
+
+
+def test_none_level_never_fsyncs(
+    minimal_shared_config: Path, core_root: Path, tmp_path: Path, monkeypatch
+) -> None:
+    assert _apply_counting(tmp_path, core_root, monkeypatch, "none", True) == (0, 0)
+
+
+def test_batch_level_groups_flushes_per_filesystem_and_directory(
+    minimal_shared_config: Path, core_root: Path, tmp_path: Path, monkeypatch
+) -> None:
+    fsyncs, syncfs_calls = _apply_counting(
+        tmp_path, core_root, monkeypatch, "batch", True
+    )
+
+    assert 1 <= syncfs_calls <= 3
+    # Directories and the few metadata files, never one per target.
+    assert fsyncs < FILE_COUNT // 2
+
+
+def test_batch_level_falls_back_to_file_fsync_without_syncfs(
+    minimal_shared_config: Path, core_root: Path, tmp_path: Path, monkeypatch
+) -> None:
+    fsyncs, _ = _apply_counting(tmp_path, core_root, monkeypatch, "batch", False)
+
+    assert fsyncs >= FILE_COUNT
+
+
+def test_strict_level_fsyncs_every_file_and_directory(
+    minimal_shared_config: Path, core_root: Path, tmp_path: Path, monkeypatch
+) -> None:
+    fsyncs, syncfs_calls = _apply_counting(
+        tmp_path, core_root, monkeypatch, "strict", True
+    )
+
+    assert syncfs_calls == 0
+    assert fsyncs >= 2 * FILE_COUNT
+
+
+def test_unknown_level_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown durability level"):
+        DurabilityBarrier("paranoid")
@@ -0,0 +1,94 @@
+import json
+from pathlib import Path
+
+from code_agnostic.__main__ import cli
+from code_agnostic.core.repository import CoreRepository
+from code_agnostic.executor import SyncExecutor
+from code_agnostic.fleet import FleetRootRepository, FleetService, expand_fleet_homes
+from code_agnostic.skills.compilers import CodexSkillCompiler
+
+
+def _hub_with_skill(core_root: Path) -> None:
+    skill = core_root / "skills" / "deploy" / "SKILL.md"
+    skill.parent.mkdir(parents=True)
+    skill.write_text("---\nname: deploy\ndescription: d\n---\nbody\n", "utf-8")
+
+
+def _homes(tmp_path: Path, *names: str) -> list[Path]:
+    homes = [tmp_path / "homes" / name for name in names]
+    for home in homes:
+        home.mkdir(parents=True)
+    return homes
+
+
+def test_fleet_apply_writes_each_home_with_its_own_state(
+    minimal_shared_config: Path, core_root: Path, tmp_path: Path, cli_runner, enable_app
+) -> None:
+    enable_app("codex")
+    _hub_with_skill(core_root)
+    alice, bob = _homes(tmp_path, "alice", "bob")
+
+    result = cli_runner.invoke(
+        cli, ["fleet", "apply", "--root-glob", str(tmp_path / "homes" / "*")]
+    )
+
+    assert result.exit_code == 0, result.output
+    for home in (alice, bob):
+        assert (home / ".codex" / "config.toml").is_file()
+        assert (home / ".codex" / "skills" / "deploy" / "SKILL.md").is_file()
+        state = json.loads(
+            (home / ".config" / "code-agnostic" / ".sync-state.json").read_text()
+        )
+        managed = state["managed_paths"]["app:codex:skills"]
+        assert managed == [str(home / ".codex" / "skills" / "deploy" / "SKILL.md")]
+        executor = SyncExecutor(FleetRootRepository(CoreRepository(), home))
+        assert len(executor.list_revisions()) == 1
+    assert not (tmp_path / ".codex").exists()
+    assert not (core_root / ".sync-state.json").exists()
+
+
+def test_fleet_compiles_sources_once(
+    minimal_shared_config: Path, core_root: Path, tmp_path: Path, monkeypatch
+) -> None:
+    _hub_with_skill(core_root)
+    homes = _homes(tmp_path, "a", "b", "c")
+    calls: list[str] = []
+    original = CodexSkillCompiler.compile
+
+    def counting(self, skill):
+        calls.append(skill.name)
+        return original(self, skill)
+
+    monkeypatch.setattr(CodexSkillCompiler, "compile", counting)
+
+    results = FleetService(CoreRepository(), ["codex"], jobs=3).run(homes)
+
+    assert all(item.ok for item in results)
+    assert all(item.applied == 2 for item in results)
+    assert calls == ["deploy"]
+
+
+def test_fleet_failing_home_does_not_stop_others(
+    minimal_shared_config: Path, core_root: Path, tmp_path: Path, cli_runner, enable_app
+) -> None:
+    enable_app("codex")
+    (home,) = _homes(tmp_path, "ok")
+    roots_file = tmp_path / "roots.txt"
+    roots_file.write_text(f"# fleet\n{home}\n{tmp_path / 'missing'}\n", "utf-8")
+
+    result = cli_runner.invoke(
+        cli, ["fleet", "apply", "--roots-file", str(roots_file), "--format", "json"]
+    )
+
+    assert result.exit_code == 1
+    payload = json.loads(result.output)
+    assert [item["ok"] for item in payload["homes"]] == [True, False]
+    assert (home / ".codex" / "config.toml").is_file()
+
+
+def test_expand_fleet_homes_dedupes(tmp_path: Path) -> None:
+    (home,) = _homes(tmp_path, "one")
+
+    homes = expand_fleet_homes([home, tmp_path / "homes" / ".." / "homes" / "one"])
+
+    assert homes == [home.resolve()]
@@ -0,0 +1,94 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from code_agnostic.imports import filesystem
+from code_agnostic.imports.filesystem import (
+    content_equal,
+    scan_tree,
+    stage_path,
+    swap_into_place,
+)
+
+
+def _write_tree(root: Path, files: dict[str, bytes]) -> Path:
+    for relative, data in files.items():
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return root
+
+
+def test_manifest_matches_identical_trees_and_detects_changes(tmp_path: Path) -> None:
+    files = {"SKILL.md": b"body", "assets/a.bin": b"x" * 4096, "assets/b/c": b""}
+    left = _write_tree(tmp_path / "left", files)
+    right = _write_tree(tmp_path / "right", files)
+    (right / "empty").mkdir()
+
+    assert not content_equal(left, right)
+    (left / "empty").mkdir()
+    assert content_equal(left, right)
+
+    (right / "assets" / "a.bin").write_bytes(b"y" * 4096)
+    assert not content_equal(left, right)
+
+
+def test_manifest_hashes_only_when_sizes_match(tmp_path: Path) -> None:
+    left = _write_tree(tmp_path / "left", {"a": b"one", "b": b"same"})
+    right = _write_tree(tmp_path / "right", {"a": b"three", "b": b"same"})
+
+    source = scan_tree(left)
+    target = scan_tree(right)
+
+    assert not source.matches(target)
+    assert all(entry._digest is None for entry in source.entries.values())
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks unsupported")
+def test_scan_tree_reports_nested_symlinks(tmp_path: Path) -> None:
+    root = _write_tree(tmp_path / "skill", {"SKILL.md": b"body"})
+    (root / "nested").mkdir()
+    os.symlink(root / "SKILL.md", root / "nested" / "link.md")
+
+    assert scan_tree(root).has_symlink
+    assert "nested/link.md" not in scan_tree(root).entries
+    followed = scan_tree(root, follow_symlinks=True)
+    assert followed.entries["nested/link.md"].size == 4
+
+
+def test_stage_and_swap_replaces_directory_atomically(tmp_path: Path) -> None:
+    source = _write_tree(tmp_path / "src", {"SKILL.md": b"new", "a/b": b"data"})
+    target = _write_tree(tmp_path / "hub" / "skill", {"SKILL.md": b"old", "stale": b""})
+
+    staged = stage_path(source, target)
+    assert (target / "SKILL.md").read_bytes() == b"old"
+    swap_into_place(staged, target)
+
+    assert content_equal(source, target)
+    assert sorted(p.name for p in target.parent.iterdir()) == ["skill"]
+
+
+def test_stage_path_hardlinks_when_requested(tmp_path: Path) -> None:
+    source = _write_tree(tmp_path / "src", {"SKILL.md": b"body"})
+    target = tmp_path / "hub" / "skill"
+
+    swap_into_place(stage_path(source, target, hardlink=True), target)
+
+    assert (target / "SKILL.md").stat().st_ino == (source / "SKILL.md").stat().st_ino
+
+
+def test_failed_stage_leaves_target_untouched(tmp_path: Path, monkeypatch) -> None:
+    source = _write_tree(tmp_path / "src", {"SKILL.md": b"new"})
+    target = _write_tree(tmp_path / "hub" / "skill", {"SKILL.md": b"old"})
+
+    def boom(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(filesystem.shutil, "copyfile", boom)
+    monkeypatch.setattr(filesystem, "_reflink", lambda *args: False)
+    with pytest.raises(OSError):
+        stage_path(source, target)
+
+    assert (target / "SKILL.md").read_bytes() == b"old"
+    assert sorted(p.name for p in target.parent.iterdir()) == ["skill"]
@@ -0,0 +1,91 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from code_agnostic import locking
+from code_agnostic.content_store import ContentStore
+from code_agnostic.core.repository import CoreRepository
+from code_agnostic.executor import SyncExecutor
+from code_agnostic.locking import advisory_lock
+from code_agnostic.models import Action, ActionKind, ActionStatus, SyncPlan
+
+pytestmark = pytest.mark.skipif(locking.fcntl is None, reason="requires fcntl")
+
+
+def _workspace_plan(core: CoreRepository, tmp_path: Path, name: str) -> SyncPlan:
+    workspace_root = tmp_path / name
+    workspace_root.mkdir()
+    core.add_workspace(name, workspace_root)
+    return SyncPlan(
+        actions=[
+            Action(
+                kind=ActionKind.WRITE_TEXT,
+                path=workspace_root / "AGENTS.md",
+                status=ActionStatus.CREATE,
+                detail="create workspace file",
+                payload=f"{name}\n",
+                scope="rules",
+                app="workspace",
+                workspace=name,
+            )
+        ],
+        errors=[],
+        skipped=[],
+    )
+
+
+def _hold(lock_path: Path, acquired: threading.Event, seconds: float) -> None:
+    with advisory_lock(lock_path):
+        acquired.set()
+        time.sleep(seconds)
+
+
+def test_nonblocking_lock_yields_none_while_held(tmp_path: Path) -> None:
+    lock_path = tmp_path / "root" / ".sync.lock"
+
+    with advisory_lock(lock_path) as waited:
+        assert waited is not None
+        with advisory_lock(lock_path, blocking=False) as contended:
+            assert contended is None
+        with advisory_lock(lock_path, shared=True, blocking=False) as shared:
+            assert shared is None
+
+    with advisory_lock(lock_path, blocking=False) as free:
+        assert free is not None
+
+
+def test_apply_waits_only_for_its_own_root_lock(
+    minimal_shared_config: Path, core_root: Path, tmp_path: Path
+) -> None:
+    core = CoreRepository(core_root)
+    alpha = _workspace_plan(core, tmp_path, "alpha")
+    beta = _workspace_plan(core, tmp_path, "beta")
+    acquired = threading.Event()
+    holder = threading.Thread(
+        target=_hold,
+        args=(core.workspace_config_dir("alpha") / ".sync.lock", acquired, 0.3),
+    )
+    holder.start()
+    acquired.wait()
+
+    started = time.monotonic()
+    [beta_outcome] = SyncExecutor(core=core).execute_by_root(beta)
+    assert time.monotonic() - started < 0.3
+    assert beta_outcome.committed
+
+    [alpha_outcome] = SyncExecutor(core=core).execute_by_root(alpha)
+    holder.join()
+    assert alpha_outcome.committed
+    assert alpha_outcome.lock_wait > 0.1
+    assert (tmp_path / "alpha" / "AGENTS.md").read_text(encoding="utf-8") == "alpha\n"
+
+
+def test_store_prune_is_skipped_while_another_apply_links(tmp_path: Path) -> None:
+    store = ContentStore(tmp_path / ".sync-store")
+    store.ensure("orphan\n")
+
+    with store.in_use():
+        assert store.prune() == 0
+    assert store.prune() == 1
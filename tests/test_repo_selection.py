@@ -0,0 +1,82 @@
+import json
+from pathlib import Path
+
+from code_agnostic.__main__ import cli
+from code_agnostic.repo_selection import RepoSelection
+from code_agnostic.workspaces import WorkspaceService
+
+
+def test_repo_selection_matches_paths_and_names() -> None:
+    selection = RepoSelection.from_payload(
+        {
+            "include": ["services/*", "tools"],
+            "exclude": ["*-legacy"],
+            "apps": {"codex": ["services/api"]},
+        }
+    )
+
+    assert selection.selects("services/api")
+    assert selection.selects("tools")
+    assert not selection.selects("libs/core")
+    assert not selection.selects("services/billing-legacy")
+    assert not selection.allows_app("services/api", "codex")
+    assert selection.allows_app("services/api", "opencode")
+    assert RepoSelection.from_payload(selection.to_payload()) == selection
+
+
+def test_discovery_prunes_excluded_subtrees(tmp_path: Path, monkeypatch) -> None:
+    for repo in ("keep", "vendor/a", "vendor/b"):
+        (tmp_path / repo / ".git").mkdir(parents=True)
+    service = WorkspaceService()
+    visited: list[Path] = []
+    original = service.resolve_git_dir
+
+    def tracking(repo_path: Path):
+        visited.append(repo_path)
+        return original(repo_path)
+
+    monkeypatch.setattr(service, "resolve_git_dir", tracking)
+    selection = RepoSelection(exclude=("vendor",))
+
+    repos = service.discover_git_repos(tmp_path, selection)
+
+    assert [repo.name for repo in repos] == ["keep"]
+    assert not any("vendor" in path.parts for path in visited)
+
+
+def test_excluding_a_repo_cleans_up_its_synced_skills(
+    tmp_path: Path, core_root: Path, minimal_shared_config: Path, cli_runner, enable_app
+) -> None:
+    enable_app("codex")
+    workspace = tmp_path / "ws"
+    for repo in ("api", "web"):
+        (workspace / repo / ".git").mkdir(parents=True)
+    assert (
+        cli_runner.invoke(
+            cli, ["workspaces", "add", "--name", "ws", "--path", str(workspace)]
+        ).exit_code
+        == 0
+    )
+    skill = core_root / "workspaces" / "ws" / "skills" / "review"
+    skill.mkdir(parents=True)
+    (skill / "SKILL.md").write_text("---\nname: review\n---\nbody\n", encoding="utf-8")
+
+    assert cli_runner.invoke(cli, ["apply"]).exit_code == 0
+    assert (workspace / "web" / ".codex" / "skills" / "review" / "SKILL.md").exists()
+
+    result = cli_runner.invoke(
+        cli,
+        ["workspaces", "repos-add", "--pattern", "web", "-a", "codex", "-w", "ws"],
+    )
+    assert result.exit_code == 0
+    stored = json.loads((core_root / "workspaces" / "ws" / "repos.json").read_text())
+    assert stored["apps"] == {"codex": ["web"]}
+
+    assert cli_runner.invoke(cli, ["apply"]).exit_code == 0
+    assert not (
+        workspace / "web" / ".codex" / "skills" / "review" / "SKILL.md"
+    ).exists()
+    assert (workspace / "api" / ".codex" / "skills" / "review" / "SKILL.md").exists()
+
+    listing = cli_runner.invoke(cli, ["workspaces", "repos-list", "-w", "ws"])
+    assert "web (skips codex)" in listing.output
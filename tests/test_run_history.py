@@ -0,0 +1,90 @@
+import json
+from pathlib import Path
+
+from code_agnostic.__main__ import cli
+from code_agnostic.run_history import (
+    RunRecord,
+    append_history,
+    history_path,
+    load_history,
+    summarize_history,
+)
+
+
+def test_apply_and_plan_append_run_records(
+    minimal_shared_config: Path, core_root: Path, cli_runner, enable_app
+) -> None:
+    enable_app("codex")
+    skill = core_root / "skills" / "deploy"
+    skill.mkdir(parents=True)
+    (skill / "SKILL.md").write_text("---\nname: deploy\n---\nRun it.\n", "utf-8")
+
+    assert cli_runner.invoke(cli, ["apply"]).exit_code == 0
+    assert cli_runner.invoke(cli, ["plan"]).exit_code == 0
+
+    apply_run, plan_run = load_history(core_root)[-2:]
+    assert apply_run.command == "apply" and apply_run.ok
+    assert apply_run.counts["create"] >= 1
+    assert set(apply_run.phases) == {"apply", "plan"}
+    assert apply_run.bytes_written and apply_run.bytes_written > 0
+    assert apply_run.revisions == 1
+    assert apply_run.cache_hits is not None
+    assert plan_run.command == "plan"
+    assert plan_run.counts["noop"] == plan_run.counts["actions"]
+
+
+def test_failed_plan_is_recorded(
+    minimal_shared_config: Path, core_root: Path, cli_runner, enable_app
+) -> None:
+    enable_app("opencode")
+    (core_root / "config" / "mcp.base.json").write_text("{bad", encoding="utf-8")
+
+    result = cli_runner.invoke(cli, ["plan"])
+
+    assert result.exit_code != 0
+    assert load_history(core_root)[-1].ok is False
+
+
+def test_history_is_bounded(tmp_path: Path) -> None:
+    for index in range(5):
+        append_history(
+            tmp_path, RunRecord(command="plan", started_at=str(index)), limit=3
+        )
+
+    lines = history_path(tmp_path).read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["started_at"] for line in lines] == ["2", "3", "4"]
+
+
+def test_summarize_history_reports_trend() -> None:
+    records = [
+        RunRecord(command="apply", started_at="t", duration=duration)
+        for duration in (1.0, 1.0, 2.0, 2.0)
+    ]
+
+    (summary,) = summarize_history(records)
+
+    assert summary.runs == 4
+    assert summary.trend == 1.0
+    assert summary.p95_duration == 2.0
+
+
+def test_stats_and_prometheus_textfile(
+    minimal_shared_config: Path, core_root: Path, tmp_path: Path, cli_runner
+) -> None:
+    metrics = tmp_path / "textfile" / "code_agnostic.prom"
+
+    result = cli_runner.invoke(cli, ["apply", "--metrics-textfile", str(metrics)])
+    assert result.exit_code == 0, result.output
+
+    text = metrics.read_text(encoding="utf-8")
+    assert 'code_agnostic_last_run_success{command="apply"} 1' in text
+    assert "# TYPE code_agnostic_last_run_duration_seconds gauge" in text
+    assert metrics.stat().st_mode & 0o044 == 0o044
+
+    result = cli_runner.invoke(cli, ["stats"])
+    assert result.exit_code == 0, result.output
+    assert "apply" in result.output
+
+    result = cli_runner.invoke(cli, ["stats", "--format", "json"])
+    payload = json.loads(result.output)
+    assert payload["commands"][0]["command"] == "apply"
@@ -0,0 +1,100 @@
+import os
+from pathlib import Path
+
+from code_agnostic.__main__ import cli
+from code_agnostic.apps.apps_service import AppsService
+from code_agnostic.apps.common import compiled_planning
+from code_agnostic.apps.common.compiled_planning import (
+    list_skill_assets,
+    plan_copied_file_action,
+)
+from code_agnostic.core.repository import CoreRepository
+from code_agnostic.models import ActionKind, ActionStatus
+
+
+def _write_skill(core_root: Path) -> Path:
+    skill = core_root / "skills" / "deploy"
+    (skill / "scripts").mkdir(parents=True)
+    (skill / "SKILL.md").write_text("---\nname: deploy\n---\nRun it.\n", "utf-8")
+    (skill / "scripts" / "run.sh").write_text("#!/bin/sh\necho hi\n", "utf-8")
+    (skill / "reference.md").write_text("notes\n", "utf-8")
+    (skill / ".cache").mkdir()
+    (skill / ".cache" / "ignored").write_text("x", "utf-8")
+    return skill
+
+
+def _asset_actions(core_root: Path) -> dict[str, ActionStatus]:
+    plan = AppsService(CoreRepository(core_root)).plan_for_target("codex")
+    return {
+        action.path.name: action.status
+        for action in plan.actions
+        if action.kind == ActionKind.COPY_FILE
+    }
+
+
+def test_list_skill_assets_skips_compile_inputs_and_hidden(tmp_path: Path) -> None:
+    skill = _write_skill(tmp_path)
+    (skill / "meta.yaml").write_text("name: deploy\n", "utf-8")
+
+    assert list_skill_assets(skill) == [Path("reference.md"), Path("scripts/run.sh")]
+
+
+def test_copied_file_with_equal_content_but_new_mtime_is_noop(
+    tmp_path: Path,
+) -> None:
+    source = tmp_path / "source.txt"
+    target = tmp_path / "target.txt"
+    source.write_text("same\n", "utf-8")
+    target.write_text("same\n", "utf-8")
+    os.utime(target, ns=(0, 0))
+
+    action = plan_copied_file_action(
+        source=source,
+        target=target,
+        scope="app:codex:skills",
+        app="codex",
+        create_detail="create",
+        noop_detail="noop",
+        update_detail="update",
+    )
+
+    assert action.status == ActionStatus.NOOP
+
+
+def test_skill_assets_sync_incrementally(
+    tmp_path: Path,
+    core_root: Path,
+    minimal_shared_config: Path,
+    cli_runner,
+    enable_app,
+    monkeypatch,
+) -> None:
+    enable_app("codex")
+    skill = _write_skill(core_root)
+
+    result = cli_runner.invoke(cli, ["apply", "-a", "codex"])
+    assert result.exit_code == 0, result.output
+
+    target = tmp_path / ".codex" / "skills" / "deploy"
+    script = target / "scripts" / "run.sh"
+    assert script.read_text("utf-8") == "#!/bin/sh\necho hi\n"
+    assert (target / "reference.md").exists()
+    assert not (target / ".cache").exists()
+    source_mtime = (skill / "scripts" / "run.sh").stat().st_mtime_ns
+    assert script.stat().st_mtime_ns == source_mtime
+
+    def fail_digest(path: Path) -> str:
+        raise AssertionError(f"unexpected hash of {path}")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(compiled_planning, "_file_digest", fail_digest)
+        assert set(_asset_actions(core_root).values()) == {ActionStatus.NOOP}
+
+    (skill / "scripts" / "run.sh").write_text("#!/bin/sh\necho bye\n", "utf-8")
+    (skill / "reference.md").unlink()
+    assert _asset_actions(core_root) == {"run.sh": ActionStatus.UPDATE}
+
+    result = cli_runner.invoke(cli, ["apply", "-a", "codex"])
+    assert result.exit_code == 0, result.output
+    assert script.read_text("utf-8") == "#!/bin/sh\necho bye\n"
+    assert not (target / "reference.md").exists()
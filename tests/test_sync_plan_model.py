@@ -182,3 +182,72 @@ def test_is_valid_with_errors() -> None:
     plan = SyncPlan(actions=[], errors=[ValueError("err")], skipped=[])
 
     assert plan.is_valid() is False
+
+
+# --- index ---
+
+
+def test_index_select_keeps_plan_order_and_sees_appends() -> None:
+    first = _action(app="cursor", scope="app:cursor:skills")
+    second = _action(app="workspace", status=ActionStatus.NOOP)
+    third = _action(app="cursor", status=ActionStatus.NOOP)
+    plan = SyncPlan(actions=[first, second, third], errors=[], skipped=[])
+
+    assert plan.index.select(app="cursor") == [first, third]
+    assert plan.index.select(app="cursor", status=ActionStatus.NOOP) == [third]
+
+    fourth = _action(app="cursor")
+    plan.actions.append(fourth)
+    assert plan.index.select(app="cursor") == [first, third, fourth]
+    assert plan.summary()["noop"] == 2
+
+    plan.actions = [first]
+    assert plan.index.select(app="cursor") == [first]
+
+
+def test_index_rebuilds_after_actions_change() -> None:
+    first = _action(app="cursor")
+    second = _action(app="codex", status=ActionStatus.NOOP)
+    plan = SyncPlan(actions=[first, second], errors=[], skipped=[])
+    assert plan.summary()["noop"] == 1
+
+    first.status = ActionStatus.NOOP
+    assert plan.summary()["noop"] == 2
+
+    replacement = _action(app="opencode")
+    plan.actions[1] = replacement
+    assert plan.index.select(app="codex") == []
+    assert plan.index.select(app="opencode") == [replacement]
+
+    del plan.actions[0]
+    assert plan.summary()["noop"] == 0
+    assert plan.index.take(plan.index.by_app["opencode"]) == [replacement]
+
+
+def test_filter_for_target_keeps_original_order() -> None:
+    actions = [
+        _action(app="workspace", path="/a"),
+        _action(app="codex", path="/b"),
+        _action(app="workspace", path="/c"),
+    ]
+    plan = SyncPlan(actions=actions, errors=[], skipped=[])
+
+    assert plan.filter_for_target("codex").actions == actions
+
+
+def test_extend_shares_equal_payloads_and_reuses_digest() -> None:
+    left = _action(app="workspace")
+    left.kind = ActionKind.WRITE_TEXT
+    left.payload = "".join(["same ", "text"])
+    right = _action(app="workspace")
+    right.kind = ActionKind.WRITE_TEXT
+    right.payload = "".join(["same ", "text"])
+    assert left.payload is not right.payload
+
+    plan = SyncPlan(actions=[], errors=[], skipped=[])
+    plan.extend(SyncPlan(actions=[left], errors=[], skipped=[]))
+    plan.extend(SyncPlan(actions=[right], errors=[], skipped=[]))
+
+    assert left.payload is right.payload
+    assert right.payload_digest() == left.payload_digest()
+    assert (left.payload_digest() or "").startswith("sha256:")
@@ -684,3 +684,91 @@ def test_execute_repairs_pending_revision_before_new_apply(
     assert primary.read_text(encoding="utf-8") == "v1\n"
     assert sibling.read_text(encoding="utf-8") == "sibling\n"
     assert not pending_path.exists()
+
+
+def _multi_root_plan(core: CoreRepository, tmp_path: Path) -> SyncPlan:
+    actions = [
+        Action(
+            kind=ActionKind.WRITE_TEXT,
+            path=tmp_path / "global.txt",
+            status=ActionStatus.CREATE,
+            detail="create global file",
+            payload="global\n",
+            scope="app:test:text",
+        )
+    ]
+    for name in ("alpha", "beta"):
+        workspace_root = tmp_path / name
+        workspace_root.mkdir()
+        core.add_workspace(name, workspace_root)
+        actions.append(
+            Action(
+                kind=ActionKind.WRITE_TEXT,
+                path=workspace_root / "AGENTS.md",
+                status=ActionStatus.CREATE,
+                detail="create workspace file",
+                payload=f"{name}\n",
+                scope="rules",
+                app="workspace",
+                workspace=name,
+            )
+        )
+    actions.append(
+        Action(
+            kind=ActionKind.SYMLINK,
+            path=tmp_path / "alpha" / "broken-link",
+            status=ActionStatus.CREATE,
+            detail="break alpha",
+            source=None,
+            scope="rules",
+            app="workspace",
+            workspace="alpha",
+        )
+    )
+    return SyncPlan(actions=actions, errors=[], skipped=[])
+
+
+def test_execute_commits_each_root_and_stops_after_failing_root(
+    minimal_shared_config: Path,
+    core_root: Path,
+    tmp_path: Path,
+) -> None:
+    core = CoreRepository(core_root)
+    plan = _multi_root_plan(core, tmp_path)
+
+    outcomes = SyncExecutor(core=core).execute_by_root(plan)
+
+    assert [(item.label, item.committed, item.attempted) for item in outcomes] == [
+        ("global", True, True),
+        ("alpha", False, True),
+        ("beta", False, False),
+    ]
+    assert (tmp_path / "global.txt").read_text(encoding="utf-8") == "global\n"
+    assert (core_root / ".sync-revisions" / "active.json").exists()
+    assert not (tmp_path / "alpha" / "AGENTS.md").exists()
+    assert not (tmp_path / "beta" / "AGENTS.md").exists()
+
+
+def test_execute_continue_on_error_commits_healthy_roots(
+    minimal_shared_config: Path,
+    core_root: Path,
+    tmp_path: Path,
+) -> None:
+    core = CoreRepository(core_root)
+    plan = _multi_root_plan(core, tmp_path)
+
+    applied, failed, failures = SyncExecutor(core=core).execute(
+        plan, continue_on_error=True
+    )
+
+    assert applied == 2
+    assert failed == 1
+    assert failures == [
+        f"Missing source for symlink action: {tmp_path / 'alpha' / 'broken-link'}"
+    ]
+    assert not (tmp_path / "alpha" / "AGENTS.md").exists()
+    assert (tmp_path / "beta" / "AGENTS.md").read_text(encoding="utf-8") == "beta\n"
+    beta_revisions = core_root / "workspaces" / "beta" / ".sync-revisions"
+    assert (beta_revisions / "active.json").exists()
+    alpha_revisions = core_root / "workspaces" / "alpha" / ".sync-revisions"
+    assert not (alpha_revisions / "active.json").exists()
@@ -0,0 +1,164 @@
+import threading
+from pathlib import Path
+
+from code_agnostic.__main__ import cli
+from code_agnostic.api import Session
+from code_agnostic.models import ActionStatus, SyncResource
+from code_agnostic.watch import (
+    ChangeSet,
+    PollingBackend,
+    WatchService,
+    classify_changes,
+)
+
+
+def _write_skill(root: Path, name: str, body: str) -> Path:
+    path = root / "skills" / name / "SKILL.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f"---\nname: {name}\ndescription: test\n---\n{body}\n", encoding="utf-8"
+    )
+    return path
+
+
+def _setup_workspace(tmp_path: Path, core_root: Path, cli_runner) -> Path:
+    workspace_root = tmp_path / "ws"
+    (workspace_root / "repo-a" / ".git").mkdir(parents=True)
+    result = cli_runner.invoke(
+        cli, ["workspaces", "add", "--name", "ws", "--path", str(workspace_root)]
+    )
+    assert result.exit_code == 0
+    return workspace_root
+
+
+def test_classify_changes_maps_hub_paths_to_resources(core_root: Path) -> None:
+    changes = classify_changes(
+        core_root,
+        [
+            core_root / "skills" / "demo" / "SKILL.md",
+            core_root / "config" / "mcp.base.json",
+            core_root / "workspaces" / "ws" / "rules" / "style.md",
+            core_root / "workspaces" / "ws" / "git-exclude.json",
+            core_root / ".sync-state.json",
+            core_root / "workspaces" / "ws" / ".sync-revisions" / "x.json",
+        ],
+    )
+
+    assert not changes.full
+    assert changes.global_resources == {SyncResource.SKILLS, SyncResource.MCP}
+    assert changes.workspace_resources == {"ws": {SyncResource.RULES, SyncResource.MCP}}
+
+
+def test_classify_changes_requests_full_replan_for_registry_files(
+    core_root: Path,
+) -> None:
+    changes = classify_changes(core_root, [core_root / "config" / "apps.json"])
+
+    assert changes.full
+    assert classify_changes(core_root, [core_root / ".sync-state.json"]).is_empty()
+
+
+def test_polling_backend_reports_created_and_modified_files(tmp_path: Path) -> None:
+    root = tmp_path / "hub"
+    (root / "skills").mkdir(parents=True)
+    existing = root / "skills" / "a.md"
+    existing.write_text("one", encoding="utf-8")
+    backend = PollingBackend(root)
+
+    existing.write_text("changed", encoding="utf-8")
+    created = root / "skills" / "b.md"
+    created.write_text("two", encoding="utf-8")
+    (root / ".sync-state.json").write_text("{}", encoding="utf-8")
+
+    assert backend.poll(0) == {existing, created}
+    assert backend.poll(0) == set()
+
+
+def test_watch_applies_only_affected_workspace_scope(
+    tmp_path: Path, minimal_shared_config: Path, cli_runner, enable_app
+) -> None:
+    enable_app("opencode")
+    workspace_root = _setup_workspace(tmp_path, minimal_shared_config, cli_runner)
+    ws_config = minimal_shared_config / "workspaces" / "ws"
+    skill_path = _write_skill(ws_config, "demo", "v1")
+    (ws_config / "AGENTS.md").write_text("rules", encoding="utf-8")
+
+    service = WatchService(Session())
+    initial = service.apply_changes(service.full_changes())
+    assert initial.failed == 0
+    target = workspace_root / "repo-a" / ".opencode" / "skills" / "demo" / "SKILL.md"
+    assert "v1" in target.read_text(encoding="utf-8")
+
+    _write_skill(ws_config, "demo", "v2")
+    changes = classify_changes(minimal_shared_config, [skill_path])
+    cycle = service.apply_changes(changes)
+
+    assert cycle.failed == 0
+    assert cycle.plan.actions
+    assert {a.resource for a in cycle.plan.actions} == {SyncResource.SKILLS}
+    assert all(a.workspace == "ws" for a in cycle.plan.actions)
+    assert "v2" in target.read_text(encoding="utf-8")
+
+
+def test_watch_keeps_parsed_sources_cached_between_cycles(
+    tmp_path: Path, minimal_shared_config: Path, cli_runner, enable_app
+) -> None:
+    enable_app("opencode")
+    _setup_workspace(tmp_path, minimal_shared_config, cli_runner)
+    ws_config = minimal_shared_config / "workspaces" / "ws"
+    _write_skill(ws_config, "alpha", "a")
+    beta = _write_skill(ws_config, "beta", "b")
+
+    service = WatchService(Session())
+    service.apply_changes(service.full_changes())
+    misses_before = service.session.cache_stats().misses
+
+    _write_skill(ws_config, "beta", "b2")
+    cycle = service.apply_changes(classify_changes(minimal_shared_config, [beta]))
+
+    stats = service.session.cache_stats()
+    assert stats.hits > 0
+    assert stats.misses - misses_before == 1
+    updated = [a for a in cycle.plan.actions if a.status != ActionStatus.NOOP]
+    assert updated
+    assert {a.path.parent.name for a in updated} == {"beta"}
+
+
+class _ScriptedBackend:
+    def __init__(self, batches: list[set[Path]], stop: threading.Event) -> None:
+        self.batches = batches
+        self.stop = stop
+        self.closed = False
+
+    def poll(self, timeout: float) -> set[Path]:
+        if not self.batches:
+            self.stop.set()
+            return set()
+        return self.batches.pop(0)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_watch_run_debounces_bursts_into_one_cycle(
+    minimal_shared_config: Path,
+) -> None:
+    stop = threading.Event()
+    skills = minimal_shared_config / "skills"
+    backend = _ScriptedBackend(
+        [{skills / "a" / "SKILL.md"}, {skills / "b" / "SKILL.md"}, set()], stop
+    )
+    cycles: list[ChangeSet] = []
+
+    WatchService(Session()).run(
+        lambda cycle: cycles.append(cycle.changes),
+        backend=backend,
+        debounce=0,
+        initial=False,
+        stop_event=stop,
+    )
+
+    assert backend.closed
+    assert len(cycles) == 1
+    assert cycles[0].global_resources == {SyncResource.SKILLS}
+    assert len(cycles[0].paths) == 2
@@ -0,0 +1,79 @@
+"""Tests for summarized and paged plan rendering."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+from rich.console import Console
+
+from code_agnostic.models import Action, ActionKind, ActionStatus, SyncPlan
+from code_agnostic.tui import SyncConsoleUI
+from code_agnostic.tui.tables import PLAN_DETAIL_LIMIT
+
+
+def _make_plan(count: int, noop_every: int = 4) -> SyncPlan:
+    actions = []
+    for index in range(count):
+        status = ActionStatus.NOOP if index % noop_every == 0 else ActionStatus.CREATE
+        actions.append(
+            Action(
+                kind=ActionKind.SYMLINK,
+                path=Path(f"/repos/repo-{index}/.cursor/skills/demo"),
+                status=status,
+                detail=f"link skill {index}",
+                app="cursor",
+                scope="ws:cursor:repo_skills_dir",
+                workspace=f"ws-{index % 3}",
+            )
+        )
+    return SyncPlan(actions=actions, errors=[], skipped=[])
+
+
+def _render(plan: SyncPlan, **view) -> str:
+    buffer = io.StringIO()
+    ui = SyncConsoleUI(Console(file=buffer, width=120, force_terminal=False))
+    ui.render_plan(plan, mode="plan:all", **view)
+    return buffer.getvalue()
+
+
+def test_small_plan_lists_changes_and_collapses_noops() -> None:
+    output = _render(_make_plan(8))
+
+    assert "link skill 1" in output
+    assert "link skill 0" not in output
+    assert "2 noop actions hidden" in output
+
+    shown = _render(_make_plan(8), show_noop=True)
+    assert "link skill 0" in shown
+    assert "hidden" not in shown
+
+
+def test_large_plan_is_summarized_by_group() -> None:
+    output = _render(_make_plan(PLAN_DETAIL_LIMIT * 4))
+
+    assert "plan summary" in output
+    assert "ws-2" in output
+    assert "link skill" not in output
+    assert "--pager" in output
+
+
+def test_group_by_controls_summary_columns() -> None:
+    output = _render(_make_plan(12), group_by=("app", "status"), show_noop=True)
+
+    assert "plan summary" in output
+    assert "ws-1" not in output
+    assert "noop" in output
+
+
+def test_summary_output_stays_bounded_as_plan_grows() -> None:
+    # Just over the limit of visible (non-noop) changes, and far over it.
+    small = _render(_make_plan(PLAN_DETAIL_LIMIT * 2))
+    large = _render(_make_plan(20_000))
+
+    for output in (small, large):
+        assert "plan summary" in output
+        assert "link skill" not in output
+    # One row per group, however many actions fall into each.
+    assert len(large.splitlines()) == len(small.splitlines())
+    assert len(large.splitlines()) < 40